@@ -7,13 +7,22 @@ Uses Claude Code CLI authentication - no API key needed.
 """
 
 import asyncio
+import functools
 from pathlib import Path
 
 from claude_agent_sdk import ClaudeAgentOptions, AssistantMessage, TextBlock, ToolUseBlock
 
 from .client import create_client_options, run_query
+from .orchestration.coordinator import Coordinator
+from .orchestration.freelance_runner import FreelanceRunner, freelance_agent_configs
+from .orchestration.types import ArchivePolicy, OrchestrationConfig, SeenPolicy
 from .prompts import copy_spec_to_project, get_coding_prompt, get_initializer_prompt
-from .progress import count_passing_tests, print_progress_summary, print_session_header
+from .progress import (
+    count_passing_tests,
+    print_combined_progress,
+    print_progress_summary,
+    print_session_header,
+)
 
 
 async def run_agent_session(
@@ -71,6 +80,11 @@ async def run_autonomous_agent(
     feature_list = project_dir / "feature_list.json"
     is_continuation = feature_list.exists()
 
+    # Search every platform concurrently, unless resuming a sequential project
+    if platform == "all" and not is_continuation:
+        await run_concurrent_platforms(project_dir, model, max_iterations, skills)
+        return
+
     if is_continuation:
         print(f"\nContinuing existing project: {project_dir}")
         print_progress_summary(project_dir)
@@ -123,3 +137,50 @@ async def run_autonomous_agent(
     print(f"\nProject directory: {project_dir}")
     print("\nTo continue later, run:")
     print(f"  python -m src.main --project-dir {project_dir}")
+
+
+async def run_concurrent_platforms(
+    project_dir: Path,
+    model: str,
+    max_iterations: int | None = None,
+    skills: list[str] | None = None,
+) -> None:
+    """
+    Run one freelance session loop per platform, concurrently.
+
+    Each platform gets its own project under project_dir/agent-N; the
+    coordinator merges their jobs into project_dir/merged.
+
+    Args:
+        project_dir: Base directory for all platform projects
+        model: Claude model to use
+        max_iterations: Maximum iterations per platform (None for unlimited)
+        skills: Skills to search for gigs
+    """
+    agents = freelance_agent_configs()
+    skills = skills or ["java", "aws", "devops"]
+
+    print(f"\nStarting concurrent freelance search: {project_dir}")
+    print(f"Platforms: {', '.join(a.platform for a in agents)}")
+    print(f"Skills: {', '.join(skills)}")
+
+    # Gigs are not ATS postings: no seen-URL set or posting archive, and the
+    # merge must not replace the job search UI's data
+    config = OrchestrationConfig(
+        agents=agents,
+        seen=SeenPolicy(enabled=False),
+        archive=ArchivePolicy(enabled=False),
+    )
+    coordinator = Coordinator(
+        output_dir=project_dir,
+        max_iterations=max_iterations,
+        config=config,
+        runner_factory=functools.partial(FreelanceRunner, model=model, skills=skills),
+        publish_ui=False,
+    )
+    await coordinator.start_all(agent_count=len(agents))
+
+    print_combined_progress({a.platform: project_dir / f"agent-{a.id}" for a in agents})
+
+    print("\nTo continue later, run:")
+    print(f"  python -m src.main --project-dir {project_dir}")
@@ -6,9 +6,16 @@ Configured client using Claude Code CLI (uses your existing authentication).
 """
 
 import json
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import aclosing
 from pathlib import Path
+from typing import Any, cast
 
-from claude_agent_sdk import query, ClaudeAgentOptions
+from claude_agent_sdk import query, ClaudeAgentOptions, HookMatcher, Message
+from claude_agent_sdk.types import HookCallback
+
+from .extraction import ContentReducer
+from .security import DEFAULT_POLICY
 
 # System prompt for the freelance assistant agent
 SYSTEM_PROMPT = """You are an expert freelance business assistant helping users find and win freelance work.
@@ -33,7 +40,11 @@ Guidelines:
 """
 
 
-def create_client_options(project_dir: Path, model: str) -> ClaudeAgentOptions:
+def create_client_options(
+    project_dir: Path,
+    model: str,
+    reducer: ContentReducer | None = None,
+) -> ClaudeAgentOptions:
     """
     Create configured Claude Agent options.
 
@@ -42,6 +53,7 @@ def create_client_options(project_dir: Path, model: str) -> ClaudeAgentOptions:
     Args:
         project_dir: Working directory for the agent
         model: Claude model to use
+        reducer: Content reducer for fetched ATS pages (a new one if omitted)
 
     Returns:
         Configured ClaudeAgentOptions
@@ -57,6 +69,8 @@ def create_client_options(project_dir: Path, model: str) -> ClaudeAgentOptions:
     with open(settings_path, "w") as f:
         json.dump(settings, f, indent=2)
 
+    reducer = reducer or ContentReducer()
+
     # Create options - uses CLI authentication, fully autonomous
     return ClaudeAgentOptions(
         system_prompt=SYSTEM_PROMPT,
@@ -64,10 +78,24 @@ def create_client_options(project_dir: Path, model: str) -> ClaudeAgentOptions:
         cwd=str(project_dir),
         allowed_tools=["Read", "Write", "Edit", "Glob", "Grep", "Bash", "WebSearch", "WebFetch", "TodoWrite"],
         permission_mode="acceptEdits",  # Auto-accept without prompting
+        hooks={
+            "PreToolUse": [hook_matcher("Bash", DEFAULT_POLICY.hook)],
+            "PostToolUse": [hook_matcher("WebFetch", reducer.hook)],
+        },
     )
 
 
-async def run_query(prompt: str, options: ClaudeAgentOptions):
+# Hooks in this package take and return plain dicts; the SDK types the same
+# payloads as TypedDicts
+Hook = Callable[[dict[str, Any], str | None, Any], Awaitable[dict[str, Any]]]
+
+
+def hook_matcher(matcher: str, hook: Hook) -> HookMatcher:
+    """Register a single hook for the tools matched by ``matcher``."""
+    return HookMatcher(matcher=matcher, hooks=[cast(HookCallback, hook)])
+
+
+async def run_query(prompt: str, options: ClaudeAgentOptions) -> AsyncGenerator[Message, None]:
     """
     Run a query using Claude Code CLI authentication.
 
@@ -78,5 +106,9 @@ async def run_query(prompt: str, options: ClaudeAgentOptions):
     Yields:
         Events from the Claude response
     """
-    async for message in query(prompt=prompt, options=options):
-        yield message
+    # aclosing: if the caller stops early or is cancelled (e.g. by a session
+    # watchdog), close the SDK stream so it terminates the CLI subprocess
+    stream = cast(AsyncGenerator[Message, None], query(prompt=prompt, options=options))
+    async with aclosing(stream):
+        async for message in stream:
+            yield message
@@ -0,0 +1,527 @@
+"""
+ATS Page Extraction
+===================
+
+Post-tool-use hook that reduces fetched ATS job pages to compact structured records.
+
+Raw Greenhouse/Lever/Ashby/Workable pages are mostly markup, navigation and
+boilerplate. The model only needs a handful of fields to score a posting, so
+WebFetch results for known ATS domains are replaced by a small record.
+"""
+
+import json
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup, Tag
+
+# Host suffix -> ATS platform name
+ATS_DOMAINS: dict[str, str] = {
+    "greenhouse.io": "greenhouse",
+    "lever.co": "lever",
+    "ashbyhq.com": "ashby",
+    "workable.com": "workable",
+}
+
+# Section headings that introduce requirement / responsibility lists
+REQUIREMENT_HEADINGS = re.compile(
+    r"requirement|qualification|what you.?ll (?:need|bring)|you (?:have|bring|are)|"
+    r"about you|skills|experience|must have|nice to have|who you are",
+    re.IGNORECASE,
+)
+RESPONSIBILITY_HEADINGS = re.compile(
+    r"responsibilit|what you.?ll (?:do|work on)|the role|your role|in this role|"
+    r"you will|day.to.day|what we.?re looking for you to do|duties",
+    re.IGNORECASE,
+)
+
+SALARY_PATTERN = re.compile(
+    r"(?:[$£€]\s?\d[\d,.]*\s?[kK]?(?:\s?(?:-|–|—|to)\s?[$£€]?\s?\d[\d,.]*\s?[kK]?)?"
+    r"(?:\s?(?:USD|EUR|GBP|CAD))?(?:\s?(?:/|per)\s?(?:year|yr|annum|hour|hr))?)",
+)
+
+# Technologies worth surfacing in the stack field
+TECH_KEYWORDS: tuple[str, ...] = (
+    "Python",
+    "Go",
+    "Golang",
+    "Java",
+    "Kotlin",
+    "Scala",
+    "Rust",
+    "TypeScript",
+    "JavaScript",
+    "Ruby",
+    "C++",
+    "C#",
+    "Node.js",
+    "React",
+    "AWS",
+    "GCP",
+    "Azure",
+    "Kubernetes",
+    "Docker",
+    "Terraform",
+    "Pulumi",
+    "Ansible",
+    "Helm",
+    "ArgoCD",
+    "Istio",
+    "Linkerd",
+    "Kafka",
+    "Spark",
+    "Flink",
+    "Airflow",
+    "PostgreSQL",
+    "Postgres",
+    "MySQL",
+    "Redis",
+    "DynamoDB",
+    "Cassandra",
+    "MongoDB",
+    "Elasticsearch",
+    "Snowflake",
+    "BigQuery",
+    "Datadog",
+    "Prometheus",
+    "Grafana",
+    "OpenTelemetry",
+    "Jaeger",
+    "Vault",
+    "GitHub Actions",
+    "CircleCI",
+    "Jenkins",
+    "Buildkite",
+    "gRPC",
+    "GraphQL",
+    "Linux",
+    "Spring",
+    "Spring Boot",
+    "Django",
+    "FastAPI",
+    "Rails",
+)
+TECH_PATTERN = re.compile(
+    r"(?<![\w+#])("
+    + "|".join(re.escape(t) for t in sorted(TECH_KEYWORDS, key=len, reverse=True))
+    + r")(?![\w+#])",
+)
+
+MAX_ITEMS = 12
+MAX_ITEM_CHARS = 200
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+def detect_platform(url: str) -> str | None:
+    """Return the ATS platform for a URL, or None if it is not a known ATS."""
+    host = urlparse(url).hostname or ""
+    for suffix, platform in ATS_DOMAINS.items():
+        if host == suffix or host.endswith("." + suffix):
+            return platform
+    return None
+
+
+@dataclass
+class JobPageRecord:
+    """Compact structured view of a fetched job page."""
+
+    url: str
+    platform: str
+    title: str = ""
+    company: str = ""
+    location: str = ""
+    salary: str = ""
+    requirements: list[str] = field(default_factory=list)
+    responsibilities: list[str] = field(default_factory=list)
+    stack: list[str] = field(default_factory=list)
+    # Full page text; kept for the posting archive, not shown to the model
+    text: str = field(default="", repr=False)
+
+    def is_useful(self) -> bool:
+        """Whether enough was extracted to stand in for the raw page."""
+        return bool(self.title) and bool(self.requirements or self.responsibilities)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary, dropping empty fields."""
+        data = {
+            "url": self.url,
+            "platform": self.platform,
+            "title": self.title,
+            "company": self.company,
+            "location": self.location,
+            "salary": self.salary,
+            "requirements": self.requirements,
+            "responsibilities": self.responsibilities,
+            "stack": self.stack,
+        }
+        return {k: v for k, v in data.items() if v}
+
+    def to_text(self) -> str:
+        """Render the record as the text the model sees."""
+        return "[Extracted job posting]\n" + json.dumps(self.to_dict(), separators=(",", ":"))
+
+
+def _clean(text: str) -> str:
+    """Collapse whitespace and trim overly long items."""
+    text = " ".join(text.split())
+    if len(text) > MAX_ITEM_CHARS:
+        text = text[: MAX_ITEM_CHARS - 3].rstrip() + "..."
+    return text
+
+
+def _find_stack(text: str) -> list[str]:
+    """Find known technologies mentioned in text, in first-seen order."""
+    seen: dict[str, None] = {}
+    for match in TECH_PATTERN.finditer(text):
+        seen.setdefault(match.group(1), None)
+    return list(seen)
+
+
+def _find_salary(text: str) -> str:
+    """Find the first salary-looking range in text."""
+    for match in SALARY_PATTERN.finditer(text):
+        value = match.group(0).strip()
+        # Ignore lone small amounts like "$5" in benefits copy
+        if re.search(r"\d{2,}", value):
+            return value
+    return ""
+
+
+def _text_sections(lines: list[tuple[bool, str]]) -> tuple[list[str], list[str]]:
+    """
+    Split (is_heading, text) lines into requirement and responsibility items.
+
+    Items are collected under the most recent heading that matches one of
+    the section patterns.
+    """
+    requirements: list[str] = []
+    responsibilities: list[str] = []
+    current: list[str] | None = None
+
+    for is_heading, text in lines:
+        if is_heading:
+            if RESPONSIBILITY_HEADINGS.search(text):
+                current = responsibilities
+            elif REQUIREMENT_HEADINGS.search(text):
+                current = requirements
+            else:
+                current = None
+            continue
+        if current is not None and len(current) < MAX_ITEMS and text:
+            current.append(_clean(text))
+
+    return requirements, responsibilities
+
+
+def _html_lines(root: Tag) -> list[tuple[bool, str]]:
+    """Flatten HTML into heading / list-item lines in document order."""
+    lines: list[tuple[bool, str]] = []
+    for el in root.find_all(["h1", "h2", "h3", "h4", "h5", "strong", "b", "p", "li"]):
+        text = el.get_text(" ", strip=True)
+        if not text:
+            continue
+        if el.name in ("h1", "h2", "h3", "h4", "h5"):
+            lines.append((True, text))
+        elif el.name in ("strong", "b", "p"):
+            # Bold-only paragraphs are commonly used as section headings
+            if el.name == "p" and el.find(["strong", "b"]) is None:
+                continue
+            if len(text) <= 80:
+                lines.append((True, text))
+        else:
+            lines.append((False, text))
+    return lines
+
+
+def _markdown_lines(text: str) -> list[tuple[bool, str]]:
+    """Flatten markdown / plain text into heading / bullet lines."""
+    lines: list[tuple[bool, str]] = []
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        if line.startswith("#"):
+            lines.append((True, line.lstrip("#").strip()))
+        elif line.startswith(("- ", "* ", "• ")) or re.match(r"^\d+[.)]\s", line):
+            lines.append((False, re.sub(r"^(?:[-*•]|\d+[.)])\s+", "", line)))
+        elif (line.startswith("**") and line.endswith("**")) or (
+            line.endswith(":") and len(line) <= 80
+        ):
+            lines.append((True, line.strip("*: ")))
+    return lines
+
+
+def _json_ld_posting(soup: BeautifulSoup) -> dict[str, Any]:
+    """Return the schema.org JobPosting embedded in the page, if any."""
+    for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
+        try:
+            data = json.loads(script.string or "")
+        except (json.JSONDecodeError, TypeError):
+            continue
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict) and item.get("@type") == "JobPosting":
+                return item
+    return {}
+
+
+def _apply_json_ld(record: JobPageRecord, posting: dict[str, Any]) -> str:
+    """Fill record fields from a JobPosting and return its description HTML."""
+    record.title = record.title or _clean(str(posting.get("title", "")))
+    org = posting.get("hiringOrganization")
+    if isinstance(org, dict):
+        record.company = record.company or _clean(str(org.get("name", "")))
+
+    locations = posting.get("jobLocation")
+    places = []
+    for loc in locations if isinstance(locations, list) else [locations]:
+        if isinstance(loc, dict) and isinstance(loc.get("address"), dict):
+            addr = loc["address"]
+            parts = [
+                addr.get("addressLocality"),
+                addr.get("addressRegion"),
+                addr.get("addressCountry"),
+            ]
+            places.append(", ".join(str(p) for p in parts if p))
+    if posting.get("jobLocationType") == "TELECOMMUTE":
+        places.insert(0, "Remote")
+    if places and not record.location:
+        record.location = _clean("; ".join(p for p in places if p))
+
+    salary = posting.get("baseSalary")
+    if isinstance(salary, dict) and isinstance(salary.get("value"), dict) and not record.salary:
+        value = salary["value"]
+        low, high = value.get("minValue"), value.get("maxValue")
+        currency = salary.get("currency", "")
+        if low or high:
+            record.salary = " - ".join(str(v) for v in (low, high) if v)
+            record.salary = f"{record.salary} {currency}".strip()
+
+    return str(posting.get("description", ""))
+
+
+def _select_text(soup: BeautifulSoup, *selectors: str) -> str:
+    """Text of the first element matching any CSS selector."""
+    for selector in selectors:
+        el = soup.select_one(selector)
+        if el is not None:
+            text = el.get_text(" ", strip=True)
+            if text:
+                return _clean(text)
+    return ""
+
+
+def _extract_greenhouse(soup: BeautifulSoup, record: JobPageRecord) -> Tag | None:
+    record.title = record.title or _select_text(soup, "h1.app-title", ".job__title h1", "h1")
+    record.company = record.company or _select_text(soup, ".company-name", ".job__company")
+    record.location = record.location or _select_text(soup, ".location", ".job__location")
+    return soup.select_one("#content, .job__description, #app_body")
+
+
+def _extract_lever(soup: BeautifulSoup, record: JobPageRecord) -> Tag | None:
+    record.title = record.title or _select_text(soup, ".posting-headline h2", "h2")
+    record.location = record.location or _select_text(
+        soup, ".posting-categories .location", ".sort-by-location"
+    )
+    return soup.select_one(".posting-page .content, .section-wrapper.page-full-width")
+
+
+def _extract_ashby(soup: BeautifulSoup, record: JobPageRecord) -> Tag | None:
+    record.title = record.title or _select_text(soup, "h1[class*='title']", "h1")
+    record.location = record.location or _select_text(
+        soup, "[class*='location'] p", "[class*='location']"
+    )
+    return soup.select_one("[class*='descriptionText'], [class*='description']")
+
+
+def _extract_workable(soup: BeautifulSoup, record: JobPageRecord) -> Tag | None:
+    record.title = record.title or _select_text(soup, "[data-ui='job-title']", "h1")
+    record.location = record.location or _select_text(
+        soup, "[data-ui='job-location']", "[class*='location']"
+    )
+    return soup.select_one("[data-ui='job-description'], [data-ui='job-requirements']") or (
+        soup.select_one("main")
+    )
+
+
+# Platform -> extractor filling title/company/location and returning the description root
+EXTRACTORS: dict[str, Callable[[BeautifulSoup, JobPageRecord], Tag | None]] = {
+    "greenhouse": _extract_greenhouse,
+    "lever": _extract_lever,
+    "ashby": _extract_ashby,
+    "workable": _extract_workable,
+}
+
+
+def _looks_like_html(content: str) -> bool:
+    return bool(re.search(r"<(?:html|body|div|script|h1|ul)\b", content[:5000], re.IGNORECASE))
+
+
+def extract_job_page(url: str, content: str) -> JobPageRecord | None:
+    """
+    Extract a structured record from fetched page content.
+
+    Handles both raw HTML and the markdown-ish text WebFetch may return.
+
+    Args:
+        url: The fetched URL
+        content: Page content
+
+    Returns:
+        JobPageRecord, or None if the URL is not a known ATS page
+    """
+    platform = detect_platform(url)
+    if platform is None:
+        return None
+
+    record = JobPageRecord(url=url, platform=platform)
+
+    if _looks_like_html(content):
+        soup = BeautifulSoup(content, "html.parser")
+        description = _apply_json_ld(record, _json_ld_posting(soup))
+
+        root = EXTRACTORS[platform](soup, record)
+        if description:
+            root = BeautifulSoup(description, "html.parser")
+        for script in (root or soup).find_all(["script", "style", "noscript"]):
+            script.decompose()
+        lines = _html_lines(root or soup)
+        text = (root or soup).get_text(" ", strip=True)
+    else:
+        lines = _markdown_lines(content)
+        text = content
+        for is_heading, line in lines:
+            if is_heading and not record.title:
+                record.title = _clean(line)
+                break
+
+    record.requirements, record.responsibilities = _text_sections(lines)
+    record.salary = record.salary or _find_salary(text)
+    record.stack = _find_stack(text)[: MAX_ITEMS * 2]
+    record.text = text
+    return record
+
+
+@dataclass
+class ReductionStats:
+    """Token accounting for reduced pages."""
+
+    pages: int = 0
+    tokens_before: int = 0
+    tokens_after: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "pages": self.pages,
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens_after,
+        }
+
+
+def _response_text(response: Any) -> str:
+    """Pull the page text out of a WebFetch tool response."""
+    if isinstance(response, str):
+        return response
+    if isinstance(response, dict):
+        for key in ("result", "content", "text"):
+            text = response.get(key)
+            if isinstance(text, str):
+                return text
+    return ""
+
+
+def _replace_response_text(response: Any, text: str) -> Any:
+    """Return a tool response with the same shape but new page text."""
+    if isinstance(response, dict):
+        updated = dict(response)
+        for key in ("result", "content", "text"):
+            if isinstance(updated.get(key), str):
+                updated[key] = text
+                return updated
+    return text
+
+
+class ContentReducer:
+    """
+    Post-tool-use hook that swaps raw ATS pages for structured records.
+
+    Tracks estimated tokens per fetched page before and after reduction.
+    """
+
+    def __init__(
+        self,
+        on_page: Callable[[str, int, int], None] | None = None,
+        on_posting: Callable[[JobPageRecord], None] | None = None,
+    ):
+        """
+        Initialize the reducer.
+
+        Args:
+            on_page: Optional callback(url, tokens_before, tokens_after) per reduced page
+            on_posting: Optional callback(record) per job posting extracted, reduced or not
+        """
+        self.stats = ReductionStats()
+        self.on_page = on_page
+        self.on_posting = on_posting
+
+    def reduce(self, url: str, content: str) -> str | None:
+        """Return the reduced text for a page, or None to keep it unchanged."""
+        record = extract_job_page(url, content)
+        if record is None or not record.is_useful():
+            return None
+        if self.on_posting:
+            self.on_posting(record)
+
+        reduced = record.to_text()
+        before, after = estimate_tokens(content), estimate_tokens(reduced)
+        if after >= before:
+            return None
+
+        self.stats.pages += 1
+        self.stats.tokens_before += before
+        self.stats.tokens_after += after
+        if self.on_page:
+            self.on_page(url, before, after)
+        return reduced
+
+    async def hook(
+        self,
+        input_data: dict[str, Any],
+        tool_use_id: str | None = None,
+        context: Any | None = None,
+    ) -> dict[str, Any]:
+        """
+        Post-tool-use hook for WebFetch.
+
+        Returns empty dict to keep the output, or an updated tool output.
+        """
+        if input_data.get("tool_name") != "WebFetch":
+            return {}
+
+        url = input_data.get("tool_input", {}).get("url", "")
+        response = input_data.get("tool_response")
+        content = _response_text(response)
+        if not url or not content:
+            return {}
+
+        reduced = self.reduce(url, content)
+        if reduced is None:
+            return {}
+
+        return {
+            "hookSpecificOutput": {
+                "hookEventName": "PostToolUse",
+                "updatedToolOutput": _replace_response_text(response, reduced),
+            }
+        }
@@ -67,7 +67,7 @@ Environment Variables:
         type=str,
         choices=["upwork", "fiverr", "freelancer", "toptal", "all"],
         default="all",
-        help="Freelance platform to focus on (default: all)",
+        help="Freelance platform to focus on (default: all, searched concurrently)",
     )
 
     parser.add_argument(
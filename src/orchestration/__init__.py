@@ -3,12 +3,13 @@ Python Orchestration System for Multi-Agent Job Search
 =======================================================
 
 Manages parallel job search agents using the claude_agent_sdk.
+
+Exports are loaded on first access so that importing the package (and
+running read-only CLI commands) does not import the agent SDK.
 """
 
-from .coordinator import Coordinator
-from .agent_runner import AgentRunner
-from .merger import merge_outputs
-from .state import AgentState, OrchestrationState
+from importlib import import_module
+from typing import Any
 
 __all__ = [
     "Coordinator",
@@ -17,3 +18,20 @@ __all__ = [
     "AgentState",
     "OrchestrationState",
 ]
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    "Coordinator": ".coordinator",
+    "AgentRunner": ".agent_runner",
+    "merge_outputs": ".merger",
+    "AgentState": ".state",
+    "OrchestrationState": ".state",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
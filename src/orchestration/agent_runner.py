@@ -7,16 +7,43 @@ Runs individual job search agents within the orchestration framework.
 
 import asyncio
 import json
+from contextlib import AbstractAsyncContextManager, aclosing, nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable
-
-from claude_agent_sdk import ClaudeAgentOptions, AssistantMessage, TextBlock, ToolUseBlock
-
-from ..client import run_query
+from typing import Any
+
+from claude_agent_sdk import (
+    AssistantMessage,
+    ClaudeAgentOptions,
+    HookMatcher,
+    ResultMessage,
+    TextBlock,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
+
+from ..client import hook_matcher, run_query
+from ..extraction import ContentReducer, JobPageRecord
+from ..security import DEFAULT_POLICY
+from .archive import PostingArchive
+from .breaker import BLOCKED, FETCH_FAILED, PlatformBreakers, is_fetch_failure
+from .company_cache import CompanyCache
+from .company_tools import COMPANY_TOOL_NAMES, create_company_server
 from .config import get_agent_prompt, PROJECT_ROOT
-from .state import AgentState, StateManager, now_iso
-from .types import AgentConfig, AgentStatus
+from .events import AGENT_COMPLETED, ITERATION_STARTED, JOB_FOUND, SESSION_STALLED, EventBus
+from .ledger import Usage, record_session
+from .session_log import SESSION_LOG_FILE, SessionLogSink
+from .state import JOBS_FILES, AgentState, StateManager, find_agent_file, now_iso
+from .telemetry import SessionRecorder, ToolLatencies
+from .ratelimit import HostRateLimiter
+from .seen import SeenUrls
+from .seen_tools import SEEN_TOOL_NAMES, create_seen_server
+from .types import AgentConfig, AgentStatus, SearchSettings, SessionLimits
+from .watchdog import SessionStalledError, watch_stream
+
+# Longest single wait while paused by an open circuit, so stop signals are noticed
+CIRCUIT_POLL_SECONDS = 5
 
 
 class AgentRunner:
@@ -32,6 +59,15 @@ class AgentRunner:
         output_dir: Path,
         state_manager: StateManager,
         max_iterations: int | None = None,
+        company_cache: CompanyCache | None = None,
+        events: EventBus | None = None,
+        session_limits: SessionLimits | None = None,
+        log_sink: SessionLogSink | None = None,
+        breakers: PlatformBreakers | None = None,
+        rate_limiter: HostRateLimiter | None = None,
+        search: SearchSettings | None = None,
+        seen: SeenUrls | None = None,
+        archive: PostingArchive | None = None,
     ):
         """
         Initialize the agent runner.
@@ -41,15 +77,39 @@ class AgentRunner:
             output_dir: Output directory for this agent
             state_manager: State manager for reading/writing state
             max_iterations: Maximum iterations (None for unlimited)
+            company_cache: Shared company research cache (None to disable)
+            events: Event bus for progress events (None to disable)
+            session_limits: Per-session deadline and inactivity timeout
+            log_sink: Shared session log writer (defaults to a private one)
+            breakers: Shared platform circuit breakers (None to disable)
+            rate_limiter: Shared per-host limiter for WebFetch/WebSearch (None to disable)
+            search: Web search settings (results per query)
+            seen: Shared set of already-scored job URLs (None to disable)
+            archive: Shared archive of fetched posting text (None to disable)
         """
         self.config = config
         self.output_dir = Path(output_dir)
         self.state_manager = state_manager
         self.max_iterations = max_iterations
+        self.company_cache = company_cache
+        self.events = events
+        self.session_limits = session_limits or SessionLimits()
+        self.log_sink = log_sink or SessionLogSink()
+        self.breakers = breakers
+        self.rate_limiter = rate_limiter
+        self.search = search or SearchSettings()
+        self.seen = seen
+        self.archive = archive
+        self._jobs_seen: int | None = None
         self.state = AgentState(
             agent_id=config.id,
             platform=config.platform,
         )
+        self.reducer = ContentReducer(
+            on_page=self._log_reduced_page, on_posting=self._archive_posting
+        )
+        self.tool_latencies = ToolLatencies()
+        self.usage = Usage()
 
     def _create_options(self) -> ClaudeAgentOptions:
         """Create Claude agent options for this agent."""
@@ -86,18 +146,133 @@ Guidelines:
 4. Log progress to session.log
 5. Create complete.flag when done
 6. If stuck, write to blocked.md and continue
+7. Use at most {self.search.max_results_per_query} results from each search query
+"""
+
+        allowed_tools = [
+            "Read", "Write", "Edit", "Glob", "Grep", "Bash", "WebSearch", "WebFetch", "TodoWrite",
+        ]
+        mcp_servers = {}
+        guideline = 8
+        if self.company_cache is not None:
+            system_prompt += f"""{guideline}. Before researching a company, call lookup_company and
+   only research the fields it reports missing; afterwards call record_company
+   with what you found
+"""
+            guideline += 1
+            allowed_tools += COMPANY_TOOL_NAMES
+            mcp_servers["company_cache"] = create_company_server(
+                self.company_cache, holder=f"agent-{self.config.id}"
+            )
+        if self.seen is not None:
+            system_prompt += f"""{guideline}. Pass posting URLs from search results to filter_seen_urls
+   and only fetch the ones it returns as new; the others were already scored
 """
+            allowed_tools += SEEN_TOOL_NAMES
+            mcp_servers["seen_urls"] = create_seen_server(self.seen)
+
+        pre_tool_hooks = [hook_matcher("Bash", DEFAULT_POLICY.hook)]
+        if self.seen is not None:
+            pre_tool_hooks.append(hook_matcher("WebFetch", self.seen.hook))
+        if self.rate_limiter is not None:
+            pre_tool_hooks.append(
+                hook_matcher("WebFetch|WebSearch", self.rate_limiter.hook)
+            )
 
         return ClaudeAgentOptions(
             system_prompt=system_prompt,
             max_turns=100,
             cwd=str(self.output_dir),
-            allowed_tools=["Read", "Write", "Edit", "Glob", "Grep", "Bash", "WebSearch", "WebFetch", "TodoWrite"],
+            allowed_tools=allowed_tools,
+            mcp_servers=mcp_servers,
             permission_mode="acceptEdits",
+            hooks={
+                "PreToolUse": pre_tool_hooks,
+                "PostToolUse": [
+                    hook_matcher("WebFetch", self.reducer.hook),
+                    self._fetch_failure_hook(),
+                    self._progress_hook(),
+                ],
+            },
         )
 
-    def _update_state(self, **updates) -> None:
-        """Update and persist agent state."""
+    def _progress_hook(self) -> HookMatcher:
+        """
+        PostToolUse hook that refreshes the job count whenever jobs.json is
+        written, and reports blocked.md writes to the circuit breaker.
+        """
+        async def on_file_written(
+            input_data: dict[str, Any], tool_use_id: str | None, context: Any
+        ) -> dict[str, Any]:
+            path = input_data.get("tool_input", {}).get("file_path", "")
+            if Path(path).name == "jobs.json":
+                self._update_state()
+                self._record_seen()
+            elif Path(path).name == "blocked.md":
+                self._record_failure(BLOCKED, "wrote blocked.md")
+            return {}
+
+        return hook_matcher("Write|Edit|MultiEdit", on_file_written)
+
+    def _record_seen(self) -> None:
+        """Add this agent's scored jobs to the shared seen-URL set."""
+        if self.seen is None:
+            return
+        try:
+            with open(find_agent_file(self.output_dir, JOBS_FILES)) as f:
+                jobs = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+        if isinstance(jobs, list):
+            self.seen.record_jobs(jobs, source=f"agent-{self.config.id}")
+
+    def _fetch_failure_hook(self) -> HookMatcher:
+        """PostToolUse hook that reports error and block pages from WebFetch."""
+        async def on_fetch(
+            input_data: dict[str, Any], tool_use_id: str | None, context: Any
+        ) -> dict[str, Any]:
+            if is_fetch_failure(input_data.get("tool_response")):
+                self._record_failure(FETCH_FAILED, input_data.get("tool_input", {}).get("url", ""))
+            return {}
+
+        return hook_matcher("WebFetch", on_fetch)
+
+    def _record_failure(self, kind: str, detail: str = "") -> None:
+        """Report a failure signal for this agent's platform."""
+        if self.breakers is not None:
+            self.breakers.record_failure(self.config.platform, kind, detail)
+
+    def _session_slot(self) -> AbstractAsyncContextManager[Any]:
+        """Session slot that records the session's outcome on the platform's breaker."""
+        if self.breakers is None:
+            return nullcontext()
+        return self.breakers.session(self.config.platform)
+
+    async def _wait_for_circuit(self) -> bool:
+        """
+        Wait until the platform's circuit admits a session.
+
+        Returns:
+            False if a stop signal arrived while waiting
+        """
+        if self.breakers is None:
+            return True
+        breaker = self.breakers.get(self.config.platform)
+        wait = breaker.admit()
+        if wait:
+            print(f"\n[Agent {self.config.id}] Circuit open ({breaker.reason}); pausing")
+            self._log(f"Paused: circuit open ({breaker.reason})")
+            self._update_state()
+        while wait:
+            await asyncio.sleep(min(wait, CIRCUIT_POLL_SECONDS))
+            if self.should_stop():
+                return False
+            wait = breaker.admit()
+        return True
+
+    def _update_state(self, **updates: Any) -> None:
+        """Update and persist agent state, publishing progress events."""
+        previous_status = self.state.status
         for key, value in updates.items():
             if hasattr(self.state, key):
                 setattr(self.state, key, value)
@@ -105,18 +280,63 @@ Guidelines:
         # Update job count from file
         self.state.jobs_found = self.state_manager.count_jobs(self.config.id)
 
+        # Fetched-page token accounting
+        self.state.pages_reduced = self.reducer.stats.pages
+        self.state.page_tokens_before = self.reducer.stats.tokens_before
+        self.state.page_tokens_after = self.reducer.stats.tokens_after
+
+        # Token and cost totals for this run
+        self.usage.apply_to(self.state)
+
+        if self.breakers is not None:
+            breaker = self.breakers.get(self.config.platform)
+            self.state.circuit = breaker.state.value
+            self.state.circuit_reason = breaker.reason
+
         self.state_manager.write_agent_state(self.state)
 
+        jobs_seen = self._jobs_seen
+        self._jobs_seen = self.state.jobs_found
+        if jobs_seen is not None and self.state.jobs_found > jobs_seen:
+            self._publish(
+                JOB_FOUND, jobs_found=self.state.jobs_found, new=self.state.jobs_found - jobs_seen
+            )
+
+        if self.state.status != previous_status and self.state.status in (
+            AgentStatus.COMPLETED, AgentStatus.STOPPED, AgentStatus.ERROR,
+        ):
+            self._publish(
+                AGENT_COMPLETED,
+                status=self.state.status.value,
+                iterations=self.state.iteration,
+                jobs_found=self.state.jobs_found,
+            )
+
+    def _publish(self, event_type: str, **data: Any) -> None:
+        """Publish an event tagged with this agent."""
+        if self.events is not None:
+            self.events.publish(
+                event_type, agent_id=self.config.id, platform=self.config.platform, **data
+            )
+
     def should_stop(self) -> bool:
         """Check if agent should stop."""
         return self.state_manager.check_stop_signal()
 
     def _log(self, message: str) -> None:
-        """Append to session log."""
-        log_file = self.output_dir / "session.log"
+        """Queue a line for the session log."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(log_file, "a") as f:
-            f.write(f"[{timestamp}] {message}\n")
+        self.log_sink.write(self.output_dir / SESSION_LOG_FILE, f"[{timestamp}] {message}")
+
+    def _log_reduced_page(self, url: str, tokens_before: int, tokens_after: int) -> None:
+        """Record token savings for a reduced page."""
+        self._log(f"Reduced {url}: ~{tokens_before} -> ~{tokens_after} tokens")
+
+    def _archive_posting(self, record: JobPageRecord) -> None:
+        """Keep a fetched posting's text so it can be rescored offline."""
+        if self.archive is not None:
+            posting = {**record.to_dict(), "text": record.text}
+            self.archive.add(record.url, posting, source=f"agent-{self.config.id}")
 
     async def run(self) -> None:
         """
@@ -136,7 +356,7 @@ Guidelines:
 
         try:
             # Load platform-specific prompt
-            prompt = get_agent_prompt(self.config.platform)
+            prompt = self._get_initial_prompt()
 
             # Create agent options
             options = self._create_options()
@@ -152,26 +372,46 @@ Guidelines:
                     self._log("Stopped by orchestrator")
                     break
 
+                # Wait out an open circuit without holding a session slot
+                if not await self._wait_for_circuit():
+                    print(f"\n[Agent {self.config.id}] Stop signal received")
+                    self._update_state(status=AgentStatus.STOPPED)
+                    self._log("Stopped by orchestrator")
+                    break
+
                 # Update state
                 self._update_state(
                     iteration=iteration,
                     last_search=f"Iteration {iteration}",
                 )
                 self._log(f"Starting iteration {iteration}")
+                self._publish(ITERATION_STARTED, iteration=iteration)
 
                 print(f"\n[Agent {self.config.id}] Iteration {iteration}")
 
                 # Run agent session
                 try:
-                    await self._run_session(options, prompt if iteration == 1 else self._get_continue_prompt())
+                    async with self._session_slot():
+                        await self._run_session(
+                            options, prompt if iteration == 1 else self._get_continue_prompt()
+                        )
+                except SessionStalledError as e:
+                    print(f"\n[Agent {self.config.id}] {e}; moving on")
+                    self._log(f"Stalled in iteration {iteration}: {e}")
+                    self._update_state(
+                        stalls=self.state.stalls + 1,
+                        last_stall=f"iteration {iteration}: {e}",
+                    )
+                    self._publish(
+                        SESSION_STALLED, iteration=iteration, reason=e.reason, seconds=e.seconds
+                    )
                 except Exception as e:
                     print(f"\n[Agent {self.config.id}] Session error: {e}")
                     self._log(f"Error in iteration {iteration}: {e}")
                     # Continue to next iteration
 
-                # Check for completion flag
-                complete_flag = self.output_dir / "complete.flag"
-                if complete_flag.exists():
+                # Check for completion
+                if self._is_complete():
                     print(f"\n[Agent {self.config.id}] Completed!")
                     self._update_state(status=AgentStatus.COMPLETED)
                     self._log(f"Completed after {iteration} iterations")
@@ -193,18 +433,80 @@ Guidelines:
             )
             self._log(f"Fatal error: {e}")
             raise
+        finally:
+            await self.log_sink.flush()
 
     async def _run_session(self, options: ClaudeAgentOptions, prompt: str) -> None:
-        """Run a single agent session."""
-        async for message in run_query(prompt, options):
-            if isinstance(message, AssistantMessage):
-                for block in message.content:
-                    if isinstance(block, TextBlock):
-                        # Print abbreviated output
-                        text = block.text[:200] + "..." if len(block.text) > 200 else block.text
-                        print(f"[Agent {self.config.id}] {text}")
-                    elif isinstance(block, ToolUseBlock):
-                        print(f"[Agent {self.config.id}] [Tool: {block.name}]")
+        """
+        Run a single agent session, recording its events to sessions/*.jsonl.
+
+        Raises:
+            SessionStalledError: If the session exceeds its deadline or goes quiet
+        """
+        recorder = SessionRecorder.for_session(
+            self.output_dir / "sessions",
+            self.state.iteration,
+            self.tool_latencies,
+            agent_id=self.config.id,
+            platform=self.config.platform,
+        )
+        recorder.start()
+        result: dict[str, Any] = {}
+        error = None
+        try:
+            stream = watch_stream(run_query(prompt, options), self.session_limits)
+            async with aclosing(stream) as messages:
+                async for message in messages:
+                    result = self._handle_message(message, recorder) or result
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            recorder.end(error=error, **result)
+
+    def _handle_message(self, message: object, recorder: SessionRecorder) -> dict[str, Any] | None:
+        """Print and record one SDK message; returns session result fields for a ResultMessage."""
+        if isinstance(message, AssistantMessage):
+            recorder.turn()
+            for block in message.content:
+                if isinstance(block, TextBlock):
+                    # Print abbreviated output
+                    text = block.text[:200] + "..." if len(block.text) > 200 else block.text
+                    print(f"[Agent {self.config.id}] {text}")
+                elif isinstance(block, ToolUseBlock):
+                    recorder.tool_use(block.id, block.name, block.input)
+                    print(f"[Agent {self.config.id}] [Tool: {block.name}]")
+        elif isinstance(message, UserMessage) and isinstance(message.content, list):
+            for block in message.content:
+                if isinstance(block, ToolResultBlock):
+                    tool = recorder.tool_result(block.tool_use_id, bool(block.is_error))
+                    # A fetch the seen-URL hook skipped is not a platform failure
+                    denied = self.seen is not None and self.seen.pop_denied(block.tool_use_id)
+                    if block.is_error and tool == "WebFetch" and not denied:
+                        self._record_failure(FETCH_FAILED, "WebFetch error")
+        elif isinstance(message, ResultMessage):
+            usage = Usage.from_result(message.usage, message.total_cost_usd)
+            self.usage.add(usage)
+            record_session(
+                self.output_dir, usage,
+                iteration=self.state.iteration,
+                session_id=message.session_id,
+            )
+            return {
+                "num_turns": message.num_turns,
+                "sdk_duration_ms": message.duration_ms,
+                "is_error": message.is_error,
+                "cost_usd": usage.cost_usd,
+            }
+        return None
+
+    def _get_initial_prompt(self) -> str:
+        """Get prompt for the first iteration."""
+        return get_agent_prompt(self.config.platform)
+
+    def _is_complete(self) -> bool:
+        """Check whether the agent has signalled completion."""
+        return (self.output_dir / "complete.flag").exists()
 
     def _get_continue_prompt(self) -> str:
         """Get prompt for continuation iterations."""
@@ -212,7 +514,7 @@ Guidelines:
 
 Check your progress:
 1. Read jobs.json to see what you've found so far
-2. Look at session.log for your previous searches
+2. Look at recent.log for your latest activity (session.log has the full history)
 3. Try new search queries you haven't done yet
 4. Add any new jobs you find to jobs.json
 
@@ -0,0 +1,247 @@
+"""
+Posting Archive
+===============
+
+Keeps the extracted text of every fetched job posting, so postings can be
+rescored offline when the profile or thresholds change.
+
+    archive/postings.zst    compressed posting frames, appended in fetch order
+    archive/index.sqlite    URL -> (offset, length, codec, dictionary) index,
+                            plus the trained dictionaries
+
+Each posting is compressed on its own, so any one can be read back with a
+single seek. Postings are short and share most of their boilerplate, which
+per-record compression handles badly on its own; once `train_after`
+postings are stored, the next merge trains a zstd dictionary on them and
+every later frame uses it. A new dictionary is trained each time the
+archive doubles. Older frames keep the dictionary they were written with.
+Training happens at merge time, not while agents fetch, so it never
+stalls the coordinator's event loop.
+
+zstd needs the optional `zstandard` package (pip install zstandard).
+Without it, postings are stored with zlib and no dictionary.
+
+The archive lives under output/archive, which `make reset` leaves alone.
+"""
+
+import json
+import sqlite3
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install zstandard
+    zstandard = None  # type: ignore[assignment, unused-ignore]
+
+from .publish import content_hash, dumps_compact
+from .snapshots import canonical_url
+from .state import now_iso
+from .types import ArchivePolicy
+
+ARCHIVE_DIR = "archive"
+DATA_FILE = "postings.zst"
+INDEX_FILE = "index.sqlite"
+
+ZSTD = "zstd"
+ZLIB = "zlib"
+
+# Frames are written from a WebFetch hook; the dictionary does most of the work
+ZSTD_LEVEL = 3
+
+# Most recent postings used to train a dictionary
+MAX_TRAINING_SAMPLES = 2000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings (
+    url TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    codec TEXT NOT NULL,
+    dictionary INTEGER,
+    content_hash TEXT NOT NULL,
+    source TEXT,
+    fetched_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dictionaries (
+    id INTEGER PRIMARY KEY,
+    samples INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    created_at TEXT NOT NULL
+);
+"""
+
+
+class PostingArchive:
+    """Append-only, randomly accessible store of fetched postings."""
+
+    def __init__(self, directory: Path, policy: ArchivePolicy | None = None):
+        self.directory = Path(directory)
+        self.policy = policy or ArchivePolicy()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.data_file = self.directory / DATA_FILE
+        self._db = sqlite3.connect(self.directory / INDEX_FILE, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.executescript(SCHEMA)
+        self._dictionaries: dict[int, Any] = {}
+        self._compressor: tuple[int | None, Any] | None = None
+
+    def __len__(self) -> int:
+        count: int = self._db.execute("SELECT count(*) FROM postings").fetchone()[0]
+        return count
+
+    def _dictionary(self, dict_id: int) -> Any:
+        if dict_id not in self._dictionaries:
+            row = self._db.execute(
+                "SELECT data FROM dictionaries WHERE id = ?", (dict_id,)
+            ).fetchone()
+            self._dictionaries[dict_id] = zstandard.ZstdCompressionDict(row[0])
+        return self._dictionaries[dict_id]
+
+    def _latest_dictionary(self) -> tuple[int | None, int]:
+        """(id, samples trained on) of the newest dictionary."""
+        row = self._db.execute(
+            "SELECT id, samples FROM dictionaries ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        return (row[0], row[1]) if row else (None, 0)
+
+    def _compress(self, body: bytes) -> tuple[bytes, str, int | None]:
+        """(frame, codec, dictionary id) for a posting body."""
+        if zstandard is None:
+            return zlib.compress(body, 9), ZLIB, None
+        dict_id, _ = self._latest_dictionary()
+        if self._compressor is None or self._compressor[0] != dict_id:
+            kwargs = {"dict_data": self._dictionary(dict_id)} if dict_id is not None else {}
+            self._compressor = (dict_id, zstandard.ZstdCompressor(level=ZSTD_LEVEL, **kwargs))
+        return self._compressor[1].compress(body), ZSTD, dict_id
+
+    def _decompress(self, frame: bytes, codec: str, dict_id: int | None) -> bytes:
+        if codec == ZLIB:
+            return zlib.decompress(frame)
+        if zstandard is None:
+            raise RuntimeError("Reading zstd postings needs zstandard: pip install zstandard")
+        kwargs = {"dict_data": self._dictionary(dict_id)} if dict_id is not None else {}
+        return zstandard.ZstdDecompressor(**kwargs).decompress(frame)
+
+    def add(self, url: str, posting: dict[str, Any], source: str = "") -> bool:
+        """
+        Archive a posting under its canonical URL.
+
+        Returns:
+            False if the same content is already archived for the URL
+        """
+        key = canonical_url(url)
+        body = dumps_compact(posting)
+        digest = content_hash(body)
+        row = self._db.execute("SELECT content_hash FROM postings WHERE url = ?", (key,)).fetchone()
+        if row is not None and row[0] == digest:
+            return False
+
+        frame, codec, dict_id = self._compress(body)
+        # The frame is on disk before the index points at it; a crash in
+        # between only leaves unreferenced bytes at the end of the file
+        with open(self.data_file, "ab") as f:
+            offset = f.tell()
+            f.write(frame)
+            f.flush()
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO postings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, offset, len(frame), len(body), codec, dict_id, digest, source, now_iso()),
+            )
+        return True
+
+    def train_if_due(self) -> int | None:
+        """
+        Train a new dictionary once enough postings exist, and again each time they double.
+
+        Returns:
+            The new dictionary id, or None if none was trained
+        """
+        if zstandard is None:
+            return None
+        _, trained_on = self._latest_dictionary()
+        if len(self) < max(self.policy.train_after, 2 * trained_on):
+            return None
+        return self.train()
+
+    def train(self) -> int | None:
+        """
+        Train a dictionary on the most recent postings; later frames use it.
+
+        Returns:
+            The new dictionary id, or None if zstd is unavailable or training failed
+        """
+        if zstandard is None:
+            return None
+        samples: list[bytes | bytearray | memoryview] = [
+            body for _, body in self._bodies(limit=MAX_TRAINING_SAMPLES, newest_first=True)
+        ]
+        try:
+            trained = zstandard.train_dictionary(self.policy.dictionary_size, samples)
+        except zstandard.ZstdError:
+            # Too few or too uniform samples; keep the current dictionary
+            return None
+        with self._db:
+            cur = self._db.execute(
+                "INSERT INTO dictionaries (samples, data, created_at) VALUES (?, ?, ?)",
+                (len(self), trained.as_bytes(), now_iso()),
+            )
+        return cur.lastrowid
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        """The archived posting for `url`, or None."""
+        row = self._db.execute(
+            "SELECT offset, length, codec, dictionary FROM postings WHERE url = ?",
+            (canonical_url(url),),
+        ).fetchone()
+        if row is None:
+            return None
+        offset, length, codec, dict_id = row
+        with open(self.data_file, "rb") as f:
+            f.seek(offset)
+            posting: dict[str, Any] = json.loads(self._decompress(f.read(length), codec, dict_id))
+        return posting
+
+    def _bodies(
+        self,
+        limit: int | None = None,
+        newest_first: bool = False,
+    ) -> Iterator[tuple[str, bytes]]:
+        order = "DESC" if newest_first else "ASC"
+        rows = self._db.execute(
+            f"SELECT url, offset, length, codec, dictionary FROM postings "
+            f"ORDER BY fetched_at {order}, rowid {order} LIMIT ?",
+            (-1 if limit is None else limit,),
+        ).fetchall()
+        if not rows:
+            return
+        with open(self.data_file, "rb") as f:
+            for url, offset, length, codec, dict_id in rows:
+                f.seek(offset)
+                yield url, self._decompress(f.read(length), codec, dict_id)
+
+    def postings(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """(canonical URL, posting) pairs in fetch order."""
+        for url, body in self._bodies():
+            yield url, json.loads(body)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Posting count and compression totals."""
+        postings, size, stored = self._db.execute(
+            "SELECT count(*), coalesce(sum(size), 0), coalesce(sum(length), 0) FROM postings"
+        ).fetchone()
+        dictionaries = self._db.execute("SELECT count(*) FROM dictionaries").fetchone()[0]
+        return {
+            "postings": postings,
+            "bytes": size,
+            "stored_bytes": stored,
+            "file_bytes": self.data_file.stat().st_size if self.data_file.exists() else 0,
+            "dictionaries": dictionaries,
+        }
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,249 @@
+"""
+Platform Circuit Breakers
+=========================
+
+Pauses a platform whose source keeps failing instead of letting its
+agent burn full sessions against it.
+
+Failure signals (session errors, blocked.md writes and failed WebFetch
+calls) are counted per platform over a sliding window. Once they reach
+the threshold the platform's circuit opens: its agent waits out a
+cool-down without holding a session slot, so healthy platforms can use
+it. After the cool-down the circuit is half-open and a single probe
+session is let through; a clean probe closes the circuit, any failure
+during it opens it again.
+"""
+
+import asyncio
+import re
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from enum import StrEnum
+from typing import Any
+
+from .events import CIRCUIT_CHANGED, EventBus
+from .types import BreakerPolicy
+
+# Failure kinds
+SESSION_ERROR = "session_error"
+BLOCKED = "blocked"
+FETCH_FAILED = "fetch_failed"
+
+# Signs of a blocked or failed fetch at the start of a WebFetch response
+_FETCH_FAILURE = re.compile(
+    r"status code (?:403|429|5\d\d)|\b(?:403 Forbidden|429 Too Many Requests|Access Denied|"
+    r"captcha|ECONNREFUSED|ETIMEDOUT|ENOTFOUND)\b",
+    re.IGNORECASE,
+)
+
+
+class CircuitState(StrEnum):
+    """State of a platform's circuit."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def is_fetch_failure(response: Any) -> bool:
+    """Whether a WebFetch tool response looks like an error or a block page."""
+    if isinstance(response, dict):
+        if response.get("is_error") or response.get("error"):
+            return True
+        text = next(
+            (
+                response[k]
+                for k in ("result", "content", "text")
+                if isinstance(response.get(k), str)
+            ),
+            "",
+        )
+    else:
+        text = response if isinstance(response, str) else ""
+    return bool(_FETCH_FAILURE.search(text[:500]))
+
+
+class CircuitBreaker:
+    """Failure tracking and open/half-open/closed state for one platform."""
+
+    def __init__(
+        self,
+        platform: str,
+        policy: BreakerPolicy,
+        clock: Callable[[], float] = time.monotonic,
+        on_change: Callable[["CircuitBreaker"], None] | None = None,
+    ):
+        self.platform = platform
+        self.policy = policy
+        self.clock = clock
+        self.on_change = on_change
+        self.failures: deque[float] = deque()
+        self.failures_total = 0
+        self.trips = 0
+        self.reason = ""
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open circuit turns half-open once its cool-down ends."""
+        if self._state == CircuitState.OPEN and self.retry_after() == 0:
+            self._set(CircuitState.HALF_OPEN)
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit may be probed (0 if not open)."""
+        if self._state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.policy.cooldown_seconds - self.clock())
+
+    def admit(self) -> float:
+        """
+        Ask to start a session.
+
+        Returns:
+            0 if the session may start (claiming the probe when half-open),
+            otherwise seconds to wait before asking again
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return 0.0
+        if state == CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return 0.0
+        return self.retry_after() or self.policy.probe_poll_seconds
+
+    def record_failure(self, kind: str, detail: str = "") -> None:
+        """Count a failure signal, opening the circuit at the threshold."""
+        now = self.clock()
+        self.failures_total += 1
+        self.failures.append(now)
+        while self.failures and now - self.failures[0] > self.policy.window_seconds:
+            self.failures.popleft()
+        self.reason = f"{kind}: {detail}" if detail else kind
+
+        if self._state == CircuitState.HALF_OPEN or (
+            self._state == CircuitState.CLOSED
+            and len(self.failures) >= self.policy.failure_threshold
+        ):
+            self._open(now)
+
+    def record_success(self) -> None:
+        """Record a clean session, closing a half-open circuit."""
+        self.failures.clear()
+        if self._state == CircuitState.HALF_OPEN:
+            self.reason = ""
+            self._set(CircuitState.CLOSED)
+
+    def end_probe(self) -> None:
+        """Release the half-open probe claimed by admit()."""
+        self._probing = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "state": self.state.value,
+            "reason": self.reason,
+            "recent_failures": len(self.failures),
+            "failures_total": self.failures_total,
+            "trips": self.trips,
+            "retry_after_seconds": round(self.retry_after(), 1),
+        }
+
+    def _open(self, now: float) -> None:
+        self._opened_at = now
+        self.trips += 1
+        self.failures.clear()
+        self._set(CircuitState.OPEN)
+
+    def _set(self, state: CircuitState) -> None:
+        changed = state != self._state
+        self._state = state
+        if changed and self.on_change is not None:
+            self.on_change(self)
+
+
+class PlatformBreakers:
+    """Coordinator-wide breakers, one per platform, plus shared session slots."""
+
+    def __init__(
+        self,
+        policy: BreakerPolicy | None = None,
+        events: EventBus | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the breakers.
+
+        Args:
+            policy: Thresholds, cool-down and session slot limit
+            events: Event bus for circuit changes (None to disable)
+            clock: Monotonic clock, in seconds
+        """
+        self.policy = policy or BreakerPolicy()
+        self.events = events
+        self.clock = clock
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self._slots: asyncio.Semaphore | None = None
+
+    def get(self, platform: str) -> CircuitBreaker:
+        """The breaker for a platform, created on first use."""
+        breaker = self.breakers.get(platform)
+        if breaker is None:
+            breaker = CircuitBreaker(platform, self.policy, self.clock, on_change=self._changed)
+            self.breakers[platform] = breaker
+        return breaker
+
+    def record_failure(self, platform: str, kind: str, detail: str = "") -> None:
+        """Count a failure signal for a platform."""
+        self.get(platform).record_failure(kind, detail)
+
+    @asynccontextmanager
+    async def session(self, platform: str) -> AsyncIterator[CircuitBreaker]:
+        """
+        Hold a session slot for an admitted session and record its outcome.
+
+        A session that raises counts as a session error; one that ends
+        without any failure signal counts as a success.
+        """
+        breaker = self.get(platform)
+        if self._slots is None and self.policy.max_concurrent_sessions:
+            self._slots = asyncio.Semaphore(self.policy.max_concurrent_sessions)
+        try:
+            if self._slots is not None:
+                await self._slots.acquire()
+            try:
+                failures = breaker.failures_total
+                yield breaker
+            except Exception as e:
+                breaker.record_failure(SESSION_ERROR, str(e))
+                raise
+            else:
+                if breaker.failures_total == failures:
+                    breaker.record_success()
+            finally:
+                if self._slots is not None:
+                    self._slots.release()
+        finally:
+            breaker.end_probe()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Per-platform breaker state."""
+        return {platform: breaker.to_dict() for platform, breaker in sorted(self.breakers.items())}
+
+    def _changed(self, breaker: CircuitBreaker) -> None:
+        state = breaker._state
+        print(
+            f"\n[Circuit {breaker.platform}] {state.value}"
+            + (f" ({breaker.reason})" if breaker.reason else "")
+        )
+        if self.events is not None:
+            self.events.publish(
+                CIRCUIT_CHANGED,
+                platform=breaker.platform,
+                state=state.value,
+                reason=breaker.reason,
+            )
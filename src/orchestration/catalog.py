@@ -0,0 +1,312 @@
+"""
+Merged Job Catalog
+==================
+
+A SQLite copy of the merged job list (merged/jobs.sqlite) for fast,
+filtered and ranked search without the UI or Postgres.
+
+    companies   one row per company name
+    jobs        one row per job URL: scalar fields, the full record as JSON
+    job_tech    job -> tech stack entry
+    jobs_fts    FTS5 index over role, company, requirements, responsibilities
+
+B-tree indexes cover score, found date, platform and company (each
+ordered by score, which is how results are usually wanted), and tech.
+The catalog is rebuilt into a temporary file on every merge and renamed
+into place, so a running query never sees a half-built database.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from .stats import detect_platform
+
+CATALOG_FILE = "jobs.sqlite"
+
+# Bump when the schema changes
+CATALOG_VERSION = 1
+
+# bm25 column weights: role, company, requirements, responsibilities
+FTS_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+SORT_ORDERS = {
+    "score": "j.match_score DESC, j.id",
+    "date": "j.found_date DESC, j.match_score DESC",
+    "company": "c.name COLLATE NOCASE, j.match_score DESC",
+}
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE companies (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE jobs (
+    id INTEGER PRIMARY KEY,
+    job_url TEXT NOT NULL UNIQUE,
+    external_id TEXT,
+    company_id INTEGER NOT NULL REFERENCES companies(id),
+    role TEXT NOT NULL,
+    location TEXT,
+    salary TEXT,
+    platform TEXT NOT NULL,
+    found_date TEXT,
+    match_score INTEGER NOT NULL,
+    status TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE job_tech (
+    job_id INTEGER NOT NULL REFERENCES jobs(id),
+    tech TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (job_id, tech)
+) WITHOUT ROWID;
+"""
+
+INDEXES = """
+CREATE INDEX idx_jobs_score ON jobs(match_score DESC);
+CREATE INDEX idx_jobs_found_date ON jobs(found_date DESC);
+CREATE INDEX idx_jobs_platform ON jobs(platform, match_score DESC);
+CREATE INDEX idx_jobs_company ON jobs(company_id, match_score DESC);
+CREATE INDEX idx_job_tech ON job_tech(tech, job_id);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE jobs_fts USING fts5(
+    role, company, requirements, responsibilities,
+    content='', tokenize='porter unicode61'
+);
+"""
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, list):
+        return "\n".join(str(v) for v in value)
+    return str(value) if value else ""
+
+
+def has_fts5() -> bool:
+    """Whether this Python's SQLite was built with FTS5."""
+    try:
+        sqlite3.connect(":memory:").execute("CREATE VIRTUAL TABLE t USING fts5(a)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def write_catalog(
+    jobs: list[dict[str, Any]],
+    path: Path,
+    platform_domains: dict[str, str] | None = None,
+) -> int:
+    """
+    Build the catalog for `jobs` and atomically replace `path` with it.
+
+    Args:
+        jobs: Merged jobs
+        path: Destination, e.g. output/merged/jobs.sqlite
+        platform_domains: Domain -> platform, for jobs without ats_platform
+
+    Returns:
+        Number of jobs written
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    platform_domains = platform_domains or {}
+    fts = has_fts5()
+
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(tmp)
+        try:
+            # Nothing reads the temp file, so skip the journal entirely
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.executescript(SCHEMA)
+            if fts:
+                conn.executescript(FTS_SCHEMA)
+            count = _insert_jobs(conn, jobs, platform_domains, fts)
+            conn.executescript(INDEXES)
+            conn.executemany(
+                "INSERT INTO meta VALUES (?, ?)",
+                [
+                    ("version", str(CATALOG_VERSION)),
+                    ("fts", "1" if fts else "0"),
+                ],
+            )
+            conn.commit()
+            conn.execute("ANALYZE")
+            conn.commit()
+        finally:
+            conn.close()
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return count
+
+
+def _insert_jobs(
+    conn: sqlite3.Connection,
+    jobs: list[dict[str, Any]],
+    platform_domains: dict[str, str],
+    fts: bool,
+) -> int:
+    company_ids: dict[str, int] = {}
+    job_rows, tech_rows, fts_rows = [], [], []
+    seen: set[str] = set()
+    for job in jobs:
+        url = job.get("job_url", "")
+        if not url or url in seen:
+            continue
+        seen.add(url)
+        job_id = len(seen)
+        company = job.get("company") or "Unknown"
+        company_id = company_ids.setdefault(company, len(company_ids) + 1)
+        job_rows.append(
+            (
+                job_id,
+                url,
+                job.get("id"),
+                company_id,
+                job.get("role") or "",
+                job.get("location"),
+                job.get("salary"),
+                detect_platform(job, platform_domains),
+                job.get("found_date"),
+                job.get("match_score") or 0,
+                job.get("status"),
+                json.dumps(job, ensure_ascii=False),
+            )
+        )
+        for tech in {t for t in job.get("tech_stack") or [] if isinstance(t, str)}:
+            tech_rows.append((job_id, tech))
+        fts_rows.append(
+            (
+                job_id,
+                job.get("role") or "",
+                company,
+                _text(job.get("requirements")),
+                _text(job.get("responsibilities")),
+            )
+        )
+
+    conn.executemany(
+        "INSERT INTO companies VALUES (?, ?)", [(i, n) for n, i in company_ids.items()]
+    )
+    conn.executemany("INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", job_rows)
+    conn.executemany("INSERT OR IGNORE INTO job_tech VALUES (?, ?)", tech_rows)
+    if fts:
+        conn.executemany(
+            "INSERT INTO jobs_fts (rowid, role, company, requirements, responsibilities) "
+            "VALUES (?, ?, ?, ?, ?)",
+            fts_rows,
+        )
+    return len(job_rows)
+
+
+def fts_query(text: str) -> str:
+    """
+    Turn free text into an FTS5 query: every word must match, as a prefix.
+
+    Words are quoted so FTS5 operators and punctuation in the input are
+    taken literally.
+    """
+    terms = [word.replace('"', '""') for word in text.split()]
+    return " ".join(f'"{term}"*' for term in terms if term)
+
+
+def search_catalog(
+    path: Path,
+    text: str | None = None,
+    min_score: int | None = None,
+    platform: str | None = None,
+    company: str | None = None,
+    tech: str | None = None,
+    location: str | None = None,
+    since: str | None = None,
+    sort: str | None = None,
+    limit: int = 20,
+) -> list[dict[str, Any]]:
+    """
+    Search the catalog.
+
+    Args:
+        path: Catalog file
+        text: Free text matched against role, company, requirements and responsibilities
+        min_score: Minimum match_score
+        platform: ATS platform
+        company: Company name (case-insensitive)
+        tech: Tech stack entry (case-insensitive)
+        location: Substring of the location ("Remote" matches remote roles)
+        since: Earliest found_date (YYYY-MM-DD)
+        sort: "score", "date" or "company"; text searches default to relevance
+        limit: Maximum results
+
+    Returns:
+        Matching jobs (full records), each with "rank" set for text searches
+    """
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        fts = conn.execute("SELECT value FROM meta WHERE key = 'fts'").fetchone() == ("1",)
+        joins = ["JOIN companies c ON c.id = j.company_id"]
+        where: list[str] = []
+        params: list[Any] = []
+        relevance = "NULL"
+
+        if text and text.strip():
+            if fts:
+                joins.append("JOIN jobs_fts f ON f.rowid = j.id")
+                where.append("jobs_fts MATCH ?")
+                params.append(fts_query(text))
+                relevance = f"bm25(jobs_fts, {', '.join(str(w) for w in FTS_WEIGHTS)})"
+            else:
+                for word in text.split():
+                    where.append("(j.role LIKE ? OR c.name LIKE ? OR j.data LIKE ?)")
+                    params.extend([f"%{word}%"] * 3)
+        if min_score is not None:
+            where.append("j.match_score >= ?")
+            params.append(min_score)
+        if platform:
+            where.append("j.platform = ?")
+            params.append(platform.lower())
+        if company:
+            where.append("c.name = ? COLLATE NOCASE")
+            params.append(company)
+        if tech:
+            where.append("j.id IN (SELECT job_id FROM job_tech WHERE tech = ?)")
+            params.append(tech)
+        if location:
+            where.append("j.location LIKE ?")
+            params.append(f"%{location}%")
+        if since:
+            where.append("j.found_date >= ?")
+            params.append(since)
+
+        if sort is None and relevance != "NULL":
+            order = "relevance, j.match_score DESC"
+        else:
+            order = SORT_ORDERS[sort or "score"]
+
+        sql = (
+            f"SELECT j.data, {relevance} AS relevance FROM jobs j {' '.join(joins)}"
+            f"{' WHERE ' + ' AND '.join(where) if where else ''}"
+            f" ORDER BY {order} LIMIT ?"
+        )
+        rows = conn.execute(sql, [*params, limit]).fetchall()
+    finally:
+        conn.close()
+
+    results = []
+    for data, score in rows:
+        job = json.loads(data)
+        if score is not None:
+            # bm25 is lower-is-better; flip it so higher means more relevant
+            job["rank"] = round(-score, 3)
+        results.append(job)
+    return results
@@ -0,0 +1,256 @@
+"""
+Merged Job Change Feed
+======================
+
+An append-only log of what each merge changed, so consumers (the UI
+import, notifier scripts) can process deltas instead of diffing the
+whole merged/jobs.json.
+
+merged/changes.jsonl has one record per line:
+
+    {"seq": 41, "op": "added", "job_url": "...", "at": "...", "job": {...}}
+    {"seq": 42, "op": "updated", "job_url": "...", "at": "...", "job": {...}}
+    {"seq": 43, "op": "removed", "job_url": "...", "at": "..."}
+
+Sequence numbers only ever increase. A consumer remembers the last seq
+it processed and asks for everything after it (`read_changes`, or
+`python -m src.orchestration changes --cursor FILE`).
+
+The log is compacted once it grows well past the number of live jobs:
+only the newest record per job URL is kept (with its original seq), so a
+consumer at any cursor still ends up with the right state. Removal
+records older than the tombstone retention are dropped too; the highest
+dropped seq becomes the log's horizon, and a consumer whose cursor is
+older than that gets CursorExpiredError and must resync from jobs.json.
+
+merged/.changes-state.json holds the last seq, the horizon and the
+content hash of every live job. If the log itself is deleted, the horizon
+moves up to the last seq, so every existing cursor expires.
+"""
+
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from .publish import atomic_write, atomic_write_json, content_hash, dumps_compact
+from .state import now_iso
+
+CHANGES_FILE = "changes.jsonl"
+CHANGES_STATE_FILE = ".changes-state.json"
+
+ADDED = "added"
+UPDATED = "updated"
+REMOVED = "removed"
+
+# Compact when the log holds more than this many records per live job...
+COMPACT_RATIO = 2
+# ...and at least this many records in total
+COMPACT_MIN_RECORDS = 1000
+
+# How long removal records survive compaction
+TOMBSTONE_RETENTION = timedelta(days=7)
+
+
+class CursorExpiredError(Exception):
+    """The cursor is older than the log's horizon; resync from jobs.json."""
+
+    def __init__(self, cursor: int, horizon: int):
+        super().__init__(f"Cursor {cursor} is older than the change log horizon {horizon}")
+        self.cursor = cursor
+        self.horizon = horizon
+
+
+@dataclass
+class ChangeSummary:
+    """What one merge appended to the log."""
+
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    last_seq: int = 0
+    compacted: bool = False
+
+    @property
+    def total(self) -> int:
+        return self.added + self.updated + self.removed
+
+
+def _load_state(merged_dir: Path) -> dict[str, Any]:
+    try:
+        with open(merged_dir / CHANGES_STATE_FILE) as f:
+            state: dict[str, Any] = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {"last_seq": 0, "horizon": 0, "records": 0, "jobs": {}}
+    # `make reset` deletes the log but not this dotfile; every record up to
+    # last_seq is gone, so no older cursor can be served
+    if state["last_seq"] > 0 and not (merged_dir / CHANGES_FILE).exists():
+        state.update(horizon=state["last_seq"], records=0)
+    return state
+
+
+def _iter_records(log_file: Path) -> Iterator[dict[str, Any]]:
+    try:
+        f = open(log_file)
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from a crash mid-append
+                continue
+
+
+def _rewrite(log_file: Path, records: list[dict[str, Any]]) -> None:
+    atomic_write(log_file, b"".join(dumps_compact(r) + b"\n" for r in records))
+
+
+def update_changes(
+    jobs: list[dict[str, Any]],
+    merged_dir: Path,
+    compact_min_records: int = COMPACT_MIN_RECORDS,
+    tombstone_retention: timedelta = TOMBSTONE_RETENTION,
+) -> ChangeSummary:
+    """
+    Append the differences between `jobs` and the previous merge to the log.
+
+    Args:
+        jobs: Merged jobs
+        merged_dir: output/merged
+        compact_min_records: Smallest log worth compacting
+        tombstone_retention: How long removal records survive compaction
+
+    Returns:
+        Counts of appended records and the last sequence number
+    """
+    merged_dir = Path(merged_dir)
+    log_file = merged_dir / CHANGES_FILE
+    state = _load_state(merged_dir)
+    previous: dict[str, str] = state["jobs"]
+    seq = state["last_seq"]
+
+    # Records past the saved state were appended by a merge that did not
+    # finish; drop them so their seqs are not reused for different changes
+    if log_file.exists() and any(r.get("seq", 0) > seq for r in _iter_records(log_file)):
+        _rewrite(log_file, [r for r in _iter_records(log_file) if r.get("seq", 0) <= seq])
+
+    at = now_iso()
+    summary = ChangeSummary()
+    records: list[dict[str, Any]] = []
+    current: dict[str, str] = {}
+    for job in jobs:
+        url = job.get("job_url", "")
+        if not url or url in current:
+            continue
+        digest = content_hash(job)
+        current[url] = digest
+        old = previous.get(url)
+        if old == digest:
+            continue
+        op = ADDED if old is None else UPDATED
+        seq += 1
+        records.append({"seq": seq, "op": op, "job_url": url, "at": at, "job": job})
+        if op == ADDED:
+            summary.added += 1
+        else:
+            summary.updated += 1
+    for url in previous.keys() - current.keys():
+        seq += 1
+        records.append({"seq": seq, "op": REMOVED, "job_url": url, "at": at})
+        summary.removed += 1
+
+    if records:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_file, "ab") as f:
+            f.write(b"".join(dumps_compact(r) + b"\n" for r in records))
+            f.flush()
+
+    state.update(last_seq=seq, records=state.get("records", 0) + len(records), jobs=current)
+    summary.last_seq = seq
+
+    if state["records"] > max(compact_min_records, COMPACT_RATIO * len(current)):
+        state["records"], state["horizon"] = compact_changes(
+            log_file, state["horizon"], tombstone_retention
+        )
+        summary.compacted = True
+
+    atomic_write_json(merged_dir / CHANGES_STATE_FILE, state)
+    return summary
+
+
+def compact_changes(
+    log_file: Path,
+    horizon: int = 0,
+    tombstone_retention: timedelta = TOMBSTONE_RETENTION,
+) -> tuple[int, int]:
+    """
+    Keep only the newest record per job URL, dropping expired removals.
+
+    Args:
+        log_file: merged/changes.jsonl
+        horizon: Current horizon
+        tombstone_retention: How long removal records are kept
+
+    Returns:
+        (records kept, new horizon)
+    """
+    latest: dict[str, dict[str, Any]] = {}
+    for record in _iter_records(log_file):
+        latest[record["job_url"]] = record
+
+    cutoff = datetime.now(UTC) - tombstone_retention
+    kept = []
+    for record in sorted(latest.values(), key=lambda r: r["seq"]):
+        if record["op"] == REMOVED and datetime.fromisoformat(record["at"]) < cutoff:
+            horizon = max(horizon, record["seq"])
+            continue
+        kept.append(record)
+
+    _rewrite(log_file, kept)
+    return len(kept), horizon
+
+
+def read_changes(
+    merged_dir: Path,
+    after: int = 0,
+    limit: int | None = None,
+) -> tuple[list[dict[str, Any]], int]:
+    """
+    Records with seq greater than `after`, oldest first.
+
+    Args:
+        merged_dir: output/merged
+        after: Last sequence number already processed (0 for everything)
+        limit: Maximum records to return
+
+    Returns:
+        (records, cursor to pass as `after` next time)
+
+    Raises:
+        CursorExpiredError: `after` is non-zero and predates removals compaction dropped
+    """
+    merged_dir = Path(merged_dir)
+    state = _load_state(merged_dir)
+    # after=0 means starting from scratch, which the compacted log still serves
+    if 0 < after < state["horizon"]:
+        raise CursorExpiredError(after, state["horizon"])
+
+    records: list[dict[str, Any]] = []
+    cursor = after
+    for record in _iter_records(merged_dir / CHANGES_FILE):
+        seq = record.get("seq", 0)
+        # Ignore records a crashed merge appended past the saved state
+        if seq <= after or seq > state["last_seq"]:
+            continue
+        if limit is not None and len(records) >= limit:
+            break
+        records.append(record)
+        cursor = seq
+    return records, cursor
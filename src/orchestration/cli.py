@@ -3,17 +3,23 @@ CLI for Orchestration System
 ============================
 
 Command-line interface for managing job search agents.
+
+Only `start` needs the agent SDK; it is imported inside `cmd_start` so the
+read-only commands (`status`, `merge`, `query`, `stop`) start quickly;
+`import` likewise loads the optional Postgres driver only when it runs,
+and `rescore` the posting archive and pre-scorer.
 """
 
 import argparse
-import asyncio
+import json
 import sys
 from pathlib import Path
+from typing import Any
 
 from .config import get_output_dir
-from .coordinator import Coordinator, print_status
 from .merger import merge_outputs, get_merge_stats
 from .state import StateManager
+from .status import get_status, print_status
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -46,6 +52,13 @@ def create_parser() -> argparse.ArgumentParser:
         default=None,
         help="Output directory (default: ./output)",
     )
+    start_parser.add_argument(
+        "--serve",
+        type=int,
+        default=None,
+        metavar="PORT",
+        help="Serve status JSON, an SSE event stream and /metrics on localhost:PORT",
+    )
 
     # status command
     status_parser = subparsers.add_parser("status", help="Show agent status")
@@ -55,6 +68,22 @@ def create_parser() -> argparse.ArgumentParser:
         default=None,
         help="Output directory (default: ./output)",
     )
+    status_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the status snapshot as JSON (same as the status server's /status)",
+    )
+    status_parser.add_argument(
+        "-w", "--watch",
+        action="store_true",
+        help="Keep refreshing a live dashboard until Ctrl+C",
+    )
+    status_parser.add_argument(
+        "--interval",
+        type=float,
+        default=2.0,
+        help="Seconds between dashboard refreshes (default: 2)",
+    )
 
     # merge command
     merge_parser = subparsers.add_parser("merge", help="Merge agent outputs")
@@ -65,6 +94,164 @@ def create_parser() -> argparse.ArgumentParser:
         help="Output directory (default: ./output)",
     )
 
+    # query command
+    query_parser = subparsers.add_parser("query", help="Search merged jobs")
+    query_parser.add_argument(
+        "text",
+        nargs="*",
+        help="Words to match in role, company, requirements and responsibilities",
+    )
+    query_parser.add_argument("--min-score", type=int, default=None, help="Minimum match score")
+    query_parser.add_argument(
+        "--platform",
+        type=str,
+        default=None,
+        help="ATS platform (e.g. greenhouse)",
+    )
+    query_parser.add_argument("--company", type=str, default=None, help="Company name")
+    query_parser.add_argument(
+        "--tech",
+        type=str,
+        default=None,
+        help="Tech stack entry (e.g. Python)",
+    )
+    query_parser.add_argument(
+        "--location",
+        type=str,
+        default=None,
+        help="Location substring (e.g. Remote)",
+    )
+    query_parser.add_argument(
+        "--since",
+        type=str,
+        default=None,
+        metavar="YYYY-MM-DD",
+        help="Found on or after",
+    )
+    query_parser.add_argument(
+        "--sort",
+        choices=["score", "date", "company"],
+        default=None,
+        help="Sort order (default: relevance for text searches, otherwise score)",
+    )
+    query_parser.add_argument(
+        "-l", "--limit",
+        type=int,
+        default=20,
+        help="Maximum results (default: 20)",
+    )
+    query_parser.add_argument("--json", action="store_true", help="Print matching jobs as JSON")
+    query_parser.add_argument(
+        "-o", "--output",
+        type=str,
+        default=None,
+        help="Output directory (default: ./output)",
+    )
+
+    # changes command
+    changes_parser = subparsers.add_parser(
+        "changes", help="Print merged job changes since a cursor"
+    )
+    changes_parser.add_argument(
+        "--after",
+        type=int,
+        default=None,
+        metavar="SEQ",
+        help="Print changes after this sequence number (default: 0, or the cursor file's)",
+    )
+    changes_parser.add_argument(
+        "--cursor",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="Read the starting sequence number from FILE and save the new one there",
+    )
+    changes_parser.add_argument("-l", "--limit", type=int, default=None, help="Maximum records")
+    changes_parser.add_argument(
+        "-o", "--output",
+        type=str,
+        default=None,
+        help="Output directory (default: ./output)",
+    )
+
+    # diff command
+    diff_parser = subparsers.add_parser("diff", help="Compare merged jobs between two snapshots")
+    diff_parser.add_argument(
+        "from_run",
+        nargs="?",
+        default="~1",
+        help="Older snapshot: id, unique prefix, 'latest' or ~N (default: ~1, before latest)",
+    )
+    diff_parser.add_argument(
+        "to_run",
+        nargs="?",
+        default="latest",
+        help="Newer snapshot (default: latest)",
+    )
+    diff_parser.add_argument("--list", action="store_true", help="List snapshots and exit")
+    diff_parser.add_argument("--json", action="store_true", help="Print the diff as JSON")
+    diff_parser.add_argument(
+        "-o", "--output",
+        type=str,
+        default=None,
+        help="Output directory (default: ./output)",
+    )
+
+    # import command
+    import_parser = subparsers.add_parser("import", help="Load merged jobs into the UI database")
+    import_parser.add_argument(
+        "--database-url",
+        type=str,
+        default=None,
+        help="Postgres connection URL (default: $DATABASE_URL)",
+    )
+    import_parser.add_argument(
+        "-f", "--file",
+        type=str,
+        default=None,
+        help="Jobs file (default: <output>/merged/jobs.json)",
+    )
+    import_parser.add_argument(
+        "-o", "--output",
+        type=str,
+        default=None,
+        help="Output directory (default: ./output)",
+    )
+
+    # rescore command
+    rescore_parser = subparsers.add_parser(
+        "rescore", help="Rescore archived postings against the current profile, offline"
+    )
+    rescore_parser.add_argument(
+        "--profile",
+        type=str,
+        default=None,
+        help="Candidate profile (default: prompts/resume.md)",
+    )
+    rescore_parser.add_argument(
+        "--min-score",
+        type=int,
+        default=None,
+        help="Qualifying score (default: scoring.min_score from config/agents.json)",
+    )
+    rescore_parser.add_argument(
+        "-l", "--limit",
+        type=int,
+        default=20,
+        help="Postings to print (default: 20)",
+    )
+    rescore_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print every rescored posting as JSON",
+    )
+    rescore_parser.add_argument(
+        "-o", "--output",
+        type=str,
+        default=None,
+        help="Output directory (default: ./output)",
+    )
+
     # stop command
     stop_parser = subparsers.add_parser("stop", help="Stop running agents")
     stop_parser.add_argument(
@@ -85,11 +272,16 @@ def create_parser() -> argparse.ArgumentParser:
 
 def cmd_start(args: argparse.Namespace) -> int:
     """Handle start command."""
+    import asyncio
+
+    from .coordinator import Coordinator
+
     output_dir = Path(args.output) if args.output else None
 
     coordinator = Coordinator(
         output_dir=output_dir,
         max_iterations=args.iterations,
+        serve_port=args.serve,
     )
 
     try:
@@ -104,6 +296,16 @@ def cmd_start(args: argparse.Namespace) -> int:
 def cmd_status(args: argparse.Namespace) -> int:
     """Handle status command."""
     output_dir = Path(args.output) if args.output else None
+
+    if args.json:
+        print(json.dumps(get_status(output_dir), indent=2))
+        return 0
+
+    if args.watch:
+        from .dashboard import watch_status
+
+        return watch_status(output_dir, interval=args.interval)
+
     print_status(output_dir)
 
     # Also show merge stats
@@ -111,6 +313,17 @@ def cmd_status(args: argparse.Namespace) -> int:
     if stats["merged_jobs"] > 0:
         print(f"Merged output: {stats['merged_jobs']} jobs")
 
+    metadata = stats["metadata"]
+    if metadata and metadata.get("platforms"):
+        print(f"Cost per unique qualifying job (score >= {metadata['min_score']}):")
+        for platform, entry in metadata["platforms"].items():
+            per_job = entry["cost_per_qualifying_job"]
+            per_job_str = f"${per_job:.2f}" if per_job is not None else "---"
+            print(
+                f"  {platform:12} {entry['qualifying_jobs']:>4} jobs  "
+                f"${entry['usage']['cost_usd']:.2f} total  {per_job_str}/job"
+            )
+
     return 0
 
 
@@ -125,6 +338,247 @@ def cmd_merge(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_query(args: argparse.Namespace) -> int:
+    """Handle query command."""
+    import time
+
+    from .catalog import CATALOG_FILE, search_catalog
+
+    output_dir = Path(args.output) if args.output else get_output_dir()
+    catalog = output_dir / "merged" / CATALOG_FILE
+    if not catalog.exists():
+        print(f"No catalog at {catalog}; run `python -m src.orchestration merge` first")
+        return 1
+
+    started = time.perf_counter()
+    jobs = search_catalog(
+        catalog,
+        text=" ".join(args.text) or None,
+        min_score=args.min_score,
+        platform=args.platform,
+        company=args.company,
+        tech=args.tech,
+        location=args.location,
+        since=args.since,
+        sort=args.sort,
+        limit=args.limit,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if args.json:
+        print(json.dumps(jobs, indent=2, ensure_ascii=False))
+        return 0
+
+    for job in jobs:
+        print(
+            f"{job.get('match_score') or 0:>3}  {(job.get('company') or '')[:24]:24}  "
+            f"{(job.get('role') or '')[:40]:40}  {(job.get('location') or '')[:20]:20}  "
+            f"{job.get('job_url', '')}"
+        )
+    print(f"\n{len(jobs)} jobs in {elapsed_ms:.1f} ms")
+    return 0
+
+
+def cmd_changes(args: argparse.Namespace) -> int:
+    """Handle changes command."""
+    from .changes import CursorExpiredError, read_changes
+
+    output_dir = Path(args.output) if args.output else get_output_dir()
+    cursor_file = Path(args.cursor) if args.cursor else None
+
+    after = args.after
+    if after is None and cursor_file and cursor_file.exists():
+        after = int(cursor_file.read_text().strip() or 0)
+
+    try:
+        records, cursor = read_changes(output_dir / "merged", after=after or 0, limit=args.limit)
+    except CursorExpiredError as e:
+        print(f"{e}; reload merged/jobs.json and restart from --after 0", file=sys.stderr)
+        return 2
+
+    for record in records:
+        print(json.dumps(record, ensure_ascii=False))
+    if cursor_file:
+        cursor_file.write_text(f"{cursor}\n")
+    return 0
+
+
+def cmd_diff(args: argparse.Namespace) -> int:
+    """Handle diff command."""
+    from .snapshots import SNAPSHOTS_DIR, SnapshotStore, changed_fields
+
+    output_dir = Path(args.output) if args.output else get_output_dir()
+    store = SnapshotStore(output_dir / SNAPSHOTS_DIR)
+
+    if args.list:
+        for run_id in store.runs():
+            run = store.load_run(run_id)
+            print(f"{run_id}  {run['total']:>6} jobs  {len(run['changes']):>5} changed")
+        return 0
+
+    try:
+        to_run = store.resolve(args.to_run)
+        # With a single snapshot, the default compares against nothing
+        if args.from_run == "~1" and len(store.runs()) == 1:
+            from_run = None
+        else:
+            from_run = store.resolve(args.from_run)
+    except KeyError as e:
+        print(e.args[0])
+        return 1
+
+    diff = store.diff(from_run, to_run)
+
+    def describe(digest: str) -> dict[str, Any]:
+        job = store.load_object(digest)
+        return {k: job.get(k) for k in ("job_url", "company", "role", "match_score")}
+
+    sections = {
+        "new": [describe(d) for d in diff.new.values()],
+        "changed": [
+            {
+                **describe(new),
+                "fields": changed_fields(store.load_object(old), store.load_object(new)),
+            }
+            for old, new in diff.changed.values()
+        ],
+        "disappeared": [describe(d) for d in diff.disappeared.values()],
+    }
+
+    if args.json:
+        report = {"from": from_run, "to": to_run, **sections}
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 0
+
+    print(f"{from_run or '(empty)'} -> {to_run}")
+    for name, jobs in sections.items():
+        print(f"\n{name.capitalize()} ({len(jobs)}):")
+        for job in sorted(jobs, key=lambda j: -(j["match_score"] or 0)):
+            fields = f"  [{', '.join(job['fields'])}]" if "fields" in job else ""
+            print(
+                f"  {job['match_score'] or 0:>3}  {(job['company'] or '')[:24]:24}  "
+                f"{(job['role'] or '')[:40]:40}  {job['job_url']}{fields}"
+            )
+    return 0
+
+
+def cmd_import(args: argparse.Namespace) -> int:
+    """Handle import command."""
+    import os
+    import time
+
+    from .db_import import import_merged
+
+    database_url = args.database_url or os.environ.get("DATABASE_URL")
+    if not database_url:
+        print("No database configured: set DATABASE_URL or pass --database-url")
+        return 1
+
+    output_dir = Path(args.output) if args.output else get_output_dir()
+    jobs_file = Path(args.file) if args.file else output_dir / "merged" / "jobs.json"
+    if not jobs_file.exists():
+        print(f"No merged jobs at {jobs_file}; run `python -m src.orchestration merge` first")
+        return 1
+
+    started = time.perf_counter()
+    try:
+        result = import_merged(jobs_file, database_url)
+    except RuntimeError as e:
+        print(e)
+        return 1
+
+    print(
+        f"Imported {result.total} jobs in {time.perf_counter() - started:.1f}s: "
+        f"{result.inserted} new, {result.updated} updated, {result.unchanged} unchanged, "
+        f"{result.skipped} skipped"
+    )
+    return 0
+
+
+def cmd_rescore(args: argparse.Namespace) -> int:
+    """Handle rescore command."""
+    import time
+
+    from .archive import ARCHIVE_DIR, INDEX_FILE, PostingArchive
+    from .config import load_config
+    from .prescore import PROFILE_FILE, RESCORED_FILE, load_profile, rescore_postings
+    from .publish import atomic_write_json
+    from .seen import EXACT_FILE, SEEN_DIR, SeenUrls
+    from .state import now_iso
+
+    output_dir = Path(args.output) if args.output else get_output_dir()
+    archive_dir = output_dir / ARCHIVE_DIR
+    if not (archive_dir / INDEX_FILE).exists():
+        print(f"No posting archive at {archive_dir}; postings are archived as agents fetch them")
+        return 1
+
+    profile_file = Path(args.profile) if args.profile else PROFILE_FILE
+    try:
+        profile = load_profile(profile_file)
+    except FileNotFoundError:
+        print(f"No profile at {profile_file}")
+        return 1
+
+    config = load_config()
+    min_score = args.min_score if args.min_score is not None else config.scoring.min_score
+
+    started = time.perf_counter()
+    archive = PostingArchive(archive_dir, config.archive)
+    try:
+        postings = list(archive.postings())
+    except RuntimeError as e:
+        print(e)
+        return 1
+    finally:
+        archive.close()
+
+    # The scores agents gave, from the seen-URL set
+    previous: dict[str, int | None] = {}
+    if (output_dir / SEEN_DIR / EXACT_FILE).exists():
+        seen = SeenUrls(output_dir / SEEN_DIR, config.seen)
+        try:
+            for url, _ in postings:
+                entry = seen.lookup(url)
+                if entry is not None:
+                    previous[url] = entry.score
+        finally:
+            seen.close()
+
+    rows = rescore_postings(profile, postings, previous)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    atomic_write_json(
+        archive_dir / RESCORED_FILE,
+        {
+            "rescored_at": now_iso(),
+            "profile": str(profile_file),
+            "min_score": min_score,
+            "postings": rows,
+        },
+        indent=2,
+    )
+
+    if args.json:
+        print(json.dumps(rows, indent=2, ensure_ascii=False))
+        return 0
+
+    for row in rows[:args.limit]:
+        before = row["previous_score"]
+        print(
+            f"{row['score']:>3}  {'' if before is None else before:>3}  {row['company'][:24]:24}  "
+            f"{row['title'][:40]:40}  {row['job_url']}"
+        )
+    qualifying = sum(r["score"] >= min_score for r in rows)
+    scored_before = [r for r in rows if r["previous_score"] is not None]
+    newly = sum(r["score"] >= min_score > r["previous_score"] for r in scored_before)
+    dropped = sum(r["score"] < min_score <= r["previous_score"] for r in scored_before)
+    print(
+        f"\n{len(rows)} postings rescored in {elapsed_ms:.1f} ms: "
+        f"{qualifying} at or above {min_score} ({newly} newly, {dropped} no longer)"
+    )
+    print(f"Wrote {archive_dir / RESCORED_FILE}")
+    return 0
+
+
 def cmd_stop(args: argparse.Namespace) -> int:
     """Handle stop command."""
     output_dir = Path(args.output) if args.output else get_output_dir()
@@ -155,6 +609,11 @@ def main(argv: list[str] | None = None) -> int:
         "start": cmd_start,
         "status": cmd_status,
         "merge": cmd_merge,
+        "query": cmd_query,
+        "changes": cmd_changes,
+        "diff": cmd_diff,
+        "import": cmd_import,
+        "rescore": cmd_rescore,
         "stop": cmd_stop,
     }
 
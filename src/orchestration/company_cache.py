@@ -0,0 +1,307 @@
+"""
+Company Research Cache
+======================
+
+Persistent company facts shared across agents and runs.
+
+Facts (glassdoor_rating, company_size, funding, ...) are stored per field
+with the time they were observed, so each field can expire on its own TTL.
+Within a run, a lease lets one agent research a company while the others
+wait for its result or skip.
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from .state import now_iso
+
+# Cache file name, relative to the base output directory
+COMPANY_CACHE_FILE = "company-cache.json"
+
+DAY = 24 * 60 * 60
+
+# How long each researched field stays fresh, in seconds
+FIELD_TTLS: dict[str, int] = {
+    "glassdoor_rating": 30 * DAY,
+    "company_size": 90 * DAY,
+    "funding": 60 * DAY,
+}
+DEFAULT_TTL = 30 * DAY
+
+# Legal suffixes dropped when normalizing company names
+_SUFFIXES = re.compile(
+    r"\b(inc|incorporated|llc|ltd|limited|corp|corporation|co|company|gmbh|plc|sa|ag|bv)\b\.?$"
+)
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_company_name(name: str) -> str:
+    """
+    Normalize a company name to a cache key.
+
+    "Stripe, Inc." and "stripe" map to the same key.
+    """
+    key = name.lower().strip()
+    key = _NON_WORD.sub(" ", key).strip()
+    previous = None
+    while key != previous:
+        previous = key
+        key = _SUFFIXES.sub("", key).strip()
+    return key.replace(" ", "-")
+
+
+def _parse_iso(value: str) -> datetime | None:
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+
+
+@dataclass
+class CompanyField:
+    """A single researched fact."""
+
+    value: Any
+    updated_at: str
+    source: str = ""
+
+    def is_fresh(self, name: str, now: datetime | None = None) -> bool:
+        """Whether this field is still within its TTL."""
+        updated = _parse_iso(self.updated_at)
+        if updated is None:
+            return False
+        now = now or datetime.now(UTC)
+        ttl = FIELD_TTLS.get(name, DEFAULT_TTL)
+        return now - updated < timedelta(seconds=ttl)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {"value": self.value, "updated_at": self.updated_at, "source": self.source}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CompanyField":
+        """Create from dictionary."""
+        return cls(
+            value=data.get("value"),
+            updated_at=data.get("updated_at", ""),
+            source=data.get("source", ""),
+        )
+
+
+@dataclass
+class CompanyRecord:
+    """Cached facts for one company."""
+
+    name: str
+    fields: dict[str, CompanyField] = field(default_factory=dict)
+
+    def fresh_fields(self, now: datetime | None = None) -> dict[str, Any]:
+        """Values of all fields still within their TTL."""
+        return {k: f.value for k, f in self.fields.items() if f.is_fresh(k, now)}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {"name": self.name, "fields": {k: f.to_dict() for k, f in self.fields.items()}}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CompanyRecord":
+        """Create from dictionary."""
+        return cls(
+            name=data.get("name", ""),
+            fields={k: CompanyField.from_dict(v) for k, v in data.get("fields", {}).items()},
+        )
+
+
+@dataclass
+class _Lease:
+    holder: str
+    expires: float
+    done: asyncio.Event
+
+
+class CompanyCache:
+    """
+    Company knowledge cache backed by a JSON file.
+
+    Shared by all agents in a coordinator process. Lookups are in-memory;
+    the file is rewritten atomically whenever facts are recorded.
+    """
+
+    def __init__(self, path: Path, lease_seconds: float = 600):
+        """
+        Initialize the cache.
+
+        Args:
+            path: JSON file holding the cache (created on first write)
+            lease_seconds: How long a research lease is held before it lapses
+        """
+        self.path = Path(path)
+        self.lease_seconds = lease_seconds
+        self.records: dict[str, CompanyRecord] = {}
+        self._leases: dict[str, _Lease] = {}
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def load(self) -> None:
+        """Load records from disk."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+        self.records = {k: CompanyRecord.from_dict(v) for k, v in data.items()}
+
+    def save(self) -> None:
+        """Write records to disk atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump({k: r.to_dict() for k, r in self.records.items()}, f, indent=2)
+        os.replace(tmp, self.path)
+
+    def get(self, name: str) -> dict[str, Any]:
+        """Fresh cached facts for a company (empty if unknown or expired)."""
+        record = self.records.get(normalize_company_name(name))
+        facts = record.fresh_fields() if record else {}
+        if facts:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return facts
+
+    def missing_fields(self, name: str) -> list[str]:
+        """Tracked fields that are absent or stale for a company."""
+        record = self.records.get(normalize_company_name(name))
+        fresh = record.fresh_fields() if record else {}
+        return [f for f in FIELD_TTLS if f not in fresh]
+
+    def record(
+        self,
+        name: str,
+        facts: dict[str, Any],
+        source: str = "",
+        observed_at: str | None = None,
+        save: bool = True,
+    ) -> None:
+        """
+        Record researched facts for a company.
+
+        Empty values are ignored, and a fact never replaces one observed later.
+
+        Args:
+            name: Company name
+            facts: Field -> value
+            source: Who observed the facts (e.g. agent-2)
+            observed_at: ISO timestamp of the observation (defaults to now)
+            save: Persist immediately
+        """
+        key = normalize_company_name(name)
+        if not key:
+            return
+        observed_at = observed_at or now_iso()
+        observed = _parse_iso(observed_at)
+        record = self.records.setdefault(key, CompanyRecord(name=name))
+
+        for field_name, value in facts.items():
+            if value in (None, "", [], {}):
+                continue
+            existing = record.fields.get(field_name)
+            if existing is not None:
+                existing_at = _parse_iso(existing.updated_at)
+                if existing_at and observed and existing_at > observed:
+                    continue
+            record.fields[field_name] = CompanyField(value, observed_at, source)
+
+        if save:
+            self.save()
+
+    async def acquire(
+        self,
+        name: str,
+        holder: str,
+        wait: float = 0,
+    ) -> tuple[dict[str, Any], bool]:
+        """
+        Look up a company and decide whether the caller should research it.
+
+        If every tracked field is fresh, no research is needed. If another
+        agent holds the lease, wait up to `wait` seconds for its result and
+        then skip. Otherwise the caller gets the lease and must `release` it.
+
+        Args:
+            name: Company name
+            holder: Identifier of the requesting agent
+            wait: Seconds to wait for another agent's research
+
+        Returns:
+            (fresh facts, whether the caller holds the lease and should research)
+        """
+        key = normalize_company_name(name)
+        if not self.missing_fields(name):
+            return self.get(name), False
+
+        self._expire_leases()
+        lease = self._leases.get(key)
+        if lease and lease.holder != holder:
+            if wait > 0:
+                try:
+                    await asyncio.wait_for(lease.done.wait(), timeout=wait)
+                except TimeoutError:
+                    pass
+            return self.get(name), False
+
+        self._leases[key] = _Lease(
+            holder=holder,
+            expires=time.monotonic() + self.lease_seconds,
+            done=asyncio.Event(),
+        )
+        return self.get(name), True
+
+    def _expire_leases(self) -> None:
+        """Drop lapsed leases, waking anyone still waiting on them."""
+        now = time.monotonic()
+        for key, lease in list(self._leases.items()):
+            if lease.expires <= now:
+                del self._leases[key]
+                lease.done.set()
+
+    def release(
+        self,
+        name: str,
+        holder: str,
+        facts: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Record research results and release the caller's lease.
+
+        Args:
+            name: Company name
+            holder: Identifier of the agent holding the lease
+            facts: Researched facts to record
+        """
+        if facts:
+            self.record(name, facts, source=holder)
+        key = normalize_company_name(name)
+        lease = self._leases.get(key)
+        if lease and lease.holder == holder:
+            del self._leases[key]
+            lease.done.set()
+
+    def stats(self) -> dict[str, int]:
+        """Lookup statistics for this process."""
+        return {
+            "companies": len(self.records),
+            "hits": self.hits,
+            "misses": self.misses,
+            "leases": len(self._leases),
+        }
@@ -0,0 +1,96 @@
+"""
+Company Cache Tools
+===================
+
+In-process MCP tools that give agents cheap access to the company cache.
+"""
+
+import json
+from typing import Any
+
+from claude_agent_sdk import create_sdk_mcp_server, tool
+
+from .company_cache import FIELD_TTLS, CompanyCache
+
+SERVER_NAME = "company_cache"
+
+# Tool names as exposed to the agent
+COMPANY_TOOL_NAMES = [
+    f"mcp__{SERVER_NAME}__lookup_company",
+    f"mcp__{SERVER_NAME}__record_company",
+]
+
+# JSON schema types of the cached fact fields; anything not listed is a string
+FIELD_SCHEMAS: dict[str, dict[str, Any]] = {
+    "glassdoor_rating": {"type": "number", "description": "Glassdoor rating, 0-5"},
+    "company_size": {
+        "type": ["integer", "string"],
+        "description": "Employee count, or a range such as 200-500",
+    },
+    "funding": {"type": "string", "description": "Latest round and amount, e.g. Series B ($120M)"},
+}
+
+# Only the company name is required; agents record just the fields they researched
+RECORD_COMPANY_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        **{
+            field_name: FIELD_SCHEMAS.get(field_name, {"type": "string"})
+            for field_name in FIELD_TTLS
+        },
+    },
+    "required": ["name"],
+}
+
+# Seconds an agent waits for another agent's research before skipping
+LEASE_WAIT_SECONDS = 60
+
+
+def _text(payload: dict[str, Any]) -> dict[str, Any]:
+    return {"content": [{"type": "text", "text": json.dumps(payload)}]}
+
+
+def create_company_server(cache: CompanyCache, holder: str) -> Any:
+    """
+    Create the company cache MCP server for one agent.
+
+    Args:
+        cache: Shared company cache
+        holder: Identifier of the agent using the tools (e.g. agent-2)
+
+    Returns:
+        SDK MCP server config for ClaudeAgentOptions.mcp_servers
+    """
+
+    @tool(
+        "lookup_company",
+        "Look up cached company facts before researching a company. Returns "
+        "cached facts and whether you should research the missing fields.",
+        {"name": str},
+    )
+    async def lookup_company(args: dict[str, Any]) -> dict[str, Any]:
+        name = args["name"]
+        facts, should_research = await cache.acquire(name, holder, wait=LEASE_WAIT_SECONDS)
+        missing = cache.missing_fields(name) if should_research else []
+        if should_research:
+            action = "research the missing fields, then call record_company"
+        elif cache.missing_fields(name):
+            action = "another agent is researching this company; use these facts and move on"
+        else:
+            action = "use these facts; no research needed"
+        return _text({"facts": facts, "missing": missing, "action": action})
+
+    @tool(
+        "record_company",
+        "Record researched company facts so other agents and later runs can reuse them. "
+        "Pass only the fields you found.",
+        RECORD_COMPANY_SCHEMA,
+    )
+    async def record_company(args: dict[str, Any]) -> dict[str, Any]:
+        name = args["name"]
+        facts = {k: v for k, v in args.items() if k != "name"}
+        cache.release(name, holder, facts)
+        return _text({"recorded": sorted(k for k, v in facts.items() if v)})
+
+    return create_sdk_mcp_server(SERVER_NAME, tools=[lookup_company, record_company])
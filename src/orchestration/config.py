@@ -8,7 +8,7 @@ Load agent configurations from config files.
 import json
 from pathlib import Path
 
-from .types import AgentConfig, OrchestrationConfig, ScoringConfig
+from .types import AgentConfig, OrchestrationConfig, ScoringConfig, SearchSettings
 
 # Project root directory
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -19,6 +19,28 @@ def get_config_path() -> Path:
     return PROJECT_ROOT / "config" / "agents.json"
 
 
+def get_search_config_path() -> Path:
+    """Get path to orchestration/config.json, which holds the search settings."""
+    return PROJECT_ROOT / "orchestration" / "config.json"
+
+
+def load_search_settings() -> SearchSettings:
+    """
+    Load web search politeness settings from orchestration/config.json.
+
+    Returns:
+        SearchSettings (defaults if the file or its "search" block is missing)
+    """
+    path = get_search_config_path()
+    if not path.exists():
+        return SearchSettings()
+
+    with open(path) as f:
+        data = json.load(f)
+
+    return SearchSettings.from_dict(data.get("search", {}))
+
+
 def load_config() -> OrchestrationConfig:
     """
     Load orchestration configuration from config/agents.json.
@@ -30,12 +52,13 @@ def load_config() -> OrchestrationConfig:
 
     if not config_path.exists():
         # Return default config if file doesn't exist
-        return get_default_config()
-
-    with open(config_path) as f:
-        data = json.load(f)
+        config = get_default_config()
+    else:
+        with open(config_path) as f:
+            config = OrchestrationConfig.from_dict(json.load(f))
 
-    return OrchestrationConfig.from_dict(data)
+    config.search = load_search_settings()
+    return config
 
 
 def get_default_config() -> OrchestrationConfig:
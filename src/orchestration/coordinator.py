@@ -6,16 +6,30 @@ Manages parallel job search agents using asyncio.
 """
 
 import asyncio
+import json
+import time
 import uuid
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
 
 from .agent_runner import AgentRunner
+from .archive import ARCHIVE_DIR, PostingArchive
+from .breaker import PlatformBreakers
+from .company_cache import COMPANY_CACHE_FILE, CompanyCache
 from .config import get_output_dir, load_config
+from .events import MERGE_PUBLISHED, EventBus
+from .ledger import Usage, format_cost
 from .merger import merge_outputs
+from .metrics import LoopLagMonitor, MetricsCollector
+from .ratelimit import HostRateLimiter, format_wait_report
+from .seen import SEEN_DIR, SeenUrls
+from .server import StatusServer
+from .session_log import SessionLogSink
 from .state import AgentState, OrchestrationState, StateManager, now_iso
-from .types import AgentConfig, AgentStatus, OrchestrationStatus
+from .status import build_snapshot
+from .supervisor import Supervisor
+from .telemetry import TOOL_LATENCY_FILE, ToolLatencies, format_latency_report
+from .types import AgentStatus, OrchestrationConfig, OrchestrationStatus
 
 
 class Coordinator:
@@ -30,6 +44,10 @@ class Coordinator:
         self,
         output_dir: Path | None = None,
         max_iterations: int | None = None,
+        config: OrchestrationConfig | None = None,
+        runner_factory: Callable[..., AgentRunner] = AgentRunner,
+        serve_port: int | None = None,
+        publish_ui: bool = True,
     ):
         """
         Initialize the coordinator.
@@ -37,17 +55,47 @@ class Coordinator:
         Args:
             output_dir: Base output directory (defaults to project output/)
             max_iterations: Max iterations per agent (None for unlimited)
+            config: Agent configuration (defaults to config/agents.json)
+            runner_factory: Callable building a runner for each agent; receives
+                the same keyword arguments as AgentRunner
+            serve_port: Serve status, events and metrics on localhost:PORT (None to disable)
+            publish_ui: Mirror the merged jobs to the UI static data directory
         """
         self.output_dir = Path(output_dir) if output_dir else get_output_dir()
         self.max_iterations = max_iterations
-        self.config = load_config()
+        self.config = config or load_config()
+        self.runner_factory = runner_factory
+        self.publish_ui = publish_ui
         self.state_manager = StateManager(self.output_dir)
         self.session_id = str(uuid.uuid4())[:8]
         self.state = OrchestrationState(
             session_id=self.session_id,
             agent_count=len(self.config.agents),
         )
-        self._tasks: list[asyncio.Task] = []
+        self.company_cache = CompanyCache(self.output_dir / COMPANY_CACHE_FILE)
+        self.runners: list[AgentRunner] = []
+        self.jobs_at_start = 0
+        self.events = EventBus()
+        self.log_sink = SessionLogSink()
+        self.breakers = PlatformBreakers(self.config.breaker, events=self.events)
+        self.rate_limiter = HostRateLimiter(self.config.search.delay_between_requests)
+        self.seen = (
+            SeenUrls(self.output_dir / SEEN_DIR, self.config.seen)
+            if self.config.seen.enabled else None
+        )
+        self.archive = (
+            PostingArchive(self.output_dir / ARCHIVE_DIR, self.config.archive)
+            if self.config.archive.enabled else None
+        )
+        self.lag_monitor = LoopLagMonitor()
+        self.metrics = MetricsCollector(self, self.lag_monitor)
+        self.server = (
+            StatusServer(self.snapshot, self.events, port=serve_port, metrics=self.metrics.render)
+            if serve_port is not None else None
+        )
+        self.supervisor = Supervisor(
+            self.state_manager, self.config.restart_policy, events=self.events,
+        )
 
     def _setup_directories(self, agent_count: int) -> None:
         """Create output directories for agents."""
@@ -60,7 +108,7 @@ class Coordinator:
         merged_dir = self.output_dir / "merged"
         merged_dir.mkdir(parents=True, exist_ok=True)
 
-    def _update_state(self, **updates) -> None:
+    def _update_state(self, **updates: Any) -> None:
         """Update and persist orchestration state."""
         for key, value in updates.items():
             if hasattr(self.state, key):
@@ -69,8 +117,48 @@ class Coordinator:
         # Update total jobs count
         self.state.total_jobs_found = self.state_manager.get_total_jobs(self.state.agent_count)
 
+        # Roll up token and cost totals from the agents
+        usage = Usage()
+        for runner in self.runners:
+            state = getattr(runner, "state", None)
+            if state is not None:
+                usage.add(Usage.from_state(state))
+        usage.apply_to(self.state)
+
         self.state_manager.write_orchestration_state(self.state)
 
+    def snapshot(self) -> dict[str, Any]:
+        """Current status from in-memory state, in the same shape as `status --json`."""
+        agent_states: list[AgentState | None] = [
+            getattr(runner, "state", None) or self.state_manager.read_agent_state(runner.config.id)
+            for runner in self.runners
+        ]
+        total_jobs = sum(s.jobs_found for s in agent_states if s)
+        return build_snapshot(self.state, agent_states, total_jobs)
+
+    def tool_latencies(self) -> dict[str, ToolLatencies]:
+        """Per-agent tool latency histograms, keyed by agent label."""
+        return {
+            f"agent-{runner.config.id} ({runner.config.name})": runner.tool_latencies
+            for runner in self.runners
+            if hasattr(runner, "tool_latencies")
+        }
+
+    def _write_tool_latencies(self) -> None:
+        """Write per-agent and combined tool latency histograms."""
+        per_agent = self.tool_latencies()
+        combined = ToolLatencies()
+        for latencies in per_agent.values():
+            combined.merge(latencies)
+        report = {
+            "updated_at": now_iso(),
+            "all": combined.to_dict(),
+            "agents": {agent: latencies.to_dict() for agent, latencies in per_agent.items()},
+            "rate_limit_waits": self.rate_limiter.to_dict(),
+        }
+        with open(self.output_dir / TOOL_LATENCY_FILE, "w") as f:
+            json.dump(report, f, indent=2)
+
     async def start_all(self, agent_count: int = 4) -> None:
         """
         Start all agents in parallel.
@@ -98,26 +186,55 @@ class Coordinator:
             status=OrchestrationStatus.RUNNING,
             started_at=now_iso(),
         )
+        # Agent job files accumulate across sessions; cost is per job found in this one
+        self.jobs_at_start = self.state.total_jobs_found
+
+        lag_task = None
+        if self.server is not None:
+            await self.server.start()
+            lag_task = asyncio.create_task(self.lag_monitor.run(), name="loop-lag")
+            print(
+                f"  Status server: {self.server.url}/status "
+                "(events: /events, metrics: /metrics)\n"
+            )
 
+        try:
+            await self._run_and_merge(agent_count)
+        finally:
+            if self.server is not None:
+                await self.server.stop()
+            if lag_task is not None:
+                lag_task.cancel()
+            if self.archive is not None:
+                self.archive.close()
+            if self.seen is not None:
+                self.seen.close()
+
+    async def _run_and_merge(self, agent_count: int) -> None:
+        """Run the agents under supervision, then merge and report."""
         # Create agent runners
         runners: list[AgentRunner] = []
         for i in range(agent_count):
             agent_config = self.config.agents[i]
             agent_dir = self.output_dir / f"agent-{agent_config.id}"
 
-            runner = AgentRunner(
+            runner = self.runner_factory(
                 config=agent_config,
                 output_dir=agent_dir,
                 state_manager=self.state_manager,
                 max_iterations=self.max_iterations,
+                company_cache=self.company_cache,
+                events=self.events,
+                session_limits=self.config.session,
+                log_sink=self.log_sink,
+                breakers=self.breakers,
+                rate_limiter=self.rate_limiter,
+                search=self.config.search,
+                seen=self.seen,
+                archive=self.archive,
             )
             runners.append(runner)
-
-        # Start all agents as concurrent tasks
-        self._tasks = [
-            asyncio.create_task(runner.run(), name=f"agent-{runner.config.id}")
-            for runner in runners
-        ]
+        self.runners = runners
 
         # Start monitor task
         monitor_task = asyncio.create_task(
@@ -126,8 +243,8 @@ class Coordinator:
         )
 
         try:
-            # Wait for all agent tasks to complete
-            await asyncio.gather(*self._tasks, return_exceptions=True)
+            # Run all agents as supervised tasks until they finish or are disabled
+            await self.supervisor.run_all(runners)
         except asyncio.CancelledError:
             print("\nOrchestration cancelled")
         finally:
@@ -137,20 +254,57 @@ class Coordinator:
                 await monitor_task
             except asyncio.CancelledError:
                 pass
+            await self.log_sink.close()
 
         # Final merge
         print("\n" + "=" * 60)
         print("  All agents complete - merging outputs")
         print("=" * 60)
 
-        merged_count = merge_outputs(self.output_dir)
+        merge_started = time.monotonic()
+        merged_count = merge_outputs(
+            self.output_dir, config=self.config, publish_ui=self.publish_ui
+        )
+        self.metrics.observe_merge((time.monotonic() - merge_started) * 1000)
+        self.events.publish(
+            MERGE_PUBLISHED,
+            jobs=merged_count,
+            path=str(self.output_dir / "merged" / "jobs.json"),
+        )
+        cache_stats = self.company_cache.stats()
+        print(f"  Company cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+        if self.seen is not None:
+            seen_stats = self.seen.to_dict()
+            print(
+                f"  Seen URLs: {seen_stats['hits']} refetches skipped, "
+                f"{seen_stats['urls']} known ({seen_stats['bloom_bytes'] / 1e6:.1f} MB filter)"
+            )
+        if self.archive is not None:
+            archive_stats = self.archive.to_dict()
+            print(
+                f"  Posting archive: {archive_stats['postings']} postings, "
+                f"{archive_stats['bytes'] / 1e6:.1f} MB -> "
+                f"{archive_stats['stored_bytes'] / 1e6:.1f} MB"
+            )
+
+        latency_lines = format_latency_report(self.tool_latencies())
+        if latency_lines:
+            print("  Tool time by agent:")
+            print("\n".join(latency_lines))
+        wait_lines = format_wait_report(self.rate_limiter)
+        if wait_lines:
+            print("  Rate-limit waits by host:")
+            print("\n".join(wait_lines))
+        self._write_tool_latencies()
 
         self._update_state(
             status=OrchestrationStatus.COMPLETED,
             last_merge_at=now_iso(),
         )
 
-        print(f"\n  Session complete: {merged_count} jobs found")
+        session_jobs = max(0, self.state.total_jobs_found - self.jobs_at_start)
+        print(f"\n  Session complete: {session_jobs} jobs found ({merged_count} merged in total)")
+        print(f"  Cost: {format_cost(Usage.from_state(self.state), session_jobs)}")
         print(f"  Output: {self.output_dir / 'merged' / 'jobs.json'}")
         print("=" * 60)
 
@@ -163,8 +317,12 @@ class Coordinator:
         """
         while True:
             await asyncio.sleep(interval)
-            self._print_status()
-            self._update_state()
+            try:
+                self._print_status()
+                self._update_state()
+                self._write_tool_latencies()
+            except Exception as e:
+                print(f"Warning: status update failed: {e}")
 
     def _print_status(self) -> None:
         """Print current status of all agents."""
@@ -218,98 +376,3 @@ class Coordinator:
         # A more sophisticated implementation would use per-agent signals
         print(f"\nNote: Stop signal affects all agents (agent {agent_id} requested)")
         self.stop_all()
-
-
-def get_status(output_dir: Path | None = None) -> dict:
-    """
-    Get current orchestration status.
-
-    Args:
-        output_dir: Base output directory
-
-    Returns:
-        Dictionary with orchestration and agent states
-    """
-    if output_dir is None:
-        output_dir = get_output_dir()
-
-    state_manager = StateManager(output_dir)
-    config = load_config()
-
-    orch_state = state_manager.read_orchestration_state()
-    agent_states = state_manager.read_all_agent_states(len(config.agents))
-
-    return {
-        "orchestration": orch_state.to_dict() if orch_state else None,
-        "agents": [s.to_dict() if s else None for s in agent_states],
-        "total_jobs": state_manager.get_total_jobs(len(config.agents)),
-    }
-
-
-def print_status(output_dir: Path | None = None) -> None:
-    """
-    Print formatted status to console.
-
-    Args:
-        output_dir: Base output directory
-    """
-    if output_dir is None:
-        output_dir = get_output_dir()
-
-    state_manager = StateManager(output_dir)
-    config = load_config()
-
-    orch_state = state_manager.read_orchestration_state()
-    agent_states = state_manager.read_all_agent_states(len(config.agents))
-
-    print()
-    print("+" + "=" * 62 + "+")
-    print("|" + " " * 18 + "Job Search Orchestration" + " " * 20 + "|")
-    print("+" + "=" * 62 + "+")
-
-    for i, state in enumerate(agent_states):
-        agent_id = i + 1
-        agent_config = config.agents[i] if i < len(config.agents) else None
-        platform = agent_config.name if agent_config else f"Agent {agent_id}"
-
-        if state:
-            status = state.status.value.upper()[:8].ljust(8)
-            iteration = f"Iter {state.iteration}".ljust(8)
-            jobs = f"{state.jobs_found} jobs".ljust(8)
-
-            # Calculate time ago
-            if state.updated_at:
-                try:
-                    updated = datetime.fromisoformat(state.updated_at.replace("Z", "+00:00"))
-                    delta = datetime.now(timezone.utc) - updated
-                    mins = int(delta.total_seconds() / 60)
-                    time_ago = f"{mins}m ago" if mins < 60 else f"{mins // 60}h ago"
-                except:
-                    time_ago = "?"
-            else:
-                time_ago = "?"
-
-            print(f"| Agent {agent_id} ({platform:10}) | {status} | {iteration} | {jobs} | {time_ago:>6} |")
-        else:
-            print(f"| Agent {agent_id} ({platform:10}) | {'NONE':8} | {'---':8} | {'---':8} | {'---':>6} |")
-
-    print("+" + "-" * 62 + "+")
-
-    total_jobs = state_manager.get_total_jobs(len(config.agents))
-    running = sum(1 for s in agent_states if s and s.status == AgentStatus.RUNNING)
-
-    last_merge = ""
-    if orch_state and orch_state.last_merge_at:
-        try:
-            merged = datetime.fromisoformat(orch_state.last_merge_at.replace("Z", "+00:00"))
-            delta = datetime.now(timezone.utc) - merged
-            mins = int(delta.total_seconds() / 60)
-            last_merge = f"{mins}m ago" if mins < 60 else f"{mins // 60}h ago"
-        except:
-            last_merge = "?"
-    else:
-        last_merge = "never"
-
-    print(f"| Total: {total_jobs} jobs found | {running}/{len(config.agents)} running | Last merge: {last_merge:>8} |")
-    print("+" + "=" * 62 + "+")
-    print()
@@ -0,0 +1,376 @@
+"""
+Live Status Dashboard
+=====================
+
+`status --watch`: a terminal dashboard that refreshes in place.
+
+Each watched file keeps an open handle and its parsed value, and is only
+re-read when its inode, mtime or size changes, so an idle tick costs one
+stat per file. Redraws are diff-based: only changed lines are rewritten,
+which keeps the dashboard cheap with many agents on a slow SSH link.
+"""
+
+import json
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, TextIO
+
+from .config import get_output_dir, load_config
+from .state import JOBS_FILES, AgentState, OrchestrationState, find_agent_file
+from .status import format_age
+from .types import AgentConfig, AgentStatus
+
+# Samples older than this are dropped from rate calculations
+RATE_WINDOW_SECONDS = 600
+
+WIDTH = 78
+
+_CLEAR = "\x1b[2J\x1b[H"
+_ERASE_LINE = "\x1b[K"
+
+
+def _count(data: Any) -> int:
+    return len(data) if isinstance(data, list) else 0
+
+
+class WatchedFile:
+    """A JSON file that is re-parsed only when it changes on disk."""
+
+    def __init__(self, path: Path, parse: Callable[[Any], Any] = lambda data: data):
+        """
+        Initialize the watcher.
+
+        Args:
+            path: JSON file to watch (may not exist yet)
+            parse: Applied to the decoded JSON; only its result is cached
+        """
+        self.path = Path(path)
+        self.parse = parse
+        self.value: Any = None
+        self.reads = 0
+        self._handle: TextIO | None = None
+        self._key: tuple[int, int, int] | None = None
+
+    def refresh(self) -> bool:
+        """
+        Re-read the file if it changed.
+
+        A file caught mid-write keeps its previous value and is retried on
+        the next refresh.
+
+        Returns:
+            True if the cached value changed
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            self.close()
+            changed = self._key is not None
+            self.value = None
+            self._key = None
+            return changed
+
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if key == self._key:
+            return False
+
+        try:
+            # Writers truncate in place (same inode); atomic replaces need a reopen
+            if self._handle is None or os.fstat(self._handle.fileno()).st_ino != st.st_ino:
+                self.close()
+                self._handle = open(self.path)
+            self._handle.seek(0)
+            data = json.loads(self._handle.read())
+        except (json.JSONDecodeError, OSError):
+            return False
+
+        self._key = key
+        self.reads += 1
+        value = self.parse(data)
+        changed = bool(value != self.value)
+        self.value = value
+        return changed
+
+    def close(self) -> None:
+        """Close the file handle."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class Rate:
+    """Rate of change of a counter over a sliding window."""
+
+    def __init__(self, window: float = RATE_WINDOW_SECONDS):
+        self.window = window
+        self.samples: deque[tuple[float, int]] = deque()
+
+    def add(self, value: int, now: float) -> None:
+        """Record a counter sample."""
+        if self.samples and value < self.samples[-1][1]:
+            # Counter reset (agent restarted): start over
+            self.samples.clear()
+        self.samples.append((now, value))
+        while len(self.samples) > 2 and now - self.samples[0][0] > self.window:
+            self.samples.popleft()
+
+    def per_second(self) -> float | None:
+        """Rate over the window, or None with fewer than two samples."""
+        if len(self.samples) < 2:
+            return None
+        (t0, v0), (t1, v1) = self.samples[0], self.samples[-1]
+        if t1 <= t0:
+            return None
+        return (v1 - v0) / (t1 - t0)
+
+
+def _since_start(value: int, started_at: str) -> float | None:
+    """Average rate per second since an ISO start time."""
+    try:
+        started = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+    elapsed = (datetime.now(UTC) - started).total_seconds()
+    return value / elapsed if elapsed > 0 else None
+
+
+class AgentWatch:
+    """Cached state, job count and rates for one agent."""
+
+    def __init__(self, output_dir: Path, config: AgentConfig):
+        self.config = config
+        self.agent_dir = output_dir / f"agent-{config.id}"
+        self.state = WatchedFile(
+            self.agent_dir / "state.json",
+            lambda data: AgentState.from_dict(data) if isinstance(data, dict) else None,
+        )
+        self.jobs = WatchedFile(find_agent_file(self.agent_dir, JOBS_FILES), _count)
+        self.jobs_rate = Rate()
+        self.iterations_rate = Rate()
+
+    def refresh(self, now: float) -> bool:
+        """Re-read changed files and record rate samples. Returns True if anything changed."""
+        if self.jobs.value is None:
+            # Freelance sessions create data/jobs/jobs.json part way through
+            path = find_agent_file(self.agent_dir, JOBS_FILES)
+            if path != self.jobs.path:
+                self.jobs.close()
+                self.jobs = WatchedFile(path, _count)
+
+        changed = self.state.refresh()
+        changed = self.jobs.refresh() or changed
+
+        state: AgentState | None = self.state.value
+        if state is not None:
+            self.jobs_rate.add(self.job_count, now)
+            self.iterations_rate.add(state.iteration, now)
+        return changed
+
+    @property
+    def job_count(self) -> int:
+        """Jobs in the agent's jobs file, falling back to its reported count."""
+        if self.jobs.value is not None:
+            count: int = self.jobs.value
+            return count
+        return self.state.value.jobs_found if self.state.value else 0
+
+    def rates(self) -> tuple[float | None, float | None]:
+        """(jobs per minute, iterations per hour), windowed or since start."""
+        state: AgentState | None = self.state.value
+        if state is None:
+            return None, None
+        jobs = self.jobs_rate.per_second()
+        iterations = self.iterations_rate.per_second()
+        if jobs is None:
+            jobs = _since_start(self.job_count, state.started_at)
+        if iterations is None:
+            iterations = _since_start(state.iteration, state.started_at)
+        return (
+            jobs * 60 if jobs is not None else None,
+            iterations * 3600 if iterations is not None else None,
+        )
+
+    def close(self) -> None:
+        """Close file handles."""
+        self.state.close()
+        self.jobs.close()
+
+
+class StatusDashboard:
+    """Incrementally refreshed view over all agent and orchestration state."""
+
+    def __init__(self, output_dir: Path, agents: list[AgentConfig]):
+        """
+        Initialize the dashboard.
+
+        Args:
+            output_dir: Base output directory
+            agents: Agent configurations to show
+        """
+        self.output_dir = Path(output_dir)
+        self.agents = [AgentWatch(self.output_dir, config) for config in agents]
+        self.orchestration = WatchedFile(
+            self.output_dir / "orchestration-state.json",
+            lambda data: OrchestrationState.from_dict(data) if isinstance(data, dict) else None,
+        )
+        self.merged = WatchedFile(self.output_dir / "merged" / "jobs.json", _count)
+
+    def refresh(self, now: float | None = None) -> list[int]:
+        """
+        Re-read changed files.
+
+        Returns:
+            IDs of agents whose state or jobs changed
+        """
+        now = time.monotonic() if now is None else now
+        self.orchestration.refresh()
+        self.merged.refresh()
+        return [watch.config.id for watch in self.agents if watch.refresh(now)]
+
+    def frame(self) -> list[str]:
+        """Render the dashboard as lines."""
+        lines = [
+            "+" + "=" * (WIDTH - 2) + "+",
+            "|" + "Job Search Orchestration (watching)".center(WIDTH - 2) + "|",
+            "+" + "=" * (WIDTH - 2) + "+",
+        ]
+
+        running = 0
+        total_jobs = 0
+        for watch in self.agents:
+            label = f"Agent {watch.config.id} ({watch.config.name:10})"
+            state: AgentState | None = watch.state.value
+            if state is None:
+                row = f"| {label} | {'NONE':8} | {'---':8} | {'---':9} | {'---':>9} | {'---':>8} |"
+                lines.append(f"{row} {'---':>6} |"[:WIDTH])
+                continue
+
+            running += state.status == AgentStatus.RUNNING
+            total_jobs += watch.job_count
+            jobs_per_min, iterations_per_hour = watch.rates()
+            status = state.status.value.upper()[:8]
+            jobs_rate = f"{jobs_per_min:.1f}/min" if jobs_per_min is not None else "---"
+            iter_rate = f"{iterations_per_hour:.1f}/h" if iterations_per_hour is not None else "---"
+            lines.append(
+                f"| {label} | {status:8} | Iter {state.iteration:<3} | {watch.job_count:>4} jobs "
+                f"| {jobs_rate:>9} | {iter_rate:>8} | {format_age(state.updated_at):>6} |"
+            )
+            if state.error:
+                lines.append(f"|   error: {state.error}"[: WIDTH - 1].ljust(WIDTH - 1) + "|")
+            if state.stalls:
+                lines.append(
+                    f"|   {state.stalls} stalled: {state.last_stall}"[: WIDTH - 1].ljust(WIDTH - 1)
+                    + "|"
+                )
+            if state.circuit != "closed":
+                lines.append(
+                    f"|   circuit {state.circuit}: {state.circuit_reason}"[: WIDTH - 1].ljust(
+                        WIDTH - 1
+                    )
+                    + "|"
+                )
+            if state.restarts:
+                last = state.restart_history[-1]["error"] if state.restart_history else ""
+                lines.append(
+                    f"|   {state.restarts} restarts: {last}"[: WIDTH - 1].ljust(WIDTH - 1) + "|"
+                )
+
+        orch: OrchestrationState | None = self.orchestration.value
+        last_merge = format_age(orch.last_merge_at) if orch and orch.last_merge_at else "never"
+        merged = self.merged.value or 0
+
+        lines.append("+" + "-" * (WIDTH - 2) + "+")
+        lines.append(
+            f"| Total: {total_jobs} jobs | Merged: {merged} | {running}/{len(self.agents)} running "
+            f"| Last merge: {last_merge}"[: WIDTH - 1].ljust(WIDTH - 1)
+            + "|"
+        )
+        lines.append("+" + "=" * (WIDTH - 2) + "+")
+        return lines
+
+    def close(self) -> None:
+        """Close all file handles."""
+        for watch in self.agents:
+            watch.close()
+        self.orchestration.close()
+        self.merged.close()
+
+
+class DiffRenderer:
+    """Redraws a frame by rewriting only the lines that changed."""
+
+    def __init__(self, ansi: bool = True):
+        """
+        Initialize the renderer.
+
+        Args:
+            ansi: Use cursor addressing; otherwise print whole frames when they change
+        """
+        self.ansi = ansi
+        self.previous: list[str] | None = None
+
+    def render(self, lines: list[str]) -> str:
+        """Return the output needed to turn the previous frame into `lines`."""
+        previous = self.previous
+        self.previous = list(lines)
+
+        if not self.ansi:
+            return "" if lines == previous else "\n".join(lines) + "\n\n"
+        if previous is None:
+            return _CLEAR + "\n".join(lines) + "\n"
+
+        parts = []
+        for row, line in enumerate(lines):
+            if row >= len(previous) or previous[row] != line:
+                parts.append(f"\x1b[{row + 1};1H{line}{_ERASE_LINE}")
+        for row in range(len(lines), len(previous)):
+            parts.append(f"\x1b[{row + 1};1H{_ERASE_LINE}")
+        if parts:
+            # Park the cursor below the frame
+            parts.append(f"\x1b[{len(lines) + 1};1H")
+        return "".join(parts)
+
+
+def watch_status(
+    output_dir: Path | None = None,
+    interval: float = 2.0,
+    stream: TextIO | None = None,
+    max_refreshes: int | None = None,
+) -> int:
+    """
+    Run the live dashboard until interrupted.
+
+    Args:
+        output_dir: Base output directory
+        interval: Seconds between refreshes
+        stream: Output stream (default: stdout)
+        max_refreshes: Stop after this many refreshes (None to run until Ctrl+C)
+
+    Returns:
+        Exit code
+    """
+    if output_dir is None:
+        output_dir = get_output_dir()
+    stream = stream or sys.stdout
+
+    dashboard = StatusDashboard(output_dir, load_config().agents)
+    renderer = DiffRenderer(ansi=stream.isatty())
+    refreshes = 0
+    try:
+        while max_refreshes is None or refreshes < max_refreshes:
+            dashboard.refresh()
+            stream.write(renderer.render(dashboard.frame()))
+            stream.flush()
+            refreshes += 1
+            if max_refreshes is None or refreshes < max_refreshes:
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        stream.write("\n")
+    finally:
+        dashboard.close()
+    return 0
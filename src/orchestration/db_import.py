@@ -0,0 +1,292 @@
+"""
+Database Import
+===============
+
+Bulk-loads merged/jobs.json into the Postgres tables the UI uses
+(`jobs`, `companies`, `applications`; see ui/prisma/schema.prisma).
+
+Jobs are streamed with COPY into a temporary staging table, then merged
+with set-based statements:
+
+    companies     INSERT ... ON CONFLICT (name), filling in missing facts
+    jobs          INSERT ... ON CONFLICT (job_url) DO UPDATE, only where
+                  the job's content hash differs from the stored one
+    applications  a "new" application for every newly inserted job
+
+Requires the optional `psycopg` package (pip install "psycopg[binary]").
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+try:
+    import psycopg
+    from psycopg.types.json import Jsonb
+except ImportError:  # optional: pip install "psycopg[binary]"
+    psycopg = None  # type: ignore[assignment, unused-ignore]
+    Jsonb = None  # type: ignore[assignment, unused-ignore]
+
+from .publish import content_hash
+
+STAGING_TABLE = "staging_jobs"
+
+STAGING_COLUMNS = (
+    "external_id",
+    "job_url",
+    "ats_platform",
+    "company_name",
+    "role",
+    "location",
+    "salary",
+    "found_date",
+    "match_score",
+    "requirements",
+    "tech_stack",
+    "responsibilities",
+    "why_good_fit",
+    "experience_to_highlight",
+    "questions_to_ask",
+    "raw_data",
+    "content_hash",
+    "status",
+    "company_size",
+    "glassdoor_rating",
+    "funding",
+)
+
+CREATE_STAGING = f"""
+CREATE TEMP TABLE {STAGING_TABLE} (
+    external_id text,
+    job_url text PRIMARY KEY,
+    ats_platform text,
+    company_name text NOT NULL,
+    role text NOT NULL,
+    location text,
+    salary text,
+    found_date date,
+    match_score integer,
+    requirements text[],
+    tech_stack text[],
+    responsibilities text[],
+    why_good_fit text,
+    experience_to_highlight text[],
+    questions_to_ask text[],
+    raw_data jsonb,
+    content_hash text NOT NULL,
+    status text,
+    company_size text,
+    glassdoor_rating numeric(2, 1),
+    funding text
+) ON COMMIT DROP
+"""
+
+# Databases pushed before content hashes existed get the column on first import
+ADD_HASH_COLUMN = "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS content_hash varchar(64)"
+
+UPSERT_COMPANIES = f"""
+INSERT INTO companies (name, employee_count, glassdoor_rating, funding)
+SELECT DISTINCT ON (company_name)
+    left(company_name, 255), left(company_size, 50), glassdoor_rating, left(funding, 255)
+FROM {STAGING_TABLE}
+ORDER BY company_name, match_score DESC NULLS LAST
+ON CONFLICT (name) DO UPDATE SET
+    employee_count = COALESCE(companies.employee_count, EXCLUDED.employee_count),
+    glassdoor_rating = COALESCE(companies.glassdoor_rating, EXCLUDED.glassdoor_rating),
+    funding = COALESCE(companies.funding, EXCLUDED.funding),
+    updated_at = now()
+WHERE (companies.employee_count IS NULL AND EXCLUDED.employee_count IS NOT NULL)
+   OR (companies.glassdoor_rating IS NULL AND EXCLUDED.glassdoor_rating IS NOT NULL)
+   OR (companies.funding IS NULL AND EXCLUDED.funding IS NOT NULL)
+"""
+
+UPSERT_JOBS = f"""
+WITH upserted AS (
+    INSERT INTO jobs (
+        external_id, job_url, ats_platform, company_id, company_name, role, location,
+        salary, found_date, match_score, requirements, tech_stack, responsibilities,
+        why_good_fit, experience_to_highlight, questions_to_ask, raw_data, content_hash
+    )
+    SELECT
+        -- external_id is unique too; drop it if another URL already owns it
+        CASE WHEN EXISTS (
+            SELECT 1 FROM jobs other
+            WHERE other.external_id = s.external_id AND other.job_url <> s.job_url
+        ) THEN NULL ELSE left(s.external_id, 100) END,
+        s.job_url, left(s.ats_platform, 50), c.id, left(s.company_name, 255),
+        left(s.role, 500), left(s.location, 255), left(s.salary, 255), s.found_date,
+        s.match_score, s.requirements, s.tech_stack, s.responsibilities, s.why_good_fit,
+        s.experience_to_highlight, s.questions_to_ask, s.raw_data, s.content_hash
+    FROM {STAGING_TABLE} s
+    LEFT JOIN companies c ON c.name = left(s.company_name, 255)
+    ON CONFLICT (job_url) DO UPDATE SET
+        external_id = COALESCE(EXCLUDED.external_id, jobs.external_id),
+        ats_platform = EXCLUDED.ats_platform,
+        company_id = EXCLUDED.company_id,
+        company_name = EXCLUDED.company_name,
+        role = EXCLUDED.role,
+        location = EXCLUDED.location,
+        salary = EXCLUDED.salary,
+        found_date = EXCLUDED.found_date,
+        match_score = EXCLUDED.match_score,
+        requirements = EXCLUDED.requirements,
+        tech_stack = EXCLUDED.tech_stack,
+        responsibilities = EXCLUDED.responsibilities,
+        why_good_fit = EXCLUDED.why_good_fit,
+        experience_to_highlight = EXCLUDED.experience_to_highlight,
+        questions_to_ask = EXCLUDED.questions_to_ask,
+        raw_data = EXCLUDED.raw_data,
+        content_hash = EXCLUDED.content_hash,
+        updated_at = now()
+    WHERE jobs.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+    RETURNING id, job_url, (xmax = 0) AS inserted
+),
+applications_created AS (
+    INSERT INTO applications (job_id, status)
+    SELECT u.id,
+           (CASE WHEN s.status = 'priority' THEN 'reviewing' ELSE 'new' END)::application_status
+    FROM upserted u JOIN {STAGING_TABLE} s ON s.job_url = u.job_url
+    WHERE u.inserted
+    ON CONFLICT (job_id) DO NOTHING
+)
+SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM upserted
+"""
+
+
+@dataclass
+class ImportResult:
+    """Outcome of an import."""
+
+    total: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "total": self.total,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "skipped": self.skipped,
+        }
+
+
+def _date(value: Any) -> date | None:
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _rating(value: Any) -> float | None:
+    """A glassdoor_rating that fits numeric(2, 1), or None."""
+    try:
+        rating = round(float(str(value).split("/")[0]), 1)
+    except ValueError:
+        return None
+    return rating if 0 <= rating < 10 else None
+
+
+def _list(value: Any) -> list[str]:
+    if not isinstance(value, list):
+        return []
+    return [str(v) for v in value]
+
+
+def _score(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def staging_row(job: dict[str, Any]) -> tuple[Any, ...]:
+    """A job as a staging-table row, in STAGING_COLUMNS order."""
+    return (
+        job.get("id") or None,
+        job["job_url"],
+        job.get("ats_platform") or None,
+        job.get("company") or "Unknown",
+        job.get("role") or "",
+        job.get("location") or None,
+        job.get("salary") or None,
+        _date(job.get("found_date")),
+        _score(job.get("match_score")),
+        _list(job.get("requirements")),
+        _list(job.get("tech_stack")),
+        _list(job.get("responsibilities")),
+        job.get("why_good_fit") or None,
+        _list(job.get("experience_to_highlight")),
+        _list(job.get("questions_to_ask")),
+        Jsonb(job) if Jsonb is not None else json.dumps(job),
+        content_hash(job),
+        job.get("status") or None,
+        job.get("company_size") or None,
+        _rating(job.get("glassdoor_rating")),
+        job.get("funding") or None,
+    )
+
+
+def import_jobs(conn: Any, jobs: list[dict[str, Any]]) -> ImportResult:
+    """
+    Upsert jobs (and their companies) in one transaction.
+
+    Args:
+        conn: psycopg connection
+        jobs: Merged job records
+
+    Returns:
+        Counts of inserted, updated, unchanged and skipped (no URL or duplicate) jobs
+    """
+    result = ImportResult(total=len(jobs))
+    rows = []
+    seen: set[str] = set()
+    external_ids: set[str] = set()
+    for job in jobs:
+        url = job.get("job_url")
+        if not url or url in seen:
+            result.skipped += 1
+            continue
+        seen.add(url)
+        row = staging_row(job)
+        # Keep the first of any duplicated external_id; later ones import without it
+        if row[0] in external_ids:
+            row = (None, *row[1:])
+        elif row[0] is not None:
+            external_ids.add(row[0])
+        rows.append(row)
+
+    with conn.transaction():
+        with conn.cursor() as cur:
+            cur.execute(ADD_HASH_COLUMN)
+            cur.execute(CREATE_STAGING)
+            with cur.copy(
+                f"COPY {STAGING_TABLE} ({', '.join(STAGING_COLUMNS)}) FROM STDIN"
+            ) as copy:
+                for row in rows:
+                    copy.write_row(row)
+            cur.execute(UPSERT_COMPANIES)
+            cur.execute(UPSERT_JOBS)
+            result.inserted, result.updated = cur.fetchone()
+
+    result.unchanged = len(rows) - result.inserted - result.updated
+    return result
+
+
+def import_merged(jobs_file: Path, database_url: str) -> ImportResult:
+    """
+    Import a merged jobs file into the database at `database_url`.
+
+    Raises:
+        RuntimeError: psycopg is not installed
+    """
+    if psycopg is None:
+        raise RuntimeError('Database import needs psycopg: pip install "psycopg[binary]"')
+    with open(jobs_file) as f:
+        jobs = json.load(f)
+    with psycopg.connect(database_url) as conn:
+        return import_jobs(conn, jobs)
@@ -0,0 +1,129 @@
+"""
+Orchestration Events
+====================
+
+In-process publish/subscribe for progress events.
+
+Runners and the coordinator publish events as they happen; subscribers
+(the status server's SSE streams) each get their own bounded queue. A
+short history lets a reconnecting client resume from its last event ID.
+"""
+
+import asyncio
+import json
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .state import now_iso
+
+# Event types
+JOB_FOUND = "job_found"
+ITERATION_STARTED = "iteration_started"
+AGENT_COMPLETED = "agent_completed"
+MERGE_PUBLISHED = "merge_published"
+SESSION_STALLED = "session_stalled"
+AGENT_RESTARTED = "agent_restarted"
+AGENT_DISABLED = "agent_disabled"
+CIRCUIT_CHANGED = "circuit_changed"
+
+
+@dataclass
+class Event:
+    """A single published event."""
+
+    seq: int
+    type: str
+    timestamp: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {"seq": self.seq, "type": self.type, "timestamp": self.timestamp, **self.data}
+
+    def to_sse(self) -> bytes:
+        """Encode as a Server-Sent Events message."""
+        return (
+            f"id: {self.seq}\nevent: {self.type}\ndata: {json.dumps(self.to_dict())}\n\n".encode()
+        )
+
+
+class EventBus:
+    """Fans published events out to subscriber queues."""
+
+    def __init__(self, history: int = 256, queue_size: int = 1000):
+        """
+        Initialize the bus.
+
+        Args:
+            history: Recent events kept for resuming subscribers
+            queue_size: Per-subscriber queue bound; the oldest event is dropped when full
+        """
+        self.queue_size = queue_size
+        self._history: deque[Event] = deque(maxlen=history)
+        self._subscribers: set[asyncio.Queue[Event | None]] = set()
+        self._listeners: list[Callable[[Event], None]] = []
+        self._seq = 0
+        self.dropped = 0
+
+    def publish(self, type: str, **data: Any) -> Event:
+        """
+        Publish an event to all subscribers.
+
+        Safe to call from synchronous code running on the event loop.
+
+        Args:
+            type: Event type (e.g. JOB_FOUND)
+            **data: Event payload
+
+        Returns:
+            The published event
+        """
+        self._seq += 1
+        event = Event(seq=self._seq, type=type, timestamp=now_iso(), data=data)
+        self._history.append(event)
+        for listener in self._listeners:
+            listener(event)
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(event)
+        return event
+
+    def subscribe(self, after: int | None = None) -> asyncio.Queue[Event | None]:
+        """
+        Subscribe to events.
+
+        Args:
+            after: Replay retained events with a sequence number above this
+
+        Returns:
+            Queue receiving Event objects (the bus never puts None, so
+            consumers can use it to end their own stream)
+        """
+        queue: asyncio.Queue[Event | None] = asyncio.Queue(maxsize=self.queue_size)
+        if after is not None:
+            for event in self._history:
+                if event.seq > after and not queue.full():
+                    queue.put_nowait(event)
+        self._subscribers.add(queue)
+        return queue
+
+    def add_listener(self, listener: Callable[[Event], None]) -> None:
+        """Call `listener` synchronously with every published event."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, queue: asyncio.Queue[Event | None]) -> None:
+        """Stop delivering events to a queue."""
+        self._subscribers.discard(queue)
+
+    def recent(self) -> list[Event]:
+        """Retained recent events, oldest first."""
+        return list(self._history)
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of active subscribers."""
+        return len(self._subscribers)
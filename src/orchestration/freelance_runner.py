@@ -0,0 +1,160 @@
+"""
+Freelance Runner for Orchestration
+==================================
+
+Runs one freelance platform session loop under the coordinator, so
+`--platform all` can search every platform concurrently.
+"""
+
+from pathlib import Path
+
+from claude_agent_sdk import ClaudeAgentOptions
+
+from ..client import create_client_options, hook_matcher
+from ..progress import count_passing_tests
+from ..prompts import copy_spec_to_project, get_coding_prompt, get_initializer_prompt
+from ..security import DEFAULT_POLICY
+from .agent_runner import AgentRunner
+from .archive import PostingArchive
+from .breaker import PlatformBreakers
+from .company_cache import CompanyCache
+from .events import EventBus
+from .ratelimit import HostRateLimiter
+from .seen import SeenUrls
+from .session_log import SessionLogSink
+from .state import StateManager
+from .types import AgentConfig, SearchSettings, SessionLimits
+
+# Freelance platforms searched by `--platform all`, with their domains
+FREELANCE_PLATFORMS: dict[str, str] = {
+    "upwork": "upwork.com",
+    "fiverr": "fiverr.com",
+    "freelancer": "freelancer.com",
+    "toptal": "toptal.com",
+}
+
+
+def freelance_agent_configs(platforms: list[str] | None = None) -> list[AgentConfig]:
+    """
+    Build agent configs for freelance platforms.
+
+    Args:
+        platforms: Platforms to include (defaults to all of FREELANCE_PLATFORMS)
+
+    Returns:
+        One AgentConfig per platform, numbered from 1
+    """
+    platforms = platforms or list(FREELANCE_PLATFORMS)
+    return [
+        AgentConfig(
+            id=i + 1,
+            name=platform.upper(),
+            platform=platform,
+            domain=FREELANCE_PLATFORMS[platform],
+            prompt_file="",
+        )
+        for i, platform in enumerate(platforms)
+    ]
+
+
+class FreelanceRunner(AgentRunner):
+    """
+    Runs the single-agent freelance workflow for one platform.
+
+    Uses the initializer/coding prompts and feature_list.json progress
+    tracking of the single-agent runner, with the coordinator's state,
+    stop signal and merge handling.
+    """
+
+    def __init__(
+        self,
+        config: AgentConfig,
+        output_dir: Path,
+        state_manager: StateManager,
+        max_iterations: int | None = None,
+        company_cache: CompanyCache | None = None,
+        events: EventBus | None = None,
+        session_limits: SessionLimits | None = None,
+        log_sink: SessionLogSink | None = None,
+        breakers: PlatformBreakers | None = None,
+        rate_limiter: HostRateLimiter | None = None,
+        search: SearchSettings | None = None,
+        seen: SeenUrls | None = None,
+        archive: PostingArchive | None = None,
+        model: str = "",
+        skills: list[str] | None = None,
+    ):
+        """
+        Initialize the freelance runner.
+
+        Args:
+            config: Agent configuration for the platform
+            output_dir: Project directory for this platform
+            state_manager: State manager for reading/writing state
+            max_iterations: Maximum iterations (None for unlimited)
+            company_cache: Shared company research cache (unused by freelance sessions)
+            events: Event bus for progress events (None to disable)
+            session_limits: Per-session deadline and inactivity timeout
+            log_sink: Shared session log writer (defaults to a private one)
+            breakers: Shared platform circuit breakers (None to disable)
+            rate_limiter: Shared per-host limiter for WebFetch/WebSearch (None to disable)
+            search: Web search settings (unused by freelance sessions)
+            seen: Shared seen job URLs (unused by freelance sessions)
+            archive: Shared posting archive (unused by freelance sessions)
+            model: Claude model to use
+            skills: Skills to search for gigs
+        """
+        super().__init__(
+            config,
+            output_dir,
+            state_manager,
+            max_iterations,
+            company_cache,
+            events,
+            session_limits,
+            log_sink,
+            breakers,
+            rate_limiter,
+            search,
+            seen,
+            archive,
+        )
+        self.model = model
+        self.skills = skills or ["java", "aws", "devops"]
+        self._is_continuation = (self.output_dir / "feature_list.json").exists()
+
+    def _create_options(self) -> ClaudeAgentOptions:
+        """Create Claude agent options for this platform's project."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if not self._is_continuation:
+            copy_spec_to_project(self.output_dir, self.config.platform, self.skills)
+        options = create_client_options(self.output_dir, self.model, reducer=self.reducer)
+
+        pre_tool_hooks = [hook_matcher("Bash", DEFAULT_POLICY.hook)]
+        if self.rate_limiter is not None:
+            pre_tool_hooks.append(hook_matcher("WebFetch|WebSearch", self.rate_limiter.hook))
+        options.hooks = {
+            "PreToolUse": pre_tool_hooks,
+            "PostToolUse": [
+                hook_matcher("WebFetch", self.reducer.hook),
+                self._fetch_failure_hook(),
+                self._progress_hook(),
+            ],
+        }
+        return options
+
+    def _get_initial_prompt(self) -> str:
+        """Initializer prompt for new projects, coding prompt when resuming."""
+        if self._is_continuation:
+            return get_coding_prompt()
+        return get_initializer_prompt()
+
+    def _get_continue_prompt(self) -> str:
+        """Get prompt for continuation iterations."""
+        return get_coding_prompt()
+
+    def _is_complete(self) -> bool:
+        """Complete once every task in feature_list.json passes."""
+        passing, total = count_passing_tests(self.output_dir)
+        self._log(f"Progress: {passing}/{total} tasks complete")
+        return total > 0 and passing == total
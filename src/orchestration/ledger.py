@@ -0,0 +1,144 @@
+"""
+Token and Cost Ledger
+=====================
+
+Per-session token usage and cost, taken from the SDK's result messages.
+
+Each agent appends one line per session to `agent-N/ledger.jsonl`. The
+ledger spans runs, like the agent's jobs file, so the merge can divide
+an agent's lifetime cost by the unique qualifying jobs it contributed.
+"""
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .state import now_iso
+
+# Ledger file name, relative to an agent's output directory
+LEDGER_FILE = "ledger.jsonl"
+
+
+@dataclass
+class Usage:
+    """Token usage and cost, for one session or summed over many."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    cost_usd: float = 0.0
+    sessions: int = 0
+
+    @classmethod
+    def from_result(cls, usage: dict[str, Any] | None, cost_usd: float | None) -> "Usage":
+        """Build from a ResultMessage's usage dict and total_cost_usd."""
+        usage = usage or {}
+        return cls(
+            input_tokens=usage.get("input_tokens", 0) or 0,
+            output_tokens=usage.get("output_tokens", 0) or 0,
+            cache_read_tokens=usage.get("cache_read_input_tokens", 0) or 0,
+            cache_write_tokens=usage.get("cache_creation_input_tokens", 0) or 0,
+            cost_usd=cost_usd or 0.0,
+            sessions=1,
+        )
+
+    @classmethod
+    def from_state(cls, state: Any) -> "Usage":
+        """Read the token and cost fields of an AgentState or OrchestrationState."""
+        return cls(
+            input_tokens=state.input_tokens,
+            output_tokens=state.output_tokens,
+            cache_read_tokens=state.cache_read_tokens,
+            cache_write_tokens=state.cache_write_tokens,
+            cost_usd=state.cost_usd,
+        )
+
+    def apply_to(self, state: Any) -> None:
+        """Write the token and cost fields of an AgentState or OrchestrationState."""
+        state.input_tokens = self.input_tokens
+        state.output_tokens = self.output_tokens
+        state.cache_read_tokens = self.cache_read_tokens
+        state.cache_write_tokens = self.cache_write_tokens
+        state.cost_usd = self.cost_usd
+
+    @property
+    def total_tokens(self) -> int:
+        """All input, output and cache tokens."""
+        return (
+            self.input_tokens
+            + self.output_tokens
+            + self.cache_read_tokens
+            + self.cache_write_tokens
+        )
+
+    def add(self, other: "Usage") -> None:
+        """Add another usage in place."""
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.cache_read_tokens += other.cache_read_tokens
+        self.cache_write_tokens += other.cache_write_tokens
+        self.cost_usd += other.cost_usd
+        self.sessions += other.sessions
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        data = asdict(self)
+        data["cost_usd"] = round(self.cost_usd, 6)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Usage":
+        """Create from dictionary."""
+        return cls(
+            input_tokens=data.get("input_tokens", 0),
+            output_tokens=data.get("output_tokens", 0),
+            cache_read_tokens=data.get("cache_read_tokens", 0),
+            cache_write_tokens=data.get("cache_write_tokens", 0),
+            cost_usd=data.get("cost_usd", 0.0),
+            sessions=data.get("sessions", 1),
+        )
+
+
+def record_session(agent_dir: Path, usage: Usage, **context: Any) -> None:
+    """
+    Append one session's usage to the agent's ledger.
+
+    Args:
+        agent_dir: Agent output directory
+        usage: Usage of the session
+        **context: Extra fields (iteration, session_id, ...)
+    """
+    agent_dir.mkdir(parents=True, exist_ok=True)
+    with open(agent_dir / LEDGER_FILE, "a") as f:
+        f.write(json.dumps({"ts": now_iso(), **context, **usage.to_dict()}) + "\n")
+
+
+def read_ledger(agent_dir: Path) -> Usage:
+    """Sum an agent's ledger over all runs (empty if none)."""
+    total = Usage()
+    path = agent_dir / LEDGER_FILE
+    if not path.exists():
+        return total
+    with open(path) as f:
+        for line in f:
+            try:
+                total.add(Usage.from_dict(json.loads(line)))
+            except (json.JSONDecodeError, AttributeError):
+                continue
+    return total
+
+
+def cost_per_job(cost_usd: float, jobs: int) -> float | None:
+    """Cost per job, or None when no jobs were found."""
+    return round(cost_usd / jobs, 4) if jobs else None
+
+
+def format_cost(usage: Usage, jobs: int) -> str:
+    """One-line summary like "$4.12 | 1.2M tokens | $0.34/job"."""
+    tokens = usage.total_tokens
+    tokens_str = f"{tokens / 1e6:.1f}M" if tokens >= 1e6 else f"{tokens / 1e3:.0f}k"
+    per_job = cost_per_job(usage.cost_usd, jobs)
+    per_job_str = f"${per_job:.2f}/job" if per_job is not None else "---/job"
+    return f"${usage.cost_usd:.2f} | {tokens_str} tokens | {per_job_str}"
@@ -6,13 +6,35 @@ Merge job outputs from multiple agents into a single deduplicated list.
 """
 
 import json
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from .config import get_output_dir, PROJECT_ROOT
-
-
-def merge_outputs(output_dir: Path | None = None) -> int:
+from .archive import ARCHIVE_DIR, INDEX_FILE as ARCHIVE_INDEX_FILE, PostingArchive
+from .catalog import CATALOG_FILE, write_catalog
+from .changes import CHANGES_FILE, update_changes
+from .company_cache import COMPANY_CACHE_FILE, CompanyCache, normalize_company_name
+from .config import get_output_dir, load_config, PROJECT_ROOT
+from .ledger import Usage, cost_per_job, read_ledger
+from .publish import atomic_write_json, publish_json
+from .seen import SEEN_DIR, SeenUrls
+from .shards import PAGES_DIR, write_shards
+from .snapshots import SNAPSHOTS_DIR, SnapshotStore
+from .stats import STATS_FILE, update_stats
+from .state import COMPANIES_FILES, JOBS_FILES, find_agent_file, now_iso
+from .types import OrchestrationConfig
+
+# Merge metadata (counts, cost per job), next to merged/jobs.json
+METADATA_FILE = "metadata.json"
+
+
+def merge_outputs(
+    output_dir: Path | None = None,
+    min_score: int | None = None,
+    ui_data_dir: Path | None = None,
+    config: OrchestrationConfig | None = None,
+    publish_ui: bool = True,
+) -> int:
     """
     Merge outputs from all agents into a single file.
 
@@ -20,10 +42,23 @@ def merge_outputs(output_dir: Path | None = None) -> int:
     2. Combine into single list
     3. Deduplicate by job_url
     4. Sort by match_score descending
-    5. Write to output/merged/jobs.json
+    5. Publish to output/merged/jobs.json and the UI static data directory
+       (atomically, compact, with .gz/.br and content-hashed variants),
+       plus score-ordered summary pages and per-job detail files
+    6. Update facet counts and aggregates in output/merged/stats.json
+    7. Rebuild the searchable SQLite catalog, output/merged/jobs.sqlite
+    8. Append added/updated/removed jobs to output/merged/changes.jsonl
+    9. Commit a snapshot to output/snapshots, which survives `make reset`
+    10. Add every merged URL to the seen-URL set agents check before fetching
+    11. Train a new posting-archive dictionary once enough postings are stored
+    12. Write cost per unique qualifying job to output/merged/metadata.json
 
     Args:
         output_dir: Base output directory (defaults to project output/)
+        min_score: Score a job needs to qualify (defaults to scoring.min_score)
+        ui_data_dir: UI static data directory (defaults to ui/public/data)
+        config: Orchestration config (defaults to config/agents.json)
+        publish_ui: Mirror jobs, pages and stats to the UI static data directory
 
     Returns:
         Count of merged jobs
@@ -33,12 +68,22 @@ def merge_outputs(output_dir: Path | None = None) -> int:
     else:
         output_dir = Path(output_dir)
 
+    config = config or load_config()
+    if min_score is None:
+        min_score = config.scoring.min_score
+
+    if ui_data_dir is None:
+        ui_data_dir = PROJECT_ROOT / "ui" / "public" / "data"
+    ui_dirs = [ui_data_dir] if publish_ui else []
+
     all_jobs: list[dict[str, Any]] = []
     seen_urls: set[str] = set()
+    # Per URL, the earliest (found_date, agent) that reported it
+    first_found: dict[str, tuple[str, str]] = {}
 
     # Read jobs from each agent directory
     for agent_dir in sorted(output_dir.glob("agent-*")):
-        jobs_file = agent_dir / "jobs.json"
+        jobs_file = find_agent_file(agent_dir, JOBS_FILES)
         if not jobs_file.exists():
             continue
 
@@ -51,13 +96,25 @@ def merge_outputs(output_dir: Path | None = None) -> int:
 
             for job in jobs:
                 job_url = job.get("job_url", "")
-                if job_url and job_url not in seen_urls:
+                if not job_url:
+                    continue
+                # Jobs without a date lose ties to dated ones
+                found = (str(job.get("found_date") or "9999"), agent_dir.name)
+                first_found[job_url] = min(first_found.get(job_url, found), found)
+                if job_url not in seen_urls:
                     seen_urls.add(job_url)
                     all_jobs.append(job)
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Could not read {jobs_file}: {e}")
             continue
 
+    # Unique qualifying jobs credited to the agent that found them first
+    qualifying: dict[str, int] = {}
+    for job in all_jobs:
+        if (job.get("match_score") or 0) >= min_score:
+            agent = first_found[job["job_url"]][1]
+            qualifying[agent] = qualifying.get(agent, 0) + 1
+
     # Sort by match_score descending
     all_jobs.sort(key=lambda j: j.get("match_score", 0), reverse=True)
 
@@ -65,18 +122,65 @@ def merge_outputs(output_dir: Path | None = None) -> int:
     merged_dir = output_dir / "merged"
     merged_dir.mkdir(parents=True, exist_ok=True)
 
-    merged_file = merged_dir / "jobs.json"
-    with open(merged_file, "w") as f:
-        json.dump(all_jobs, f, indent=2)
+    # Serialize once; the UI static data for non-API mode gets the same files
+    published = publish_json(all_jobs, merged_dir / "jobs.json", mirrors=ui_dirs)
+    print(f"Merged {len(all_jobs)} unique jobs to {published.path} (etag {published.etag})")
+    if published.mirrors:
+        print(f"Published to UI static data: {published.mirrors[0]}")
+
+    # Score-ordered summary pages and per-job details for the static UI
+    write_shards(all_jobs, merged_dir / PAGES_DIR, mirrors=[d / PAGES_DIR for d in ui_dirs])
+
+    # Facet counts and aggregates, updated for the jobs that changed
+    platform_domains = {agent.domain: agent.platform for agent in config.agents}
+    stats = update_stats(all_jobs, merged_dir, platform_domains, mirrors=ui_dirs)
+    print(f"Updated {STATS_FILE} ({stats['changed_jobs']} jobs changed)")
+
+    # Searchable catalog for `python -m src.orchestration query`
+    write_catalog(all_jobs, merged_dir / CATALOG_FILE, platform_domains)
+    print(f"Wrote catalog to {merged_dir / CATALOG_FILE}")
+
+    # Sequenced deltas for downstream consumers
+    changes = update_changes(all_jobs, merged_dir)
+    print(
+        f"Appended {changes.total} changes to {CHANGES_FILE} "
+        f"({changes.added} added, {changes.updated} updated, {changes.removed} removed; "
+        f"seq {changes.last_seq}{', compacted' if changes.compacted else ''})"
+    )
+
+    # Cross-run history for `python -m src.orchestration diff`
+    snapshot = SnapshotStore(output_dir / SNAPSHOTS_DIR).commit(all_jobs)
+    if snapshot:
+        print(
+            f"Committed snapshot {snapshot['id']} ({snapshot['changed']} jobs changed, "
+            f"{snapshot['objects_stored']} new records stored)"
+        )
+    else:
+        print("No changes since the last snapshot")
 
-    print(f"Merged {len(all_jobs)} unique jobs to {merged_file}")
+    # Postings scored in this or any earlier run are not fetched again
+    if config.seen.enabled:
+        seen = SeenUrls(output_dir / SEEN_DIR, config.seen)
+        try:
+            seen.record_jobs(all_jobs, source="merge")
+            print(f"Seen-URL set: {len(seen)} processed postings")
+        finally:
+            seen.close()
+
+    # Dictionary training is too slow for the fetch hook, so it happens here
+    archive_dir = output_dir / ARCHIVE_DIR
+    if config.archive.enabled and (archive_dir / ARCHIVE_INDEX_FILE).exists():
+        archive = PostingArchive(archive_dir, config.archive)
+        try:
+            dict_id = archive.train_if_due()
+            if dict_id is not None:
+                print(f"Posting archive: trained dictionary {dict_id} on {len(archive)} postings")
+        finally:
+            archive.close()
 
-    # Also copy to UI static data for non-API mode
-    ui_data_file = PROJECT_ROOT / "ui" / "public" / "data" / "jobs.json"
-    ui_data_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(ui_data_file, "w") as f:
-        json.dump(all_jobs, f, indent=2)
-    print(f"Copied to UI static data: {ui_data_file}")
+    metadata = build_merge_metadata(output_dir, len(all_jobs), qualifying, min_score)
+    metadata["jobs_etag"] = published.etag
+    atomic_write_json(merged_dir / METADATA_FILE, metadata, indent=2)
 
     # Also merge companies if present
     merge_companies(output_dir)
@@ -84,23 +188,98 @@ def merge_outputs(output_dir: Path | None = None) -> int:
     return len(all_jobs)
 
 
-def merge_companies(output_dir: Path) -> int:
+def build_merge_metadata(
+    output_dir: Path,
+    job_count: int,
+    qualifying: dict[str, int],
+    min_score: int,
+) -> dict[str, Any]:
+    """
+    Summarize a merge: job counts and cost per unique qualifying job per platform.
+
+    Costs come from each agent's ledger, which spans runs like its jobs file.
+
+    Args:
+        output_dir: Base output directory
+        job_count: Unique merged jobs
+        qualifying: Agent directory name -> unique qualifying jobs it contributed
+        min_score: Score a job needed to qualify
+
+    Returns:
+        Metadata dictionary
+    """
+    platforms: dict[str, dict[str, Any]] = {}
+    total = Usage()
+    for agent_dir in sorted(output_dir.glob("agent-*")):
+        platform = agent_dir.name
+        state_file = agent_dir / "state.json"
+        if state_file.exists():
+            try:
+                with open(state_file) as f:
+                    platform = json.load(f).get("platform") or platform
+            except (json.JSONDecodeError, OSError):
+                pass
+
+        usage = read_ledger(agent_dir)
+        entry = platforms.setdefault(platform, {"qualifying_jobs": 0, "usage": Usage()})
+        entry["qualifying_jobs"] += qualifying.get(agent_dir.name, 0)
+        entry["usage"].add(usage)
+        total.add(usage)
+
+    total_qualifying = sum(qualifying.values())
+    return {
+        "merged_at": now_iso(),
+        "jobs": job_count,
+        "min_score": min_score,
+        "qualifying_jobs": total_qualifying,
+        "usage": total.to_dict(),
+        "cost_per_qualifying_job": cost_per_job(total.cost_usd, total_qualifying),
+        "platforms": {
+            platform: {
+                "qualifying_jobs": entry["qualifying_jobs"],
+                "usage": entry["usage"].to_dict(),
+                "cost_per_qualifying_job": cost_per_job(
+                    entry["usage"].cost_usd, entry["qualifying_jobs"]
+                ),
+            }
+            for platform, entry in platforms.items()
+        },
+    }
+
+
+def merge_companies(output_dir: Path, cache: CompanyCache | None = None) -> int:
     """
     Merge company data from all agents.
 
+    Conflicting fields are resolved per field: non-empty values win over
+    empty ones, and the most recently written agent file wins over older
+    ones. Merged facts are folded into the persistent company cache, and
+    fresh cached facts fill in fields no agent researched this run.
+
     Args:
         output_dir: Base output directory
+        cache: Company cache (defaults to output_dir/company-cache.json)
 
     Returns:
         Count of merged companies
     """
+    if cache is None:
+        cache = CompanyCache(output_dir / COMPANY_CACHE_FILE)
+
     all_companies: dict[str, dict[str, Any]] = {}
 
-    # Read companies from each agent directory
-    for agent_dir in sorted(output_dir.glob("agent-*")):
-        companies_file = agent_dir / "companies.json"
-        if not companies_file.exists():
-            continue
+    # Read companies from each agent directory, oldest file first
+    companies_files = [
+        find_agent_file(agent_dir, COMPANIES_FILES)
+        for agent_dir in sorted(output_dir.glob("agent-*"))
+    ]
+    companies_files = sorted(
+        (f for f in companies_files if f.exists()), key=lambda f: f.stat().st_mtime
+    )
+
+    for companies_file in companies_files:
+        observed_at = datetime.fromtimestamp(companies_file.stat().st_mtime, UTC).isoformat()
+        source = companies_file.relative_to(output_dir).parts[0]
 
         try:
             with open(companies_file) as f:
@@ -108,27 +287,42 @@ def merge_companies(output_dir: Path) -> int:
 
             # Handle both list and dict formats
             if isinstance(companies, list):
-                for company in companies:
-                    name = company.get("name", "")
-                    if name:
-                        all_companies[name] = company
+                entries = [(c.get("name", ""), c) for c in companies if isinstance(c, dict)]
             elif isinstance(companies, dict):
-                for name, data in companies.items():
-                    all_companies[name] = data
+                entries = [(name, data) for name, data in companies.items()]
+            else:
+                entries = []
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Could not read {companies_file}: {e}")
             continue
 
+        for name, data in entries:
+            if not name or not isinstance(data, dict):
+                continue
+            key = normalize_company_name(name)
+            merged = all_companies.setdefault(key, {"name": name})
+            for field_name, value in data.items():
+                if value not in (None, "", [], {}):
+                    merged[field_name] = value
+            facts = {k: v for k, v in data.items() if k != "name"}
+            cache.record(name, facts, source=source, observed_at=observed_at, save=False)
+
+    # Fill fields nobody researched this run from the cache
+    for merged in all_companies.values():
+        for field_name, value in cache.get(merged["name"]).items():
+            merged.setdefault(field_name, value)
+
     if not all_companies:
         return 0
 
+    cache.save()
+
     # Write merged output
     merged_dir = output_dir / "merged"
     merged_dir.mkdir(parents=True, exist_ok=True)
 
     merged_file = merged_dir / "companies.json"
-    with open(merged_file, "w") as f:
-        json.dump(list(all_companies.values()), f, indent=2)
+    atomic_write_json(merged_file, list(all_companies.values()))
 
     print(f"Merged {len(all_companies)} companies to {merged_file}")
 
@@ -153,10 +347,11 @@ def get_merge_stats(output_dir: Path | None = None) -> dict[str, Any]:
     merged_jobs_file = output_dir / "merged" / "jobs.json"
     merged_companies_file = output_dir / "merged" / "companies.json"
 
-    stats = {
+    stats: dict[str, Any] = {
         "merged_jobs": 0,
         "merged_companies": 0,
         "agents": {},
+        "metadata": None,
     }
 
     if merged_jobs_file.exists():
@@ -178,7 +373,7 @@ def get_merge_stats(output_dir: Path | None = None) -> dict[str, Any]:
     # Get per-agent stats
     for agent_dir in sorted(output_dir.glob("agent-*")):
         agent_name = agent_dir.name
-        jobs_file = agent_dir / "jobs.json"
+        jobs_file = find_agent_file(agent_dir, JOBS_FILES)
 
         agent_jobs = 0
         if jobs_file.exists():
@@ -191,4 +386,12 @@ def get_merge_stats(output_dir: Path | None = None) -> dict[str, Any]:
 
         stats["agents"][agent_name] = {"jobs": agent_jobs}
 
+    metadata_file = output_dir / "merged" / METADATA_FILE
+    if metadata_file.exists():
+        try:
+            with open(metadata_file) as f:
+                stats["metadata"] = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            pass
+
     return stats
@@ -0,0 +1,285 @@
+"""
+Orchestration Metrics
+=====================
+
+OpenMetrics (Prometheus) exposition for a running coordinator, served
+at /metrics by the status server.
+
+Nothing is read from disk per scrape: event counters are incremented as
+events are published, and gauges and histograms are read from the
+coordinator's in-memory state (runner AgentStates, tool latency
+histograms, cache counters and the event-loop lag monitor).
+"""
+
+import asyncio
+import time
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+from ..security import DEFAULT_POLICY
+from .breaker import CircuitState
+from .events import JOB_FOUND, Event
+from .telemetry import LatencyHistogram
+from .types import AgentStatus
+
+PREFIX = "jobsearch"
+
+# Merge duration buckets, in milliseconds
+MERGE_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10_000)
+
+# Event-loop lag buckets, in milliseconds
+LAG_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Exposition:
+    """Builds an OpenMetrics text exposition."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def family(self, name: str, kind: str, help: str, unit: str = "") -> None:
+        """Start a metric family."""
+        self.lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+        if unit:
+            self.lines.append(f"# UNIT {PREFIX}_{name} {unit}")
+        self.lines.append(f"# HELP {PREFIX}_{name} {help}")
+
+    def sample(self, name: str, value: float, **labels: Any) -> None:
+        """Add one sample."""
+        self.lines.append(f"{PREFIX}_{name}{_labels(labels)} {_number(value)}")
+
+    def histogram(self, name: str, histogram: LatencyHistogram, **labels: Any) -> None:
+        """Add a millisecond LatencyHistogram as a histogram in seconds."""
+        cumulative = 0
+        for bound, count in zip(histogram.buckets, histogram.counts):
+            cumulative += count
+            self.sample(f"{name}_bucket", cumulative, **labels, le=_number(bound / 1000))
+        self.sample(f"{name}_bucket", histogram.count, **labels, le="+Inf")
+        self.sample(f"{name}_count", histogram.count, **labels)
+        self.sample(f"{name}_sum", histogram.total_ms / 1000, **labels)
+
+    def render(self) -> str:
+        """The exposition text, terminated by # EOF."""
+        return "\n".join([*self.lines, "# EOF"]) + "\n"
+
+
+class LoopLagMonitor:
+    """Measures event-loop lag as the overshoot of a periodic sleep."""
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.last_ms = 0.0
+        self.histogram = LatencyHistogram(LAG_BUCKETS_MS)
+
+    async def run(self) -> None:
+        """Sample until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.last_ms = max(0.0, (loop.time() - started - self.interval) * 1000)
+            self.histogram.observe(self.last_ms)
+
+
+class MetricsCollector:
+    """Collects coordinator metrics into an OpenMetrics exposition."""
+
+    def __init__(self, coordinator: Any, lag_monitor: LoopLagMonitor | None = None):
+        """
+        Initialize the collector.
+
+        Args:
+            coordinator: Coordinator whose in-memory state is exported
+            lag_monitor: Event-loop lag monitor (None to omit lag metrics)
+        """
+        self.coordinator = coordinator
+        self.lag_monitor = lag_monitor
+        self.started = time.time()
+        self.events: Counter[str] = Counter()
+        self.jobs_found: Counter[tuple[int, str]] = Counter()
+        self.merge_durations = LatencyHistogram(MERGE_BUCKETS_MS)
+        coordinator.events.add_listener(self.on_event)
+
+    def on_event(self, event: Event) -> None:
+        """Update counters for a published event."""
+        self.events[event.type] += 1
+        if event.type == JOB_FOUND:
+            key = (event.data.get("agent_id", 0), event.data.get("platform", ""))
+            self.jobs_found[key] += event.data.get("new", 1)
+
+    def observe_merge(self, ms: float) -> None:
+        """Record how long a merge took."""
+        self.merge_durations.observe(ms)
+
+    def _runners(self) -> Iterable[Any]:
+        runners: Iterable[Any] = self.coordinator.runners
+        return runners
+
+    def render(self) -> str:
+        """Render all metrics."""
+        out = Exposition()
+
+        out.family("start_time_seconds", "gauge", "Coordinator start time", unit="seconds")
+        out.sample("start_time_seconds", self.started)
+
+        self._agent_metrics(out)
+
+        out.family("events", "counter", "Progress events published")
+        for event_type, count in sorted(self.events.items()):
+            out.sample("events_total", count, type=event_type)
+
+        out.family("jobs_found_events", "counter", "New jobs announced by job_found events")
+        for (agent_id, platform), count in sorted(self.jobs_found.items()):
+            out.sample("jobs_found_events_total", count, agent=agent_id, platform=platform)
+
+        self._latency_metrics(out)
+
+        out.family(
+            "merge_duration_seconds", "histogram", "Time to merge agent outputs", unit="seconds"
+        )
+        out.histogram("merge_duration_seconds", self.merge_durations)
+
+        self._cache_metrics(out)
+        self._circuit_metrics(out)
+        self._rate_limit_metrics(out)
+
+        if self.lag_monitor is not None:
+            out.family(
+                "event_loop_lag_seconds", "gauge", "Most recent event-loop lag", unit="seconds"
+            )
+            out.sample("event_loop_lag_seconds", self.lag_monitor.last_ms / 1000)
+            out.family(
+                "event_loop_lag_histogram_seconds",
+                "histogram",
+                "Event-loop lag samples",
+                unit="seconds",
+            )
+            out.histogram("event_loop_lag_histogram_seconds", self.lag_monitor.histogram)
+
+        return out.render()
+
+    def _agent_metrics(self, out: Exposition) -> None:
+        states = [(r.config, r.state) for r in self._runners() if getattr(r, "state", None)]
+
+        out.family("agent_status", "gauge", "1 for the agent's current status, 0 otherwise")
+        for config, state in states:
+            for status in AgentStatus:
+                out.sample(
+                    "agent_status",
+                    int(state.status == status),
+                    agent=config.id,
+                    platform=config.platform,
+                    status=status.value,
+                )
+
+        gauges = [
+            ("agent_iteration", "Current iteration", "iteration"),
+            ("agent_jobs_found", "Jobs in the agent's jobs file", "jobs_found"),
+        ]
+        for name, help, attr in gauges:
+            out.family(name, "gauge", help)
+            for config, state in states:
+                out.sample(name, getattr(state, attr), agent=config.id, platform=config.platform)
+
+        counters = [
+            ("agent_cost_usd", "Model cost this run, in USD", "cost_usd"),
+            ("agent_input_tokens", "Input tokens this run", "input_tokens"),
+            ("agent_output_tokens", "Output tokens this run", "output_tokens"),
+            ("agent_cache_read_tokens", "Cache read tokens this run", "cache_read_tokens"),
+            ("agent_pages_reduced", "Fetched pages reduced to structured records", "pages_reduced"),
+        ]
+        for name, help, attr in counters:
+            out.family(name, "counter", help)
+            for config, state in states:
+                out.sample(
+                    f"{name}_total", getattr(state, attr), agent=config.id, platform=config.platform
+                )
+
+    def _latency_metrics(self, out: Exposition) -> None:
+        runners = [r for r in self._runners() if hasattr(r, "tool_latencies")]
+
+        out.family(
+            "session_duration_seconds", "histogram", "Agent session wall time", unit="seconds"
+        )
+        for runner in runners:
+            out.histogram(
+                "session_duration_seconds",
+                runner.tool_latencies.session_durations,
+                agent=runner.config.id,
+                platform=runner.config.platform,
+            )
+
+        out.family("tool_call_duration_seconds", "histogram", "Tool call latency", unit="seconds")
+        for runner in runners:
+            for tool, histogram in sorted(runner.tool_latencies.tools.items()):
+                out.histogram(
+                    "tool_call_duration_seconds",
+                    histogram,
+                    agent=runner.config.id,
+                    platform=runner.config.platform,
+                    tool=tool,
+                )
+
+    def _circuit_metrics(self, out: Exposition) -> None:
+        breakers = getattr(self.coordinator, "breakers", None)
+        if breakers is None:
+            return
+        out.family(
+            "circuit_state", "gauge", "1 for the platform circuit's current state, 0 otherwise"
+        )
+        for platform, breaker in sorted(breakers.breakers.items()):
+            for state in CircuitState:
+                out.sample(
+                    "circuit_state",
+                    int(breaker.state == state),
+                    platform=platform,
+                    state=state.value,
+                )
+        out.family("circuit_trips", "counter", "Times a platform circuit opened")
+        for platform, breaker in sorted(breakers.breakers.items()):
+            out.sample("circuit_trips_total", breaker.trips, platform=platform)
+
+    def _rate_limit_metrics(self, out: Exposition) -> None:
+        limiter = getattr(self.coordinator, "rate_limiter", None)
+        if limiter is None:
+            return
+        out.family(
+            "rate_limit_wait_seconds",
+            "histogram",
+            "Time web tools waited for a host's rate limit",
+            unit="seconds",
+        )
+        for host, histogram in sorted(limiter.waits.items()):
+            out.histogram("rate_limit_wait_seconds", histogram, host=host)
+
+    def _cache_metrics(self, out: Exposition) -> None:
+        caches = {"bash_policy": DEFAULT_POLICY}
+        company_cache = getattr(self.coordinator, "company_cache", None)
+        if company_cache is not None:
+            caches["company"] = company_cache
+
+        out.family("cache_hits", "counter", "Cache hits")
+        for name, cache in caches.items():
+            out.sample("cache_hits_total", cache.hits, cache=name)
+        out.family("cache_misses", "counter", "Cache misses")
+        for name, cache in caches.items():
+            out.sample("cache_misses_total", cache.misses, cache=name)
+        out.family("cache_hit_ratio", "gauge", "Cache hits / lookups")
+        for name, cache in caches.items():
+            lookups = cache.hits + cache.misses
+            out.sample("cache_hit_ratio", cache.hits / lookups if lookups else 0.0, cache=name)
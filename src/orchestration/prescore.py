@@ -0,0 +1,190 @@
+"""
+Local Pre-Scorer
+================
+
+Scores archived postings against the candidate profile without a model
+or the network, so `rescore` can re-rank everything already fetched after
+prompts/resume.md or the score thresholds change.
+
+The score (0-100) is a weighted sum of four signals read from the profile:
+
+    stack      share of the posting's technologies the profile mentions   40
+    role       overlap between the posting title and a target role         30
+    level      posting seniority is one of the target levels               15
+    location   posting is remote (profile accepts remote) or in a
+               location the profile names                                   15
+
+It is a coarse stand-in for the agent's judgement: good for finding which
+postings move across the threshold when the profile changes, not for
+replacing the agent's score.
+"""
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..extraction import TECH_PATTERN
+from .config import PROJECT_ROOT
+
+PROFILE_FILE = PROJECT_ROOT / "prompts" / "resume.md"
+
+# Written under output/archive by `rescore`
+RESCORED_FILE = "rescored.json"
+
+STACK_WEIGHT = 40
+ROLE_WEIGHT = 30
+LEVEL_WEIGHT = 15
+LOCATION_WEIGHT = 15
+
+LEVELS = (
+    "intern",
+    "junior",
+    "mid",
+    "senior",
+    "staff",
+    "principal",
+    "lead",
+    "manager",
+    "director",
+    "head",
+    "distinguished",
+)
+
+# Words that say nothing about the role itself
+_STOPWORDS = {"a", "an", "and", "the", "of", "for", "in", "on", "or", "if", "to", "with", "ok"}
+
+# Location words too broad to count as a match
+_LOCATION_NOISE = {"remote", "hybrid", "onsite", "preferred", "us", "usa"}
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+_LIST_ITEM = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s+(.*)$")
+
+
+def _tokens(text: str) -> set[str]:
+    return set(_TOKEN.findall(text.lower())) - _STOPWORDS
+
+
+def _stack(text: str) -> set[str]:
+    return {match.group(1).lower() for match in TECH_PATTERN.finditer(text)}
+
+
+@dataclass
+class Profile:
+    """The parts of a candidate profile the pre-scorer uses."""
+
+    stack: set[str] = field(default_factory=set)
+    roles: list[set[str]] = field(default_factory=list)
+    levels: set[str] = field(default_factory=set)
+    locations: set[str] = field(default_factory=set)
+    remote: bool = False
+
+    @classmethod
+    def from_markdown(cls, text: str) -> "Profile":
+        """
+        Read a profile written like prompts/initializer_prompt.md.example:
+        technologies anywhere in the text, target roles as the list under a
+        "Target Roles" line, and locations from the "Location:" line.
+        """
+        profile = cls(stack=_stack(text))
+        in_roles = False
+        for line in text.splitlines():
+            stripped = line.strip().strip("*").strip()
+            if re.match(r"target roles?\b", stripped, re.IGNORECASE):
+                in_roles = True
+                continue
+            if re.match(r"location\s*:", stripped, re.IGNORECASE) and not profile.locations:
+                value = stripped.split(":", 1)[1].strip("* ")
+                profile.remote = "remote" in value.lower()
+                profile.locations = _tokens(value) - _LOCATION_NOISE
+                continue
+            if not in_roles:
+                continue
+            item = _LIST_ITEM.match(line)
+            if item:
+                role = _tokens(re.sub(r"\(.*?\)", " ", item.group(1)))
+                profile.levels |= role & set(LEVELS)
+                if role - set(LEVELS):
+                    profile.roles.append(role - set(LEVELS))
+            elif stripped:
+                in_roles = False
+        return profile
+
+
+def load_profile(path: Path | None = None) -> Profile:
+    """
+    Load the candidate profile.
+
+    Raises:
+        FileNotFoundError: the profile does not exist
+    """
+    with open(path or PROFILE_FILE) as f:
+        return Profile.from_markdown(f.read())
+
+
+def prescore(profile: Profile, posting: dict[str, Any]) -> int:
+    """Score an archived posting (title, location, stack, text) against the profile."""
+    title = posting.get("title", "")
+    text = " ".join([title, posting.get("text", "")] + [str(v) for v in posting.get("stack", [])])
+
+    stack = _stack(text)
+    stack_score = len(stack & profile.stack) / len(stack) if stack else 0.5
+
+    title_tokens = _tokens(title) - set(LEVELS)
+    role_score = max(
+        (len(title_tokens & role) / len(title_tokens | role) for role in profile.roles),
+        default=0.5,
+    )
+
+    title_levels = _tokens(title) & set(LEVELS)
+    if not title_levels or not profile.levels:
+        level_score = 0.5
+    else:
+        level_score = 1.0 if title_levels & profile.levels else 0.0
+
+    location = posting.get("location", "").lower()
+    if not location:
+        location_score = 0.5
+    elif (profile.remote and "remote" in location) or _tokens(location) & profile.locations:
+        location_score = 1.0
+    else:
+        location_score = 0.0
+
+    return round(
+        STACK_WEIGHT * stack_score
+        + ROLE_WEIGHT * role_score
+        + LEVEL_WEIGHT * level_score
+        + LOCATION_WEIGHT * location_score
+    )
+
+
+def rescore_postings(
+    profile: Profile,
+    postings: Iterable[tuple[str, dict[str, Any]]],
+    previous: dict[str, int | None] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Score every posting, highest first.
+
+    Args:
+        profile: Candidate profile
+        postings: (URL, archived posting) pairs
+        previous: Scores the agents gave, by URL
+
+    Returns:
+        One row per posting: job_url, title, company, previous_score, score
+    """
+    previous = previous or {}
+    rows = [
+        {
+            "job_url": url,
+            "title": posting.get("title", ""),
+            "company": posting.get("company", ""),
+            "previous_score": previous.get(url),
+            "score": prescore(profile, posting),
+        }
+        for url, posting in postings
+    ]
+    rows.sort(key=lambda r: (-r["score"], r["job_url"]))
+    return rows
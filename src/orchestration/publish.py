@@ -0,0 +1,227 @@
+"""
+Atomic Publishing
+=================
+
+Writes merged outputs so readers never see a half-written file.
+
+Each document is serialized once, in compact form, to a temporary file in
+the destination directory and renamed into place. Next to it go
+precompressed `.gz` (and `.br`, when the optional `brotli` package is
+installed) variants, a content-hashed copy (`jobs.<hash>.json`) that can
+be cached forever, and a small `<stem>.version.json` naming the current
+hash. Mirrors (the UI's static data directory) get hardlinks of the same
+files, or a kernel-side `copy_file_range` copy across filesystems.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None  # type: ignore[assignment, unused-ignore]
+
+# Hex digits of the content hash used in filenames and ETags
+HASH_LENGTH = 16
+
+# Content-hashed generations kept per document, so clients holding the
+# previous version file can still fetch what it names
+KEEP_VERSIONS = 2
+
+
+@dataclass
+class PublishedFile:
+    """Files written for one published document."""
+
+    path: Path
+    etag: str
+    size: int
+    hashed_path: Path
+    variants: list[Path] = field(default_factory=list)
+    mirrors: list[Path] = field(default_factory=list)
+
+    def files(self) -> list[Path]:
+        """Every file written in the document's own directory."""
+        return [
+            self.path,
+            *self.variants,
+            self.hashed_path,
+            *self._hashed_variants(),
+            self.version_path,
+        ]
+
+    @property
+    def version_path(self) -> Path:
+        return self.path.with_name(f"{self.path.stem}.version.json")
+
+    def _hashed_variants(self) -> list[Path]:
+        return [self.hashed_path.with_name(self.hashed_path.name + v.suffix) for v in self.variants]
+
+
+def dumps_compact(data: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def content_hash(data: Any) -> str:
+    """
+    Content hash of a JSON document, or of bytes already serialized with dumps_compact.
+
+    Used for ETags, hashed filenames and change detection across the merge
+    artifacts, so equal content hashes the same everywhere.
+    """
+    body = data if isinstance(data, bytes) else dumps_compact(data)
+    return hashlib.sha256(body).hexdigest()[:HASH_LENGTH]
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write `data` to a temp file beside `path`, fsync it and rename it into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_json(path: Path, data: Any, indent: int | None = None) -> None:
+    """Atomically write JSON (compact unless `indent` is given)."""
+    body = (
+        dumps_compact(data) if indent is None else json.dumps(data, indent=indent).encode("utf-8")
+    )
+    atomic_write(path, body)
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """
+    Atomically place `src`'s content at `dst`.
+
+    Hardlinks when both are on one filesystem; otherwise copies with
+    `os.copy_file_range` (falling back to a userspace copy) into a temp file
+    that is renamed into place.
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        try:
+            os.link(src, tmp)
+        except OSError:
+            _copy(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _copy(src: Path, dst: Path) -> None:
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        copy_file_range = getattr(os, "copy_file_range", None)
+        if copy_file_range is not None:
+            remaining = os.fstat(fin.fileno()).st_size
+            try:
+                while remaining > 0:
+                    copied = copy_file_range(fin.fileno(), fout.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return
+            except OSError:
+                pass
+            fin.seek(0)
+            fout.seek(0)
+            fout.truncate()
+        shutil.copyfileobj(fin, fout)
+
+
+def _compressed_variants(body: bytes) -> dict[str, bytes]:
+    variants = {".gz": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(body)
+    return variants
+
+
+def _prune_versions(directory: Path, stem: str, suffix: str, keep: set[str]) -> None:
+    pattern = re.compile(rf"^{re.escape(stem)}\.([0-9a-f]{{{HASH_LENGTH}}}){re.escape(suffix)}$")
+    generations: dict[str, float] = {}
+    for path in directory.iterdir():
+        match = pattern.match(path.name)
+        if match:
+            generations[match.group(1)] = path.stat().st_mtime
+    newest = sorted(generations, key=generations.__getitem__, reverse=True)
+    stale = [h for h in newest if h not in keep][max(0, KEEP_VERSIONS - len(keep)) :]
+    for etag in stale:
+        for variant in ("", ".gz", ".br"):
+            (directory / f"{stem}.{etag}{suffix}{variant}").unlink(missing_ok=True)
+
+
+def publish_json(data: Any, path: Path, mirrors: list[Path] | None = None) -> PublishedFile:
+    """
+    Publish a JSON document atomically, with compressed and hashed variants.
+
+    Args:
+        data: JSON-serializable document
+        path: Destination, e.g. output/merged/jobs.json
+        mirrors: Directories that get the same files (hardlinked or copied)
+
+    Returns:
+        What was written
+    """
+    path = Path(path)
+    body = dumps_compact(data)
+    etag = content_hash(body)
+    hashed = path.with_name(f"{path.stem}.{etag}{path.suffix}")
+
+    atomic_write(path, body)
+    variants = []
+    for suffix, compressed in _compressed_variants(body).items():
+        variant = path.with_name(path.name + suffix)
+        atomic_write(variant, compressed)
+        variants.append(variant)
+    # Stale .br files from a run that had brotli would otherwise go out of date
+    if brotli is None:
+        path.with_name(path.name + ".br").unlink(missing_ok=True)
+
+    link_or_copy(path, hashed)
+    for variant in variants:
+        link_or_copy(variant, hashed.with_name(hashed.name + variant.suffix))
+
+    published = PublishedFile(
+        path=path, etag=etag, size=len(body), hashed_path=hashed, variants=variants
+    )
+    atomic_write_json(
+        published.version_path,
+        {
+            "etag": etag,
+            "file": hashed.name,
+            "bytes": len(body),
+            "encodings": [v.suffix.lstrip(".") for v in variants],
+        },
+    )
+    _prune_versions(path.parent, path.stem, path.suffix, {etag})
+
+    for mirror in mirrors or []:
+        mirror = Path(mirror)
+        for file in published.files():
+            link_or_copy(file, mirror / file.name)
+        if brotli is None:
+            (mirror / (path.name + ".br")).unlink(missing_ok=True)
+        _prune_versions(mirror, path.stem, path.suffix, {etag})
+        published.mirrors.append(mirror / path.name)
+
+    return published
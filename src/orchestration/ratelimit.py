@@ -0,0 +1,137 @@
+"""
+Per-Host Rate Limiting
+======================
+
+Coordinator-wide politeness for WebFetch and WebSearch.
+
+Every agent in the process shares one token bucket per destination host,
+refilled at one request per `search.delayBetweenRequests` seconds
+(orchestration/config.json). A PreToolUse hook takes a token before the
+tool runs, waiting if the host's bucket is empty, and records how long it
+waited so the limits can be tuned.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+from urllib.parse import urlparse
+
+from .telemetry import LatencyHistogram
+
+# Bucket key for WebSearch, whose destination is the search backend
+WEB_SEARCH_HOST = "web-search"
+
+# Hook wait buckets, in milliseconds
+WAIT_BUCKETS_MS = (0, 100, 500, 1000, 2500, 5000, 10_000, 30_000, 60_000)
+
+
+def tool_host(tool_name: str, tool_input: dict[str, Any]) -> str | None:
+    """The bucket key for a web tool call, or None if it is not rate limited."""
+    if tool_name == "WebSearch":
+        return WEB_SEARCH_HOST
+    if tool_name == "WebFetch":
+        host = urlparse(tool_input.get("url", "")).hostname
+        return host.lower().removeprefix("www.") if host else None
+    return None
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations in arrival order."""
+
+    def __init__(
+        self, rate: float, capacity: float = 1, clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst
+            clock: Monotonic clock, in seconds
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = capacity
+        self.updated = clock()
+
+    def reserve(self) -> float:
+        """Take a token, returning how many seconds to wait before using it."""
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+class HostRateLimiter:
+    """Shared per-host buckets and the PreToolUse hook that applies them."""
+
+    def __init__(
+        self,
+        delay_between_requests: float = 5,
+        burst: float = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            delay_between_requests: Seconds between requests to one host (0 disables)
+            burst: Requests allowed back to back before pacing starts
+            clock: Monotonic clock, in seconds
+            sleep: Coroutine used for waits
+        """
+        self.delay_between_requests = delay_between_requests
+        self.burst = burst
+        self.clock = clock
+        self.sleep = sleep
+        self.buckets: dict[str, TokenBucket] = {}
+        self.waits: dict[str, LatencyHistogram] = {}
+
+    async def acquire(self, host: str) -> float:
+        """Wait for a request slot to `host`; returns the seconds waited."""
+        if self.delay_between_requests <= 0:
+            return 0.0
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(1 / self.delay_between_requests, self.burst, self.clock)
+            self.buckets[host] = bucket
+        wait = bucket.reserve()
+        if wait > 0:
+            await self.sleep(wait)
+        self.waits.setdefault(host, LatencyHistogram(WAIT_BUCKETS_MS)).observe(wait * 1000)
+        return wait
+
+    async def hook(
+        self,
+        input_data: dict[str, Any],
+        tool_use_id: str | None = None,
+        context: Any | None = None,
+    ) -> dict[str, Any]:
+        """
+        Pre-tool-use hook for WebFetch and WebSearch.
+
+        Waits for the destination host's bucket and lets the call proceed.
+        """
+        host = tool_host(input_data.get("tool_name", ""), input_data.get("tool_input", {}))
+        if host is not None:
+            await self.acquire(host)
+        return {}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Per-host wait histograms."""
+        return {
+            "delay_between_requests": self.delay_between_requests,
+            "hosts": {host: histogram.to_dict() for host, histogram in sorted(self.waits.items())},
+        }
+
+
+def format_wait_report(limiter: HostRateLimiter, top: int = 5) -> list[str]:
+    """Format the hosts with the most rate-limit waiting."""
+    ranked = sorted(limiter.waits.items(), key=lambda item: item[1].total_ms, reverse=True)
+    return [
+        f"    {host:28} {histogram.count:>5} calls  waited {histogram.total_ms / 1000:.0f}s  "
+        f"p95 {histogram.quantile(0.95) / 1000:.1f}s"
+        for host, histogram in ranked[:top]
+    ]
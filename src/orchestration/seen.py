@@ -0,0 +1,296 @@
+"""
+Seen Job URLs
+=============
+
+Remembers every job URL that has been scored, across agents and runs, so
+agents do not fetch and re-score postings someone already processed.
+
+    seen/urls.bloom    mmap-backed Bloom filter over canonical URLs
+    seen/urls.sqlite   exact URL -> score set, the source of truth
+
+A lookup checks the Bloom filter first; a miss (the common case for new
+postings) is answered from memory, and only possible hits go to SQLite,
+which rules out false positives and supplies the score. The filter is
+sized for `capacity` URLs at the configured false-positive rate (1M URLs
+at 0.1% is about 1.8 MB) and is rebuilt from the exact set, at double the
+capacity, when it fills up or its parameters change.
+
+Both files live under output/seen, which `make reset` leaves alone.
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import sqlite3
+import struct
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from .snapshots import canonical_url
+from .types import SeenPolicy
+
+SEEN_DIR = "seen"
+BLOOM_FILE = "urls.bloom"
+EXACT_FILE = "urls.sqlite"
+
+# magic, capacity, bits, hash count, items added
+_MAGIC = b"AJSBLM01"
+_HEADER = struct.Struct("<8sQQQQ")
+
+
+def bloom_parameters(capacity: int, fp_rate: float) -> tuple[int, int]:
+    """Optimal (bits, hash count) for `capacity` items at `fp_rate`."""
+    bits = math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2)
+    bits = max(64, (bits + 7) // 8 * 8)
+    hashes = max(1, round(bits / capacity * math.log(2)))
+    return bits, hashes
+
+
+class BloomFilter:
+    """A Bloom filter whose bit array is a memory-mapped file."""
+
+    def __init__(self, path: Path, capacity: int, fp_rate: float):
+        self.path = Path(path)
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.bits, self.hashes = bloom_parameters(capacity, fp_rate)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        size = _HEADER.size + self.bits // 8
+        with open(self.path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, capacity, self.bits, self.hashes, 0))
+            f.truncate(size)
+        self._open()
+
+    @classmethod
+    def load(cls, path: Path, fp_rate: float) -> "BloomFilter | None":
+        """Open an existing filter built for `fp_rate`, or None if unusable."""
+        try:
+            with open(path, "rb") as f:
+                magic, capacity, bits, hashes, _ = _HEADER.unpack(f.read(_HEADER.size))
+            size = Path(path).stat().st_size
+        except (OSError, struct.error):
+            return None
+        if magic != _MAGIC or (bits, hashes) != bloom_parameters(capacity, fp_rate):
+            return None
+        if size != _HEADER.size + bits // 8:
+            return None
+        bloom = cls.__new__(cls)
+        bloom.path, bloom.capacity, bloom.fp_rate = Path(path), capacity, fp_rate
+        bloom.bits, bloom.hashes = bits, hashes
+        bloom._open()
+        return bloom
+
+    def _open(self) -> None:
+        self._file = open(self.path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    @property
+    def count(self) -> int:
+        """Items added."""
+        count: int = _HEADER.unpack_from(self._map)[4]
+        return count
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._map)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._map[_HEADER.size + (pos >> 3)] |= 1 << (pos & 7)
+        struct.pack_into("<Q", self._map, _HEADER.size - 8, self.count + 1)
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._map[_HEADER.size + (pos >> 3)] & (1 << (pos & 7)) for pos in self._positions(key)
+        )
+
+    def flush(self) -> None:
+        self._map.flush()
+
+    def close(self) -> None:
+        self._map.flush()
+        self._map.close()
+        self._file.close()
+
+
+@dataclass
+class SeenEntry:
+    """A processed job URL."""
+
+    url: str
+    score: int | None
+    source: str
+
+
+class SeenUrls:
+    """Bloom filter plus exact set of processed job URLs."""
+
+    def __init__(self, directory: Path, policy: SeenPolicy | None = None):
+        self.directory = Path(directory)
+        self.policy = policy or SeenPolicy()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.directory / EXACT_FILE, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            "url TEXT PRIMARY KEY, score INTEGER, source TEXT, seen_at TEXT) WITHOUT ROWID"
+        )
+        self._db.commit()
+        self.lookups = 0
+        self.filtered = 0
+        self.hits = 0
+        self.false_positives = 0
+        # tool_use_ids of fetches the hook denied, so they are not mistaken for failures
+        self._denied: set[str] = set()
+
+        bloom = BloomFilter.load(self.directory / BLOOM_FILE, self.policy.false_positive_rate)
+        if bloom is None or bloom.capacity < self.policy.capacity:
+            if bloom is not None:
+                bloom.close()
+            bloom = self._rebuild(max(self.policy.capacity, 2 * len(self)))
+        self.bloom = bloom
+
+    def __len__(self) -> int:
+        count: int = self._db.execute("SELECT count(*) FROM seen").fetchone()[0]
+        return count
+
+    def _rebuild(self, capacity: int) -> BloomFilter:
+        """A new filter with room for `capacity` URLs, filled from the exact set."""
+        tmp = self.directory / f".{BLOOM_FILE}.{os.getpid()}.tmp"
+        bloom = BloomFilter(tmp, capacity, self.policy.false_positive_rate)
+        for (url,) in self._db.execute("SELECT url FROM seen"):
+            bloom.add(url)
+        bloom.flush()
+        os.replace(tmp, self.directory / BLOOM_FILE)
+        bloom.path = self.directory / BLOOM_FILE
+        return bloom
+
+    def lookup(self, url: str) -> SeenEntry | None:
+        """The entry for `url` if it was already processed."""
+        self.lookups += 1
+        key = canonical_url(url)
+        if key not in self.bloom:
+            self.filtered += 1
+            return None
+        row = self._db.execute("SELECT score, source FROM seen WHERE url = ?", (key,)).fetchone()
+        if row is None:
+            self.false_positives += 1
+            return None
+        self.hits += 1
+        return SeenEntry(url=key, score=row[0], source=row[1])
+
+    def partition(self, urls: Iterable[str]) -> tuple[list[str], list[SeenEntry]]:
+        """Split URLs into (not yet processed, already processed)."""
+        new, seen = [], []
+        for url in urls:
+            entry = self.lookup(url)
+            if entry is None:
+                new.append(url)
+            else:
+                seen.append(entry)
+        return new, seen
+
+    def record(self, entries: Iterable[tuple[str, int | None, str]]) -> int:
+        """
+        Record processed URLs as (url, score, source).
+
+        Returns:
+            Number of entries written
+        """
+        now = datetime.now(UTC).isoformat()
+        rows = [(canonical_url(url), score, source, now) for url, score, source in entries if url]
+        if not rows:
+            return 0
+        # The filter goes first, so it always covers the exact set even if
+        # the process dies between the two writes
+        for key, *_ in rows:
+            if key not in self.bloom:
+                self.bloom.add(key)
+        self.bloom.flush()
+        with self._db:
+            self._db.executemany(
+                "INSERT INTO seen VALUES (?, ?, ?, ?) ON CONFLICT (url) DO UPDATE SET "
+                "score = excluded.score, source = excluded.source, seen_at = excluded.seen_at "
+                "WHERE seen.score IS NOT excluded.score",
+                rows,
+            )
+        if self.bloom.count > self.bloom.capacity:
+            self.bloom.close()
+            self.bloom = self._rebuild(2 * max(self.bloom.capacity, len(self)))
+        return len(rows)
+
+    def record_jobs(self, jobs: Iterable[dict[str, Any]], source: str) -> int:
+        """Record the URLs and scores of job records."""
+        return self.record(
+            (job.get("job_url", ""), job.get("match_score"), source)
+            for job in jobs
+            if isinstance(job, dict)
+        )
+
+    async def hook(
+        self,
+        input_data: dict[str, Any],
+        tool_use_id: str | None = None,
+        context: Any | None = None,
+    ) -> dict[str, Any]:
+        """
+        Pre-tool-use hook for WebFetch.
+
+        Denies fetching a posting that was already scored, telling the agent
+        its score instead.
+        """
+        if input_data.get("tool_name") != "WebFetch":
+            return {}
+        url = input_data.get("tool_input", {}).get("url", "")
+        entry = self.lookup(url) if url else None
+        if entry is None:
+            return {}
+
+        if tool_use_id:
+            self._denied.add(tool_use_id)
+        score = entry.score if entry.score is not None else "unknown"
+        reason = (
+            f"Already processed (score {score}): {url}. Skip it and move on to another posting."
+        )
+        return {
+            "decision": "block",
+            "reason": reason,
+            "hookSpecificOutput": {
+                "hookEventName": "PreToolUse",
+                "permissionDecision": "deny",
+                "permissionDecisionReason": reason,
+            },
+        }
+
+    def pop_denied(self, tool_use_id: str) -> bool:
+        """Whether the hook denied this tool use (forgetting it afterwards)."""
+        if tool_use_id in self._denied:
+            self._denied.discard(tool_use_id)
+            return True
+        return False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Lookup counters and filter size."""
+        return {
+            "urls": len(self),
+            "lookups": self.lookups,
+            "filtered": self.filtered,
+            "hits": self.hits,
+            "false_positives": self.false_positives,
+            "bloom_bytes": self.bloom.size_bytes,
+            "bloom_capacity": self.bloom.capacity,
+        }
+
+    def close(self) -> None:
+        self.bloom.close()
+        self._db.close()
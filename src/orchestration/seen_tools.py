@@ -0,0 +1,52 @@
+"""
+Seen URL Tools
+==============
+
+In-process MCP tool that lets agents drop already-processed postings
+from search results before fetching any of them.
+"""
+
+import json
+import re
+from typing import Any
+
+from claude_agent_sdk import create_sdk_mcp_server, tool
+
+from .seen import SeenUrls
+
+SERVER_NAME = "seen_urls"
+
+# Tool names as exposed to the agent
+SEEN_TOOL_NAMES = [f"mcp__{SERVER_NAME}__filter_seen_urls"]
+
+_URL = re.compile(r"https?://\S+")
+
+
+def create_seen_server(seen: SeenUrls) -> Any:
+    """
+    Create the seen-URL MCP server.
+
+    Args:
+        seen: Shared seen-URL set
+
+    Returns:
+        SDK MCP server config for ClaudeAgentOptions.mcp_servers
+    """
+
+    @tool(
+        "filter_seen_urls",
+        "Check job posting URLs (whitespace or newline separated) against every posting "
+        "already scored by any agent or earlier run. Returns the URLs still worth fetching "
+        "and the scores of the ones already processed.",
+        {"urls": str},
+    )
+    async def filter_seen_urls(args: dict[str, Any]) -> dict[str, Any]:
+        urls = _URL.findall(args.get("urls", ""))
+        new, seen_entries = seen.partition(urls)
+        payload = {
+            "new": new,
+            "already_processed": [{"url": e.url, "score": e.score} for e in seen_entries],
+        }
+        return {"content": [{"type": "text", "text": json.dumps(payload)}]}
+
+    return create_sdk_mcp_server(SERVER_NAME, tools=[filter_seen_urls])
@@ -0,0 +1,210 @@
+"""
+Status Server
+=============
+
+Optional local HTTP endpoint served by the coordinator.
+
+Routes:
+    GET /status         JSON snapshot of orchestration and agent state
+    GET /agents/<id>    JSON state of one agent
+    GET /events         Server-Sent Events stream (job_found, iteration_started,
+                        agent_completed, merge_published); honours Last-Event-ID
+    GET /metrics        OpenMetrics exposition (when a metrics renderer is given)
+
+Built on asyncio streams so it runs on the coordinator's event loop with
+no extra dependencies. Binds to localhost by default.
+"""
+
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+
+from .events import Event, EventBus
+
+# Seconds between SSE keep-alive comments
+KEEPALIVE_SECONDS = 15.0
+
+# Seconds allowed to send the request head
+REQUEST_TIMEOUT_SECONDS = 10.0
+
+METRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+class StatusServer:
+    """Serves status snapshots and the event stream over HTTP."""
+
+    def __init__(
+        self,
+        snapshot: Callable[[], dict[str, Any]],
+        events: EventBus,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        keepalive: float = KEEPALIVE_SECONDS,
+        metrics: Callable[[], str] | None = None,
+        allow_origin: str | None = None,
+    ):
+        """
+        Initialize the server.
+
+        Args:
+            snapshot: Returns the current status snapshot (see status.build_snapshot)
+            events: Event bus to stream from
+            host: Interface to bind
+            port: Port to bind (0 picks a free port; see `port` after start)
+            keepalive: Seconds between SSE keep-alive comments
+            metrics: Renders the /metrics exposition (None to disable the route)
+            allow_origin: Origin allowed to read responses cross-origin (None: same-origin only)
+        """
+        self.snapshot = snapshot
+        self.events = events
+        self.host = host
+        self.port = port
+        self.keepalive = keepalive
+        self.metrics = metrics
+        self.allow_origin = allow_origin
+        self._server: asyncio.Server | None = None
+        self._handlers: set[asyncio.Task[None]] = set()
+        self._streams: set[asyncio.Queue[Event | None]] = set()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self, grace: float = 1.0) -> None:
+        """
+        Stop listening and close open connections.
+
+        Event streams first flush events already queued (such as the final
+        merge_published), then end; anything still open after `grace`
+        seconds is cancelled.
+        """
+        if self._server is None:
+            return
+        self._server.close()
+        for queue in self._streams:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(None)
+        if self._handlers:
+            await asyncio.wait(list(self._handlers), timeout=grace)
+        for task in list(self._handlers):
+            task.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # Always set: asyncio.start_server runs each handler in its own task
+        task = asyncio.current_task()
+        assert task is not None
+        self._handlers.add(task)
+        try:
+            try:
+                method, path, headers = await asyncio.wait_for(
+                    self._read_head(reader), timeout=REQUEST_TIMEOUT_SECONDS
+                )
+            except (TimeoutError, ValueError, asyncio.IncompleteReadError):
+                await self._send_json(writer, 400, {"error": "bad request"})
+                return
+
+            if method != "GET":
+                await self._send_json(writer, 405, {"error": "method not allowed"})
+                return
+
+            path = path.split("?", 1)[0].rstrip("/") or "/"
+            if path == "/status":
+                await self._send_json(writer, 200, self.snapshot())
+            elif path.startswith("/agents/"):
+                await self._send_agent(writer, path.removeprefix("/agents/"))
+            elif path == "/metrics" and self.metrics is not None:
+                await self._send(writer, 200, self.metrics().encode(), METRICS_CONTENT_TYPE)
+            elif path == "/events":
+                await self._stream_events(writer, headers.get("last-event-id"))
+            else:
+                await self._send_json(writer, 404, {"error": "not found"})
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._handlers.discard(task)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+
+    async def _read_head(self, reader: asyncio.StreamReader) -> tuple[str, str, dict[str, str]]:
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        method, path, _ = request_line.split(" ", 2)
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        return method, path, headers
+
+    async def _send_agent(self, writer: asyncio.StreamWriter, agent_id: str) -> None:
+        for agent in self.snapshot()["agents"]:
+            if agent and str(agent["agent_id"]) == agent_id:
+                await self._send_json(writer, 200, agent)
+                return
+        await self._send_json(writer, 404, {"error": f"unknown agent {agent_id}"})
+
+    def _cors_header(self) -> str:
+        if self.allow_origin is None:
+            return ""
+        return f"Access-Control-Allow-Origin: {self.allow_origin}\r\nVary: Origin\r\n"
+
+    async def _send_json(self, writer: asyncio.StreamWriter, status: int, payload: Any) -> None:
+        await self._send(writer, status, json.dumps(payload).encode(), "application/json")
+
+    async def _send(
+        self, writer: asyncio.StreamWriter, status: int, body: bytes, content_type: str
+    ) -> None:
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"{self._cors_header()}"
+            "Connection: close\r\n\r\n".encode()
+            + body
+        )
+        await writer.drain()
+
+    async def _stream_events(self, writer: asyncio.StreamWriter, last_event_id: str | None) -> None:
+        after = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+        queue = self.events.subscribe(after=after)
+        self._streams.add(queue)
+        try:
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: text/event-stream\r\n"
+                b"Cache-Control: no-cache\r\n"
+                + self._cors_header().encode()
+                + b"Connection: keep-alive\r\n\r\n"
+                b"retry: 1000\n\n"
+            )
+            await writer.drain()
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=self.keepalive)
+                    if event is None:
+                        # Server stopping
+                        return
+                    writer.write(event.to_sse())
+                except TimeoutError:
+                    writer.write(b": keep-alive\n\n")
+                await writer.drain()
+        finally:
+            self._streams.discard(queue)
+            self.events.unsubscribe(queue)
@@ -0,0 +1,194 @@
+"""
+Session Log Sink
+================
+
+Buffered, rotating writer for agent session logs.
+
+Runners hand lines to a shared sink without touching the disk. A
+background task batches queued lines, appends each file once per batch
+off the event loop, rotates logs by size or age into gzip archives, and
+refreshes a short `recent.log` tail next to each log that agents can
+read instead of the full history.
+
+Without a running event loop, writes go straight to disk.
+"""
+
+import asyncio
+import gzip
+import os
+import shutil
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+SESSION_LOG_FILE = "session.log"
+
+# Tail file written next to each log, relative to the log's directory
+RECENT_LOG_FILE = "recent.log"
+
+DAY = 24 * 60 * 60
+
+# Timestamp prefix written by AgentRunner._log, used to date a log's first line
+_TIMESTAMP_FORMAT = "[%Y-%m-%d %H:%M:%S]"
+
+# Bytes read from the end of a log to rebuild its tail
+_TAIL_READ_BYTES = 16 * 1024
+
+
+class SessionLogSink:
+    """Shared asynchronous log writer with rotation and tail files."""
+
+    def __init__(
+        self,
+        max_bytes: int = 5 * 1024 * 1024,
+        max_age_seconds: float = 7 * DAY,
+        keep_archives: int = 5,
+        tail_lines: int = 40,
+        flush_interval: float = 0.25,
+        batch_size: int = 1000,
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            max_bytes: Rotate a log once it reaches this size
+            max_age_seconds: Rotate a log once its first line is this old
+            keep_archives: Compressed archives kept per log
+            tail_lines: Lines kept in each recent.log
+            flush_interval: Seconds the writer waits to gather a batch
+            batch_size: Maximum lines per batch
+        """
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.keep_archives = keep_archives
+        self.tail_lines = tail_lines
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.lines_written = 0
+        self.batches = 0
+        self.rotations = 0
+        self._queue: asyncio.Queue[tuple[Path, str]] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._started_at: dict[Path, float] = {}
+
+    def write(self, path: Path, line: str) -> None:
+        """
+        Queue a line for `path` (a trailing newline is added if missing).
+
+        Never blocks; falls back to a direct write outside an event loop.
+        """
+        if not line.endswith("\n"):
+            line += "\n"
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_batch({Path(path): [line]})
+            return
+        if self._loop is not loop or self._queue is None or self._task is None or self._task.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._writer(self._queue), name="session-log-writer")
+        self._queue.put_nowait((Path(path), line))
+
+    async def flush(self) -> None:
+        """Wait until every queued line is on disk."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Flush and stop the background writer."""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._queue = None
+        self._loop = None
+
+    async def _writer(self, queue: asyncio.Queue[tuple[Path, str]]) -> None:
+        while True:
+            items = [await queue.get()]
+            await asyncio.sleep(self.flush_interval)
+            while len(items) < self.batch_size and not queue.empty():
+                items.append(queue.get_nowait())
+
+            batch: dict[Path, list[str]] = defaultdict(list)
+            for path, line in items:
+                batch[path].append(line)
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except OSError as e:
+                print(f"Warning: could not write session log: {e}")
+            finally:
+                for _ in items:
+                    queue.task_done()
+
+    def _write_batch(self, batch: dict[Path, list[str]]) -> None:
+        """Append, rotate and refresh tails for one batch (runs in a worker thread)."""
+        for path, lines in batch.items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._rotate_if_needed(path)
+            with open(path, "a") as f:
+                f.writelines(lines)
+            self._started_at.setdefault(path, time.time())
+            self._write_tail(path)
+            self.lines_written += len(lines)
+        self.batches += 1
+
+    def _first_line_time(self, path: Path) -> float:
+        try:
+            with open(path) as f:
+                first = f.readline()
+            return datetime.strptime(first[:21], _TIMESTAMP_FORMAT).timestamp()
+        except (OSError, ValueError):
+            return time.time()
+
+    def _rotate_if_needed(self, path: Path) -> None:
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            self._started_at.pop(path, None)
+            return
+        if path not in self._started_at:
+            self._started_at[path] = self._first_line_time(path)
+        too_old = time.time() - self._started_at[path] >= self.max_age_seconds
+        if size < self.max_bytes and not (too_old and size):
+            return
+
+        # Microseconds keep two rotations in the same second apart, and the
+        # names still sort in rotation order for pruning
+        when = datetime.now()
+        while path.with_name(f"{path.name}.{when:%Y%m%d-%H%M%S-%f}.gz").exists():
+            when += timedelta(microseconds=1)
+        stamp = f"{when:%Y%m%d-%H%M%S-%f}"
+        archive = path.with_name(f"{path.name}.{stamp}.gz")
+        rotated = path.with_name(f"{path.name}.{stamp}")
+        os.replace(path, rotated)
+        with open(rotated, "rb") as src, gzip.open(archive, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        rotated.unlink()
+        self._started_at.pop(path, None)
+        self.rotations += 1
+
+        archives = sorted(path.parent.glob(f"{path.name}.*.gz"))
+        for old in archives[: -self.keep_archives] if self.keep_archives else archives:
+            old.unlink()
+
+    def _write_tail(self, path: Path) -> None:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - _TAIL_READ_BYTES))
+            data = f.read().decode("utf-8", errors="replace")
+        lines = data.splitlines(keepends=True)
+        if len(data) >= _TAIL_READ_BYTES and lines:
+            lines = lines[1:]  # drop the partial first line
+        tail = path.with_name(RECENT_LOG_FILE)
+        tmp = tail.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            f.writelines(lines[-self.tail_lines :])
+        os.replace(tmp, tail)
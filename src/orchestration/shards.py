@@ -0,0 +1,163 @@
+"""
+Sharded UI Data
+===============
+
+Splits the merged job list into score-ordered pages of summary records
+plus one detail file per job, so the static UI can paint the first page
+without downloading every job's long text fields.
+
+    pages/manifest.json       job count and page list
+    pages/page-0001.json      summaries of the highest-scoring jobs
+    pages/detail/<key>.json   full record for one job
+
+Files are only rewritten when their content changes (tracked by content
+hash in pages/.index.json, which is not mirrored to the UI), and detail
+files for jobs that disappeared are removed; the manifest is written last.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from .publish import atomic_write, content_hash, dumps_compact, link_or_copy
+from .state import now_iso
+
+# Directory (under merged/ and the UI data directory) holding the shards
+PAGES_DIR = "pages"
+MANIFEST_FILE = "manifest.json"
+INDEX_FILE = ".index.json"
+
+DEFAULT_PAGE_SIZE = 100
+
+# Fields the job list needs; everything else is loaded on demand
+SUMMARY_FIELDS = (
+    "id",
+    "job_url",
+    "ats_platform",
+    "company",
+    "role",
+    "location",
+    "salary",
+    "found_date",
+    "match_score",
+    "status",
+    "tech_stack",
+)
+
+
+def detail_key(job: dict[str, Any]) -> str:
+    """Stable, filename-safe key for a job's detail file."""
+    return content_hash(job.get("job_url", ""))
+
+
+def summarize(job: dict[str, Any]) -> dict[str, Any]:
+    """The summary record for a job, pointing at its detail file."""
+    summary = {k: job[k] for k in SUMMARY_FIELDS if k in job}
+    summary["detail"] = detail_key(job)
+    return summary
+
+
+class ShardWriter:
+    """Writes changed shard files to a directory and its mirrors."""
+
+    def __init__(self, directory: Path, mirrors: list[Path]):
+        self.directory = directory
+        self.mirrors = mirrors
+        self.written = 0
+
+    def write(self, name: str, data: Any, previous_hash: str | None = None) -> str:
+        """Write `name` unless its content hash is unchanged; returns the hash."""
+        body = dumps_compact(data)
+        digest = content_hash(body)
+        if digest == previous_hash and all(
+            (d / name).exists() for d in (self.directory, *self.mirrors)
+        ):
+            return digest
+        atomic_write(self.directory / name, body)
+        for mirror in self.mirrors:
+            link_or_copy(self.directory / name, mirror / name)
+        self.written += 1
+        return digest
+
+    def remove(self, name: str) -> None:
+        for directory in (self.directory, *self.mirrors):
+            (directory / name).unlink(missing_ok=True)
+
+
+def _read_index(directory: Path) -> dict[str, Any]:
+    try:
+        with open(directory / INDEX_FILE) as f:
+            index: dict[str, Any] = json.load(f)
+        return index
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def write_shards(
+    jobs: list[dict[str, Any]],
+    directory: Path,
+    mirrors: list[Path] | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> dict[str, Any]:
+    """
+    Write score-ordered summary pages, per-job detail files and a manifest.
+
+    Args:
+        jobs: Merged jobs, already sorted by match_score descending
+        directory: Shard directory, e.g. output/merged/pages
+        mirrors: Directories that get the same files (the UI's data/pages)
+        page_size: Summaries per page
+
+    Returns:
+        The manifest
+    """
+    directory = Path(directory)
+    mirrors = [Path(m) for m in mirrors or []]
+    previous = _read_index(directory)
+    old_pages: dict[str, str] = previous.get("pages", {})
+    old_details: dict[str, str] = previous.get("details", {})
+    writer = ShardWriter(directory, mirrors)
+
+    details: dict[str, str] = {}
+    for job in jobs:
+        key = detail_key(job)
+        if key in details:
+            continue
+        details[key] = writer.write(f"detail/{key}.json", job, old_details.get(key))
+    for key in old_details.keys() - details.keys():
+        writer.remove(f"detail/{key}.json")
+
+    pages: list[dict[str, Any]] = []
+    page_hashes: dict[str, str] = {}
+    for start in range(0, len(jobs), page_size):
+        chunk = jobs[start : start + page_size]
+        name = f"page-{len(pages) + 1:04d}.json"
+        page_hashes[name] = writer.write(
+            name, [summarize(job) for job in chunk], old_pages.get(name)
+        )
+        pages.append(
+            {
+                "file": name,
+                "count": len(chunk),
+                "max_score": chunk[0].get("match_score") or 0,
+                "min_score": chunk[-1].get("match_score") or 0,
+                "hash": page_hashes[name],
+            }
+        )
+    for name in old_pages.keys() - page_hashes.keys():
+        writer.remove(name)
+
+    manifest = {
+        "generated_at": now_iso(),
+        "total": len(jobs),
+        "page_size": page_size,
+        "pages": pages,
+        "detail_dir": "detail",
+    }
+    atomic_write(directory / INDEX_FILE, dumps_compact({"pages": page_hashes, "details": details}))
+    atomic_write(directory / MANIFEST_FILE, dumps_compact(manifest))
+    for mirror in mirrors:
+        link_or_copy(directory / MANIFEST_FILE, mirror / MANIFEST_FILE)
+
+    print(f"Wrote {len(pages)} pages and {writer.written} changed files to {directory}")
+    return manifest
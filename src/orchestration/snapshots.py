@@ -0,0 +1,227 @@
+"""
+Snapshot Store
+==============
+
+A content-addressed history of merged jobs that outlives `make reset`,
+so one run can be compared with any other.
+
+    snapshots/objects/ab/<hash>.json   one job record, named by its content hash
+    snapshots/runs/<run>.json          what one merge changed
+    snapshots/HEAD.json                the latest run and its URL -> hash map
+
+Jobs are keyed by canonical URL (tracking parameters, fragments and
+trailing slashes removed). A record is stored once no matter how many
+snapshots contain it. Each run file lists only the jobs that changed
+since its parent, as URL -> [old hash, new hash] with null for "absent",
+so diffing two runs composes the run files between them and costs time
+proportional to the changes, not to the number of jobs.
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .publish import atomic_write, atomic_write_json, content_hash, dumps_compact
+
+# Directory under the base output directory; `make reset` leaves it alone
+SNAPSHOTS_DIR = "snapshots"
+HEAD_FILE = "HEAD.json"
+
+# Query parameters that do not identify a posting
+TRACKING_PARAMS = {"gh_src", "source", "ref", "lever-source", "lever-origin"}
+TRACKING_PREFIXES = ("utm_",)
+
+
+def canonical_url(url: str) -> str:
+    """A job URL with tracking parameters, fragment and trailing slash removed."""
+    parts = urlsplit(url.strip())
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+    ]
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(query)), "")
+    )
+
+
+@dataclass
+class JobDiff:
+    """Differences between two snapshots, keyed by canonical URL."""
+
+    from_run: str | None
+    to_run: str
+    new: dict[str, str] = field(default_factory=dict)
+    changed: dict[str, tuple[str, str]] = field(default_factory=dict)
+    disappeared: dict[str, str] = field(default_factory=dict)
+
+
+def _run_order(run_id: str) -> tuple[str, int]:
+    """Sort key for run ids: timestamp, then the numeric collision suffix (…-9 before …-10)."""
+    parts = run_id.split("-")
+    if len(parts) == 3 and parts[2].isdigit():
+        return f"{parts[0]}-{parts[1]}", int(parts[2])
+    return run_id, 0
+
+
+class SnapshotStore:
+    """Content-addressed job snapshots under output/snapshots."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.runs_dir = self.root / "runs"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.json"
+
+    def _head(self) -> dict[str, Any]:
+        try:
+            with open(self.root / HEAD_FILE) as f:
+                head: dict[str, Any] = json.load(f)
+            return head
+        except (OSError, json.JSONDecodeError):
+            return {"run": None, "entries": {}}
+
+    def runs(self) -> list[str]:
+        """Run ids, oldest first."""
+        if not self.runs_dir.exists():
+            return []
+        return sorted((p.stem for p in self.runs_dir.glob("*.json")), key=_run_order)
+
+    def load_run(self, run_id: str) -> dict[str, Any]:
+        with open(self.runs_dir / f"{run_id}.json") as f:
+            run: dict[str, Any] = json.load(f)
+        return run
+
+    def load_object(self, digest: str) -> dict[str, Any]:
+        with open(self._object_path(digest)) as f:
+            job: dict[str, Any] = json.load(f)
+        return job
+
+    def commit(self, jobs: list[dict[str, Any]]) -> dict[str, Any] | None:
+        """
+        Record a snapshot of `jobs`.
+
+        Returns:
+            The new run (id, parent, counts), or None when nothing changed
+        """
+        head = self._head()
+        previous: dict[str, str] = head["entries"]
+        entries: dict[str, str] = {}
+        changes: dict[str, list[str | None]] = {}
+        stored = 0
+
+        for job in jobs:
+            url = job.get("job_url")
+            if not url:
+                continue
+            key = canonical_url(url)
+            if key in entries:
+                continue
+            digest = content_hash(job)
+            entries[key] = digest
+            if previous.get(key) == digest:
+                continue
+            changes[key] = [previous.get(key), digest]
+            path = self._object_path(digest)
+            if not path.exists():
+                atomic_write(path, dumps_compact(job))
+                stored += 1
+        for key in previous.keys() - entries.keys():
+            changes[key] = [previous[key], None]
+
+        if not changes:
+            return None
+
+        run_id = self._new_run_id()
+        run = {
+            "id": run_id,
+            "parent": head["run"],
+            "created_at": datetime.now(UTC).isoformat(),
+            "total": len(entries),
+            "objects_stored": stored,
+            "changes": dict(sorted(changes.items())),
+        }
+        atomic_write_json(self.runs_dir / f"{run_id}.json", run)
+        atomic_write_json(self.root / HEAD_FILE, {"run": run_id, "entries": entries})
+        return {k: v for k, v in run.items() if k != "changes"} | {"changed": len(changes)}
+
+    def _new_run_id(self) -> str:
+        run_id = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+        existing = set(self.runs())
+        if run_id not in existing:
+            return run_id
+        n = 1
+        while f"{run_id}-{n}" in existing:
+            n += 1
+        return f"{run_id}-{n}"
+
+    def resolve(self, ref: str) -> str:
+        """
+        A run id from a reference: a full id, a unique prefix, or
+        "latest"/"~N" (N runs before the latest).
+
+        Raises:
+            KeyError: no run or more than one matches
+        """
+        runs = self.runs()
+        if ref == "latest":
+            ref = "~0"
+        if ref.startswith("~") and ref[1:].isdigit():
+            index = len(runs) - 1 - int(ref[1:])
+            if 0 <= index < len(runs):
+                return runs[index]
+            raise KeyError(f"Only {len(runs)} snapshots exist")
+        matches = [r for r in runs if r.startswith(ref)]
+        if ref in runs:
+            return ref
+        if len(matches) != 1:
+            raise KeyError(f"{'No' if not matches else 'Ambiguous'} snapshot matches {ref!r}")
+        return matches[0]
+
+    def diff(self, from_run: str | None, to_run: str) -> JobDiff:
+        """
+        Jobs new, changed and disappeared between two runs.
+
+        `from_run` None means "before the first snapshot". If `from_run` is
+        the later of the two, the result describes going back in time.
+        """
+        runs = self.runs()
+        start = runs.index(from_run) if from_run is not None else -1
+        end = runs.index(to_run)
+        reverse = start > end
+        if reverse:
+            start, end = end, start
+
+        # Compose the per-run changes between the two: earliest "old", latest "new"
+        net: dict[str, list[str | None]] = {}
+        for run_id in runs[start + 1 : end + 1]:
+            for key, (old, new) in self.load_run(run_id)["changes"].items():
+                if key in net:
+                    net[key][1] = new
+                else:
+                    net[key] = [old, new]
+
+        result = JobDiff(from_run=from_run, to_run=to_run)
+        for key, (old, new) in sorted(net.items()):
+            if reverse:
+                old, new = new, old
+            if old == new:
+                continue
+            if old is not None and new is not None:
+                result.changed[key] = (old, new)
+            elif new is not None:
+                result.new[key] = new
+            elif old is not None:
+                result.disappeared[key] = old
+        return result
+
+
+def changed_fields(before: dict[str, Any], after: dict[str, Any]) -> list[str]:
+    """Names of fields whose values differ between two job records."""
+    return sorted(k for k in before.keys() | after.keys() if before.get(k) != after.get(k))
@@ -13,6 +13,20 @@ from typing import Any
 
 from .types import AgentStatus, OrchestrationStatus
 
+# Result files, relative to an agent's output directory. ATS agents write at
+# the top level; freelance sessions use the data/ layout from app_spec.txt.
+JOBS_FILES = ("jobs.json", "data/jobs/jobs.json")
+COMPANIES_FILES = ("companies.json", "data/companies/companies.json")
+
+
+def find_agent_file(agent_dir: Path, candidates: tuple[str, ...]) -> Path:
+    """Return the first existing candidate file, or the first candidate if none exist."""
+    for name in candidates:
+        path = agent_dir / name
+        if path.exists():
+            return path
+    return agent_dir / candidates[0]
+
 
 def now_iso() -> str:
     """Get current time as ISO format string."""
@@ -31,6 +45,20 @@ class AgentState:
     jobs_found: int = 0
     last_search: str = ""
     error: str | None = None
+    pages_reduced: int = 0
+    page_tokens_before: int = 0
+    page_tokens_after: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    cost_usd: float = 0.0
+    stalls: int = 0
+    last_stall: str = ""
+    restarts: int = 0
+    restart_history: list[dict[str, Any]] = field(default_factory=list)
+    circuit: str = "closed"
+    circuit_reason: str = ""
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -44,6 +72,20 @@ class AgentState:
             "jobs_found": self.jobs_found,
             "last_search": self.last_search,
             "error": self.error,
+            "pages_reduced": self.pages_reduced,
+            "page_tokens_before": self.page_tokens_before,
+            "page_tokens_after": self.page_tokens_after,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "stalls": self.stalls,
+            "last_stall": self.last_stall,
+            "restarts": self.restarts,
+            "restart_history": self.restart_history,
+            "circuit": self.circuit,
+            "circuit_reason": self.circuit_reason,
         }
 
     @classmethod
@@ -59,6 +101,20 @@ class AgentState:
             jobs_found=data.get("jobs_found", 0),
             last_search=data.get("last_search", ""),
             error=data.get("error"),
+            pages_reduced=data.get("pages_reduced", 0),
+            page_tokens_before=data.get("page_tokens_before", 0),
+            page_tokens_after=data.get("page_tokens_after", 0),
+            input_tokens=data.get("input_tokens", 0),
+            output_tokens=data.get("output_tokens", 0),
+            cache_read_tokens=data.get("cache_read_tokens", 0),
+            cache_write_tokens=data.get("cache_write_tokens", 0),
+            cost_usd=data.get("cost_usd", 0.0),
+            stalls=data.get("stalls", 0),
+            last_stall=data.get("last_stall", ""),
+            restarts=data.get("restarts", 0),
+            restart_history=data.get("restart_history", []),
+            circuit=data.get("circuit", "closed"),
+            circuit_reason=data.get("circuit_reason", ""),
         )
 
 
@@ -72,6 +128,11 @@ class OrchestrationState:
     status: OrchestrationStatus = OrchestrationStatus.PENDING
     total_jobs_found: int = 0
     last_merge_at: str = ""
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    cost_usd: float = 0.0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -83,6 +144,11 @@ class OrchestrationState:
             "status": self.status.value,
             "total_jobs_found": self.total_jobs_found,
             "last_merge_at": self.last_merge_at,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+            "cost_usd": round(self.cost_usd, 6),
         }
 
     @classmethod
@@ -96,6 +162,11 @@ class OrchestrationState:
             status=OrchestrationStatus(data.get("status", "pending")),
             total_jobs_found=data.get("total_jobs_found", 0),
             last_merge_at=data.get("last_merge_at", ""),
+            input_tokens=data.get("input_tokens", 0),
+            output_tokens=data.get("output_tokens", 0),
+            cache_read_tokens=data.get("cache_read_tokens", 0),
+            cache_write_tokens=data.get("cache_write_tokens", 0),
+            cost_usd=data.get("cost_usd", 0.0),
         )
 
 
@@ -185,7 +256,7 @@ class StateManager:
 
     def count_jobs(self, agent_id: int) -> int:
         """Count jobs found by an agent."""
-        jobs_path = self.output_dir / f"agent-{agent_id}" / "jobs.json"
+        jobs_path = find_agent_file(self.output_dir / f"agent-{agent_id}", JOBS_FILES)
         if not jobs_path.exists():
             return 0
 
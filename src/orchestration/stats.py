@@ -0,0 +1,261 @@
+"""
+Merged Job Statistics
+=====================
+
+Facet counts and aggregates for the merged job list, written to
+merged/stats.json so the UI does not recompute them from every job.
+
+Each job contributes a small facet record (score, platform, company,
+location, tech stack). Those records, keyed by job URL with a content
+hash, are kept in merged/.stats-index.json along with the running
+counters, so a merge in which only a few jobs changed subtracts their old
+contributions and adds the new ones instead of recounting everything.
+"""
+
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from .publish import atomic_write_json, content_hash, link_or_copy
+from .state import now_iso
+
+STATS_FILE = "stats.json"
+STATS_INDEX_FILE = ".stats-index.json"
+
+# Bump when the facet record or aggregates change, forcing a full rebuild
+STATS_VERSION = 1
+
+# Score bands, matching SCORE_THRESHOLDS in ui/src/constants
+SCORE_BANDS = (("priority", 90), ("high", 85), ("good", 80), ("other", 0))
+
+# Width of score histogram buckets
+HISTOGRAM_WIDTH = 5
+
+TOP_TECH = 25
+TOP_COMPANIES = 50
+
+
+def simplify_location(location: str | None) -> str:
+    """Location facet, as the UI groups it."""
+    if not location:
+        return "Unknown"
+    if "Remote" in location:
+        return "Remote"
+    return location.split(",")[0]
+
+
+def detect_platform(job: dict[str, Any], platform_domains: dict[str, str]) -> str:
+    """The job's ATS platform, from its own field or its URL's domain."""
+    platform: str | None = job.get("ats_platform")
+    if platform:
+        return platform
+    url = job.get("job_url", "").lower()
+    for domain, platform in platform_domains.items():
+        if domain and domain in url:
+            return platform
+    return "unknown"
+
+
+def facets(job: dict[str, Any], platform_domains: dict[str, str]) -> dict[str, Any]:
+    """The facet record a job contributes to the stats."""
+    return {
+        "score": job.get("match_score") or 0,
+        "platform": detect_platform(job, platform_domains),
+        "company": job.get("company") or "Unknown",
+        "location": simplify_location(job.get("location")),
+        "tech": sorted({t for t in job.get("tech_stack") or [] if isinstance(t, str)}),
+    }
+
+
+def score_band(score: float) -> str:
+    return next(name for name, threshold in SCORE_BANDS if score >= threshold)
+
+
+class StatsAccumulator:
+    """Counters that facet records can be added to and subtracted from."""
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.score_bands: Counter[str] = Counter()
+        self.score_histogram: Counter[int] = Counter()
+        self.tech: Counter[str] = Counter()
+        self.locations: Counter[str] = Counter()
+        self.platform_jobs: Counter[str] = Counter()
+        self.platform_score_sum: Counter[str] = Counter()
+        self.company_jobs: Counter[str] = Counter()
+        self.company_score_sum: Counter[str] = Counter()
+        self.company_platforms: dict[str, Counter[str]] = {}
+
+    # Counter attributes persisted in the stats index
+    _COUNTERS = (
+        "score_bands",
+        "score_histogram",
+        "tech",
+        "locations",
+        "platform_jobs",
+        "platform_score_sum",
+        "company_jobs",
+        "company_score_sum",
+    )
+
+    def to_state(self) -> dict[str, Any]:
+        """Raw counters, for the stats index."""
+
+        def nonzero(counter: Counter[Any]) -> dict[Any, int]:
+            return {k: v for k, v in counter.items() if v}
+
+        state: dict[str, Any] = {name: nonzero(getattr(self, name)) for name in self._COUNTERS}
+        state["total"] = self.total
+        state["company_platforms"] = {
+            c: nonzero(p) for c, p in self.company_platforms.items() if any(p.values())
+        }
+        return state
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> "StatsAccumulator":
+        """Restore counters saved by to_state()."""
+        acc = cls()
+        acc.total = state["total"]
+        for name in cls._COUNTERS:
+            getattr(acc, name).update(state[name])
+        acc.score_histogram = Counter({int(k): v for k, v in acc.score_histogram.items()})
+        acc.company_platforms = {c: Counter(p) for c, p in state["company_platforms"].items()}
+        return acc
+
+    def apply(self, record: dict[str, Any], sign: int = 1) -> None:
+        """Add (sign=1) or subtract (sign=-1) one job's facet record."""
+        score = record["score"]
+        self.total += sign
+        self.score_bands[score_band(score)] += sign
+        self.score_histogram[min(int(score) // HISTOGRAM_WIDTH * HISTOGRAM_WIDTH, 100)] += sign
+        for tech in record["tech"]:
+            self.tech[tech] += sign
+        self.locations[record["location"]] += sign
+        platform, company = record["platform"], record["company"]
+        self.platform_jobs[platform] += sign
+        self.platform_score_sum[platform] += sign * score
+        self.company_jobs[company] += sign
+        self.company_score_sum[company] += sign * score
+        self.company_platforms.setdefault(company, Counter())[platform] += sign
+
+    def to_dict(self) -> dict[str, Any]:
+        """The stats.json document."""
+
+        def positive(counter: Counter[Any]) -> dict[Any, int]:
+            return {
+                k: v
+                for k, v in sorted(counter.items(), key=lambda kv: (-kv[1], str(kv[0])))
+                if v > 0
+            }
+
+        companies = sorted(
+            (c for c, n in self.company_jobs.items() if n > 0),
+            key=lambda c: (-self.company_jobs[c], c),
+        )
+        return {
+            "generated_at": now_iso(),
+            "total": self.total,
+            "score_bands": {name: self.score_bands[name] for name, _ in SCORE_BANDS},
+            "score_histogram": {
+                f"{low}-{min(low + HISTOGRAM_WIDTH - 1, 100)}": self.score_histogram[low]
+                for low in range(0, 101, HISTOGRAM_WIDTH)
+                if self.score_histogram[low] > 0
+            },
+            "tech_stack": positive(self.tech),
+            "top_tech_stack": [[tech, n] for tech, n in positive(self.tech).items()][:TOP_TECH],
+            "locations": positive(self.locations),
+            "platforms": {
+                platform: {
+                    "jobs": n,
+                    "avg_score": round(self.platform_score_sum[platform] / n, 1),
+                }
+                for platform, n in positive(self.platform_jobs).items()
+            },
+            "company_count": len(companies),
+            "companies": {
+                company: {
+                    "jobs": self.company_jobs[company],
+                    "avg_score": round(
+                        self.company_score_sum[company] / self.company_jobs[company], 1
+                    ),
+                    "platforms": sorted(
+                        p for p, n in self.company_platforms[company].items() if n > 0
+                    ),
+                }
+                for company in companies[:TOP_COMPANIES]
+            },
+        }
+
+
+def update_stats(
+    jobs: list[dict[str, Any]],
+    merged_dir: Path,
+    platform_domains: dict[str, str] | None = None,
+    mirrors: list[Path] | None = None,
+) -> dict[str, Any]:
+    """
+    Bring merged/stats.json up to date with `jobs`.
+
+    Only jobs whose content hash changed since the last merge are
+    re-counted; a missing or outdated index triggers a full rebuild.
+
+    Args:
+        jobs: Merged jobs
+        merged_dir: output/merged
+        platform_domains: Domain -> platform, for jobs without ats_platform
+        mirrors: Directories that also get stats.json (the UI's data directory)
+
+    Returns:
+        The stats document, with "changed_jobs" set to how many jobs were re-counted
+    """
+    platform_domains = platform_domains or {}
+    index_file = merged_dir / STATS_INDEX_FILE
+    try:
+        with open(index_file) as f:
+            index = json.load(f)
+        if (
+            index.get("version") != STATS_VERSION
+            or index.get("platform_domains") != platform_domains
+        ):
+            index = {}
+    except (OSError, json.JSONDecodeError):
+        index = {}
+    previous: dict[str, list[Any]] = index.get("jobs", {})
+    acc = StatsAccumulator.from_state(index["counters"]) if index else StatsAccumulator()
+
+    current: dict[str, list[Any]] = {}
+    changed = 0
+    for job in jobs:
+        url = job.get("job_url", "")
+        if not url or url in current:
+            continue
+        digest = content_hash(job)
+        old = previous.get(url)
+        if old is not None and old[0] == digest:
+            current[url] = old
+            continue
+        if old is not None:
+            acc.apply(old[1], -1)
+        record = facets(job, platform_domains)
+        acc.apply(record)
+        current[url] = [digest, record]
+        changed += 1
+    for url in previous.keys() - current.keys():
+        acc.apply(previous[url][1], -1)
+        changed += 1
+
+    stats = acc.to_dict()
+    atomic_write_json(merged_dir / STATS_FILE, stats)
+    for mirror in mirrors or []:
+        link_or_copy(merged_dir / STATS_FILE, Path(mirror) / STATS_FILE)
+    atomic_write_json(
+        index_file,
+        {
+            "version": STATS_VERSION,
+            "platform_domains": platform_domains,
+            "counters": acc.to_state(),
+            "jobs": current,
+        },
+    )
+    return {**stats, "changed_jobs": changed}
@@ -0,0 +1,143 @@
+"""
+Status Reporting for Orchestration
+==================================
+
+Read-only status views over state files.
+
+Kept free of the agent SDK so `status` stays fast to start.
+"""
+
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from .config import get_output_dir, load_config
+from .ledger import Usage, format_cost
+from .state import AgentState, OrchestrationState, StateManager
+from .types import AgentStatus
+
+
+def format_age(timestamp: str) -> str:
+    """Format an ISO timestamp as "5m ago" / "2h ago" ("?" if missing or invalid)."""
+    if not timestamp:
+        return "?"
+    try:
+        then = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return "?"
+    mins = int((datetime.now(UTC) - then).total_seconds() / 60)
+    return f"{mins}m ago" if mins < 60 else f"{mins // 60}h ago"
+
+
+def build_snapshot(
+    orch_state: OrchestrationState | None,
+    agent_states: list[AgentState | None],
+    total_jobs: int,
+) -> dict[str, Any]:
+    """
+    Build the status snapshot shared by `status --json` and the status server.
+
+    Args:
+        orch_state: Orchestration state (None if never started)
+        agent_states: One entry per agent (None if not started)
+        total_jobs: Jobs found across all agents
+
+    Returns:
+        Dictionary with orchestration and agent states
+    """
+    return {
+        "orchestration": orch_state.to_dict() if orch_state else None,
+        "agents": [s.to_dict() if s else None for s in agent_states],
+        "total_jobs": total_jobs,
+    }
+
+
+def get_status(output_dir: Path | None = None) -> dict[str, Any]:
+    """
+    Get current orchestration status.
+
+    Args:
+        output_dir: Base output directory
+
+    Returns:
+        Dictionary with orchestration and agent states
+    """
+    if output_dir is None:
+        output_dir = get_output_dir()
+
+    state_manager = StateManager(output_dir)
+    config = load_config()
+
+    return build_snapshot(
+        state_manager.read_orchestration_state(),
+        state_manager.read_all_agent_states(len(config.agents)),
+        state_manager.get_total_jobs(len(config.agents)),
+    )
+
+
+def print_status(output_dir: Path | None = None) -> None:
+    """
+    Print formatted status to console.
+
+    Args:
+        output_dir: Base output directory
+    """
+    if output_dir is None:
+        output_dir = get_output_dir()
+
+    state_manager = StateManager(output_dir)
+    config = load_config()
+
+    orch_state = state_manager.read_orchestration_state()
+    agent_states = state_manager.read_all_agent_states(len(config.agents))
+
+    print()
+    print("+" + "=" * 62 + "+")
+    print("|" + " " * 18 + "Job Search Orchestration" + " " * 20 + "|")
+    print("+" + "=" * 62 + "+")
+
+    for i, state in enumerate(agent_states):
+        agent_id = i + 1
+        agent_config = config.agents[i] if i < len(config.agents) else None
+        platform = agent_config.name if agent_config else f"Agent {agent_id}"
+
+        if state:
+            status = state.status.value.upper()[:8].ljust(8)
+            iteration = f"Iter {state.iteration}".ljust(8)
+            jobs = f"{state.jobs_found} jobs".ljust(8)
+
+            time_ago = format_age(state.updated_at)
+
+            print(
+                f"| Agent {agent_id} ({platform:10}) | {status} | {iteration} | {jobs} "
+                f"| {time_ago:>6} |"
+            )
+        else:
+            print(
+                f"| Agent {agent_id} ({platform:10}) | {'NONE':8} | {'---':8} | {'---':8} "
+                f"| {'---':>6} |"
+            )
+
+    print("+" + "-" * 62 + "+")
+
+    total_jobs = state_manager.get_total_jobs(len(config.agents))
+    running = sum(1 for s in agent_states if s and s.status == AgentStatus.RUNNING)
+
+    if orch_state and orch_state.last_merge_at:
+        last_merge = format_age(orch_state.last_merge_at)
+    else:
+        last_merge = "never"
+
+    print(
+        f"| Total: {total_jobs} jobs found | {running}/{len(config.agents)} running "
+        f"| Last merge: {last_merge:>8} |"
+    )
+
+    usage = Usage()
+    for state in agent_states:
+        if state:
+            usage.add(Usage.from_state(state))
+    if usage.total_tokens:
+        print(f"| Cost this run: {format_cost(usage, total_jobs)}")
+    print("+" + "=" * 62 + "+")
+    print()
@@ -0,0 +1,128 @@
+"""
+Agent Supervisor
+================
+
+Runs each agent in its own supervised task so one crash cannot take
+down its siblings or the monitor.
+
+When `runner.run()` raises, the supervisor records the crash in the
+agent's state, waits an exponential backoff and starts the agent again.
+An agent that crashes more than `max_restarts` times within
+`window_seconds` is disabled for the rest of the run.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .events import AGENT_DISABLED, AGENT_RESTARTED, EventBus
+from .state import StateManager, now_iso
+from .types import AgentStatus, RestartPolicy
+
+# Restart history entries kept in an agent's state
+HISTORY_LIMIT = 20
+
+
+class Supervisor:
+    """Restarts crashed agents according to their restart policies."""
+
+    def __init__(
+        self,
+        state_manager: StateManager,
+        policy_for: Callable[[Any], RestartPolicy],
+        events: EventBus | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        """
+        Initialize the supervisor.
+
+        Args:
+            state_manager: State manager for persisting restart history
+            policy_for: Returns the restart policy for an agent's config
+            events: Event bus for restart events (None to disable)
+            clock: Monotonic clock, in seconds
+            sleep: Coroutine used for backoff waits
+        """
+        self.state_manager = state_manager
+        self.policy_for = policy_for
+        self.events = events
+        self.clock = clock
+        self.sleep = sleep
+
+    async def run_all(self, runners: list[Any]) -> None:
+        """Supervise every runner until all have finished or been disabled."""
+        tasks = [
+            asyncio.create_task(self.supervise(runner), name=f"agent-{runner.config.id}")
+            for runner in runners
+        ]
+        try:
+            await asyncio.wait(tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def supervise(self, runner: Any) -> None:
+        """Run one agent, restarting it on crashes until its policy is exhausted."""
+        policy = self.policy_for(runner.config)
+        crashes: deque[float] = deque()
+        while True:
+            try:
+                await runner.run()
+                return
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+
+            now = self.clock()
+            crashes.append(now)
+            while crashes and now - crashes[0] > policy.window_seconds:
+                crashes.popleft()
+
+            if len(crashes) > policy.max_restarts:
+                self._disable(runner, error, len(crashes), policy)
+                return
+            if self.state_manager.check_stop_signal():
+                return
+
+            delay = min(
+                policy.max_backoff_seconds, policy.backoff_seconds * 2 ** (len(crashes) - 1)
+            )
+            self._record_restart(runner, error, delay)
+            await self.sleep(delay)
+
+    def _record_restart(self, runner: Any, error: str, delay: float) -> None:
+        state = runner.state
+        state.restarts += 1
+        state.restart_history = [
+            *state.restart_history,
+            {"at": now_iso(), "error": error, "backoff_seconds": delay},
+        ][-HISTORY_LIMIT:]
+        state.updated_at = now_iso()
+        self.state_manager.write_agent_state(state)
+        print(f"\n[Agent {runner.config.id}] Crashed ({error}); restarting in {delay:.0f}s")
+        self._publish(
+            AGENT_RESTARTED, runner, error=error, restarts=state.restarts, backoff_seconds=delay
+        )
+
+    def _disable(self, runner: Any, error: str, crashes: int, policy: RestartPolicy) -> None:
+        state = runner.state
+        state.status = AgentStatus.DISABLED
+        state.error = (
+            f"disabled after {crashes} crashes in {policy.window_seconds:.0f}s; last: {error}"
+        )
+        state.updated_at = now_iso()
+        self.state_manager.write_agent_state(state)
+        print(f"\n[Agent {runner.config.id}] {state.error}")
+        self._publish(AGENT_DISABLED, runner, error=error, restarts=state.restarts)
+
+    def _publish(self, event_type: str, runner: Any, **data: Any) -> None:
+        if self.events is not None:
+            self.events.publish(
+                event_type,
+                agent_id=runner.config.id,
+                platform=runner.config.platform,
+                **data,
+            )
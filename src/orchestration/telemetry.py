@@ -0,0 +1,271 @@
+"""
+Session Telemetry
+=================
+
+Structured per-session event logs and tool-call latency histograms.
+
+Each agent session writes a JSONL file under `agent-N/sessions/` with
+timestamped session_start, tool_use, tool_result and session_end events.
+Tool calls are matched to their results by tool_use_id; the latency of
+each call feeds a per-tool histogram that the coordinator aggregates
+across agents.
+"""
+
+import json
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TextIO
+
+from .state import now_iso
+
+# Aggregated latency report, relative to the base output directory
+TOOL_LATENCY_FILE = "tool-latency.json"
+
+# Histogram bucket upper bounds, in milliseconds (plus an overflow bucket)
+LATENCY_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000, 10_000, 30_000, 60_000, 120_000)
+
+# Session duration buckets, in milliseconds
+SESSION_BUCKETS_MS = (30_000, 60_000, 120_000, 300_000, 600_000, 1_200_000, 1_800_000, 3_600_000)
+
+# Tool input fields worth logging, truncated to SUMMARY_CHARS
+_SUMMARY_FIELDS = ("url", "query", "file_path", "command", "pattern", "path")
+SUMMARY_CHARS = 200
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram."""
+
+    def __init__(self, buckets: tuple[int, ...] = LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        """Record one latency."""
+        self.counts[bisect_left(self.buckets, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's observations (same buckets)."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile (max for the overflow bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return float(self.buckets[i]) if i < len(self.buckets) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 1),
+            "max_ms": round(self.max_ms, 1),
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "buckets": dict(zip([*map(str, self.buckets), "+Inf"], self.counts)),
+        }
+
+
+class ToolLatencies:
+    """Per-tool latency histograms plus total session wall time."""
+
+    def __init__(self) -> None:
+        self.tools: dict[str, LatencyHistogram] = {}
+        self.session_durations = LatencyHistogram(SESSION_BUCKETS_MS)
+
+    @property
+    def session_ms(self) -> float:
+        """Total session wall time."""
+        return self.session_durations.total_ms
+
+    @property
+    def sessions(self) -> int:
+        """Sessions recorded."""
+        return self.session_durations.count
+
+    def observe(self, tool: str, ms: float) -> None:
+        """Record one tool call."""
+        self.tools.setdefault(tool, LatencyHistogram()).observe(ms)
+
+    def merge(self, other: "ToolLatencies") -> None:
+        """Add another set of histograms."""
+        for tool, histogram in other.tools.items():
+            self.tools.setdefault(tool, LatencyHistogram()).merge(histogram)
+        self.session_durations.merge(other.session_durations)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary, with each tool's share of session wall time."""
+        tools = {}
+        for tool, histogram in sorted(self.tools.items(), key=lambda kv: -kv[1].total_ms):
+            entry = histogram.to_dict()
+            entry["share_of_session"] = (
+                round(histogram.total_ms / self.session_ms, 3) if self.session_ms else 0.0
+            )
+            tools[tool] = entry
+        return {"sessions": self.sessions, "session_ms": round(self.session_ms, 1), "tools": tools}
+
+
+def summarize_tool_input(tool_input: dict[str, Any]) -> dict[str, str]:
+    """Keep the identifying fields of a tool input, truncated."""
+    return {k: str(tool_input[k])[:SUMMARY_CHARS] for k in _SUMMARY_FIELDS if k in tool_input}
+
+
+class SessionRecorder:
+    """Writes one session's JSONL event log and feeds tool latencies."""
+
+    def __init__(
+        self,
+        path: Path,
+        latencies: ToolLatencies,
+        clock: Callable[[], float] = time.monotonic,
+        **context: Any,
+    ):
+        """
+        Initialize the recorder.
+
+        Args:
+            path: JSONL file to write
+            latencies: Histograms to record tool-call latencies into
+            clock: Monotonic clock in seconds
+            **context: Fields added to session_start (agent_id, iteration, ...)
+        """
+        self.path = Path(path)
+        self.latencies = latencies
+        self.clock = clock
+        self.context = context
+        self.turns = 0
+        self.tool_calls = 0
+        self._pending: dict[str, tuple[str, float]] = {}
+        self._started = 0.0
+        self._file: TextIO | None = None
+
+    @classmethod
+    def for_session(
+        cls, sessions_dir: Path, iteration: int, latencies: ToolLatencies, **context: Any
+    ) -> "SessionRecorder":
+        """Recorder writing to a timestamped file in `sessions_dir`."""
+        name = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-iter{iteration:03d}.jsonl"
+        return cls(sessions_dir / name, latencies, iteration=iteration, **context)
+
+    def _write(self, event: str, **data: Any) -> None:
+        if self._file is None:
+            return
+        record = {
+            "ts": now_iso(),
+            "t_ms": round((self.clock() - self._started) * 1000, 1),
+            "event": event,
+            **data,
+        }
+        self._file.write(json.dumps(record) + "\n")
+
+    def start(self) -> None:
+        """Open the log and record session_start."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a")
+        self._started = self.clock()
+        self._write("session_start", **self.context)
+
+    def turn(self) -> None:
+        """Count an assistant turn."""
+        self.turns += 1
+
+    def tool_use(
+        self, tool_use_id: str, name: str, tool_input: dict[str, Any] | None = None
+    ) -> None:
+        """Record a tool call."""
+        self.tool_calls += 1
+        self._pending[tool_use_id] = (name, self.clock())
+        self._write(
+            "tool_use",
+            id=tool_use_id,
+            tool=name,
+            turn=self.turns,
+            input=summarize_tool_input(tool_input or {}),
+        )
+
+    def tool_result(self, tool_use_id: str, is_error: bool = False) -> str | None:
+        """Record a tool result and its latency; returns the tool's name if the call was seen."""
+        pending = self._pending.pop(tool_use_id, None)
+        if pending is None:
+            return None
+        name, started = pending
+        ms = (self.clock() - started) * 1000
+        self.latencies.observe(name, ms)
+        self._write(
+            "tool_result", id=tool_use_id, tool=name, duration_ms=round(ms, 1), is_error=is_error
+        )
+        return name
+
+    def end(self, error: str | None = None, **result: Any) -> float:
+        """
+        Record session_end and close the log.
+
+        Tool calls still waiting for a result are logged as unmatched.
+
+        Args:
+            error: Error that ended the session, if any
+            **result: Fields from the SDK result (num_turns, duration_ms, ...)
+
+        Returns:
+            Session wall time in milliseconds
+        """
+        ms = (self.clock() - self._started) * 1000
+        self.latencies.session_durations.observe(ms)
+        for tool_use_id, (name, _) in self._pending.items():
+            self._write("tool_unmatched", id=tool_use_id, tool=name)
+        self._pending.clear()
+        self._write(
+            "session_end",
+            duration_ms=round(ms, 1),
+            turns=self.turns,
+            tool_calls=self.tool_calls,
+            error=error,
+            **result,
+        )
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        return ms
+
+
+def format_latency_report(latencies: dict[str, ToolLatencies], top: int = 5) -> list[str]:
+    """
+    Format per-agent tool latency summaries.
+
+    Args:
+        latencies: Agent label -> histograms
+        top: Tools shown per agent, by total time
+
+    Returns:
+        Report lines
+    """
+    lines = []
+    for agent, agent_latencies in latencies.items():
+        data = agent_latencies.to_dict()
+        if not data["tools"]:
+            continue
+        lines.append(f"  {agent}: {data['sessions']} sessions, {data['session_ms'] / 1000:.0f}s")
+        for tool, entry in list(data["tools"].items())[:top]:
+            lines.append(
+                f"    {tool:24} {entry['count']:>5} calls  "
+                f"{entry['share_of_session']:>6.1%} of time  "
+                f"p50 {entry['p50_ms'] / 1000:.1f}s  p95 {entry['p95_ms'] / 1000:.1f}s"
+            )
+    return lines
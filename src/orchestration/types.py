@@ -19,6 +19,7 @@ class AgentStatus(str, Enum):
     COMPLETED = "completed"
     STOPPED = "stopped"
     ERROR = "error"
+    DISABLED = "disabled"
 
 
 class OrchestrationStatus(str, Enum):
@@ -30,6 +31,104 @@ class OrchestrationStatus(str, Enum):
     ERROR = "error"
 
 
+@dataclass
+class RestartPolicy:
+    """How the supervisor restarts an agent that crashes."""
+    max_restarts: int = 3
+    window_seconds: float = 900
+    backoff_seconds: float = 10
+    max_backoff_seconds: float = 300
+
+    @classmethod
+    def from_dict(
+        cls, data: dict[str, Any], base: "RestartPolicy | None" = None
+    ) -> "RestartPolicy":
+        """Create a policy from a config block, filling gaps from `base`."""
+        base = base or cls()
+        return cls(
+            max_restarts=data.get("max_restarts", base.max_restarts),
+            window_seconds=data.get("window_seconds", base.window_seconds),
+            backoff_seconds=data.get("backoff_seconds", base.backoff_seconds),
+            max_backoff_seconds=data.get("max_backoff_seconds", base.max_backoff_seconds),
+        )
+
+
+@dataclass
+class SearchSettings:
+    """Web search politeness, from the "search" block of orchestration/config.json."""
+    delay_between_requests: float = 5
+    max_results_per_query: int = 20
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SearchSettings":
+        """Create settings from the camelCase config block."""
+        base = cls()
+        return cls(
+            delay_between_requests=data.get("delayBetweenRequests", base.delay_between_requests),
+            max_results_per_query=data.get("maxResultsPerQuery", base.max_results_per_query),
+        )
+
+
+@dataclass
+class BreakerPolicy:
+    """When to pause a failing platform, and how many sessions may run at once."""
+    failure_threshold: int = 5
+    window_seconds: float = 600
+    cooldown_seconds: float = 900
+    probe_poll_seconds: float = 30
+    max_concurrent_sessions: int | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BreakerPolicy":
+        """Create a policy from a config block."""
+        base = cls()
+        return cls(
+            failure_threshold=data.get("failure_threshold", base.failure_threshold),
+            window_seconds=data.get("window_seconds", base.window_seconds),
+            cooldown_seconds=data.get("cooldown_seconds", base.cooldown_seconds),
+            probe_poll_seconds=data.get("probe_poll_seconds", base.probe_poll_seconds),
+            max_concurrent_sessions=data.get(
+                "max_concurrent_sessions", base.max_concurrent_sessions
+            ),
+        )
+
+
+@dataclass
+class SeenPolicy:
+    """Sizing of the seen-URL filter that stops agents refetching scored postings."""
+    enabled: bool = True
+    false_positive_rate: float = 0.001
+    capacity: int = 1_000_000
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SeenPolicy":
+        """Create a policy from a config block."""
+        base = cls()
+        return cls(
+            enabled=data.get("enabled", base.enabled),
+            false_positive_rate=data.get("false_positive_rate", base.false_positive_rate),
+            capacity=data.get("capacity", base.capacity),
+        )
+
+
+@dataclass
+class ArchivePolicy:
+    """Compression of the fetched-posting archive that `rescore` reads."""
+    enabled: bool = True
+    dictionary_size: int = 64 * 1024
+    train_after: int = 100
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ArchivePolicy":
+        """Create a policy from a config block."""
+        base = cls()
+        return cls(
+            enabled=data.get("enabled", base.enabled),
+            dictionary_size=data.get("dictionary_size", base.dictionary_size),
+            train_after=data.get("train_after", base.train_after),
+        )
+
+
 @dataclass
 class AgentConfig:
     """Configuration for a single agent."""
@@ -38,6 +137,7 @@ class AgentConfig:
     platform: str
     domain: str
     prompt_file: str
+    restart: RestartPolicy | None = None
 
 
 @dataclass
@@ -47,15 +147,33 @@ class ScoringConfig:
     max_jobs_per_agent: int = 75
 
 
+@dataclass
+class SessionLimits:
+    """Watchdog limits for a single agent session (None disables a limit)."""
+    max_session_seconds: float | None = 3600
+    idle_timeout_seconds: float | None = 600
+
+
 @dataclass
 class OrchestrationConfig:
     """Full orchestration configuration."""
     agents: list[AgentConfig] = field(default_factory=list)
     scoring: ScoringConfig = field(default_factory=ScoringConfig)
+    session: SessionLimits = field(default_factory=SessionLimits)
+    restart: RestartPolicy = field(default_factory=RestartPolicy)
+    breaker: BreakerPolicy = field(default_factory=BreakerPolicy)
+    search: SearchSettings = field(default_factory=SearchSettings)
+    seen: SeenPolicy = field(default_factory=SeenPolicy)
+    archive: ArchivePolicy = field(default_factory=ArchivePolicy)
+
+    def restart_policy(self, agent: AgentConfig) -> RestartPolicy:
+        """The restart policy for an agent (its own, or the default)."""
+        return agent.restart or self.restart
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "OrchestrationConfig":
         """Create config from dictionary."""
+        restart = RestartPolicy.from_dict(data.get("restart", {}))
         agents = [
             AgentConfig(
                 id=a["id"],
@@ -63,6 +181,7 @@ class OrchestrationConfig:
                 platform=a["platform"],
                 domain=a["domain"],
                 prompt_file=a["prompt_file"],
+                restart=RestartPolicy.from_dict(a["restart"], restart) if "restart" in a else None,
             )
             for a in data.get("agents", [])
         ]
@@ -71,7 +190,17 @@ class OrchestrationConfig:
             min_score=scoring_data.get("min_score", 70),
             max_jobs_per_agent=scoring_data.get("max_jobs_per_agent", 75),
         )
-        return cls(agents=agents, scoring=scoring)
+        session_data = data.get("session", {})
+        session = SessionLimits(
+            max_session_seconds=session_data.get("max_session_seconds", 3600),
+            idle_timeout_seconds=session_data.get("idle_timeout_seconds", 600),
+        )
+        return cls(
+            agents=agents, scoring=scoring, session=session, restart=restart,
+            breaker=BreakerPolicy.from_dict(data.get("breaker", {})),
+            seen=SeenPolicy.from_dict(data.get("seen", {})),
+            archive=ArchivePolicy.from_dict(data.get("archive", {})),
+        )
 
 
 @dataclass
@@ -0,0 +1,84 @@
+"""
+Session Watchdog
+================
+
+Bounds a session's message stream with a wall-clock deadline and an
+inactivity timeout, so one hung WebFetch or wedged CLI subprocess cannot
+hold an agent's slot forever.
+
+On a stall the pending read is cancelled and the stream is closed; with
+`client.run_query` that closes the SDK query, which terminates its CLI
+subprocess.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+from typing import TypeVar
+
+from .types import SessionLimits
+
+T = TypeVar("T")
+
+
+class SessionStalledError(Exception):
+    """A session hit its deadline or went quiet for too long."""
+
+    def __init__(self, reason: str, seconds: float):
+        """
+        Args:
+            reason: "deadline" or "idle"
+            seconds: The limit that was exceeded
+        """
+        self.reason = reason
+        self.seconds = seconds
+        label = "deadline" if reason == "deadline" else "no messages"
+        super().__init__(f"session stalled: {label} after {seconds:.0f}s")
+
+
+# TypeVar rather than PEP 695 syntax keeps the module importable on Python 3.11
+async def watch_stream(  # noqa: UP047
+    stream: AsyncIterator[T], limits: SessionLimits
+) -> AsyncGenerator[T, None]:
+    """
+    Yield from `stream`, enforcing session limits.
+
+    Args:
+        stream: Async message stream (an async generator is closed on exit)
+        limits: Deadline and inactivity limits
+
+    Yields:
+        Messages from the stream
+
+    Raises:
+        SessionStalledError: If a limit is exceeded
+    """
+    loop = asyncio.get_running_loop()
+    deadline = (
+        loop.time() + limits.max_session_seconds if limits.max_session_seconds is not None else None
+    )
+    try:
+        while True:
+            timeouts = []
+            if limits.idle_timeout_seconds is not None:
+                timeouts.append(limits.idle_timeout_seconds)
+            if deadline is not None:
+                timeouts.append(max(0.0, deadline - loop.time()))
+            timeout = min(timeouts) if timeouts else None
+
+            try:
+                message = await asyncio.wait_for(anext(stream), timeout)
+            except StopAsyncIteration:
+                return
+            except TimeoutError:
+                if deadline is not None and loop.time() >= deadline:
+                    reason, seconds = "deadline", limits.max_session_seconds
+                else:
+                    reason, seconds = "idle", limits.idle_timeout_seconds
+                # A timeout is only set when one of the limits is configured
+                assert seconds is not None
+                raise SessionStalledError(reason, seconds) from None
+            yield message
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
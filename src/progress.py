@@ -52,3 +52,28 @@ def print_progress_summary(project_dir: Path) -> None:
         print(f"\nProgress: {passing}/{total} tasks complete ({percentage:.1f}%)")
     else:
         print("\nProgress: feature_list.json not yet created")
+
+
+def print_combined_progress(project_dirs: dict[str, Path]) -> None:
+    """
+    Print per-platform and combined progress for concurrent sessions.
+
+    Args:
+        project_dirs: Mapping of platform name to its project directory
+    """
+    total_passing = 0
+    total_tasks = 0
+
+    print("\nProgress by platform:")
+    for platform, project_dir in project_dirs.items():
+        passing, total = count_passing_tests(project_dir)
+        total_passing += passing
+        total_tasks += total
+        if total > 0:
+            print(f"  {platform:12} {passing}/{total} tasks complete")
+        else:
+            print(f"  {platform:12} feature_list.json not yet created")
+
+    if total_tasks > 0:
+        percentage = (total_passing / total_tasks) * 100
+        print(f"\nCombined: {total_passing}/{total_tasks} tasks complete ({percentage:.1f}%)")
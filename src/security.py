@@ -5,11 +5,13 @@ Security Hooks
 Pre-tool-use hooks that validate bash commands using an allowlist.
 """
 
-import os
 import re
-import shlex
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any
 
+from .shell import Command, ShellParseError, parse
+
 # Allowed commands for freelance assistant
 ALLOWED_COMMANDS: set[str] = {
     "ls",
@@ -32,162 +34,227 @@ ALLOWED_COMMANDS: set[str] = {
     "uniq",
     "date",
     "pwd",
+    # File checks in prompts/initializer_prompt.md.example
+    "[",
+    "test",
 }
 
 # Commands requiring extra validation
 COMMANDS_NEEDING_EXTRA_VALIDATION = {"pkill", "chmod", "rm"}
 
+_CHMOD_MODE = re.compile(r"^[ugoa]*\+x$")
+
 
 def extract_commands(command_string: str) -> list[str]:
     """
     Extract command names from a shell command string.
 
-    Handles pipes, command chaining (&&, ||, ;), and subshells.
+    Handles pipes, command chaining (&&, ||, ;), subshells, command
+    substitutions and redirections. Returns an empty list if the command
+    cannot be parsed (fail safe).
     """
-    commands = []
-
-    # Split on semicolons not inside quotes
-    segments = re.split(r'(?<!["\'])\s*;\s*(?!["\'])', command_string)
-
-    for segment in segments:
-        segment = segment.strip()
-        if not segment:
-            continue
-
-        try:
-            tokens = shlex.split(segment)
-        except ValueError:
-            return []  # Malformed - fail safe
-
-        if not tokens:
-            continue
-
-        expect_command = True
-
-        for token in tokens:
-            if token in ("|", "||", "&&", "&"):
-                expect_command = True
-                continue
-
-            if token in ("if", "then", "else", "fi", "for", "while", "do", "done"):
-                continue
-
-            if token.startswith("-"):
-                continue
-
-            if "=" in token and not token.startswith("="):
-                continue
+    try:
+        script = parse(command_string)
+    except ShellParseError:
+        return []
+    return [cmd.name for cmd in script.iter_commands()]
 
-            if expect_command:
-                cmd = os.path.basename(token)
-                commands.append(cmd)
-                expect_command = False
 
-    return commands
+def _commands_named(command: Command | str, name: str) -> list[Command] | None:
+    """Commands called `name` in a Command or command string (None if unparseable)."""
+    if isinstance(command, Command):
+        return [command] if command.name == name else []
+    try:
+        return [c for c in parse(command).iter_commands() if c.name == name]
+    except ShellParseError:
+        return None
 
 
-def validate_pkill_command(command_string: str) -> tuple[bool, str]:
+def validate_pkill_command(command: Command | str) -> tuple[bool, str]:
     """Validate pkill - only allow killing dev processes."""
     allowed_processes = {"node", "npm", "npx", "python", "uvicorn", "gunicorn"}
 
-    try:
-        tokens = shlex.split(command_string)
-    except ValueError:
+    commands = _commands_named(command, "pkill")
+    if commands is None:
         return False, "Could not parse pkill command"
 
-    args = [t for t in tokens[1:] if not t.startswith("-")]
-    if not args:
-        return False, "pkill requires a process name"
+    for cmd in commands:
+        args = [t for t in cmd.args if not t.startswith("-")]
+        if not args:
+            return False, "pkill requires a process name"
 
-    target = args[-1].split()[0] if " " in args[-1] else args[-1]
+        target = args[-1].split()[0] if " " in args[-1] else args[-1]
 
-    if target in allowed_processes:
-        return True, ""
-    return False, f"pkill only allowed for: {allowed_processes}"
+        if target not in allowed_processes:
+            return False, f"pkill only allowed for: {allowed_processes}"
+    return True, ""
 
 
-def validate_chmod_command(command_string: str) -> tuple[bool, str]:
+def validate_chmod_command(command: Command | str) -> tuple[bool, str]:
     """Validate chmod - only allow +x for making files executable."""
-    try:
-        tokens = shlex.split(command_string)
-    except ValueError:
+    commands = _commands_named(command, "chmod")
+    if commands is None:
         return False, "Could not parse chmod command"
 
-    if not tokens or tokens[0] != "chmod":
+    if not commands:
         return False, "Not a chmod command"
 
-    mode = None
-    for token in tokens[1:]:
-        if token.startswith("-"):
-            return False, "chmod flags not allowed"
-        elif mode is None:
-            mode = token
+    for cmd in commands:
+        mode = None
+        for token in cmd.args:
+            if token.startswith("-"):
+                return False, "chmod flags not allowed"
+            elif mode is None:
+                mode = token
 
-    if mode is None:
-        return False, "chmod requires a mode"
+        if mode is None:
+            return False, "chmod requires a mode"
 
-    if not re.match(r"^[ugoa]*\+x$", mode):
-        return False, f"chmod only allowed with +x, got: {mode}"
+        if not _CHMOD_MODE.match(mode):
+            return False, f"chmod only allowed with +x, got: {mode}"
 
     return True, ""
 
 
-def validate_rm_command(command_string: str) -> tuple[bool, str]:
+def validate_rm_command(command: Command | str) -> tuple[bool, str]:
     """Validate rm - block recursive and force deletes."""
-    try:
-        tokens = shlex.split(command_string)
-    except ValueError:
+    commands = _commands_named(command, "rm")
+    if commands is None:
         return False, "Could not parse rm command"
 
-    for token in tokens[1:]:
-        if token.startswith("-") and ("r" in token or "f" in token):
-            return False, "rm -r and rm -f are not allowed"
+    for cmd in commands:
+        for token in cmd.args:
+            if token.startswith("-") and any(flag in token for flag in "rRf"):
+                return False, "rm -r and rm -f are not allowed"
 
     return True, ""
 
 
-async def bash_security_hook(
-    input_data: dict[str, Any],
-    tool_use_id: str | None = None,
-    context: Any | None = None,
-) -> dict[str, Any]:
+# Per-command validators for COMMANDS_NEEDING_EXTRA_VALIDATION
+VALIDATORS: dict[str, Callable[[Command | str], tuple[bool, str]]] = {
+    "pkill": validate_pkill_command,
+    "chmod": validate_chmod_command,
+    "rm": validate_rm_command,
+}
+
+
+class BashPolicy:
     """
-    Pre-tool-use hook that validates bash commands.
+    Allowlist policy for bash commands.
 
-    Returns empty dict to allow, or {"decision": "block", "reason": "..."} to block.
+    Built once and shared by every agent in the process. Decisions are
+    cached in a bounded LRU, since agents repeat the same commands
+    (cat jobs.json, ls, git status) many times per session.
     """
-    if input_data.get("tool_name") != "Bash":
-        return {}
 
-    command = input_data.get("tool_input", {}).get("command", "")
-    if not command:
-        return {}
+    def __init__(
+        self,
+        allowed_commands: set[str] | frozenset[str] = frozenset(ALLOWED_COMMANDS),
+        cache_size: int = 1024,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            allowed_commands: Command names that may run
+            cache_size: Maximum number of cached decisions
+        """
+        self.allowed_commands = frozenset(allowed_commands)
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, tuple[bool, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _evaluate(self, command: str) -> tuple[bool, str]:
+        """Validate a command without consulting the cache."""
+        try:
+            commands = list(parse(command).iter_commands())
+        except ShellParseError as e:
+            return False, f"Could not parse command: {command} ({e})"
+        if not commands:
+            return False, f"Could not parse command: {command}"
+
+        for cmd in commands:
+            if cmd.dynamic_name:
+                return False, f"Command name built from an expansion is not allowed: {cmd.argv[0]}"
+
+            if cmd.name not in self.allowed_commands:
+                names = sorted(self.allowed_commands)
+                return False, f"Command '{cmd.name}' not in allowed list: {names}"
+
+            validator = VALIDATORS.get(cmd.name)
+            if validator is not None:
+                allowed, reason = validator(cmd)
+                if not allowed:
+                    return False, reason
+
+        return True, ""
+
+    def check(self, command: str) -> tuple[bool, str]:
+        """
+        Validate a command string.
+
+        Returns:
+            (allowed, reason) - reason is empty when allowed
+        """
+        cached = self._cache.get(command)
+        if cached is not None:
+            self.hits += 1
+            self._cache.move_to_end(command)
+            return cached
+
+        self.misses += 1
+        decision = self._evaluate(command)
+        self._cache[command] = decision
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return decision
+
+    async def hook(
+        self,
+        input_data: dict[str, Any],
+        tool_use_id: str | None = None,
+        context: Any | None = None,
+    ) -> dict[str, Any]:
+        """
+        Pre-tool-use hook that validates bash commands.
+
+        Returns empty dict to allow, or {"decision": "block", "reason": "..."} to block.
+        """
+        if input_data.get("tool_name") != "Bash":
+            return {}
+
+        command = input_data.get("tool_input", {}).get("command", "")
+        if not command:
+            return {}
+
+        allowed, reason = self.check(command)
+        if allowed:
+            return {}
 
-    commands = extract_commands(command)
-    if not commands:
         return {
             "decision": "block",
-            "reason": f"Could not parse command: {command}",
+            "reason": reason,
+            "hookSpecificOutput": {
+                "hookEventName": "PreToolUse",
+                "permissionDecision": "deny",
+                "permissionDecisionReason": reason,
+            },
         }
 
-    for cmd in commands:
-        if cmd not in ALLOWED_COMMANDS:
-            return {
-                "decision": "block",
-                "reason": f"Command '{cmd}' not in allowed list: {ALLOWED_COMMANDS}",
-            }
-
-        if cmd in COMMANDS_NEEDING_EXTRA_VALIDATION:
-            if cmd == "pkill":
-                allowed, reason = validate_pkill_command(command)
-            elif cmd == "chmod":
-                allowed, reason = validate_chmod_command(command)
-            elif cmd == "rm":
-                allowed, reason = validate_rm_command(command)
-            else:
-                allowed, reason = True, ""
-
-            if not allowed:
-                return {"decision": "block", "reason": reason}
-
-    return {}
+
+# Shared policy used by all agents in this process
+DEFAULT_POLICY = BashPolicy()
+
+
+async def bash_security_hook(
+    input_data: dict[str, Any],
+    tool_use_id: str | None = None,
+    context: Any | None = None,
+) -> dict[str, Any]:
+    """
+    Pre-tool-use hook that validates bash commands with the default policy.
+
+    Returns empty dict to allow, or {"decision": "block", "reason": "..."} to block.
+    """
+    return await DEFAULT_POLICY.hook(input_data, tool_use_id, context)
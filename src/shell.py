@@ -0,0 +1,494 @@
+"""
+Shell Command Parser
+====================
+
+Single-pass tokenizer and parser for the shell subset agents use.
+
+Builds a small AST of pipelines and commands in one left-to-right scan.
+Command substitutions ($(...) and backticks), subshells, process
+substitutions and heredoc bodies are parsed recursively as they are
+reached, so nested commands are visible to the security policy without
+re-tokenizing anything.
+"""
+
+import os
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+
+class ShellParseError(ValueError):
+    """Raised for input outside the supported shell subset."""
+
+
+@dataclass
+class Redirect:
+    """An I/O redirection such as `> out.txt` or `2>&1`."""
+
+    op: str
+    target: str
+
+
+@dataclass
+class Command:
+    """A simple command: assignments, words and redirections."""
+
+    argv: list[str] = field(default_factory=list)
+    assignments: list[str] = field(default_factory=list)
+    redirects: list[Redirect] = field(default_factory=list)
+    substitutions: list["Script"] = field(default_factory=list)
+    dynamic_name: bool = False
+
+    @property
+    def name(self) -> str:
+        """Command name without its directory."""
+        return os.path.basename(self.argv[0]) if self.argv else ""
+
+    @property
+    def args(self) -> list[str]:
+        """Arguments after the command name."""
+        return self.argv[1:]
+
+    def is_empty(self) -> bool:
+        return not (self.argv or self.assignments or self.redirects or self.substitutions)
+
+
+@dataclass
+class Subshell:
+    """A parenthesized command list: `( ... )`."""
+
+    body: "Script"
+    redirects: list[Redirect] = field(default_factory=list)
+
+
+@dataclass
+class Pipeline:
+    """Commands joined by `|`, followed by the operator that ends the pipeline."""
+
+    commands: list[Command | Subshell] = field(default_factory=list)
+    operator: str = ""
+
+
+@dataclass
+class Script:
+    """A list of pipelines."""
+
+    pipelines: list[Pipeline] = field(default_factory=list)
+
+    def iter_commands(self) -> Iterator[Command]:
+        """Yield every command with a name, including nested ones, in source order."""
+        for pipeline in self.pipelines:
+            for node in pipeline.commands:
+                if isinstance(node, Subshell):
+                    yield from node.body.iter_commands()
+                    continue
+                if node.argv:
+                    yield node
+                for sub in node.substitutions:
+                    yield from sub.iter_commands()
+
+
+# Words that structure compound commands rather than name a command
+KEYWORDS = frozenset(
+    {
+        "if",
+        "then",
+        "elif",
+        "else",
+        "fi",
+        "while",
+        "until",
+        "do",
+        "done",
+        "{",
+        "}",
+        "!",
+    }
+)
+# Keywords followed by words that are not commands, up to the next separator
+LIST_KEYWORDS = frozenset({"for", "select"})
+UNSUPPORTED_KEYWORDS = frozenset({"case", "esac", "function", "coproc"})
+
+_PLAIN = re.compile(r"[^\s;&|<>()'\"\\$`]+")
+# A whole word made only of plain runs and quotes without expansions or escapes
+_SIMPLE_WORD = re.compile(
+    r"(?:[^\s;&|<>()'\"\\$`#]|'[^']*'|\"[^\"\\$`]*\")(?:[^\s;&|<>()'\"\\$`]+|'[^']*'|\"[^\"\\$`]*\")*"
+)
+_QUOTED_SEGMENTS = re.compile(r"([^'\"]+)|'([^']*)'|\"([^\"]*)\"")
+_BLANK_RUN = re.compile(r"(?:[ \t]|\\\n)*")
+_TOKEN_STARTS = frozenset("\n;&|()<>#")
+_DQ_PLAIN = re.compile(r"[^\"\\$`]+")
+_HEREDOC_PLAIN = re.compile(r"[^\\$`]+")
+_REDIRECT = re.compile(r"&>>|&>|(\d*)(>>|>&|>\||<<<|<<-|<<|<&|<>|>|<)")
+_ASSIGNMENT = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(\[[^\]]*\])?\+?=")
+_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|[0-9@*#?$!-]")
+
+
+class _Parser:
+    """Recursive descent parser over a single command string."""
+
+    def __init__(self, text: str):
+        self.s = text
+        self.n = len(text)
+        self.i = 0
+        self.backticks = 0
+        self.heredocs: list[tuple[str, bool, bool, Command]] = []
+
+    def error(self, message: str) -> ShellParseError:
+        return ShellParseError(f"{message} at offset {self.i}")
+
+    # -- lists and pipelines ------------------------------------------------
+
+    def parse_list(self, closer: str | None = None) -> Script:
+        """Parse pipelines until `closer` (")" or "`") or end of input."""
+        s = self.s
+        script = Script()
+        pipeline = Pipeline()
+        cmd = Command()
+        pending_pipe = False
+        list_words = False
+
+        def end_command() -> None:
+            nonlocal cmd, pending_pipe
+            if not cmd.is_empty():
+                pipeline.commands.append(cmd)
+                pending_pipe = False
+            cmd = Command()
+
+        def end_pipeline(op: str) -> None:
+            nonlocal pipeline, list_words
+            end_command()
+            if pending_pipe:
+                raise self.error("Missing command after '|'")
+            list_words = False
+            if pipeline.commands:
+                pipeline.operator = op
+                script.pipelines.append(pipeline)
+            elif op in ("&&", "||", "&"):
+                raise self.error(f"Missing command before '{op}'")
+            pipeline = Pipeline()
+
+        while True:
+            self._skip_blanks()
+            if self.i >= self.n:
+                if closer is not None:
+                    raise self.error(f"Unterminated '{closer}'")
+                end_pipeline("")
+                return script
+
+            c = s[self.i]
+            if closer is not None and c == closer:
+                self.i += 1
+                end_pipeline("")
+                return script
+
+            if c not in _TOKEN_STARTS and not (c.isdigit() and self._at_redirect()):
+                start = self.i
+                word, dynamic, quoted = self._read_word(cmd)
+                if self.i == start:
+                    raise self.error(f"Unexpected character {c!r}")
+                if list_words:
+                    continue
+                if not cmd.argv and not cmd.assignments and not quoted:
+                    if word in KEYWORDS:
+                        continue
+                    if word in LIST_KEYWORDS:
+                        list_words = True
+                        continue
+                    if word in UNSUPPORTED_KEYWORDS:
+                        raise self.error(f"'{word}' is not supported")
+                if not cmd.argv and _ASSIGNMENT.match(s, start):
+                    cmd.assignments.append(word)
+                    continue
+                if not cmd.argv:
+                    cmd.dynamic_name = dynamic
+                    if s.startswith("()", self.i) or s.startswith(" ()", self.i):
+                        raise self.error("Function definitions are not supported")
+                cmd.argv.append(word)
+            elif c == "#":
+                newline = s.find("\n", self.i)
+                self.i = self.n if newline < 0 else newline
+            elif c == "\n":
+                self.i += 1
+                end_pipeline(";")
+                self._read_heredocs()
+            elif c == ";":
+                if s.startswith(";;", self.i):
+                    raise self.error("'case' clauses are not supported")
+                self.i += 1
+                end_pipeline(";")
+            elif c == "&" and s.startswith("&&", self.i):
+                self.i += 2
+                end_pipeline("&&")
+            elif c == "&" and not s.startswith("&>", self.i):
+                self.i += 1
+                end_pipeline("&")
+            elif c == "|":
+                if s.startswith("||", self.i):
+                    self.i += 2
+                    end_pipeline("||")
+                else:
+                    self.i += 2 if s.startswith("|&", self.i) else 1
+                    end_command()
+                    if not pipeline.commands:
+                        raise self.error("Missing command before '|'")
+                    pending_pipe = True
+            elif c == "(":
+                if s.startswith("((", self.i):
+                    raise self.error("Arithmetic commands are not supported")
+                if not cmd.is_empty():
+                    raise self.error("Unexpected '('")
+                self.i += 1
+                body = self.parse_list(")")
+                pipeline.commands.append(Subshell(body))
+                pending_pipe = False
+            elif c == ")":
+                raise self.error("Unexpected ')'")
+            elif c in "<>" and s.startswith("(", self.i + 1):
+                cmd.argv.append(self._process_substitution(cmd))
+            elif c in "<>&" or c.isdigit():
+                self._read_redirect(cmd, pipeline)
+            else:
+                raise self.error(f"Unexpected character {c!r}")
+
+    def _skip_blanks(self) -> None:
+        # The pattern also matches the empty string, so this never fails
+        m = _BLANK_RUN.match(self.s, self.i)
+        assert m is not None
+        self.i = m.end()
+
+    # -- words --------------------------------------------------------------
+
+    def _read_word(self, cmd: Command) -> tuple[str, bool, bool]:
+        """
+        Read one word, removing quotes.
+
+        Returns:
+            (text, whether it contains expansions, whether any part was quoted)
+        """
+        s, n = self.s, self.n
+
+        # Fast path: the whole word is plain text and simple quotes
+        m = _SIMPLE_WORD.match(s, self.i)
+        if m and (m.end() >= n or s[m.end()] not in "$\\`\"'"):
+            self.i = m.end()
+            text = m.group()
+            if "'" in text or '"' in text:
+                return (
+                    "".join(a or b or c for a, b, c in _QUOTED_SEGMENTS.findall(text)),
+                    False,
+                    True,
+                )
+            return text, False, False
+
+        parts: list[str] = []
+        dynamic = quoted = False
+
+        while self.i < n:
+            c = s[self.i]
+            m = _PLAIN.match(s, self.i)
+            if m:
+                parts.append(m.group())
+                self.i = m.end()
+            elif c == "'":
+                end = s.find("'", self.i + 1)
+                if end < 0:
+                    raise self.error("Unterminated single quote")
+                parts.append(s[self.i + 1 : end])
+                self.i = end + 1
+                quoted = True
+            elif c == '"':
+                self.i += 1
+                text, dyn = self._read_double_quoted(cmd, '"')
+                parts.append(text)
+                dynamic = dynamic or dyn
+                quoted = True
+            elif c == "\\":
+                if self.i + 1 >= n:
+                    raise self.error("Trailing backslash")
+                if s[self.i + 1] != "\n":
+                    parts.append(s[self.i + 1])
+                self.i += 2
+            elif c == "$":
+                parts.append(self._read_dollar(cmd))
+                dynamic = True
+            elif c == "`":
+                if self.backticks:
+                    break
+                parts.append(self._read_backtick(cmd))
+                dynamic = True
+            else:
+                break
+
+        return "".join(parts), dynamic, quoted
+
+    def _read_double_quoted(self, cmd: Command, stop: str) -> tuple[str, bool]:
+        """Read double-quoted content up to and including `stop`."""
+        s, n = self.s, self.n
+        parts: list[str] = []
+        dynamic = False
+
+        while True:
+            if self.i >= n:
+                raise self.error("Unterminated double quote")
+            c = s[self.i]
+            m = _DQ_PLAIN.match(s, self.i)
+            if m:
+                parts.append(m.group())
+                self.i = m.end()
+            elif c == stop:
+                self.i += 1
+                return "".join(parts), dynamic
+            elif c == "\\":
+                nxt = s[self.i + 1 : self.i + 2]
+                if nxt in ('"', "\\", "$", "`"):
+                    parts.append(nxt)
+                elif nxt != "\n":
+                    parts.append("\\" + nxt)
+                self.i += 2
+            elif c == "$":
+                parts.append(self._read_dollar(cmd))
+                dynamic = True
+            else:  # backtick
+                parts.append(self._read_backtick(cmd))
+                dynamic = True
+
+    def _read_dollar(self, cmd: Command) -> str:
+        """Read a `$` expansion starting at the current position."""
+        s = self.s
+        start = self.i
+        if s.startswith("$((", self.i):
+            self.i += 3
+            self._read_expansion_body(cmd, "))")
+        elif s.startswith("$(", self.i):
+            self.i += 2
+            cmd.substitutions.append(self.parse_list(")"))
+        elif s.startswith("${", self.i):
+            self.i += 2
+            self._read_expansion_body(cmd, "}")
+        else:
+            m = _NAME.match(s, self.i + 1)
+            self.i = m.end() if m else self.i + 1
+        return s[start : self.i]
+
+    def _read_expansion_body(self, cmd: Command, closer: str) -> None:
+        """Skip a `${...}` or `$((...))` body, parsing any substitutions inside it."""
+        s = self.s
+        depth = 0
+        while self.i < self.n:
+            c = s[self.i]
+            if depth == 0 and s.startswith(closer, self.i):
+                self.i += len(closer)
+                return
+            if c == "$":
+                self._read_dollar(cmd)
+            elif c == "`":
+                self._read_backtick(cmd)
+            elif c == "'":
+                end = s.find("'", self.i + 1)
+                if end < 0:
+                    raise self.error("Unterminated single quote")
+                self.i = end + 1
+            elif c == '"':
+                self.i += 1
+                self._read_double_quoted(cmd, '"')
+            else:
+                if c == "(":
+                    depth += 1
+                elif c == ")":
+                    depth -= 1
+                self.i += 2 if c == "\\" else 1
+        raise self.error(f"Unterminated expansion, expected '{closer}'")
+
+    def _read_backtick(self, cmd: Command) -> str:
+        start = self.i
+        self.i += 1
+        self.backticks += 1
+        try:
+            cmd.substitutions.append(self.parse_list("`"))
+        finally:
+            self.backticks -= 1
+        return self.s[start : self.i]
+
+    def _process_substitution(self, cmd: Command) -> str:
+        start = self.i
+        self.i += 2
+        cmd.substitutions.append(self.parse_list(")"))
+        return self.s[start : self.i]
+
+    # -- redirections and heredocs ------------------------------------------
+
+    def _at_redirect(self) -> bool:
+        m = _REDIRECT.match(self.s, self.i)
+        return m is not None and bool(m.group(1))
+
+    def _read_redirect(self, cmd: Command, pipeline: Pipeline) -> None:
+        m = _REDIRECT.match(self.s, self.i)
+        if m is None:
+            raise self.error(f"Unexpected character {self.s[self.i]!r}")
+        op = m.group()
+        self.i = m.end()
+        self._skip_blanks()
+        target, dynamic, quoted = self._read_word(cmd)
+        if not target and not quoted:
+            raise self.error(f"Missing target for '{op}'")
+
+        # Redirections after a subshell belong to it
+        node: Command | Subshell = cmd
+        if cmd.is_empty() and pipeline.commands and isinstance(pipeline.commands[-1], Subshell):
+            node = pipeline.commands[-1]
+        node.redirects.append(Redirect(op, target))
+
+        if op.endswith("<<") or op.endswith("<<-"):
+            self.heredocs.append((target, op.endswith("-"), not quoted, cmd))
+
+    def _read_heredocs(self) -> None:
+        """Consume heredoc bodies that start after the newline just read."""
+        s = self.s
+        pending, self.heredocs = self.heredocs, []
+        for delimiter, strip_tabs, expand, cmd in pending:
+            start = self.i
+            while self.i < self.n:
+                end = s.find("\n", self.i)
+                end = self.n if end < 0 else end
+                line = s[self.i : end]
+                self.i = min(end + 1, self.n)
+                if (line.lstrip("\t") if strip_tabs else line) == delimiter:
+                    body = s[start : end - len(line)]
+                    break
+            else:
+                body = s[start:]
+            if expand:
+                _scan_heredoc(body, cmd)
+
+
+def _scan_heredoc(body: str, cmd: Command) -> None:
+    """Collect substitutions from an unquoted heredoc body."""
+    parser = _Parser(body)
+    s = body
+    while parser.i < parser.n:
+        m = _HEREDOC_PLAIN.match(s, parser.i)
+        if m:
+            parser.i = m.end()
+            continue
+        c = s[parser.i]
+        if c == "\\":
+            parser.i += 2
+        elif c == "$":
+            parser._read_dollar(cmd)
+        else:
+            parser._read_backtick(cmd)
+
+
+def parse(command: str) -> Script:
+    """
+    Parse a command string into a Script.
+
+    Raises:
+        ShellParseError: If the command is malformed or outside the supported subset
+    """
+    parser = _Parser(command)
+    script = parser.parse_list()
+    if parser.heredocs:
+        parser._read_heredocs()
+    return script
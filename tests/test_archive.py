@@ -0,0 +1,152 @@
+"""
+Posting Archive Tests
+=====================
+
+Tests for the dictionary-compressed archive of fetched postings.
+"""
+
+import pytest
+
+from src.orchestration import archive as archive_module
+from src.orchestration.agent_runner import AgentRunner
+from src.orchestration.archive import ARCHIVE_DIR, DATA_FILE, ZLIB, ZSTD, PostingArchive
+from src.orchestration.state import StateManager
+from src.orchestration.types import AgentConfig, ArchivePolicy
+
+POSTING_HTML = """
+<html><body>
+  <h1 class="app-title">Staff Platform Engineer</h1>
+  <span class="company-name">at TechCorp</span>
+  <div class="location">Remote (US)</div>
+  <div id="content">
+    <h3>What you'll do</h3>
+    <ul><li>Build the internal developer platform on Kubernetes and AWS</li></ul>
+    <h3>Requirements</h3>
+    <ul><li>8+ years of experience with Go and Terraform</li></ul>
+    <p>We offer medical, dental and vision coverage, equity and a learning budget.</p>
+  </div>
+</body></html>
+"""
+
+BOILERPLATE = (
+    "TechCorp is an equal opportunity employer. We offer medical, dental and vision coverage, "
+    "a 401k match, equity, a home office stipend and a yearly learning budget. "
+)
+
+
+def _posting(n: int) -> dict:
+    return {
+        "title": f"Platform Engineer {n}",
+        "company": "TechCorp",
+        "text": BOILERPLATE
+        + f"Team {n} runs Kubernetes clusters in region {n % 7}. "
+        + BOILERPLATE,
+    }
+
+
+def _url(n: int) -> str:
+    return f"https://boards.greenhouse.io/techcorp/jobs/{n}"
+
+
+class TestPostingArchive:
+    """Tests for storing and reading postings."""
+
+    def test_random_access_by_canonical_url(self, tmp_path):
+        archive = PostingArchive(tmp_path)
+        for n in range(5):
+            assert archive.add(_url(n) + "?gh_src=abc", _posting(n), source="agent-1")
+
+        assert archive.get(_url(3)) == _posting(3)
+        assert archive.get(_url(9)) is None
+        assert [url for url, _ in archive.postings()] == [_url(n) for n in range(5)]
+
+    def test_unchanged_posting_is_not_stored_twice(self, tmp_path):
+        archive = PostingArchive(tmp_path)
+        assert archive.add(_url(1), _posting(1))
+        size = (tmp_path / DATA_FILE).stat().st_size
+        assert not archive.add(_url(1), _posting(1))
+        assert (tmp_path / DATA_FILE).stat().st_size == size
+
+        assert archive.add(_url(1), _posting(2))
+        assert archive.get(_url(1)) == _posting(2)
+        assert len(archive) == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        archive = PostingArchive(tmp_path)
+        archive.add(_url(1), _posting(1))
+        archive.close()
+        assert PostingArchive(tmp_path).get(_url(1)) == _posting(1)
+
+    def test_trains_dictionary_and_compresses_better(self, tmp_path):
+        pytest.importorskip("zstandard")
+        policy = ArchivePolicy(dictionary_size=4096, train_after=40)
+        archive = PostingArchive(tmp_path, policy)
+        for n in range(40):
+            archive.add(_url(n), _posting(n))
+        # Adding never trains; that is left to the merge
+        assert archive.to_dict()["dictionaries"] == 0
+        assert archive.train_if_due() == 1
+        assert archive.train_if_due() is None
+
+        for n in range(40, 60):
+            archive.add(_url(n), _posting(n))
+        rows = archive._db.execute(
+            "SELECT codec, dictionary, length FROM postings ORDER BY rowid"
+        ).fetchall()
+        before = [length for codec, dict_id, length in rows[:40]]
+        after = [length for codec, dict_id, length in rows[40:]]
+        assert {codec for codec, _, _ in rows} == {ZSTD}
+        assert all(dict_id == 1 for _, dict_id, _ in rows[40:])
+        assert sum(after) / len(after) < 0.6 * sum(before) / len(before)
+
+        # Every frame still decodes with the dictionary it was written with
+        assert [p for _, p in archive.postings()] == [_posting(n) for n in range(60)]
+
+    def test_merge_trains_the_dictionary(self, tmp_path, monkeypatch):
+        pytest.importorskip("zstandard")
+        from src.orchestration import merger
+        from src.orchestration.types import OrchestrationConfig
+
+        config = OrchestrationConfig(archive=ArchivePolicy(dictionary_size=4096, train_after=40))
+        monkeypatch.setattr(merger, "load_config", lambda: config)
+        archive = PostingArchive(tmp_path / ARCHIVE_DIR, config.archive)
+        for n in range(40):
+            archive.add(_url(n), _posting(n))
+        archive.close()
+
+        merger.merge_outputs(tmp_path, min_score=70, ui_data_dir=tmp_path / "ui")
+        archive = PostingArchive(tmp_path / ARCHIVE_DIR, config.archive)
+        assert archive.to_dict()["dictionaries"] == 1
+
+    def test_falls_back_to_zlib_without_zstandard(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(archive_module, "zstandard", None)
+        archive = PostingArchive(tmp_path, ArchivePolicy(train_after=1))
+        archive.add(_url(1), _posting(1))
+
+        assert archive.get(_url(1)) == _posting(1)
+        assert archive._db.execute("SELECT codec FROM postings").fetchone()[0] == ZLIB
+        assert archive.to_dict()["dictionaries"] == 0
+
+
+async def test_runner_archives_fetched_postings(tmp_path):
+    archive = PostingArchive(tmp_path / ARCHIVE_DIR)
+    config = AgentConfig(
+        id=1,
+        name="GREENHOUSE",
+        platform="greenhouse",
+        domain="boards.greenhouse.io",
+        prompt_file="",
+    )
+    runner = AgentRunner(config, tmp_path / "agent-1", StateManager(tmp_path), archive=archive)
+
+    await runner.reducer.hook(
+        {
+            "tool_name": "WebFetch",
+            "tool_input": {"url": _url(7)},
+            "tool_response": {"result": POSTING_HTML},
+        }
+    )
+
+    posting = archive.get(_url(7))
+    assert posting["title"] == "Staff Platform Engineer"
+    assert "learning budget" in posting["text"]
@@ -0,0 +1,186 @@
+"""
+Circuit Breaker Tests
+=====================
+
+Tests for per-platform circuit breakers and session slots.
+"""
+
+import asyncio
+
+import pytest
+
+from src.orchestration.agent_runner import AgentRunner
+from src.orchestration.breaker import (
+    BLOCKED,
+    FETCH_FAILED,
+    SESSION_ERROR,
+    CircuitState,
+    PlatformBreakers,
+    is_fetch_failure,
+)
+from src.orchestration.events import CIRCUIT_CHANGED, EventBus
+from src.orchestration.state import StateManager
+from src.orchestration.types import AgentConfig, BreakerPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breakers(clock, **policy) -> PlatformBreakers:
+    defaults = {"failure_threshold": 3, "window_seconds": 60, "cooldown_seconds": 100}
+    return PlatformBreakers(BreakerPolicy(**{**defaults, **policy}), events=EventBus(), clock=clock)
+
+
+class TestCircuitBreaker:
+    """Tests for breaker state transitions."""
+
+    def test_opens_at_threshold(self):
+        clock = FakeClock()
+        breaker = _breakers(clock).get("lever")
+        breaker.record_failure(FETCH_FAILED)
+        breaker.record_failure(BLOCKED)
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_failure(SESSION_ERROR, "boom")
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.reason == "session_error: boom"
+        assert breaker.admit() == 100
+
+    def test_failures_outside_window_do_not_count(self):
+        clock = FakeClock()
+        breaker = _breakers(clock).get("lever")
+        for _ in range(2):
+            breaker.record_failure(FETCH_FAILED)
+        clock.now = 61
+        breaker.record_failure(FETCH_FAILED)
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_admits_one_probe(self):
+        clock = FakeClock()
+        breaker = _breakers(clock, failure_threshold=1).get("lever")
+        breaker.record_failure(BLOCKED)
+        clock.now = 100
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.admit() == 0
+        assert breaker.admit() > 0  # probe already in flight
+
+    def test_probe_success_closes_and_failure_reopens(self):
+        clock = FakeClock()
+        breaker = _breakers(clock, failure_threshold=1).get("lever")
+        breaker.record_failure(BLOCKED)
+        clock.now = 100
+        breaker.admit()
+        breaker.record_failure(FETCH_FAILED)
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.trips == 2
+
+        clock.now = 200
+        breaker.admit()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_changes_are_published(self):
+        clock = FakeClock()
+        breakers = _breakers(clock, failure_threshold=1)
+        breakers.record_failure("lever", BLOCKED)
+        event = breakers.events.recent()[-1]
+        assert event.type == CIRCUIT_CHANGED
+        assert event.data["state"] == "open"
+
+
+class TestSessions:
+    """Tests for session outcomes and slots."""
+
+    @pytest.mark.asyncio
+    async def test_session_error_counts_and_clean_session_closes(self):
+        clock = FakeClock()
+        breakers = _breakers(clock, failure_threshold=1)
+        with pytest.raises(RuntimeError):
+            async with breakers.session("lever"):
+                raise RuntimeError("boom")
+        breaker = breakers.get("lever")
+        assert breaker.state == CircuitState.OPEN
+
+        clock.now = 100
+        assert breaker.admit() == 0
+        async with breakers.session("lever"):
+            pass
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_session_with_failure_signal_is_not_a_success(self):
+        clock = FakeClock()
+        breakers = _breakers(clock, failure_threshold=2)
+        async with breakers.session("lever"):
+            breakers.record_failure("lever", FETCH_FAILED)
+        assert len(breakers.get("lever").failures) == 1
+
+    @pytest.mark.asyncio
+    async def test_slots_limit_concurrent_sessions(self):
+        breakers = _breakers(FakeClock(), max_concurrent_sessions=1)
+        running = []
+
+        async def session(platform):
+            async with breakers.session(platform):
+                running.append(platform)
+                assert len(running) == 1
+                await asyncio.sleep(0.01)
+                running.remove(platform)
+
+        await asyncio.gather(session("lever"), session("ashby"))
+
+
+def test_is_fetch_failure():
+    assert is_fetch_failure("Request failed with status code 403")
+    assert is_fetch_failure({"result": "429 Too Many Requests"})
+    assert is_fetch_failure({"is_error": True})
+    assert not is_fetch_failure({"result": "Senior Engineer at Stripe. We handle 429 requests/s"})
+    assert not is_fetch_failure(None)
+
+
+class TestRunnerSignals:
+    """Tests for failure signals reported by the agent runner."""
+
+    def _runner(self, tmp_path, breakers) -> AgentRunner:
+        config = AgentConfig(
+            id=1, name="LEVER", platform="lever", domain="jobs.lever.co", prompt_file=""
+        )
+        return AgentRunner(config, tmp_path / "agent-1", StateManager(tmp_path), breakers=breakers)
+
+    @pytest.mark.asyncio
+    async def test_blocked_md_and_failed_fetch_are_reported(self, tmp_path):
+        breakers = _breakers(FakeClock())
+        runner = self._runner(tmp_path, breakers)
+
+        await runner._progress_hook().hooks[0](
+            {"tool_name": "Write", "tool_input": {"file_path": "blocked.md"}},
+            None,
+            None,
+        )
+        await runner._fetch_failure_hook().hooks[0](
+            {
+                "tool_name": "WebFetch",
+                "tool_input": {"url": "https://jobs.lever.co/x"},
+                "tool_response": "Request failed with status code 429",
+            },
+            None,
+            None,
+        )
+        assert breakers.get("lever").failures_total == 2
+
+    @pytest.mark.asyncio
+    async def test_paused_agent_stops_on_signal(self, tmp_path, monkeypatch):
+        breakers = _breakers(FakeClock(), failure_threshold=1)
+        breakers.record_failure("lever", BLOCKED)
+        runner = self._runner(tmp_path, breakers)
+        runner.state_manager.set_stop_signal()
+        monkeypatch.setattr("src.orchestration.agent_runner.CIRCUIT_POLL_SECONDS", 0)
+
+        assert await runner._wait_for_circuit() is False
+        assert runner.state.circuit == "open"
@@ -0,0 +1,175 @@
+"""
+Job Catalog Tests
+=================
+
+Tests for the SQLite catalog written at merge time and the query command.
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from src.orchestration.catalog import (
+    CATALOG_FILE,
+    fts_query,
+    has_fts5,
+    search_catalog,
+    write_catalog,
+)
+from src.orchestration.cli import main
+
+JOBS = [
+    {
+        "id": "gh-1",
+        "job_url": "https://boards.greenhouse.io/acme/1",
+        "company": "Acme",
+        "role": "Senior Platform Engineer",
+        "location": "Remote - US",
+        "found_date": "2026-01-10",
+        "match_score": 91,
+        "tech_stack": ["Kubernetes", "Go"],
+        "requirements": ["5+ years running Kubernetes in production"],
+        "responsibilities": ["Own the deployment pipeline"],
+    },
+    {
+        "id": "lv-2",
+        "job_url": "https://jobs.lever.co/globex/2",
+        "company": "Globex",
+        "role": "Backend Engineer",
+        "location": "Austin, TX",
+        "found_date": "2026-01-12",
+        "match_score": 84,
+        "tech_stack": ["Python", "Postgres"],
+        "requirements": ["Python services at scale"],
+        "responsibilities": ["Design APIs", "Mentor engineers on Kubernetes"],
+    },
+    {
+        "id": "lv-3",
+        "job_url": "https://jobs.lever.co/acme/3",
+        "company": "Acme",
+        "role": "Data Engineer",
+        "location": "Remote",
+        "found_date": "2026-01-05",
+        "match_score": 78,
+        "tech_stack": ["python", "Spark"],
+    },
+]
+
+DOMAINS = {"boards.greenhouse.io": "greenhouse", "jobs.lever.co": "lever"}
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    path = tmp_path / CATALOG_FILE
+    assert write_catalog(JOBS, path, DOMAINS) == 3
+    return path
+
+
+def _ids(jobs):
+    return [job["id"] for job in jobs]
+
+
+class TestSearchCatalog:
+    """Tests for search_catalog."""
+
+    def test_filters_without_text_sort_by_score(self, catalog):
+        assert _ids(search_catalog(catalog)) == ["gh-1", "lv-2", "lv-3"]
+        assert _ids(search_catalog(catalog, min_score=80)) == ["gh-1", "lv-2"]
+        assert _ids(search_catalog(catalog, platform="lever")) == ["lv-2", "lv-3"]
+        assert _ids(search_catalog(catalog, company="acme")) == ["gh-1", "lv-3"]
+        assert _ids(search_catalog(catalog, tech="PYTHON")) == ["lv-2", "lv-3"]
+        assert _ids(search_catalog(catalog, location="remote")) == ["gh-1", "lv-3"]
+        assert _ids(search_catalog(catalog, since="2026-01-10", sort="date")) == ["lv-2", "gh-1"]
+
+    def test_returns_full_records(self, catalog):
+        job = search_catalog(catalog, company="Globex")[0]
+        assert {k: v for k, v in job.items() if k != "rank"} == JOBS[1]
+
+    @pytest.mark.skipif(not has_fts5(), reason="SQLite built without FTS5")
+    def test_text_search_ranks_role_matches_first(self, tmp_path):
+        # bm25 needs a corpus where the term is rare to produce useful scores
+        filler = [
+            {
+                "id": f"f-{i}",
+                "job_url": f"https://jobs.lever.co/x/{i}",
+                "company": "X",
+                "role": "Designer",
+                "match_score": 99,
+            }
+            for i in range(10)
+        ]
+        catalog = tmp_path / CATALOG_FILE
+        write_catalog([*filler, *JOBS], catalog, DOMAINS)
+
+        results = search_catalog(catalog, text="kubernetes")
+        assert _ids(results) == ["gh-1", "lv-2"]
+        assert results[0]["rank"] > results[1]["rank"]
+
+    @pytest.mark.skipif(not has_fts5(), reason="SQLite built without FTS5")
+    def test_text_search_matches_prefixes_and_combines_with_filters(self, catalog):
+        assert set(_ids(search_catalog(catalog, text="engin"))) == {"gh-1", "lv-2", "lv-3"}
+        assert _ids(search_catalog(catalog, text="engin", sort="score")) == ["gh-1", "lv-2", "lv-3"]
+        assert _ids(search_catalog(catalog, text="engineer", platform="lever", min_score=80)) == [
+            "lv-2"
+        ]
+
+    def test_query_syntax_is_taken_literally(self, catalog):
+        assert fts_query('c++ "AND" OR') == '"c++"* """AND"""* "OR"*'
+        assert search_catalog(catalog, text='"unbalanced') == []
+
+    def test_indexes_exist(self, catalog):
+        conn = sqlite3.connect(catalog)
+        names = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+        assert {
+            "idx_jobs_score",
+            "idx_jobs_found_date",
+            "idx_jobs_platform",
+            "idx_jobs_company",
+        } <= names
+        plan = " ".join(
+            str(r)
+            for r in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM jobs "
+                "WHERE platform = 'lever' ORDER BY match_score DESC"
+            )
+        )
+        assert "idx_jobs_platform" in plan
+
+    def test_rebuild_replaces_catalog(self, catalog):
+        write_catalog(JOBS[:1], catalog, DOMAINS)
+        assert _ids(search_catalog(catalog)) == ["gh-1"]
+        assert [p.name for p in catalog.parent.iterdir()] == [CATALOG_FILE]
+
+
+def test_query_command(tmp_path, capsys):
+    write_catalog(JOBS, tmp_path / "merged" / CATALOG_FILE, DOMAINS)
+
+    assert main(["query", "-o", str(tmp_path), "--tech", "python", "--json"]) == 0
+    assert _ids(json.loads(capsys.readouterr().out)) == ["lv-2", "lv-3"]
+
+    assert main(["query", "-o", str(tmp_path), "--limit", "1"]) == 0
+    out = capsys.readouterr().out
+    assert "Senior Platform Engineer" in out
+    assert "1 jobs in" in out
+
+
+def test_query_command_prints_jobs_with_null_fields(tmp_path, capsys):
+    job = {
+        "id": "x-1",
+        "job_url": "https://jobs.lever.co/x/1",
+        "company": None,
+        "role": None,
+        "match_score": None,
+    }
+    write_catalog([job], tmp_path / "merged" / CATALOG_FILE, DOMAINS)
+
+    assert main(["query", "-o", str(tmp_path)]) == 0
+    assert "https://jobs.lever.co/x/1" in capsys.readouterr().out
+
+
+def test_query_without_catalog(tmp_path, capsys):
+    assert main(["query", "-o", str(tmp_path)]) == 1
+    assert "merge" in capsys.readouterr().out
@@ -0,0 +1,138 @@
+"""
+Change Feed Tests
+=================
+
+Tests for the sequenced merged-job change log and cursor-based reads.
+"""
+
+import json
+from datetime import timedelta
+
+import pytest
+
+from src.orchestration.changes import (
+    CHANGES_FILE,
+    CHANGES_STATE_FILE,
+    CursorExpiredError,
+    read_changes,
+    update_changes,
+)
+from src.orchestration.cli import main
+
+
+def _job(n: int, score: int = 80) -> dict:
+    return {"job_url": f"https://jobs.lever.co/acme/{n}", "company": "Acme", "match_score": score}
+
+
+def _ops(records):
+    return [(r["seq"], r["op"], r["job_url"].rsplit("/", 1)[1]) for r in records]
+
+
+class TestUpdateChanges:
+    """Tests for appending merge deltas."""
+
+    def test_added_updated_removed_with_increasing_seqs(self, tmp_path):
+        first = update_changes([_job(1), _job(2)], tmp_path)
+        assert (first.added, first.last_seq) == (2, 2)
+
+        second = update_changes([_job(1, 95), _job(3)], tmp_path)
+        assert (second.added, second.updated, second.removed, second.last_seq) == (1, 1, 1, 5)
+
+        records, cursor = read_changes(tmp_path)
+        assert _ops(records) == [
+            (1, "added", "1"),
+            (2, "added", "2"),
+            (3, "updated", "1"),
+            (4, "added", "3"),
+            (5, "removed", "2"),
+        ]
+        assert records[2]["job"]["match_score"] == 95
+        assert "job" not in records[4]
+        assert cursor == 5
+
+    def test_unchanged_merge_appends_nothing(self, tmp_path):
+        update_changes([_job(1)], tmp_path)
+        before = (tmp_path / CHANGES_FILE).read_bytes()
+        assert update_changes([_job(1)], tmp_path).total == 0
+        assert (tmp_path / CHANGES_FILE).read_bytes() == before
+
+    def test_resume_from_cursor_with_limit(self, tmp_path):
+        update_changes([_job(n) for n in range(5)], tmp_path)
+        records, cursor = read_changes(tmp_path, after=0, limit=2)
+        assert [r["seq"] for r in records] == [1, 2]
+        records, cursor = read_changes(tmp_path, after=cursor)
+        assert [r["seq"] for r in records] == [3, 4, 5]
+        assert read_changes(tmp_path, after=cursor) == ([], 5)
+
+    def test_records_from_an_unfinished_merge_are_discarded(self, tmp_path):
+        update_changes([_job(1)], tmp_path)
+        with open(tmp_path / CHANGES_FILE, "a") as f:
+            f.write(json.dumps({"seq": 2, "op": "added", "job_url": "x", "at": ""}) + "\n")
+            f.write('{"seq": 3, "op": "add')  # torn line
+
+        assert [r["seq"] for r in read_changes(tmp_path)[0]] == [1]
+        summary = update_changes([_job(1), _job(2)], tmp_path)
+        assert summary.last_seq == 2
+        assert _ops(read_changes(tmp_path)[0]) == [(1, "added", "1"), (2, "added", "2")]
+
+
+class TestCompaction:
+    """Tests for bounding the log."""
+
+    def test_compaction_keeps_latest_record_per_job(self, tmp_path):
+        for score in range(80, 90):
+            summary = update_changes([_job(1, score), _job(2)], tmp_path, compact_min_records=4)
+        assert summary.compacted
+        lines = (tmp_path / CHANGES_FILE).read_text().splitlines()
+        assert len(lines) <= 4
+        records, _ = read_changes(tmp_path)
+        latest = {r["job_url"]: r for r in records}
+        assert latest[_job(1)["job_url"]]["job"]["match_score"] == 89
+
+        # A consumer partway through still ends up with the final state
+        records, _ = read_changes(tmp_path, after=3)
+        assert latest[_job(1)["job_url"]] in records
+
+    def test_expired_removals_move_the_horizon(self, tmp_path):
+        update_changes([_job(1), _job(2)], tmp_path)
+        update_changes([_job(1)], tmp_path)
+        for score in range(81, 85):
+            update_changes(
+                [_job(1, score)], tmp_path, compact_min_records=3, tombstone_retention=timedelta(0)
+            )
+
+        state = json.loads((tmp_path / CHANGES_STATE_FILE).read_text())
+        assert state["horizon"] == 3
+        with pytest.raises(CursorExpiredError):
+            read_changes(tmp_path, after=2)
+        # Starting over, or from at/after the horizon, still works
+        assert all(r["op"] != "removed" for r in read_changes(tmp_path)[0])
+        read_changes(tmp_path, after=3)
+
+    def test_deleted_log_expires_every_cursor(self, tmp_path):
+        update_changes([_job(1), _job(2)], tmp_path)
+        # `make reset` removes merged/* but keeps the dotfile state
+        (tmp_path / CHANGES_FILE).unlink()
+        update_changes([_job(3)], tmp_path)
+
+        state = json.loads((tmp_path / CHANGES_STATE_FILE).read_text())
+        assert state["horizon"] == 2
+        with pytest.raises(CursorExpiredError):
+            read_changes(tmp_path, after=1)
+        records, cursor = read_changes(tmp_path, after=2)
+        assert _ops(records)[0] == (3, "added", "3")
+        assert {op[1:] for op in _ops(records)[1:]} == {("removed", "1"), ("removed", "2")}
+        assert cursor == 5
+
+
+def test_changes_command_saves_cursor(tmp_path, capsys):
+    update_changes([_job(1), _job(2)], tmp_path / "merged")
+    cursor = tmp_path / "cursor"
+
+    assert main(["changes", "-o", str(tmp_path), "--cursor", str(cursor), "--limit", "1"]) == 0
+    assert [json.loads(line)["seq"] for line in capsys.readouterr().out.splitlines()] == [1]
+    assert cursor.read_text().strip() == "1"
+
+    assert main(["changes", "-o", str(tmp_path), "--cursor", str(cursor)]) == 0
+    assert [json.loads(line)["seq"] for line in capsys.readouterr().out.splitlines()] == [2]
+    assert cursor.read_text().strip() == "2"
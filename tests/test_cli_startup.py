@@ -0,0 +1,71 @@
+"""
+CLI Startup Benchmark
+=====================
+
+`status` runs every few seconds from scripts and tmux panes, so the
+read-only subcommands must not import the agent SDK or the runner.
+Measured with `python -X importtime`.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Cumulative import time budget for `status`, in milliseconds
+STATUS_IMPORT_BUDGET_MS = 250
+
+FORBIDDEN_MODULES = {
+    "claude_agent_sdk",
+    "src.orchestration.agent_runner",
+    "src.orchestration.coordinator",
+    "src.orchestration.company_tools",
+    "src.orchestration.seen_tools",
+}
+
+
+def _importtime(args: list[str]) -> dict[str, int]:
+    """Run python -X importtime and return module -> cumulative microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+class TestCliStartup:
+    """Import-time checks for read-only subcommands."""
+
+    @pytest.mark.parametrize("command", ["status", "stop"])
+    def test_readonly_commands_skip_sdk(self, command, tmp_path):
+        modules = _importtime(["-m", "src.orchestration", command, "-o", str(tmp_path)])
+        assert not FORBIDDEN_MODULES & set(modules)
+
+    def test_merge_handler_skips_sdk(self):
+        modules = _importtime(["-c", "from src.orchestration.cli import cmd_merge"])
+        assert not FORBIDDEN_MODULES & set(modules)
+
+    def test_status_import_budget(self, tmp_path):
+        modules = _importtime(["-m", "src.orchestration", "status", "-o", str(tmp_path)])
+        total_ms = modules["src.orchestration"] / 1000 + modules["src.orchestration.cli"] / 1000
+        print(f"\nstatus imports: {total_ms:.1f} ms (budget {STATUS_IMPORT_BUDGET_MS} ms)")
+        assert total_ms < STATUS_IMPORT_BUDGET_MS
+
+    def test_package_exports_still_resolve(self):
+        from src.orchestration import AgentState, merge_outputs
+
+        assert AgentState.__name__ == "AgentState"
+        assert callable(merge_outputs)
@@ -0,0 +1,124 @@
+"""
+Company Cache Tests
+===================
+
+Tests for the persistent company research cache and in-run leases.
+"""
+
+import asyncio
+import json
+import os
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.orchestration.company_cache import CompanyCache, normalize_company_name
+from src.orchestration.merger import merge_companies
+
+
+class TestNormalize:
+    """Tests for company name normalization."""
+
+    def test_suffixes_and_punctuation(self):
+        assert normalize_company_name("Stripe, Inc.") == "stripe"
+        assert normalize_company_name("  STRIPE ") == "stripe"
+        assert normalize_company_name("Acme Widgets Co. LLC") == "acme-widgets"
+
+
+class TestCompanyCache:
+    """Tests for TTLs and persistence."""
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "cache.json"
+        CompanyCache(path).record("Stripe Inc", {"funding": "Series I", "company_size": "5000+"})
+        assert CompanyCache(path).get("stripe") == {"funding": "Series I", "company_size": "5000+"}
+
+    def test_expired_fields_are_missing(self, tmp_path):
+        cache = CompanyCache(tmp_path / "cache.json")
+        old = (datetime.now(UTC) - timedelta(days=45)).isoformat()
+        cache.record("Ramp", {"glassdoor_rating": "4.5", "company_size": "1000"}, observed_at=old)
+        assert cache.get("Ramp") == {"company_size": "1000"}
+        assert cache.missing_fields("Ramp") == ["glassdoor_rating", "funding"]
+
+    def test_older_observation_does_not_overwrite(self, tmp_path):
+        cache = CompanyCache(tmp_path / "cache.json")
+        cache.record("Ramp", {"funding": "Series D"})
+        old = (datetime.now(UTC) - timedelta(days=1)).isoformat()
+        cache.record("Ramp", {"funding": "Series C"}, observed_at=old)
+        assert cache.get("Ramp")["funding"] == "Series D"
+
+
+class TestLeases:
+    """Tests for in-run research leases."""
+
+    @pytest.mark.asyncio
+    async def test_second_agent_waits_for_result(self, tmp_path):
+        cache = CompanyCache(tmp_path / "cache.json")
+        _, first = await cache.acquire("Linear", "agent-1")
+        assert first
+
+        async def finish():
+            await asyncio.sleep(0.01)
+            cache.release("Linear", "agent-1", {"glassdoor_rating": "4.8"})
+
+        asyncio.create_task(finish())
+        facts, second = await cache.acquire("Linear", "agent-2", wait=1)
+        assert not second
+        assert facts == {"glassdoor_rating": "4.8"}
+
+    @pytest.mark.asyncio
+    async def test_fresh_company_needs_no_research(self, tmp_path):
+        cache = CompanyCache(tmp_path / "cache.json")
+        cache.record("Vercel", {"glassdoor_rating": "4", "company_size": "500", "funding": "D"})
+        _, should_research = await cache.acquire("Vercel", "agent-1")
+        assert not should_research
+
+    @pytest.mark.asyncio
+    async def test_lapsed_leases_are_dropped(self, tmp_path):
+        cache = CompanyCache(tmp_path / "cache.json", lease_seconds=0)
+        await cache.acquire("Linear", "agent-1")
+        await cache.acquire("Vercel", "agent-1")
+        assert cache.stats()["leases"] == 1
+
+        # agent-1 never released Linear; the lapsed lease goes to agent-2
+        _, should_research = await cache.acquire("Linear", "agent-2")
+        assert should_research
+        assert cache.stats()["leases"] == 1
+
+
+class TestMergeCompanies:
+    """Tests for field-level company merging."""
+
+    def test_newest_non_empty_field_wins(self, tmp_path):
+        for agent, funding, size, age in (
+            ("agent-1", "Series B", "100", 60),
+            ("agent-2", "Series C", "", 0),
+        ):
+            path = tmp_path / agent / "companies.json"
+            path.parent.mkdir()
+            path.write_text(
+                json.dumps([{"name": "Acme", "funding": funding, "company_size": size}])
+            )
+            mtime = (datetime.now(UTC) - timedelta(seconds=age)).timestamp()
+            os.utime(path, (mtime, mtime))
+
+        assert merge_companies(tmp_path) == 1
+        merged = json.loads((tmp_path / "merged" / "companies.json").read_text())
+        assert merged == [{"name": "Acme", "funding": "Series C", "company_size": "100"}]
+        assert CompanyCache(tmp_path / "company-cache.json").get("acme")["funding"] == "Series C"
+
+
+def test_record_company_schema_requires_only_name():
+    import jsonschema
+
+    from src.orchestration.company_tools import RECORD_COMPANY_SCHEMA
+
+    jsonschema.validate({"name": "Acme"}, RECORD_COMPANY_SCHEMA)
+    jsonschema.validate(
+        {"name": "Acme", "glassdoor_rating": 4.3, "company_size": 800}, RECORD_COMPANY_SCHEMA
+    )
+    jsonschema.validate({"name": "Acme", "company_size": "200-500"}, RECORD_COMPANY_SCHEMA)
+    with pytest.raises(jsonschema.ValidationError):
+        jsonschema.validate({"glassdoor_rating": 4.3}, RECORD_COMPANY_SCHEMA)
+    with pytest.raises(jsonschema.ValidationError):
+        jsonschema.validate({"name": "Acme", "glassdoor_rating": "great"}, RECORD_COMPANY_SCHEMA)
@@ -0,0 +1,195 @@
+"""
+Status Dashboard Tests
+======================
+
+Tests for incremental refresh, rates and diff-based redraws.
+"""
+
+import io
+import json
+import os
+
+from src.orchestration.dashboard import (
+    DiffRenderer,
+    Rate,
+    StatusDashboard,
+    WatchedFile,
+    watch_status,
+)
+from src.orchestration.state import AgentState, StateManager
+from src.orchestration.types import AgentConfig, AgentStatus
+
+
+def _agents(count: int) -> list[AgentConfig]:
+    return [
+        AgentConfig(id=i + 1, name=f"P{i + 1}", platform=f"p{i + 1}", domain="x", prompt_file="")
+        for i in range(count)
+    ]
+
+
+def _write_jobs(path, count: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps([{"url": f"https://x/{i}"} for i in range(count)]))
+
+
+def _bump_mtime(path) -> None:
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+class TestWatchedFile:
+    """Tests for change detection."""
+
+    def test_rereads_only_on_change(self, tmp_path):
+        path = tmp_path / "jobs.json"
+        _write_jobs(path, 2)
+        watched = WatchedFile(path, len)
+        assert watched.refresh() and watched.value == 2
+        assert not watched.refresh()
+        assert watched.reads == 1
+
+        _write_jobs(path, 3)
+        _bump_mtime(path)
+        assert watched.refresh() and watched.value == 3
+        assert watched.reads == 2
+        watched.close()
+
+    def test_atomic_replace_reopens(self, tmp_path):
+        path = tmp_path / "state.json"
+        path.write_text('{"a": 1}')
+        watched = WatchedFile(path)
+        watched.refresh()
+        tmp = tmp_path / "state.tmp"
+        tmp.write_text('{"a": 2}')
+        os.replace(tmp, path)
+        assert watched.refresh() and watched.value == {"a": 2}
+        watched.close()
+
+    def test_partial_write_keeps_previous_value(self, tmp_path):
+        path = tmp_path / "state.json"
+        path.write_text('{"a": 1}')
+        watched = WatchedFile(path)
+        watched.refresh()
+        path.write_text('{"a": ')
+        assert not watched.refresh()
+        assert watched.value == {"a": 1}
+        watched.close()
+
+    def test_missing_file(self, tmp_path):
+        watched = WatchedFile(tmp_path / "nope.json")
+        assert not watched.refresh()
+        assert watched.value is None
+
+
+class TestRate:
+    """Tests for windowed rates."""
+
+    def test_per_second(self):
+        rate = Rate(window=60)
+        rate.add(0, 0.0)
+        rate.add(30, 30.0)
+        assert rate.per_second() == 1.0
+
+    def test_window_drops_old_samples(self):
+        rate = Rate(window=60)
+        rate.add(0, 0.0)
+        rate.add(100, 10.0)
+        rate.add(110, 100.0)
+        rate.add(120, 110.0)
+        assert rate.per_second() == 1.0
+
+    def test_counter_reset(self):
+        rate = Rate()
+        rate.add(50, 0.0)
+        rate.add(2, 10.0)
+        assert rate.per_second() is None
+
+
+class TestStatusDashboard:
+    """Tests for incremental refresh."""
+
+    def test_refreshes_only_changed_agents(self, tmp_path):
+        manager = StateManager(tmp_path)
+        for agent_id in (1, 2, 3):
+            manager.write_agent_state(
+                AgentState(agent_id=agent_id, platform=f"p{agent_id}", status=AgentStatus.RUNNING)
+            )
+
+        dashboard = StatusDashboard(tmp_path, _agents(3))
+        assert dashboard.refresh(now=0.0) == [1, 2, 3]
+        assert dashboard.refresh(now=1.0) == []
+
+        path = tmp_path / "agent-2" / "jobs.json"
+        _write_jobs(path, 5)
+        assert dashboard.refresh(now=2.0) == [2]
+        assert [w.state.reads for w in dashboard.agents] == [1, 1, 1]
+        dashboard.close()
+
+    def test_rates_and_frame(self, tmp_path):
+        manager = StateManager(tmp_path)
+        state = AgentState(agent_id=1, platform="p1", status=AgentStatus.RUNNING, iteration=1)
+        manager.write_agent_state(state)
+        jobs = tmp_path / "agent-1" / "jobs.json"
+        _write_jobs(jobs, 0)
+
+        dashboard = StatusDashboard(tmp_path, _agents(2))
+        dashboard.refresh(now=0.0)
+        _write_jobs(jobs, 10)
+        _bump_mtime(jobs)
+        state.iteration = 2
+        manager.write_agent_state(state)
+        dashboard.refresh(now=60.0)
+
+        jobs_per_min, iterations_per_hour = dashboard.agents[0].rates()
+        assert jobs_per_min == 10.0
+        assert iterations_per_hour == 60.0
+
+        frame = "\n".join(dashboard.frame())
+        assert "10.0/min" in frame and "60.0/h" in frame
+        assert "NONE" in frame
+        assert "1/2 running" in frame
+        dashboard.close()
+
+    def test_freelance_jobs_path_appears_later(self, tmp_path):
+        dashboard = StatusDashboard(tmp_path, _agents(1))
+        dashboard.refresh(now=0.0)
+        _write_jobs(tmp_path / "agent-1" / "data" / "jobs" / "jobs.json", 4)
+        assert dashboard.refresh(now=1.0) == [1]
+        assert dashboard.agents[0].job_count == 4
+        dashboard.close()
+
+
+class TestDiffRenderer:
+    """Tests for diff-based redraws."""
+
+    def test_first_frame_clears(self):
+        out = DiffRenderer().render(["a", "b"])
+        assert out.startswith("\x1b[2J") and "a\nb" in out
+
+    def test_only_changed_lines_are_written(self):
+        renderer = DiffRenderer()
+        renderer.render(["header", "agent 1: 3", "agent 2: 4", "footer"])
+        out = renderer.render(["header", "agent 1: 3", "agent 2: 5", "footer"])
+        assert "\x1b[3;1Hagent 2: 5" in out
+        assert "header" not in out and "agent 1" not in out
+
+    def test_unchanged_frame_writes_nothing(self):
+        renderer = DiffRenderer()
+        renderer.render(["a"])
+        assert renderer.render(["a"]) == ""
+
+    def test_shrinking_frame_erases_rows(self):
+        renderer = DiffRenderer()
+        renderer.render(["a", "b", "c"])
+        assert "\x1b[3;1H\x1b[K" in renderer.render(["a", "b"])
+
+    def test_plain_output_without_tty(self):
+        renderer = DiffRenderer(ansi=False)
+        assert renderer.render(["a"]) == "a\n\n"
+        assert renderer.render(["a"]) == ""
+
+
+def test_watch_status_runs_bounded(tmp_path):
+    stream = io.StringIO()
+    assert watch_status(tmp_path, interval=0, stream=stream, max_refreshes=2) == 0
+    assert "Job Search Orchestration" in stream.getvalue()
@@ -0,0 +1,157 @@
+"""
+Extraction Tests
+================
+
+Tests for the ATS page content reducer.
+"""
+
+import json
+
+import pytest
+
+from src.extraction import ContentReducer, detect_platform, estimate_tokens, extract_job_page
+
+GREENHOUSE_HTML = (
+    """
+<html><head><title>Job</title><script>var tracking = {};</script></head>
+<body>
+  <div id="header"><h1 class="app-title">Staff Platform Engineer</h1>
+    <span class="company-name">at TechCorp</span>
+    <div class="location">Remote (US)</div></div>
+  <div id="content">
+    <p>We are building the future of payments. Salary: $180,000 - $220,000 per year.</p>
+    <h3>What you'll do</h3>
+    <ul><li>Build our Kubernetes platform on AWS</li><li>Own Terraform modules</li></ul>
+    <h3>Requirements</h3>
+    <ul><li>8+ years with Python or Go</li><li>Experience with Kafka</li></ul>
+    <h3>Benefits</h3>
+    <ul><li>Unlimited PTO</li></ul>
+  </div>
+  <footer>"""
+    + ("<a href='#'>link</a>" * 400)
+    + """</footer>
+</body></html>
+"""
+)
+
+ASHBY_HTML = (
+    """
+<html><head>
+<script type="application/ld+json">"""
+    + json.dumps(
+        {
+            "@type": "JobPosting",
+            "title": "Senior SRE",
+            "hiringOrganization": {"name": "Ramp"},
+            "jobLocationType": "TELECOMMUTE",
+            "jobLocation": [{"address": {"addressLocality": "New York", "addressRegion": "NY"}}],
+            "baseSalary": {"currency": "USD", "value": {"minValue": 190000, "maxValue": 240000}},
+            "description": "<h2>Responsibilities</h2><ul><li>Run Kubernetes</li></ul>"
+            "<h2>Qualifications</h2><ul><li>Go and Prometheus</li></ul>",
+        }
+    )
+    + """</script></head><body><div id="root"></div></body></html>
+"""
+)
+
+LEVER_MARKDOWN = """# Senior Backend Engineer
+
+Location: Remote
+
+## Responsibilities
+- Design gRPC services in Java
+- Operate PostgreSQL at scale
+
+## Requirements
+- 5+ years of Java
+- Spring Boot experience
+"""
+
+
+class TestDetectPlatform:
+    """Tests for ATS platform detection."""
+
+    def test_known_domains(self):
+        assert detect_platform("https://boards.greenhouse.io/acme/jobs/1") == "greenhouse"
+        assert detect_platform("https://jobs.lever.co/acme/abc") == "lever"
+        assert detect_platform("https://jobs.ashbyhq.com/ramp/123") == "ashby"
+        assert detect_platform("https://apply.workable.com/acme/j/ABC/") == "workable"
+
+    def test_unknown_domain(self):
+        assert detect_platform("https://example.com/greenhouse.io") is None
+
+
+class TestExtractJobPage:
+    """Tests for structured extraction."""
+
+    def test_greenhouse_html(self):
+        record = extract_job_page("https://boards.greenhouse.io/techcorp/jobs/1", GREENHOUSE_HTML)
+        assert record.title == "Staff Platform Engineer"
+        assert record.location == "Remote (US)"
+        assert record.salary.startswith("$180,000")
+        assert record.responsibilities == [
+            "Build our Kubernetes platform on AWS",
+            "Own Terraform modules",
+        ]
+        assert "8+ years with Python or Go" in record.requirements
+        assert "Unlimited PTO" not in record.requirements
+        assert {"Kubernetes", "AWS", "Terraform", "Python", "Go", "Kafka"} <= set(record.stack)
+
+    def test_json_ld_posting(self):
+        record = extract_job_page("https://jobs.ashbyhq.com/ramp/123", ASHBY_HTML)
+        assert record.title == "Senior SRE"
+        assert record.company == "Ramp"
+        assert record.location.startswith("Remote")
+        assert record.salary == "190000 - 240000 USD"
+        assert record.responsibilities == ["Run Kubernetes"]
+        assert record.requirements == ["Go and Prometheus"]
+
+    def test_markdown_content(self):
+        record = extract_job_page("https://jobs.lever.co/acme/abc", LEVER_MARKDOWN)
+        assert record.title == "Senior Backend Engineer"
+        assert len(record.responsibilities) == 2
+        assert "Spring Boot experience" in record.requirements
+        assert "Spring Boot" in record.stack
+
+    def test_non_ats_url(self):
+        assert extract_job_page("https://example.com/job", GREENHOUSE_HTML) is None
+
+
+class TestContentReducer:
+    """Tests for the PostToolUse hook."""
+
+    @pytest.mark.asyncio
+    async def test_replaces_result_and_tracks_tokens(self):
+        reducer = ContentReducer()
+        response = {"code": 200, "result": GREENHOUSE_HTML, "url": "u"}
+        result = await reducer.hook(
+            {
+                "tool_name": "WebFetch",
+                "tool_input": {"url": "https://boards.greenhouse.io/techcorp/jobs/1"},
+                "tool_response": response,
+            }
+        )
+        updated = result["hookSpecificOutput"]["updatedToolOutput"]
+        assert updated["code"] == 200
+        assert updated["result"].startswith("[Extracted job posting]")
+        assert reducer.stats.pages == 1
+        assert reducer.stats.tokens_before == estimate_tokens(GREENHOUSE_HTML)
+        assert reducer.stats.tokens_after < reducer.stats.tokens_before
+
+    @pytest.mark.asyncio
+    async def test_non_ats_passes_through(self):
+        reducer = ContentReducer()
+        result = await reducer.hook(
+            {
+                "tool_name": "WebFetch",
+                "tool_input": {"url": "https://example.com"},
+                "tool_response": "hello",
+            }
+        )
+        assert result == {}
+        assert reducer.stats.pages == 0
+
+    @pytest.mark.asyncio
+    async def test_other_tools_pass_through(self):
+        result = await ContentReducer().hook({"tool_name": "Read", "tool_input": {}})
+        assert result == {}
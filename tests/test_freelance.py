@@ -0,0 +1,125 @@
+"""
+Freelance Orchestration Tests
+=============================
+
+Tests for running freelance platforms concurrently on the coordinator.
+"""
+
+import asyncio
+import json
+from functools import partial
+
+import pytest
+
+from src import agent as agent_module
+from src.orchestration import coordinator as coordinator_module
+from src.orchestration.coordinator import Coordinator
+from src.orchestration.freelance_runner import FreelanceRunner, freelance_agent_configs
+from src.orchestration.state import StateManager
+from src.orchestration.types import OrchestrationConfig
+
+
+class FakeRunner:
+    """Runner that records overlap instead of calling the SDK."""
+
+    active = 0
+    peak = 0
+
+    def __init__(self, config, output_dir, state_manager, max_iterations=None, **kwargs):
+        self.config = config
+        self.output_dir = output_dir
+        self.kwargs = kwargs
+
+    async def run(self):
+        FakeRunner.active += 1
+        FakeRunner.peak = max(FakeRunner.peak, FakeRunner.active)
+        await asyncio.sleep(0.01)
+        FakeRunner.active -= 1
+
+
+class TestFreelanceConfigs:
+    """Tests for freelance agent configs."""
+
+    def test_all_platforms(self):
+        configs = freelance_agent_configs()
+        assert [c.platform for c in configs] == ["upwork", "fiverr", "freelancer", "toptal"]
+        assert [c.id for c in configs] == [1, 2, 3, 4]
+
+
+class TestConcurrentFanOut:
+    """Tests for coordinator fan-out with a custom runner factory."""
+
+    @pytest.mark.asyncio
+    async def test_platforms_run_concurrently(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(coordinator_module, "merge_outputs", lambda output_dir, **kwargs: 0)
+        FakeRunner.peak = 0
+        coordinator = Coordinator(
+            output_dir=tmp_path,
+            config=OrchestrationConfig(agents=freelance_agent_configs()),
+            runner_factory=partial(FakeRunner, model="m"),
+        )
+        await coordinator.start_all(agent_count=4)
+        assert FakeRunner.peak == 4
+
+    @pytest.mark.asyncio
+    async def test_freelance_run_keeps_ats_stores_and_ui_data(self, tmp_path, monkeypatch):
+        built = {}
+
+        class RecordingCoordinator:
+            def __init__(self, **kwargs):
+                built.update(kwargs)
+
+            async def start_all(self, agent_count):
+                pass
+
+        monkeypatch.setattr(agent_module, "Coordinator", RecordingCoordinator)
+        await agent_module.run_concurrent_platforms(tmp_path, model="m")
+
+        assert not built["config"].seen.enabled
+        assert not built["config"].archive.enabled
+        assert built["publish_ui"] is False
+
+
+class TestFreelanceRunner:
+    """Tests for freelance progress tracking."""
+
+    def test_complete_when_all_tasks_pass(self, tmp_path):
+        config = freelance_agent_configs(["upwork"])[0]
+        runner = FreelanceRunner(config, tmp_path / "agent-1", StateManager(tmp_path))
+        runner.output_dir.mkdir()
+        assert not runner._is_complete()
+
+        tasks = [{"passes": True}, {"passes": False}]
+        (runner.output_dir / "feature_list.json").write_text(json.dumps(tasks))
+        assert not runner._is_complete()
+
+        tasks[1]["passes"] = True
+        (runner.output_dir / "feature_list.json").write_text(json.dumps(tasks))
+        assert runner._is_complete()
+
+    @pytest.mark.asyncio
+    async def test_options_report_fetch_failures(self, tmp_path, monkeypatch):
+        config = freelance_agent_configs(["upwork"])[0]
+        runner = FreelanceRunner(config, tmp_path / "agent-1", StateManager(tmp_path))
+        failures = []
+        monkeypatch.setattr(
+            runner, "_record_failure", lambda kind, detail="": failures.append(detail)
+        )
+        options = runner._create_options()
+
+        url = "https://www.upwork.com/jobs/1"
+        for matcher in options.hooks["PostToolUse"]:
+            if matcher.matcher == "WebFetch":
+                for hook in matcher.hooks:
+                    await hook(
+                        {"tool_input": {"url": url}, "tool_response": {"is_error": True}},
+                        "t1",
+                        None,
+                    )
+        assert failures == [url]
+
+    def test_jobs_counted_from_data_layout(self, tmp_path):
+        jobs_file = tmp_path / "agent-1" / "data" / "jobs" / "jobs.json"
+        jobs_file.parent.mkdir(parents=True)
+        jobs_file.write_text(json.dumps([{"job_url": "a"}, {"job_url": "b"}]))
+        assert StateManager(tmp_path).count_jobs(1) == 2
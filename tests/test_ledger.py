@@ -0,0 +1,175 @@
+"""
+Cost Ledger Tests
+=================
+
+Tests for token/cost accounting per session, agent, run and job.
+"""
+
+import json
+
+import pytest
+from claude_agent_sdk import ResultMessage
+
+from src.orchestration import agent_runner as agent_runner_module
+from src.orchestration.agent_runner import AgentRunner
+from src.orchestration.ledger import Usage, format_cost, read_ledger, record_session
+from src.orchestration.merger import build_merge_metadata, merge_outputs
+from src.orchestration.state import AgentState, StateManager
+from src.orchestration.types import AgentConfig
+
+RESULT_USAGE = {
+    "input_tokens": 1000,
+    "output_tokens": 200,
+    "cache_read_input_tokens": 5000,
+    "cache_creation_input_tokens": 300,
+}
+
+
+class TestUsage:
+    """Tests for usage parsing and arithmetic."""
+
+    def test_from_result(self):
+        usage = Usage.from_result(RESULT_USAGE, 0.25)
+        assert usage.total_tokens == 6500
+        assert usage.cache_read_tokens == 5000
+        assert usage.sessions == 1
+
+    def test_missing_usage(self):
+        assert Usage.from_result(None, None) == Usage(sessions=1)
+
+    def test_state_round_trip(self):
+        state = AgentState(agent_id=1, platform="lever")
+        Usage.from_result(RESULT_USAGE, 0.25).apply_to(state)
+        restored = AgentState.from_dict(json.loads(json.dumps(state.to_dict())))
+        assert Usage.from_state(restored).cost_usd == 0.25
+        assert restored.cache_write_tokens == 300
+
+    def test_format_cost(self):
+        assert (
+            format_cost(Usage(input_tokens=1_500_000, cost_usd=3.0), 4)
+            == "$3.00 | 1.5M tokens | $0.75/job"
+        )
+        assert format_cost(Usage(), 0).endswith("---/job")
+
+
+class TestLedger:
+    """Tests for the per-agent ledger file."""
+
+    def test_sums_sessions_across_runs(self, tmp_path):
+        record_session(tmp_path, Usage.from_result(RESULT_USAGE, 0.25), iteration=1)
+        record_session(tmp_path, Usage.from_result(RESULT_USAGE, 0.5), iteration=2)
+        total = read_ledger(tmp_path)
+        assert total.sessions == 2
+        assert total.cost_usd == 0.75
+        assert total.input_tokens == 2000
+
+    def test_missing_ledger(self, tmp_path):
+        assert read_ledger(tmp_path) == Usage()
+
+
+class TestMergeMetadata:
+    """Tests for cost per unique qualifying job."""
+
+    def test_per_platform_cost(self, tmp_path):
+        for agent_id, platform, cost in [
+            (1, "greenhouse", 2.0),
+            (2, "lever", 1.0),
+            (3, "ashby", 0.5),
+        ]:
+            agent_dir = tmp_path / f"agent-{agent_id}"
+            StateManager(tmp_path).write_agent_state(
+                AgentState(agent_id=agent_id, platform=platform)
+            )
+            record_session(agent_dir, Usage.from_result(RESULT_USAGE, cost))
+
+        metadata = build_merge_metadata(tmp_path, 10, {"agent-1": 4, "agent-2": 1}, min_score=70)
+        platforms = metadata["platforms"]
+        assert platforms["greenhouse"]["cost_per_qualifying_job"] == 0.5
+        assert platforms["lever"]["cost_per_qualifying_job"] == 1.0
+        assert platforms["ashby"]["cost_per_qualifying_job"] is None
+        assert metadata["qualifying_jobs"] == 5
+        assert metadata["cost_per_qualifying_job"] == 0.7
+
+    def test_jobs_credited_to_earliest_finder(self, tmp_path):
+        url = "https://jobs.lever.co/acme/1"
+        for agent_id, found in [(1, "2025-02-01"), (2, "2025-01-15")]:
+            agent_dir = tmp_path / f"agent-{agent_id}"
+            agent_dir.mkdir()
+            job = {"job_url": url, "match_score": 90, "found_date": found}
+            (agent_dir / "jobs.json").write_text(json.dumps([job]))
+
+        merge_outputs(tmp_path, min_score=70, ui_data_dir=tmp_path / "ui")
+        metadata = json.loads((tmp_path / "merged" / "metadata.json").read_text())
+        assert metadata["qualifying_jobs"] == 1
+        assert metadata["platforms"]["agent-2"]["qualifying_jobs"] == 1
+        assert metadata["platforms"]["agent-1"]["qualifying_jobs"] == 0
+
+
+class TestRunnerLedger:
+    """Tests for ledger wiring in the runner."""
+
+    @pytest.mark.asyncio
+    async def test_result_message_is_recorded(self, tmp_path, monkeypatch):
+        async def fake_query(prompt, options):
+            yield ResultMessage(
+                subtype="success",
+                duration_ms=1,
+                duration_api_ms=1,
+                is_error=False,
+                num_turns=3,
+                session_id="abc",
+                total_cost_usd=0.4,
+                usage=RESULT_USAGE,
+            )
+
+        monkeypatch.setattr(agent_runner_module, "run_query", fake_query)
+        config = AgentConfig(id=1, name="LEVER", platform="lever", domain="x", prompt_file="")
+        runner = AgentRunner(config, tmp_path / "agent-1", StateManager(tmp_path))
+        await runner._run_session(None, "go")
+        await runner._run_session(None, "go")
+        runner._update_state()
+
+        assert runner.state.cost_usd == pytest.approx(0.8)
+        assert runner.state.input_tokens == 2000
+        assert read_ledger(tmp_path / "agent-1").sessions == 2
+        saved = StateManager(tmp_path).read_agent_state(1)
+        assert saved.cost_usd == pytest.approx(0.8)
+
+
+class CostRunner:
+    """Runner that spends $1 and adds one job to an agent directory with earlier jobs."""
+
+    def __init__(self, config, output_dir, state_manager, max_iterations=None, **kwargs):
+        self.config = config
+        self.output_dir = output_dir
+        self.state = AgentState(agent_id=config.id, platform=config.platform, cost_usd=1.0)
+
+    async def run(self):
+        jobs_file = self.output_dir / "jobs.json"
+        jobs = json.loads(jobs_file.read_text())
+        jobs_file.write_text(json.dumps(jobs + [{"job_url": "https://x/new"}]))
+
+
+async def test_coordinator_cost_is_per_job_found_this_session(tmp_path, monkeypatch, capsys):
+    from src.orchestration import coordinator as coordinator_module
+    from src.orchestration.coordinator import Coordinator
+    from src.orchestration.types import OrchestrationConfig
+
+    monkeypatch.setattr(coordinator_module, "merge_outputs", lambda output_dir, **kwargs: 4)
+    agent_dir = tmp_path / "agent-1"
+    agent_dir.mkdir()
+    (agent_dir / "jobs.json").write_text(
+        json.dumps([{"job_url": f"https://x/{n}"} for n in range(3)])
+    )
+    config = AgentConfig(
+        id=1, name="GREENHOUSE", platform="greenhouse", domain="greenhouse.io", prompt_file=""
+    )
+
+    coordinator = Coordinator(
+        output_dir=tmp_path, config=OrchestrationConfig(agents=[config]), runner_factory=CostRunner
+    )
+    await coordinator.start_all(agent_count=1)
+
+    out = capsys.readouterr().out
+    assert "Session complete: 1 jobs found (4 merged in total)" in out
+    assert "$1.00/job" in out
@@ -0,0 +1,153 @@
+"""
+Metrics Exporter Tests
+======================
+
+Tests for the OpenMetrics exposition, scraped from a local server.
+"""
+
+import asyncio
+import re
+import time
+
+import pytest
+
+from src.orchestration.coordinator import Coordinator
+from src.orchestration.events import ITERATION_STARTED, JOB_FOUND
+from src.orchestration.metrics import Exposition, LoopLagMonitor
+from src.orchestration.state import AgentState
+from src.orchestration.telemetry import LatencyHistogram, ToolLatencies
+from src.orchestration.types import AgentConfig, AgentStatus, OrchestrationConfig
+
+SAMPLE = re.compile(r"^([a-z_]+)(\{[^}]*\})? (-?[0-9.e+-]+|\+Inf)$")
+
+
+class FakeRunner:
+    """Runner with in-memory state and latencies, no SDK."""
+
+    def __init__(self, config, output_dir, state_manager, max_iterations=None, **kwargs):
+        self.config = config
+        self.state = AgentState(
+            agent_id=config.id,
+            platform=config.platform,
+            status=AgentStatus.RUNNING,
+            iteration=2,
+            jobs_found=5,
+            cost_usd=1.5,
+        )
+        self.tool_latencies = ToolLatencies()
+        self.tool_latencies.observe("WebFetch", 800)
+        self.tool_latencies.observe("WebFetch", 4000)
+        self.tool_latencies.session_durations.observe(90_000)
+
+
+def _coordinator(tmp_path) -> Coordinator:
+    config = OrchestrationConfig(
+        agents=[
+            AgentConfig(id=1, name="GREENHOUSE", platform="greenhouse", domain="x", prompt_file=""),
+        ]
+    )
+    coordinator = Coordinator(
+        output_dir=tmp_path, config=config, runner_factory=FakeRunner, serve_port=0
+    )
+    coordinator.runners = [FakeRunner(config.agents[0], tmp_path, None)]
+    return coordinator
+
+
+def _parse(text: str) -> dict[str, float]:
+    """Parse an exposition into {'name{labels}': value}, checking its structure."""
+    lines = text.rstrip("\n").split("\n")
+    assert lines[-1] == "# EOF"
+    families = set()
+    samples = {}
+    for line in lines[:-1]:
+        if line.startswith("# TYPE "):
+            families.add(line.split()[2])
+            continue
+        if line.startswith("#"):
+            continue
+        match = SAMPLE.match(line)
+        assert match, line
+        name, labels, value = match.groups()
+        assert any(name == f or name.startswith(f + "_") for f in families), name
+        samples[name + (labels or "")] = float(value)
+    return samples
+
+
+class TestExposition:
+    """Tests for the text format."""
+
+    def test_histogram_is_cumulative_in_seconds(self):
+        histogram = LatencyHistogram((100, 1000))
+        for ms in (50, 500, 5000):
+            histogram.observe(ms)
+        out = Exposition()
+        out.family("x_seconds", "histogram", "x", unit="seconds")
+        out.histogram("x_seconds", histogram, tool="a")
+        samples = _parse(out.render())
+        assert samples['jobsearch_x_seconds_bucket{tool="a",le="0.1"}'] == 1
+        assert samples['jobsearch_x_seconds_bucket{tool="a",le="1.0"}'] == 2
+        assert samples['jobsearch_x_seconds_bucket{tool="a",le="+Inf"}'] == 3
+        assert samples['jobsearch_x_seconds_sum{tool="a"}'] == 5.55
+
+    def test_label_escaping(self):
+        out = Exposition()
+        out.family("g", "gauge", "g")
+        out.sample("g", 1, company='a"b\\c')
+        assert 'company="a\\"b\\\\c"' in out.render()
+
+
+class TestCollector:
+    """Tests for collected values."""
+
+    def test_agent_and_event_metrics(self, tmp_path):
+        coordinator = _coordinator(tmp_path)
+        coordinator.events.publish(JOB_FOUND, agent_id=1, platform="greenhouse", new=3)
+        coordinator.events.publish(ITERATION_STARTED, agent_id=1, platform="greenhouse")
+        coordinator.metrics.observe_merge(120)
+        coordinator.company_cache.get("Stripe")
+
+        samples = _parse(coordinator.metrics.render())
+        labels = 'agent="1",platform="greenhouse"'
+        assert samples[f'jobsearch_agent_status{{{labels},status="running"}}'] == 1
+        assert samples[f'jobsearch_agent_status{{{labels},status="error"}}'] == 0
+        assert samples[f"jobsearch_agent_jobs_found{{{labels}}}"] == 5
+        assert samples[f"jobsearch_agent_cost_usd_total{{{labels}}}"] == 1.5
+        assert samples[f"jobsearch_jobs_found_events_total{{{labels}}}"] == 3
+        assert samples['jobsearch_events_total{type="iteration_started"}'] == 1
+        assert (
+            samples[f'jobsearch_tool_call_duration_seconds_count{{{labels},tool="WebFetch"}}'] == 2
+        )
+        assert samples[f'jobsearch_session_duration_seconds_bucket{{{labels},le="120.0"}}'] == 1
+        assert samples["jobsearch_merge_duration_seconds_count"] == 1
+        assert samples['jobsearch_cache_misses_total{cache="company"}'] == 1
+
+    @pytest.mark.asyncio
+    async def test_loop_lag(self):
+        monitor = LoopLagMonitor(interval=0.01)
+        task = asyncio.create_task(monitor.run())
+        await asyncio.sleep(0.02)
+        time.sleep(0.05)  # block the loop
+        await asyncio.sleep(0.03)
+        task.cancel()
+        assert monitor.histogram.max_ms >= 30
+
+
+@pytest.mark.asyncio
+async def test_local_scrape(tmp_path):
+    coordinator = _coordinator(tmp_path)
+    await coordinator.server.start()
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", coordinator.server.port)
+        writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+    finally:
+        await coordinator.server.stop()
+
+    head, _, body = response.decode().partition("\r\n\r\n")
+    assert "200 OK" in head
+    assert "application/openmetrics-text" in head
+    samples = _parse(body)
+    assert 'jobsearch_agent_iteration{agent="1",platform="greenhouse"}' in samples
+    assert "jobsearch_event_loop_lag_seconds" in samples
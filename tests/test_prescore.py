@@ -0,0 +1,97 @@
+"""
+Pre-Scorer Tests
+================
+
+Tests for the local pre-scorer and the offline `rescore` command.
+"""
+
+import json
+
+from src.orchestration.archive import ARCHIVE_DIR, PostingArchive
+from src.orchestration.cli import main
+from src.orchestration.prescore import RESCORED_FILE, Profile, prescore, rescore_postings
+from src.orchestration.seen import SEEN_DIR, SeenUrls
+
+PROFILE = """
+## Candidate Profile
+
+**Location:** Austin, TX (Remote US preferred, Austin/SF/NYC hybrid OK)
+
+**Core Stack:**
+- Languages: Go, Python
+- Cloud: AWS, Kubernetes, Terraform
+
+**Target Roles:**
+1. Staff Platform Engineer
+2. Principal Infrastructure Engineer
+
+## Step 1
+"""
+
+MATCH = {
+    "title": "Staff Platform Engineer",
+    "location": "Remote (US)",
+    "text": "You will run Kubernetes on AWS with Terraform and write Go.",
+}
+MISMATCH = {
+    "title": "Junior Frontend Developer",
+    "location": "London, UK",
+    "text": "React, TypeScript and Ruby on Rails.",
+}
+
+
+def test_profile_from_markdown():
+    profile = Profile.from_markdown(PROFILE)
+    assert profile.stack == {"go", "python", "aws", "kubernetes", "terraform"}
+    assert profile.roles == [{"platform", "engineer"}, {"infrastructure", "engineer"}]
+    assert profile.levels == {"staff", "principal"}
+    assert profile.remote
+    assert {"austin", "tx", "sf", "nyc"} <= profile.locations
+
+
+def test_prescore_ranks_by_fit():
+    profile = Profile.from_markdown(PROFILE)
+    assert prescore(profile, MATCH) == 100
+    assert prescore(profile, MISMATCH) < 20
+    assert prescore(profile, {**MATCH, "location": "Austin, TX"}) == 100
+    assert prescore(profile, {**MATCH, "title": "Senior Platform Engineer"}) == 85
+
+
+def test_rescore_postings_sorts_and_keeps_previous_scores():
+    profile = Profile.from_markdown(PROFILE)
+    rows = rescore_postings(profile, [("b", MISMATCH), ("a", MATCH)], previous={"b": 80})
+    assert [(r["job_url"], r["previous_score"]) for r in rows] == [("a", None), ("b", 80)]
+
+
+def test_rescore_command(tmp_path, capsys):
+    archive = PostingArchive(tmp_path / ARCHIVE_DIR)
+    archive.add("https://jobs.lever.co/acme/1", MATCH)
+    archive.add("https://jobs.lever.co/acme/2", MISMATCH)
+    archive.close()
+    seen = SeenUrls(tmp_path / SEEN_DIR)
+    seen.record([("https://jobs.lever.co/acme/2", 75, "agent-2")])
+    seen.close()
+    profile = tmp_path / "resume.md"
+    profile.write_text(PROFILE)
+
+    assert (
+        main(["rescore", "-o", str(tmp_path), "--profile", str(profile), "--min-score", "70"]) == 0
+    )
+    out = capsys.readouterr().out
+    assert "2 postings rescored" in out
+    assert "1 at or above 70 (0 newly, 1 no longer)" in out
+
+    with open(tmp_path / ARCHIVE_DIR / RESCORED_FILE) as f:
+        report = json.load(f)
+    assert [r["score"] for r in report["postings"]] == [
+        100,
+        prescore(Profile.from_markdown(PROFILE), MISMATCH),
+    ]
+    assert report["postings"][1]["previous_score"] == 75
+
+
+def test_rescore_without_archive_or_profile(tmp_path, capsys):
+    assert main(["rescore", "-o", str(tmp_path)]) == 1
+    PostingArchive(tmp_path / ARCHIVE_DIR).close()
+    assert main(["rescore", "-o", str(tmp_path), "--profile", str(tmp_path / "missing.md")]) == 1
+    assert "No profile" in capsys.readouterr().out
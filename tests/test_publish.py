@@ -0,0 +1,133 @@
+"""
+Publishing Tests
+================
+
+Tests for atomic, compact and precompressed publishing of merged outputs.
+"""
+
+import gzip
+import json
+import os
+
+import pytest
+
+from src.orchestration import publish as publish_module
+from src.orchestration.merger import merge_outputs
+from src.orchestration.publish import (
+    atomic_write,
+    content_hash,
+    dumps_compact,
+    link_or_copy,
+    publish_json,
+)
+
+JOBS = [{"job_url": "https://jobs.lever.co/a", "company": "Zürich AG", "match_score": 90}]
+
+
+def test_content_hash_matches_for_data_and_serialized_bytes():
+    assert content_hash(JOBS) == content_hash(dumps_compact(JOBS))
+    assert content_hash(JOBS) != content_hash(JOBS + JOBS)
+    assert len(content_hash(JOBS)) == publish_module.HASH_LENGTH
+
+
+class TestPublishJson:
+    """Tests for publish_json."""
+
+    def test_compact_with_gzip_and_hashed_copy(self, tmp_path):
+        published = publish_json(JOBS, tmp_path / "jobs.json")
+
+        body = (tmp_path / "jobs.json").read_bytes()
+        assert body == json.dumps(JOBS, separators=(",", ":"), ensure_ascii=False).encode()
+        assert gzip.decompress((tmp_path / "jobs.json.gz").read_bytes()) == body
+        assert published.hashed_path == tmp_path / f"jobs.{published.etag}.json"
+        assert published.hashed_path.read_bytes() == body
+        assert (tmp_path / f"jobs.{published.etag}.json.gz").exists()
+
+        version = json.loads((tmp_path / "jobs.version.json").read_text())
+        assert version["file"] == published.hashed_path.name
+        assert version["etag"] == published.etag
+        assert "gz" in version["encodings"]
+
+    def test_etag_is_content_hash(self, tmp_path):
+        first = publish_json(JOBS, tmp_path / "a" / "jobs.json")
+        second = publish_json(JOBS, tmp_path / "b" / "jobs.json")
+        third = publish_json(JOBS + JOBS, tmp_path / "a" / "jobs.json")
+        assert first.etag == second.etag != third.etag
+
+    def test_mirror_is_hardlinked(self, tmp_path):
+        mirror = tmp_path / "ui"
+        publish_json(JOBS, tmp_path / "merged" / "jobs.json", mirrors=[mirror])
+        source = (tmp_path / "merged" / "jobs.json").stat()
+        copy = (mirror / "jobs.json").stat()
+        assert (source.st_ino, source.st_dev) == (copy.st_ino, copy.st_dev)
+        assert (mirror / "jobs.version.json").exists()
+
+    def test_old_versions_are_pruned(self, tmp_path):
+        etags = []
+        for n in range(4):
+            etags.append(publish_json(JOBS * (n + 1), tmp_path / "jobs.json").etag)
+            os.utime(tmp_path / f"jobs.{etags[-1]}.json", (n, n))
+        hashed = {p.name for p in tmp_path.glob("jobs.*.json") if p.name != "jobs.version.json"}
+        assert hashed == {f"jobs.{etags[2]}.json", f"jobs.{etags[3]}.json"}
+        assert not (tmp_path / f"jobs.{etags[0]}.json.gz").exists()
+
+    def test_republish_leaves_previous_hardlinks_intact(self, tmp_path):
+        first = publish_json(JOBS, tmp_path / "jobs.json")
+        publish_json([], tmp_path / "jobs.json")
+        assert json.loads(first.hashed_path.read_text()) == JOBS
+        assert json.loads((tmp_path / "jobs.json").read_text()) == []
+
+
+def test_atomic_write_leaves_no_partial_file(tmp_path, monkeypatch):
+    target = tmp_path / "jobs.json"
+    target.write_text("old")
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(publish_module.os, "replace", fail)
+    with pytest.raises(OSError):
+        atomic_write(target, b"new")
+    assert target.read_text() == "old"
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_copy_when_hardlink_fails(tmp_path, monkeypatch):
+    src = tmp_path / "src.json"
+    src.write_bytes(b"x" * 100_000)
+
+    def no_link(src, dst):
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr(publish_module.os, "link", no_link)
+    link_or_copy(src, tmp_path / "out" / "dst.json")
+    assert (tmp_path / "out" / "dst.json").read_bytes() == src.read_bytes()
+
+
+def test_merge_publishes_jobs(tmp_path):
+    agent_dir = tmp_path / "agent-1"
+    agent_dir.mkdir()
+    (agent_dir / "jobs.json").write_text(json.dumps(JOBS * 2))
+
+    ui_dir = tmp_path / "ui-data"
+    assert merge_outputs(tmp_path, min_score=70, ui_data_dir=ui_dir) == 1
+
+    merged = tmp_path / "merged"
+    assert json.loads((merged / "jobs.json").read_text()) == JOBS
+    assert (ui_dir / "jobs.json").read_bytes() == (merged / "jobs.json").read_bytes()
+    metadata = json.loads((merged / "metadata.json").read_text())
+    version = json.loads((ui_dir / "jobs.version.json").read_text())
+    assert metadata["jobs_etag"] == version["etag"]
+    assert json.loads((ui_dir / "pages" / "manifest.json").read_text())["total"] == 1
+    assert json.loads((ui_dir / "stats.json").read_text())["total"] == 1
+
+
+def test_merge_without_ui_publishing(tmp_path):
+    agent_dir = tmp_path / "agent-1"
+    agent_dir.mkdir()
+    (agent_dir / "jobs.json").write_text(json.dumps(JOBS))
+
+    ui_dir = tmp_path / "ui-data"
+    assert merge_outputs(tmp_path, min_score=70, ui_data_dir=ui_dir, publish_ui=False) == 1
+    assert (tmp_path / "merged" / "jobs.json").exists()
+    assert not ui_dir.exists()
@@ -0,0 +1,119 @@
+"""
+Rate Limiter Tests
+==================
+
+Tests for the shared per-host token buckets and their PreToolUse hook.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.orchestration import config as config_module
+from src.orchestration.agent_runner import AgentRunner
+from src.orchestration.ratelimit import WEB_SEARCH_HOST, HostRateLimiter, TokenBucket, tool_host
+from src.orchestration.state import StateManager
+from src.orchestration.types import AgentConfig, SearchSettings
+
+
+class FakeClock:
+    """Clock advanced by the limiter's own sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(0)
+
+
+def _fetch(url: str) -> dict:
+    return {"tool_name": "WebFetch", "tool_input": {"url": url}}
+
+
+class TestTokenBucket:
+    """Tests for bucket reservations."""
+
+    def test_reservations_queue_in_order(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=0.2, capacity=1, clock=clock)
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(5)
+        assert bucket.reserve() == pytest.approx(10)
+        clock.now = 30
+        assert bucket.reserve() == 0
+
+    def test_burst(self):
+        bucket = TokenBucket(rate=1, capacity=3, clock=FakeClock())
+        assert [bucket.reserve() for _ in range(4)] == [0, 0, 0, pytest.approx(1)]
+
+
+def test_tool_host():
+    assert (
+        tool_host("WebFetch", {"url": "https://www.Boards.Greenhouse.io/x"})
+        == "boards.greenhouse.io"
+    )
+    assert tool_host("WebSearch", {"query": "python"}) == WEB_SEARCH_HOST
+    assert tool_host("WebFetch", {"url": ""}) is None
+    assert tool_host("Read", {}) is None
+
+
+class TestHook:
+    """Tests for the shared PreToolUse hook."""
+
+    @pytest.mark.asyncio
+    async def test_agents_share_one_bucket_per_host(self):
+        clock = FakeClock()
+        limiter = HostRateLimiter(delay_between_requests=5, clock=clock, sleep=clock.sleep)
+        results = await asyncio.gather(
+            limiter.hook(_fetch("https://jobs.lever.co/a")),
+            limiter.hook(_fetch("https://jobs.lever.co/b")),
+            limiter.hook(_fetch("https://jobs.ashbyhq.com/c")),
+        )
+        assert results == [{}, {}, {}]
+
+        lever = limiter.waits["jobs.lever.co"]
+        assert lever.count == 2
+        assert lever.total_ms == pytest.approx(5000)
+        assert limiter.waits["jobs.ashbyhq.com"].total_ms == 0
+
+        report = limiter.to_dict()
+        assert report["hosts"]["jobs.lever.co"]["max_ms"] == 5000
+
+    @pytest.mark.asyncio
+    async def test_zero_delay_disables_limits(self):
+        limiter = HostRateLimiter(delay_between_requests=0)
+        for _ in range(3):
+            assert await limiter.acquire("jobs.lever.co") == 0
+        assert limiter.waits == {}
+
+
+def test_search_settings_loaded_from_orchestration_config(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"search": {"delayBetweenRequests": 2, "maxResultsPerQuery": 7}}))
+    monkeypatch.setattr(config_module, "get_search_config_path", lambda: path)
+
+    config = config_module.load_config()
+    assert config.search == SearchSettings(delay_between_requests=2, max_results_per_query=7)
+
+
+def test_runner_installs_hook_and_results_limit(tmp_path):
+    limiter = HostRateLimiter()
+    config = AgentConfig(
+        id=1, name="LEVER", platform="lever", domain="jobs.lever.co", prompt_file=""
+    )
+    runner = AgentRunner(
+        config,
+        tmp_path / "agent-1",
+        StateManager(tmp_path),
+        rate_limiter=limiter,
+        search=SearchSettings(max_results_per_query=7),
+    )
+    options = runner._create_options()
+
+    matchers = {m.matcher: m.hooks for m in options.hooks["PreToolUse"]}
+    assert matchers["WebFetch|WebSearch"] == [limiter.hook]
+    assert "at most 7 results" in options.system_prompt
@@ -0,0 +1,74 @@
+"""
+Security Benchmark
+==================
+
+Microbenchmark for per-call bash validation overhead.
+
+A session issues thousands of Bash calls; validation must stay in the
+microseconds per call so it never shows up next to tool latency.
+"""
+
+import shlex
+import time
+
+from src.security import BashPolicy
+
+CALLS = 5000
+
+COMMANDS = [
+    "ls -la",
+    "cat jobs.json | jq '.[] | .job_url' | sort | uniq",
+    "git status && git add . && git commit -m 'update jobs'",
+    "mkdir -p data/jobs; touch data/jobs/jobs.json",
+    "rm old.txt",
+    "chmod +x run.sh",
+    "curl -s https://boards.greenhouse.io/api/v1/boards/acme/jobs | head -50",
+    "sudo rm -rf /",
+]
+
+
+def _per_call_us(policy: BashPolicy, commands: list[str], calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        policy.check(commands[i % len(commands)])
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def _unique(commands: list[str]) -> list[str]:
+    return [f"{cmd} # {i}" for i in range(CALLS // len(commands)) for cmd in commands]
+
+
+class TestPolicyBenchmark:
+    """
+    Per-call validation overhead.
+
+    Bounds are relative to a baseline measured in the same run, so a slow
+    or loaded machine does not fail them.
+    """
+
+    def test_repeated_commands_hit_cache(self):
+        policy = BashPolicy()
+        cached = _per_call_us(policy, COMMANDS, CALLS)
+        fresh = _per_call_us(BashPolicy(), _unique(COMMANDS), CALLS)
+        assert policy.misses == len(COMMANDS)
+        # A cache hit is at least an order of magnitude cheaper than a parse
+        assert cached * 10 < fresh
+
+    def test_unique_commands(self):
+        policy = BashPolicy(cache_size=64)
+        unique = _unique(COMMANDS)
+        per_call = _per_call_us(policy, unique, len(unique))
+
+        start = time.perf_counter()
+        for command in unique:
+            shlex.split(command)
+        tokenize = (time.perf_counter() - start) / len(unique) * 1e6
+
+        assert len(policy._cache) == 64
+        # Within an order of magnitude of shlex tokenizing alone
+        assert per_call < 10 * tokenize
+
+    def test_cached_decision_matches_fresh(self):
+        policy = BashPolicy()
+        for cmd in COMMANDS:
+            assert policy.check(cmd) == policy.check(cmd) == BashPolicy().check(cmd)
@@ -0,0 +1,180 @@
+"""
+Seen URL Tests
+==============
+
+Tests for the mmap Bloom filter, the exact seen-URL set and the WebFetch hook.
+"""
+
+import json
+
+from claude_agent_sdk import (
+    AssistantMessage,
+    ResultMessage,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
+
+from src.orchestration import agent_runner as agent_runner_module
+from src.orchestration.agent_runner import AgentRunner
+from src.orchestration.merger import merge_outputs
+from src.orchestration.seen import BLOOM_FILE, SEEN_DIR, BloomFilter, SeenUrls, bloom_parameters
+from src.orchestration.seen_tools import create_seen_server
+from src.orchestration.state import StateManager
+from src.orchestration.types import AgentConfig, SeenPolicy
+
+POLICY = SeenPolicy(false_positive_rate=0.01, capacity=1000)
+
+
+def _url(n: int) -> str:
+    return f"https://jobs.lever.co/acme/{n}"
+
+
+class TestBloomFilter:
+    """Tests for the Bloom filter."""
+
+    def test_sizing_stays_in_low_megabytes(self):
+        bits, hashes = bloom_parameters(1_000_000, 0.001)
+        assert bits / 8 < 2_000_000
+        assert hashes == 10
+
+    def test_no_false_negatives_and_bounded_false_positives(self, tmp_path):
+        bloom = BloomFilter(tmp_path / BLOOM_FILE, 2000, 0.01)
+        for n in range(2000):
+            bloom.add(_url(n))
+        assert all(_url(n) in bloom for n in range(2000))
+        false_positives = sum(_url(n) in bloom for n in range(2000, 22000))
+        assert false_positives / 20000 < 0.02
+
+    def test_reopens_from_disk(self, tmp_path):
+        bloom = BloomFilter(tmp_path / BLOOM_FILE, 100, 0.01)
+        bloom.add(_url(1))
+        bloom.close()
+
+        reopened = BloomFilter.load(tmp_path / BLOOM_FILE, 0.01)
+        assert _url(1) in reopened
+        assert reopened.count == 1
+        assert BloomFilter.load(tmp_path / BLOOM_FILE, 0.001) is None
+
+
+class TestSeenUrls:
+    """Tests for the combined filter and exact set."""
+
+    def test_lookup_returns_score(self, tmp_path):
+        seen = SeenUrls(tmp_path, POLICY)
+        seen.record_jobs([{"job_url": _url(1), "match_score": 87}], source="agent-2")
+
+        entry = seen.lookup(_url(1) + "/?utm_source=x")
+        assert (entry.score, entry.source) == (87, "agent-2")
+        assert seen.lookup(_url(2)) is None
+        assert seen.to_dict()["hits"] == 1
+
+    def test_persists_across_runs(self, tmp_path):
+        seen = SeenUrls(tmp_path, POLICY)
+        seen.record([(_url(1), 90, "merge")])
+        seen.close()
+
+        seen = SeenUrls(tmp_path, POLICY)
+        assert seen.lookup(_url(1)).score == 90
+        assert len(seen) == 1
+
+    def test_grows_when_full(self, tmp_path):
+        seen = SeenUrls(tmp_path, SeenPolicy(false_positive_rate=0.01, capacity=10))
+        seen.record((_url(n), n, "merge") for n in range(25))
+        assert seen.bloom.capacity >= 25
+        assert all(seen.lookup(_url(n)).score == n for n in range(25))
+
+    def test_changed_false_positive_rate_rebuilds_from_exact_set(self, tmp_path):
+        seen = SeenUrls(tmp_path, POLICY)
+        seen.record([(_url(1), 90, "merge")])
+        seen.close()
+
+        seen = SeenUrls(tmp_path, SeenPolicy(false_positive_rate=0.0001, capacity=1000))
+        assert seen.bloom.hashes == bloom_parameters(1000, 0.0001)[1]
+        assert seen.lookup(_url(1)).score == 90
+
+    async def test_hook_blocks_processed_postings(self, tmp_path):
+        seen = SeenUrls(tmp_path, POLICY)
+        seen.record([(_url(1), 88, "agent-1")])
+
+        blocked = await seen.hook({"tool_name": "WebFetch", "tool_input": {"url": _url(1)}})
+        assert blocked["decision"] == "block"
+        assert "Already processed (score 88)" in blocked["reason"]
+        assert blocked["hookSpecificOutput"]["permissionDecision"] == "deny"
+
+        assert await seen.hook({"tool_name": "WebFetch", "tool_input": {"url": _url(2)}}) == {}
+        assert await seen.hook({"tool_name": "WebSearch", "tool_input": {"query": _url(1)}}) == {}
+
+
+async def test_filter_tool(tmp_path):
+    seen = SeenUrls(tmp_path, POLICY)
+    seen.record([(_url(1), 75, "merge")])
+    server = create_seen_server(seen)
+    assert server["name"] == "seen_urls"
+
+    new, processed = seen.partition([_url(1), _url(2)])
+    assert new == [_url(2)]
+    assert [(e.url, e.score) for e in processed] == [(_url(1), 75)]
+
+
+def test_runner_installs_hook_and_tool(tmp_path):
+    seen = SeenUrls(tmp_path / SEEN_DIR, POLICY)
+    config = AgentConfig(
+        id=1, name="LEVER", platform="lever", domain="jobs.lever.co", prompt_file=""
+    )
+    runner = AgentRunner(config, tmp_path / "agent-1", StateManager(tmp_path), seen=seen)
+    options = runner._create_options()
+
+    assert any(seen.hook in m.hooks for m in options.hooks["PreToolUse"] if m.matcher == "WebFetch")
+    assert "seen_urls" in options.mcp_servers
+    assert "filter_seen_urls" in options.system_prompt
+
+    (runner.output_dir / "jobs.json").write_text(
+        json.dumps([{"job_url": _url(5), "match_score": 81}])
+    )
+    runner._record_seen()
+    assert seen.lookup(_url(5)).source == "agent-1"
+
+
+def test_merge_records_seen_urls(tmp_path):
+    agent_dir = tmp_path / "agent-1"
+    agent_dir.mkdir()
+    (agent_dir / "jobs.json").write_text(json.dumps([{"job_url": _url(1), "match_score": 93}]))
+    merge_outputs(tmp_path, min_score=70, ui_data_dir=tmp_path / "ui")
+
+    seen = SeenUrls(tmp_path / SEEN_DIR)
+    assert seen.lookup(_url(1)).score == 93
+
+
+async def test_seen_denials_are_not_fetch_failures(tmp_path, monkeypatch):
+    seen = SeenUrls(tmp_path / SEEN_DIR, POLICY)
+    seen.record([(_url(1), 90, "merge")])
+
+    async def fake_query(prompt, options):
+        for n, tool_id in ((1, "t1"), (1, "t2"), (2, "t3")):
+            tool_input = {"url": _url(n)}
+            yield AssistantMessage(
+                content=[ToolUseBlock(tool_id, "WebFetch", tool_input)], model="m"
+            )
+            await seen.hook({"tool_name": "WebFetch", "tool_input": tool_input}, tool_id)
+            yield UserMessage(content=[ToolResultBlock(tool_id, "error", is_error=True)])
+        yield ResultMessage(
+            subtype="success",
+            duration_ms=1,
+            duration_api_ms=1,
+            is_error=False,
+            num_turns=1,
+            session_id="s",
+        )
+
+    monkeypatch.setattr(agent_runner_module, "run_query", fake_query)
+    config = AgentConfig(
+        id=2, name="LEVER", platform="lever", domain="jobs.lever.co", prompt_file=""
+    )
+    runner = AgentRunner(config, tmp_path / "agent-2", StateManager(tmp_path), seen=seen)
+    failures = []
+    monkeypatch.setattr(runner, "_record_failure", lambda kind, detail="": failures.append(kind))
+    await runner._run_session(None, "go")
+
+    # Only the genuine failure on the unseen URL counts
+    assert len(failures) == 1
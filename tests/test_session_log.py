@@ -0,0 +1,129 @@
+"""
+Session Log Tests
+=================
+
+Tests for the buffered session log sink: batching, rotation and tail files.
+"""
+
+import asyncio
+import gzip
+from datetime import datetime
+
+import pytest
+
+from src.orchestration import session_log
+from src.orchestration.session_log import RECENT_LOG_FILE, SESSION_LOG_FILE, SessionLogSink
+
+
+class TestBatching:
+    """Tests for queued writes."""
+
+    @pytest.mark.asyncio
+    async def test_lines_are_batched_per_flush(self, tmp_path):
+        sink = SessionLogSink(flush_interval=0.01)
+        log = tmp_path / "agent-1" / SESSION_LOG_FILE
+        for i in range(50):
+            sink.write(log, f"line {i}")
+        assert not log.exists()
+
+        await sink.flush()
+        assert log.read_text().splitlines() == [f"line {i}" for i in range(50)]
+        assert sink.lines_written == 50
+        assert sink.batches == 1
+        await sink.close()
+
+    @pytest.mark.asyncio
+    async def test_shared_sink_writes_each_agent_file(self, tmp_path):
+        sink = SessionLogSink(flush_interval=0.01)
+        for agent in (1, 2):
+            sink.write(tmp_path / f"agent-{agent}" / SESSION_LOG_FILE, f"hello from {agent}")
+        await sink.close()
+        for agent in (1, 2):
+            assert (
+                tmp_path / f"agent-{agent}" / SESSION_LOG_FILE
+            ).read_text() == f"hello from {agent}\n"
+
+    def test_writes_directly_without_event_loop(self, tmp_path):
+        sink = SessionLogSink()
+        sink.write(tmp_path / SESSION_LOG_FILE, "sync")
+        assert (tmp_path / SESSION_LOG_FILE).read_text() == "sync\n"
+
+    def test_works_across_event_loops(self, tmp_path):
+        sink = SessionLogSink(flush_interval=0)
+
+        async def write(text):
+            sink.write(tmp_path / SESSION_LOG_FILE, text)
+            await sink.flush()
+
+        asyncio.run(write("first"))
+        asyncio.run(write("second"))
+        assert (tmp_path / SESSION_LOG_FILE).read_text() == "first\nsecond\n"
+
+
+class TestRotation:
+    """Tests for size and age based rotation."""
+
+    def test_rotates_by_size_into_gzip(self, tmp_path):
+        sink = SessionLogSink(max_bytes=100)
+        log = tmp_path / SESSION_LOG_FILE
+        sink.write(log, "x" * 120)
+        sink.write(log, "after")
+
+        assert log.read_text() == "after\n"
+        archives = list(tmp_path.glob(f"{SESSION_LOG_FILE}.*.gz"))
+        assert len(archives) == 1
+        assert gzip.decompress(archives[0].read_bytes()) == b"x" * 120 + b"\n"
+        assert sink.rotations == 1
+
+    def test_rotations_in_the_same_second_keep_every_archive(self, tmp_path, monkeypatch):
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime(2026, 1, 2, 3, 4, 5)
+
+        monkeypatch.setattr(session_log, "datetime", FrozenDatetime)
+        sink = SessionLogSink(max_bytes=10)
+        log = tmp_path / SESSION_LOG_FILE
+        for n in range(4):
+            sink.write(log, f"batch {n} " + "x" * 10)
+
+        archives = sorted(tmp_path.glob(f"{SESSION_LOG_FILE}.*.gz"))
+        assert [gzip.decompress(a.read_bytes()).split()[1] for a in archives] == [b"0", b"1", b"2"]
+
+    def test_rotates_by_age_of_first_line(self, tmp_path):
+        log = tmp_path / SESSION_LOG_FILE
+        log.write_text("[2020-01-01 00:00:00] old\n")
+        sink = SessionLogSink(max_age_seconds=60)
+        sink.write(log, "new")
+        assert log.read_text() == "new\n"
+        assert sink.rotations == 1
+
+    def test_prunes_old_archives(self, tmp_path):
+        for stamp in ("20240101-000000", "20240102-000000", "20240103-000000"):
+            (tmp_path / f"{SESSION_LOG_FILE}.{stamp}.gz").write_bytes(gzip.compress(b""))
+        log = tmp_path / SESSION_LOG_FILE
+        log.write_text("y" * 200)
+        sink = SessionLogSink(max_bytes=100, keep_archives=2)
+        sink.write(log, "z")
+
+        archives = sorted(p.name for p in tmp_path.glob(f"{SESSION_LOG_FILE}.*.gz"))
+        assert len(archives) == 2
+        assert archives[0] == f"{SESSION_LOG_FILE}.20240103-000000.gz"
+
+
+class TestRecentLog:
+    """Tests for the recent activity tail."""
+
+    def test_tail_keeps_last_lines(self, tmp_path):
+        sink = SessionLogSink(tail_lines=3)
+        log = tmp_path / SESSION_LOG_FILE
+        for i in range(10):
+            sink.write(log, f"line {i}")
+        recent = tmp_path / RECENT_LOG_FILE
+        assert recent.read_text().splitlines() == ["line 7", "line 8", "line 9"]
+
+    def test_tail_includes_lines_written_by_the_agent(self, tmp_path):
+        log = tmp_path / SESSION_LOG_FILE
+        log.write_text("agent note\n")
+        SessionLogSink(tail_lines=5).write(log, "runner line")
+        assert (tmp_path / RECENT_LOG_FILE).read_text() == "agent note\nrunner line\n"
@@ -0,0 +1,81 @@
+"""
+Sharded UI Data Tests
+=====================
+
+Tests for score-ordered summary pages, detail files and the manifest.
+"""
+
+import json
+
+from src.orchestration.shards import MANIFEST_FILE, SUMMARY_FIELDS, detail_key, write_shards
+
+
+def _jobs(n: int) -> list[dict]:
+    return [
+        {
+            "id": f"job-{i}",
+            "job_url": f"https://jobs.lever.co/acme/{i}",
+            "company": "Acme",
+            "role": f"Engineer {i}",
+            "match_score": 100 - i,
+            "responsibilities": ["a long list"] * 5,
+            "why_good_fit": "long text",
+        }
+        for i in range(n)
+    ]
+
+
+def _read(path):
+    return json.loads(path.read_text())
+
+
+class TestWriteShards:
+    """Tests for write_shards."""
+
+    def test_pages_manifest_and_details(self, tmp_path):
+        jobs = _jobs(25)
+        manifest = write_shards(jobs, tmp_path / "pages", page_size=10)
+
+        assert manifest["total"] == 25
+        assert [p["count"] for p in manifest["pages"]] == [10, 10, 5]
+        assert manifest["pages"][0]["max_score"] == 100
+        assert manifest["pages"][2]["min_score"] == 76
+        assert _read(tmp_path / "pages" / MANIFEST_FILE) == manifest
+
+        first = _read(tmp_path / "pages" / "page-0001.json")
+        assert [j["id"] for j in first] == [f"job-{i}" for i in range(10)]
+        assert set(first[0]) <= {*SUMMARY_FIELDS, "detail"}
+        assert "why_good_fit" not in first[0]
+
+        detail = _read(tmp_path / "pages" / "detail" / f"{first[0]['detail']}.json")
+        assert detail == jobs[0]
+
+    def test_only_changed_files_are_rewritten(self, tmp_path, capsys):
+        jobs = _jobs(25)
+        write_shards(jobs, tmp_path / "pages", page_size=10)
+        capsys.readouterr()
+
+        write_shards(jobs, tmp_path / "pages", page_size=10)
+        assert "0 changed files" in capsys.readouterr().out
+
+        jobs[24]["why_good_fit"] = "updated"
+        write_shards(jobs, tmp_path / "pages", page_size=10)
+        assert "1 changed files" in capsys.readouterr().out
+
+    def test_removed_jobs_and_pages_are_deleted(self, tmp_path):
+        jobs = _jobs(25)
+        mirror = tmp_path / "ui"
+        write_shards(jobs, tmp_path / "pages", mirrors=[mirror], page_size=10)
+        write_shards(jobs[:5], tmp_path / "pages", mirrors=[mirror], page_size=10)
+
+        for directory in (tmp_path / "pages", mirror):
+            assert sorted(p.name for p in directory.glob("page-*.json")) == ["page-0001.json"]
+            assert not (directory / "detail" / f"{detail_key(jobs[20])}.json").exists()
+            assert (directory / "detail" / f"{detail_key(jobs[0])}.json").exists()
+        assert _read(mirror / MANIFEST_FILE)["total"] == 5
+
+    def test_index_is_not_mirrored(self, tmp_path):
+        mirror = tmp_path / "ui"
+        write_shards(_jobs(3), tmp_path / "pages", mirrors=[mirror])
+        assert (tmp_path / "pages" / ".index.json").exists()
+        assert not (mirror / ".index.json").exists()
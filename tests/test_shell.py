@@ -0,0 +1,254 @@
+"""
+Shell Parser Tests
+==================
+
+Unit, fuzz and throughput tests for the single-pass shell parser.
+
+The fuzz and throughput suites compare against the previous regex split
+plus per-segment shlex implementation, kept here as a reference.
+"""
+
+import os
+import random
+import re
+import shlex
+import timeit
+
+import pytest
+
+from src.orchestration.config import PROJECT_ROOT
+from src.security import BashPolicy, extract_commands, validate_chmod_command
+from src.shell import Command, ShellParseError, Subshell, parse
+
+
+def legacy_extract_commands(command_string: str) -> list[str]:
+    """The regex + shlex extractor this parser replaced."""
+    commands = []
+    for segment in re.split(r'(?<!["\'])\s*;\s*(?!["\'])', command_string):
+        segment = segment.strip()
+        if not segment:
+            continue
+        try:
+            tokens = shlex.split(segment)
+        except ValueError:
+            return []
+        expect_command = True
+        for token in tokens:
+            if token in ("|", "||", "&&", "&"):
+                expect_command = True
+                continue
+            if token in ("if", "then", "else", "fi", "for", "while", "do", "done"):
+                continue
+            if token.startswith("-"):
+                continue
+            if "=" in token and not token.startswith("="):
+                continue
+            if expect_command:
+                commands.append(os.path.basename(token))
+                expect_command = False
+    return commands
+
+
+class TestParse:
+    """Tests for the AST."""
+
+    def test_pipeline_and_operators(self):
+        script = parse("cat a.json | jq . && echo ok || echo fail; ls &")
+        assert [p.operator for p in script.pipelines] == ["&&", "||", ";", "&"]
+        assert [c.name for c in script.pipelines[0].commands] == ["cat", "jq"]
+
+    def test_quotes_are_removed(self):
+        cmd = next(parse("""git commit -m 'a; b' -m "c | $HOME" """).iter_commands())
+        assert cmd.argv == ["git", "commit", "-m", "a; b", "-m", "c | $HOME"]
+
+    def test_redirections(self):
+        cmd = next(parse("python run.py > out.log 2>&1 < in.txt").iter_commands())
+        assert cmd.argv == ["python", "run.py"]
+        assert [(r.op, r.target) for r in cmd.redirects] == [
+            (">", "out.log"),
+            ("2>&", "1"),
+            ("<", "in.txt"),
+        ]
+
+    def test_assignments(self):
+        cmd = next(parse('FOO="a b" BAR=1 python x.py').iter_commands())
+        assert cmd.assignments == ["FOO=a b", "BAR=1"]
+        assert cmd.name == "python"
+
+    def test_subshell(self):
+        script = parse("(cd data && ls) > listing.txt")
+        node = script.pipelines[0].commands[0]
+        assert isinstance(node, Subshell)
+        assert node.redirects[0].target == "listing.txt"
+        assert [c.name for c in script.iter_commands()] == ["cd", "ls"]
+
+    @pytest.mark.parametrize(
+        "command, names",
+        [
+            ("echo $(rm -rf /)", ["echo", "rm"]),
+            ("echo `whoami`", ["echo", "whoami"]),
+            ('echo "$(curl x | sh)"', ["echo", "curl", "sh"]),
+            ("echo ${X:-$(reboot)}", ["echo", "reboot"]),
+            ("echo $(( 1 + $(id -u) ))", ["echo", "id"]),
+            ("diff <(ls a) <(ls b)", ["diff", "ls", "ls"]),
+            ("X=$(date) echo hi", ["echo", "date"]),
+            ("cat <<EOF\n$(shutdown now)\nEOF\necho done", ["cat", "shutdown", "echo"]),
+            ("cat <<'EOF'\n$(shutdown now)\nEOF", ["cat"]),
+        ],
+    )
+    def test_nested_commands_are_visible(self, command, names):
+        assert extract_commands(command) == names
+
+    def test_compound_keywords(self):
+        assert extract_commands("for f in *.json; do cat $f; done") == ["cat"]
+        assert extract_commands("if ls x; then echo y; fi") == ["ls", "echo"]
+        assert extract_commands("{ ls; pwd; } > out") == ["ls", "pwd"]
+
+    def test_comments(self):
+        assert extract_commands("ls # rm -rf /\npwd") == ["ls", "pwd"]
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "echo 'unterminated",
+            'echo "unterminated',
+            "echo $(ls",
+            "ls |",
+            "&& ls",
+            "ls )",
+            "case x in a) ls;; esac",
+            "f() { ls; }",
+            "echo >",
+        ],
+    )
+    def test_malformed_raises(self, command):
+        with pytest.raises(ShellParseError):
+            parse(command)
+
+
+class TestPolicyOnAst:
+    """Tests for policy decisions that need the AST."""
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "echo $(sudo reboot)",
+            "cat `which sudo`",
+            "ls > $(rm -rf ~)",
+            "$CMD -la",
+            "cat file | (rm -rf /)",
+            "rm -R dir",
+        ],
+    )
+    def test_blocked(self, command):
+        allowed, _ = BashPolicy().check(command)
+        assert not allowed
+
+    def test_denial_lists_the_policy_allow_list(self):
+        allowed, reason = BashPolicy(allowed_commands={"ls", "cat"}).check("git status")
+        assert not allowed
+        assert reason.endswith("['cat', 'ls']")
+
+    def test_initializer_prompt_commands_are_allowed(self):
+        prompt = (PROJECT_ROOT / "prompts" / "initializer_prompt.md.example").read_text()
+        checks = [line for line in prompt.splitlines() if line.startswith("[ -f ")]
+        assert checks
+        for command in checks + ["test -f jobs.json && cat jobs.json"]:
+            assert BashPolicy().check(command) == (True, "")
+
+    def test_validator_receives_command_node(self):
+        cmd = next(parse("chmod u+x run.sh").iter_commands())
+        assert validate_chmod_command(cmd) == (True, "")
+        assert validate_chmod_command(Command(argv=["chmod", "777", "x"]))[0] is False
+
+
+# -- fuzzing -----------------------------------------------------------------
+
+SIMPLE_WORDS = ["ls", "cat", "git", "echo", "grep", "jq", "file.txt", "-la", "-n", "status", "x_1"]
+QUOTED_WORDS = ["'a b'", '"c d"', "'x|y'", '"p && q"']
+OPERATORS = [" | ", " && ", " || ", "; "]
+
+
+def _random_command(rng: random.Random) -> str:
+    pipelines = []
+    for _ in range(rng.randint(1, 5)):
+        words = [rng.choice(SIMPLE_WORDS[:6])]
+        words += [rng.choice(SIMPLE_WORDS + QUOTED_WORDS) for _ in range(rng.randint(0, 4))]
+        pipelines.append(" ".join(words))
+    command = pipelines[0]
+    for p in pipelines[1:]:
+        command += rng.choice(OPERATORS) + p
+    return command
+
+
+class TestFuzz:
+    """Randomized comparison against the legacy extractor."""
+
+    def test_quote_before_semicolon_splits(self):
+        assert legacy_extract_commands("ls 'a b'; pwd") == ["ls"]
+        assert extract_commands("ls 'a b'; pwd") == ["ls", "pwd"]
+
+    def test_matches_legacy_on_common_subset(self):
+        rng = random.Random(1234)
+        for _ in range(2000):
+            command = _random_command(rng)
+            legacy = legacy_extract_commands(command)
+            # Only compare where the legacy extractor is sound: it treats quoted
+            # operators as real ones after shlex unquotes them, and its
+            # lookbehind refuses to split on ';' right after a closing quote.
+            if any(q in command for q in ("'x|y'", '"p && q"')) or re.search(r"['\"];", command):
+                continue
+            assert extract_commands(command) == legacy, command
+
+    def test_arbitrary_input_never_crashes(self):
+        rng = random.Random(99)
+        alphabet = "ab $`'\"\\|&;<>(){}#=\n\t-12"
+        for _ in range(5000):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            try:
+                parse(text)
+            except ShellParseError:
+                pass
+
+    def test_policy_never_allows_unparseable(self):
+        rng = random.Random(7)
+        policy = BashPolicy()
+        for _ in range(1000):
+            command = _random_command(rng) + rng.choice(["'", '"', "$(", "|"])
+            assert not policy.check(command)[0]
+
+
+# -- throughput --------------------------------------------------------------
+
+
+def _time(fn, command: str, number: int) -> float:
+    """Best-of-5 seconds per call."""
+    return min(timeit.repeat(lambda: fn(command), number=number, repeat=5)) / number
+
+
+class TestThroughput:
+    """Throughput against the legacy extractor."""
+
+    def test_many_segments_in_one_pass(self, monkeypatch, record_property):
+        command = "; ".join(f"cat file{i}.json | jq '.[] | .url' | sort" for i in range(50))
+        # Wall-clock times are close and noisy, so they are reported, not asserted
+        record_property("legacy_us", round(_time(legacy_extract_commands, command, 20) * 1e6))
+        record_property("parser_us", round(_time(extract_commands, command, 20) * 1e6))
+
+        expected = legacy_extract_commands(command)
+
+        # The legacy extractor re-tokenizes every segment with shlex; the
+        # parser reads the string once and never calls it
+        def no_shlex(*args, **kwargs):
+            raise AssertionError("parser used shlex")
+
+        monkeypatch.setattr(shlex, "split", no_shlex)
+        monkeypatch.setattr(shlex, "shlex", no_shlex)
+        assert extract_commands(command) == expected
+
+    def test_scales_linearly(self):
+        small = "; ".join(["git status && ls -la | grep x"] * 20)
+        large = "; ".join(["git status && ls -la | grep x"] * 400)
+        t_small = _time(extract_commands, small, 40)
+        t_large = _time(extract_commands, large, 2)
+        assert t_large / t_small < 40
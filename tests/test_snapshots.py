@@ -0,0 +1,136 @@
+"""
+Snapshot Store Tests
+====================
+
+Tests for content-addressed cross-run snapshots and the diff command.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from src.orchestration import snapshots
+from src.orchestration.cli import main
+from src.orchestration.snapshots import SNAPSHOTS_DIR, SnapshotStore, canonical_url
+
+
+def _job(n: int, score: int = 80, **extra) -> dict:
+    return {
+        "job_url": f"https://jobs.lever.co/acme/{n}",
+        "company": "Acme",
+        "role": f"Engineer {n}",
+        "match_score": score,
+        **extra,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(tmp_path / SNAPSHOTS_DIR)
+
+
+def _commit(store, jobs):
+    run = store.commit(jobs)
+    assert run is not None
+    return run["id"]
+
+
+def test_canonical_url():
+    assert (
+        canonical_url("HTTPS://Jobs.Lever.co/acme/1/?utm_source=x&lever-source=li#apply")
+        == "https://jobs.lever.co/acme/1"
+    )
+    assert (
+        canonical_url("https://boards.greenhouse.io/acme?gh_jid=42&gh_src=abc")
+        == "https://boards.greenhouse.io/acme?gh_jid=42"
+    )
+
+
+class TestSnapshotStore:
+    """Tests for committing and diffing snapshots."""
+
+    def test_unchanged_records_are_stored_once(self, store):
+        first = store.commit([_job(1), _job(2)])
+        assert (first["objects_stored"], first["changed"]) == (2, 2)
+        assert store.commit([_job(1), _job(2)]) is None
+
+        second = store.commit([_job(1), _job(2, 90)])
+        assert (second["objects_stored"], second["changed"]) == (1, 1)
+        assert second["parent"] == first["id"]
+        assert len(list((store.root / "objects").rglob("*.json"))) == 3
+
+    def test_same_posting_with_tracking_params_is_one_job(self, store):
+        tracked = {**_job(1), "job_url": _job(1)["job_url"] + "?utm_source=linkedin"}
+        run = store.commit([_job(1), tracked])
+        assert run["total"] == 1
+
+    def test_diff_between_any_two_runs(self, store):
+        a = _commit(store, [_job(1), _job(2), _job(3)])
+        b = _commit(store, [_job(1, 95), _job(2), _job(4)])
+        c = _commit(store, [_job(1, 95), _job(4), _job(5), _job(3)])
+
+        diff = store.diff(a, c)
+        assert sorted(diff.new) == [canonical_url(_job(n)["job_url"]) for n in (4, 5)]
+        assert list(diff.changed) == [canonical_url(_job(1)["job_url"])]
+        assert list(diff.disappeared) == [canonical_url(_job(2)["job_url"])]
+
+        # Job 3 left in b and came back unchanged in c: no net change
+        assert canonical_url(_job(3)["job_url"]) not in {**diff.new, **diff.disappeared}
+
+        backwards = store.diff(c, a)
+        assert backwards.new.keys() == diff.disappeared.keys()
+        assert backwards.disappeared.keys() == diff.new.keys()
+
+        assert sorted(store.diff(None, b).new) == sorted(
+            canonical_url(_job(n)["job_url"]) for n in (1, 2, 4)
+        )
+
+    def test_diff_reads_only_runs_between(self, store, monkeypatch):
+        runs = [_commit(store, [_job(n)]) for n in range(5)]
+        loaded = []
+        original = store.load_run
+        monkeypatch.setattr(store, "load_run", lambda r: loaded.append(r) or original(r))
+        store.diff(runs[2], runs[4])
+        assert loaded == runs[3:]
+
+    def test_resolve(self, store):
+        runs = [_commit(store, [_job(n)]) for n in range(3)]
+        assert store.resolve("latest") == runs[-1]
+        assert store.resolve("~2") == runs[0]
+        assert store.resolve(runs[1]) == runs[1]
+        with pytest.raises(KeyError):
+            store.resolve("~3")
+        with pytest.raises(KeyError):
+            store.resolve("nope")
+
+    def test_runs_in_the_same_second_stay_in_order(self, store, monkeypatch):
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime(2026, 1, 2, 3, 4, 5, tzinfo=tz)
+
+        monkeypatch.setattr(snapshots, "datetime", FrozenDatetime)
+        runs = [_commit(store, [_job(n)]) for n in range(12)]
+
+        assert runs[:3] == ["20260102-030405", "20260102-030405-1", "20260102-030405-2"]
+        assert store.runs() == runs
+        assert store.resolve("latest") == runs[-1] == "20260102-030405-11"
+        assert store.resolve("~2") == runs[9]
+
+
+def test_diff_command(tmp_path, capsys):
+    store = SnapshotStore(tmp_path / SNAPSHOTS_DIR)
+    store.commit([_job(1), _job(2)])
+    store.commit([_job(1, 95, why_good_fit="updated"), _job(3)])
+
+    assert main(["diff", "-o", str(tmp_path), "--json"]) == 0
+    diff = json.loads(capsys.readouterr().out)
+    assert [j["role"] for j in diff["new"]] == ["Engineer 3"]
+    assert diff["changed"][0]["fields"] == ["match_score", "why_good_fit"]
+    assert [j["role"] for j in diff["disappeared"]] == ["Engineer 2"]
+
+    assert main(["diff", "-o", str(tmp_path), "--list"]) == 0
+    assert len(capsys.readouterr().out.splitlines()) == 2
+
+    assert main(["diff", "nope", "-o", str(tmp_path)]) == 1
@@ -0,0 +1,105 @@
+"""
+Merged Statistics Tests
+=======================
+
+Tests for the precomputed stats.json facet counts and aggregates.
+"""
+
+import json
+
+from src.orchestration.stats import STATS_FILE, STATS_INDEX_FILE, update_stats
+
+DOMAINS = {"jobs.lever.co": "lever", "boards.greenhouse.io": "greenhouse"}
+
+
+def _jobs() -> list[dict]:
+    return [
+        {
+            "job_url": "https://jobs.lever.co/acme/1",
+            "company": "Acme",
+            "location": "Remote - US",
+            "match_score": 92,
+            "tech_stack": ["Python", "AWS"],
+        },
+        {
+            "job_url": "https://jobs.lever.co/acme/2",
+            "company": "Acme",
+            "location": "Austin, TX",
+            "match_score": 84,
+            "tech_stack": ["Python"],
+        },
+        {
+            "job_url": "https://boards.greenhouse.io/globex/3",
+            "company": "Globex",
+            "match_score": 81,
+            "tech_stack": ["Go", "AWS"],
+        },
+    ]
+
+
+def _without_timestamps(stats: dict) -> dict:
+    return {k: v for k, v in stats.items() if k not in ("generated_at", "changed_jobs")}
+
+
+class TestUpdateStats:
+    """Tests for update_stats."""
+
+    def test_full_build(self, tmp_path):
+        stats = update_stats(_jobs(), tmp_path, DOMAINS)
+
+        assert stats["total"] == 3
+        assert stats["changed_jobs"] == 3
+        assert stats["score_bands"] == {"priority": 1, "high": 0, "good": 2, "other": 0}
+        assert stats["score_histogram"] == {"80-84": 2, "90-94": 1}
+        assert stats["tech_stack"] == {"AWS": 2, "Python": 2, "Go": 1}
+        assert stats["top_tech_stack"][0] == ["AWS", 2]
+        assert stats["locations"] == {"Austin": 1, "Remote": 1, "Unknown": 1}
+        assert stats["platforms"] == {
+            "lever": {"jobs": 2, "avg_score": 88.0},
+            "greenhouse": {"jobs": 1, "avg_score": 81.0},
+        }
+        assert stats["company_count"] == 2
+        assert stats["companies"]["Acme"] == {"jobs": 2, "avg_score": 88.0, "platforms": ["lever"]}
+        written = json.loads((tmp_path / STATS_FILE).read_text())
+        assert _without_timestamps(written) == _without_timestamps(stats)
+
+    def test_incremental_update_matches_rebuild(self, tmp_path):
+        jobs = _jobs()
+        update_stats(jobs, tmp_path / "incremental", DOMAINS)
+
+        jobs[2]["match_score"] = 95
+        jobs[2]["tech_stack"] = ["Rust"]
+        incremental = update_stats(jobs, tmp_path / "incremental", DOMAINS)
+        rebuilt = update_stats(jobs, tmp_path / "rebuilt", DOMAINS)
+
+        assert incremental["changed_jobs"] == 1
+        assert _without_timestamps(incremental) == _without_timestamps(rebuilt)
+        assert incremental["score_bands"]["priority"] == 2
+        assert "Go" not in incremental["tech_stack"]
+
+    def test_removed_jobs_are_subtracted(self, tmp_path):
+        update_stats(_jobs(), tmp_path, DOMAINS)
+        stats = update_stats(_jobs()[:2], tmp_path, DOMAINS)
+
+        assert stats["changed_jobs"] == 1
+        assert stats["total"] == 2
+        assert "greenhouse" not in stats["platforms"]
+        assert "Globex" not in stats["companies"]
+        assert stats["tech_stack"] == {"Python": 2, "AWS": 1}
+
+    def test_unchanged_merge_recounts_nothing(self, tmp_path):
+        update_stats(_jobs(), tmp_path, DOMAINS)
+        assert update_stats(_jobs(), tmp_path, DOMAINS)["changed_jobs"] == 0
+
+    def test_new_platform_domains_force_rebuild(self, tmp_path):
+        update_stats(_jobs(), tmp_path, {})
+        assert update_stats(_jobs(), tmp_path, DOMAINS)["platforms"]["lever"]["jobs"] == 2
+
+    def test_index_is_not_mirrored(self, tmp_path):
+        mirror = tmp_path / "ui"
+        update_stats(_jobs(), tmp_path / "merged", DOMAINS, mirrors=[mirror])
+        assert json.loads((mirror / STATS_FILE).read_text())["total"] == 3
+        # Written once and linked, like the published jobs files
+        assert (mirror / STATS_FILE).samefile(tmp_path / "merged" / STATS_FILE)
+        assert (tmp_path / "merged" / STATS_INDEX_FILE).exists()
+        assert not (mirror / STATS_INDEX_FILE).exists()
@@ -0,0 +1,268 @@
+"""
+Status Server Tests
+===================
+
+Tests for the event bus, the coordinator's HTTP/SSE endpoint and
+`status --json`.
+"""
+
+import asyncio
+import json
+import sqlite3
+
+import pytest
+
+from src.orchestration import coordinator as coordinator_module
+from src.orchestration.agent_runner import AgentRunner
+from src.orchestration.cli import main
+from src.orchestration.coordinator import Coordinator
+from src.orchestration.events import AGENT_COMPLETED, JOB_FOUND, MERGE_PUBLISHED, EventBus
+from src.orchestration.server import StatusServer
+from src.orchestration.state import AgentState, StateManager
+from src.orchestration.status import build_snapshot
+from src.orchestration.types import AgentConfig, AgentStatus, OrchestrationConfig
+
+
+def _config(agent_id: int = 1) -> AgentConfig:
+    return AgentConfig(
+        id=agent_id, name="GREENHOUSE", platform="greenhouse", domain="x", prompt_file=""
+    )
+
+
+async def _get(port: int, path: str, headers: str = "") -> tuple[str, bytes]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n{headers}\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return head.decode(), body
+
+
+async def _read_events(reader: asyncio.StreamReader, count: int) -> list[dict]:
+    events = []
+    while len(events) < count:
+        line = (await asyncio.wait_for(reader.readline(), timeout=2)).decode()
+        if line.startswith("data: "):
+            events.append(json.loads(line[6:]))
+    return events
+
+
+class TestEventBus:
+    """Tests for publish/subscribe."""
+
+    @pytest.mark.asyncio
+    async def test_fan_out(self):
+        bus = EventBus()
+        a, b = bus.subscribe(), bus.subscribe()
+        bus.publish(JOB_FOUND, agent_id=1)
+        assert (await a.get()).data == {"agent_id": 1}
+        assert (await b.get()).seq == 1
+
+    @pytest.mark.asyncio
+    async def test_resume_after_seq(self):
+        bus = EventBus()
+        for i in range(5):
+            bus.publish(JOB_FOUND, n=i)
+        queue = bus.subscribe(after=3)
+        assert [queue.get_nowait().seq for _ in range(queue.qsize())] == [4, 5]
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_drops_oldest(self):
+        bus = EventBus(queue_size=2)
+        queue = bus.subscribe()
+        for i in range(3):
+            bus.publish(JOB_FOUND, n=i)
+        assert bus.dropped == 1
+        assert queue.get_nowait().data == {"n": 1}
+
+
+class TestStatusServer:
+    """Tests for the HTTP endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_status_and_agent(self):
+        state = AgentState(agent_id=1, platform="greenhouse", jobs_found=3)
+        server = StatusServer(lambda: build_snapshot(None, [state, None], 3), EventBus())
+        await server.start()
+        try:
+            head, body = await _get(server.port, "/status")
+            assert "200 OK" in head and "application/json" in head
+            assert json.loads(body)["total_jobs"] == 3
+
+            _, body = await _get(server.port, "/agents/1")
+            assert json.loads(body)["jobs_found"] == 3
+
+            head, _ = await _get(server.port, "/agents/9")
+            assert "404" in head
+            head, _ = await _get(server.port, "/nope")
+            assert "404" in head
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_cross_origin_reads_are_opt_in(self):
+        server = StatusServer(lambda: {}, EventBus())
+        await server.start()
+        try:
+            head, _ = await _get(server.port, "/status")
+            assert "Access-Control-Allow-Origin" not in head
+        finally:
+            await server.stop()
+
+        server = StatusServer(lambda: {}, EventBus(), allow_origin="http://localhost:3000")
+        await server.start()
+        try:
+            head, _ = await _get(server.port, "/status")
+            assert "Access-Control-Allow-Origin: http://localhost:3000" in head
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_sse_stream_and_resume(self):
+        bus = EventBus()
+        server = StatusServer(lambda: {}, bus)
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(b"GET /events HTTP/1.1\r\n\r\n")
+            await writer.drain()
+            assert b"text/event-stream" in await reader.readuntil(b"\r\n\r\n")
+            while bus.subscriber_count == 0:
+                await asyncio.sleep(0.01)
+
+            bus.publish(JOB_FOUND, agent_id=1, jobs_found=1)
+            bus.publish(AGENT_COMPLETED, agent_id=1)
+            events = await _read_events(reader, 2)
+            assert [e["type"] for e in events] == [JOB_FOUND, AGENT_COMPLETED]
+            writer.close()
+
+            # Reconnect with Last-Event-ID to receive only what was missed
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(b"GET /events HTTP/1.1\r\nLast-Event-ID: 1\r\n\r\n")
+            await writer.drain()
+            assert (await _read_events(reader, 1))[0]["seq"] == 2
+            writer.close()
+        finally:
+            await server.stop()
+
+
+class FakeRunner:
+    """Runner that publishes events like AgentRunner without calling the SDK."""
+
+    def __init__(
+        self, config, output_dir, state_manager, max_iterations=None, events=None, **kwargs
+    ):
+        self.config = config
+        self.events = events
+        self.state = AgentState(agent_id=config.id, platform=config.platform)
+
+    async def run(self):
+        await asyncio.sleep(0.05)
+        self.state.jobs_found = 2
+        self.events.publish(JOB_FOUND, agent_id=self.config.id, jobs_found=2)
+
+
+class TestCoordinatorServer:
+    """End-to-end: events published during a run reach SSE subscribers."""
+
+    @pytest.mark.asyncio
+    async def test_run_streams_events(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(coordinator_module, "merge_outputs", lambda output_dir, **kwargs: 2)
+        coordinator = Coordinator(
+            output_dir=tmp_path,
+            config=OrchestrationConfig(agents=[_config()]),
+            runner_factory=FakeRunner,
+            serve_port=0,
+        )
+
+        async def subscribe():
+            while coordinator.server._server is None:
+                await asyncio.sleep(0.005)
+            reader, writer = await asyncio.open_connection("127.0.0.1", coordinator.server.port)
+            writer.write(b"GET /events HTTP/1.1\r\n\r\n")
+            await writer.drain()
+            events = await _read_events(reader, 2)
+            writer.close()
+            return events
+
+        events, _ = await asyncio.gather(subscribe(), coordinator.start_all(agent_count=1))
+        assert [e["type"] for e in events] == [JOB_FOUND, MERGE_PUBLISHED]
+        assert events[1]["jobs"] == 2
+        assert coordinator.snapshot()["total_jobs"] == 2
+
+    @pytest.mark.asyncio
+    async def test_server_stops_when_merge_fails(self, tmp_path, monkeypatch):
+        def failing_merge(output_dir, **kwargs):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(coordinator_module, "merge_outputs", failing_merge)
+        coordinator = Coordinator(
+            output_dir=tmp_path,
+            config=OrchestrationConfig(agents=[_config()]),
+            runner_factory=FakeRunner,
+            serve_port=0,
+        )
+        with pytest.raises(RuntimeError):
+            await coordinator.start_all(agent_count=1)
+
+        assert coordinator.server._server is None or not coordinator.server._server.is_serving()
+        with pytest.raises(OSError):
+            await asyncio.open_connection("127.0.0.1", coordinator.server.port)
+
+        # The archive and seen-URL stores are closed with it
+        with pytest.raises(sqlite3.ProgrammingError):
+            coordinator.archive._db.execute("SELECT 1")
+        with pytest.raises(sqlite3.ProgrammingError):
+            coordinator.seen._db.execute("SELECT 1")
+
+
+class TestRunnerEvents:
+    """Tests for events published by AgentRunner state updates."""
+
+    def test_job_found_and_completed(self, tmp_path):
+        bus = EventBus()
+        manager = StateManager(tmp_path)
+        runner = AgentRunner(_config(), tmp_path / "agent-1", manager, events=bus)
+        runner._update_state(status=AgentStatus.RUNNING)
+
+        jobs = tmp_path / "agent-1" / "jobs.json"
+        jobs.write_text(json.dumps([{"url": "a"}, {"url": "b"}]))
+        runner._update_state()
+        runner._update_state(status=AgentStatus.COMPLETED)
+
+        events = [(e.type, e.data) for e in bus.recent()]
+        assert events[0] == (
+            JOB_FOUND,
+            {"agent_id": 1, "platform": "greenhouse", "jobs_found": 2, "new": 2},
+        )
+        assert events[1][0] == AGENT_COMPLETED and events[1][1]["status"] == "completed"
+
+    def test_existing_jobs_are_not_announced(self, tmp_path):
+        (tmp_path / "agent-1").mkdir()
+        (tmp_path / "agent-1" / "jobs.json").write_text(json.dumps([{"url": "a"}]))
+        bus = EventBus()
+        runner = AgentRunner(_config(), tmp_path / "agent-1", StateManager(tmp_path), events=bus)
+        runner._update_state(status=AgentStatus.RUNNING)
+        assert bus.recent() == []
+
+    @pytest.mark.asyncio
+    async def test_jobs_write_hook_refreshes_count(self, tmp_path):
+        bus = EventBus()
+        runner = AgentRunner(_config(), tmp_path / "agent-1", StateManager(tmp_path), events=bus)
+        runner._update_state()
+        (tmp_path / "agent-1" / "jobs.json").write_text(json.dumps([{"url": "a"}]))
+        hook = runner._progress_hook().hooks[0]
+        await hook(
+            {"tool_input": {"file_path": str(tmp_path / "agent-1" / "jobs.json")}}, None, None
+        )
+        assert runner.state.jobs_found == 1
+        assert bus.recent()[0].type == JOB_FOUND
+
+
+def test_status_json(tmp_path, capsys):
+    StateManager(tmp_path).write_agent_state(AgentState(agent_id=1, platform="greenhouse"))
+    assert main(["status", "--json", "-o", str(tmp_path)]) == 0
+    snapshot = json.loads(capsys.readouterr().out)
+    assert set(snapshot) == {"orchestration", "agents", "total_jobs"}
+    assert snapshot["agents"][0]["platform"] == "greenhouse"
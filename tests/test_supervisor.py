@@ -0,0 +1,191 @@
+"""
+Supervisor Tests
+================
+
+Tests for agent restart policies and crash isolation.
+"""
+
+import asyncio
+
+import pytest
+
+from src.orchestration.coordinator import Coordinator
+from src.orchestration.events import AGENT_DISABLED, AGENT_RESTARTED, EventBus
+from src.orchestration.state import AgentState, StateManager
+from src.orchestration.supervisor import Supervisor
+from src.orchestration.types import (
+    AgentConfig,
+    AgentStatus,
+    OrchestrationConfig,
+    RestartPolicy,
+)
+
+
+class CrashingRunner:
+    """Runner that raises for its first `crashes` runs, then completes."""
+
+    def __init__(self, config, crashes=0, delay=0.0):
+        self.config = config
+        self.crashes = crashes
+        self.delay = delay
+        self.runs = 0
+        self.state = AgentState(agent_id=config.id, platform=config.platform)
+
+    async def run(self):
+        self.runs += 1
+        await asyncio.sleep(self.delay)
+        if self.runs <= self.crashes:
+            raise RuntimeError(f"boom {self.runs}")
+        self.state.status = AgentStatus.COMPLETED
+
+
+def _agent(agent_id: int, **restart) -> AgentConfig:
+    return AgentConfig(
+        id=agent_id,
+        name=f"A{agent_id}",
+        platform=f"p{agent_id}",
+        domain="x",
+        prompt_file="",
+        restart=RestartPolicy(**restart) if restart else None,
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _supervisor(tmp_path, clock: FakeClock, policy: RestartPolicy, events=None) -> Supervisor:
+    return Supervisor(
+        StateManager(tmp_path),
+        lambda config: config.restart or policy,
+        events=events,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+
+class TestRestartPolicy:
+    """Tests for restarts, backoff and escalation."""
+
+    @pytest.mark.asyncio
+    async def test_restarts_with_exponential_backoff(self, tmp_path):
+        clock = FakeClock()
+        bus = EventBus()
+        runner = CrashingRunner(_agent(1), crashes=2)
+        policy = RestartPolicy(max_restarts=3, window_seconds=900, backoff_seconds=10)
+        await _supervisor(tmp_path, clock, policy, bus).supervise(runner)
+
+        assert runner.runs == 3
+        assert runner.state.status == AgentStatus.COMPLETED
+        assert clock.sleeps == [10, 20]
+        saved = StateManager(tmp_path).read_agent_state(1)
+        assert saved.restarts == 2
+        assert [h["error"] for h in saved.restart_history] == [
+            "RuntimeError: boom 1",
+            "RuntimeError: boom 2",
+        ]
+        assert [e.type for e in bus.recent()] == [AGENT_RESTARTED, AGENT_RESTARTED]
+
+    @pytest.mark.asyncio
+    async def test_disables_after_too_many_crashes(self, tmp_path):
+        clock = FakeClock()
+        bus = EventBus()
+        runner = CrashingRunner(_agent(1), crashes=100)
+        policy = RestartPolicy(max_restarts=2, window_seconds=900, backoff_seconds=1)
+        await _supervisor(tmp_path, clock, policy, bus).supervise(runner)
+
+        assert runner.runs == 3
+        saved = StateManager(tmp_path).read_agent_state(1)
+        assert saved.status == AgentStatus.DISABLED
+        assert saved.error.startswith("disabled after 3 crashes")
+        assert bus.recent()[-1].type == AGENT_DISABLED
+
+    @pytest.mark.asyncio
+    async def test_crashes_outside_window_are_forgotten(self, tmp_path):
+        clock = FakeClock()
+        runner = CrashingRunner(_agent(1), crashes=4)
+        policy = RestartPolicy(max_restarts=1, window_seconds=50, backoff_seconds=60)
+        await _supervisor(tmp_path, clock, policy).supervise(runner)
+
+        assert runner.runs == 5
+        assert runner.state.status == AgentStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_backoff_is_capped(self, tmp_path):
+        clock = FakeClock()
+        runner = CrashingRunner(_agent(1), crashes=4)
+        policy = RestartPolicy(max_restarts=10, backoff_seconds=10, max_backoff_seconds=25)
+        await _supervisor(tmp_path, clock, policy).supervise(runner)
+        assert clock.sleeps == [10, 20, 25, 25]
+
+    @pytest.mark.asyncio
+    async def test_no_restart_after_stop_signal(self, tmp_path):
+        clock = FakeClock()
+        StateManager(tmp_path).set_stop_signal()
+        runner = CrashingRunner(_agent(1), crashes=5)
+        await _supervisor(tmp_path, clock, RestartPolicy()).supervise(runner)
+        assert runner.runs == 1
+
+
+@pytest.mark.asyncio
+async def test_crash_does_not_stop_siblings(tmp_path):
+    clock = FakeClock()
+    crashing = CrashingRunner(_agent(1, max_restarts=0), crashes=100)
+    healthy = CrashingRunner(_agent(2), delay=0.05)
+    await _supervisor(tmp_path, clock, RestartPolicy()).run_all([crashing, healthy])
+
+    assert crashing.state.status == AgentStatus.DISABLED
+    assert healthy.state.status == AgentStatus.COMPLETED
+
+
+def test_agent_restart_overrides_defaults():
+    config = OrchestrationConfig.from_dict(
+        {
+            "agents": [
+                {
+                    "id": 1,
+                    "name": "A",
+                    "platform": "a",
+                    "domain": "x",
+                    "prompt_file": "",
+                    "restart": {"max_restarts": 7},
+                },
+                {"id": 2, "name": "B", "platform": "b", "domain": "x", "prompt_file": ""},
+            ],
+            "restart": {"max_restarts": 2, "backoff_seconds": 1},
+        }
+    )
+    assert config.restart_policy(config.agents[0]) == RestartPolicy(
+        max_restarts=7, backoff_seconds=1
+    )
+    assert config.restart_policy(config.agents[1]) == RestartPolicy(
+        max_restarts=2, backoff_seconds=1
+    )
+
+
+@pytest.mark.asyncio
+async def test_coordinator_survives_crashing_agent(tmp_path, monkeypatch):
+    from src.orchestration import coordinator as coordinator_module
+
+    monkeypatch.setattr(coordinator_module, "merge_outputs", lambda output_dir, **kwargs: 0)
+
+    def factory(config, **kwargs):
+        return CrashingRunner(config, crashes=100 if config.id == 1 else 0)
+
+    config = OrchestrationConfig(
+        agents=[_agent(1, max_restarts=0), _agent(2)],
+    )
+    coordinator = Coordinator(output_dir=tmp_path, config=config, runner_factory=factory)
+    await asyncio.wait_for(coordinator.start_all(), timeout=5)
+
+    statuses = [r.state.status for r in coordinator.runners]
+    assert statuses == [AgentStatus.DISABLED, AgentStatus.COMPLETED]
@@ -0,0 +1,166 @@
+"""
+Session Telemetry Tests
+=======================
+
+Tests for session event logs and tool latency histograms.
+"""
+
+import json
+
+import pytest
+from claude_agent_sdk import (
+    AssistantMessage,
+    ResultMessage,
+    TextBlock,
+    ToolResultBlock,
+    ToolUseBlock,
+    UserMessage,
+)
+
+from src.orchestration import agent_runner as agent_runner_module
+from src.orchestration.agent_runner import AgentRunner
+from src.orchestration.state import StateManager
+from src.orchestration.telemetry import (
+    LatencyHistogram,
+    SessionRecorder,
+    ToolLatencies,
+    format_latency_report,
+)
+from src.orchestration.types import AgentConfig
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _events(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestLatencyHistogram:
+    """Tests for bucketing and quantiles."""
+
+    def test_quantiles(self):
+        histogram = LatencyHistogram()
+        for ms in [50] * 90 + [7000] * 10:
+            histogram.observe(ms)
+        assert histogram.quantile(0.5) == 100
+        assert histogram.quantile(0.95) == 10_000
+        assert histogram.to_dict()["buckets"]["100"] == 90
+
+    def test_overflow_uses_max(self):
+        histogram = LatencyHistogram()
+        histogram.observe(500_000)
+        assert histogram.quantile(0.99) == 500_000
+
+    def test_merge(self):
+        a, b = ToolLatencies(), ToolLatencies()
+        a.observe("WebFetch", 1000)
+        b.observe("WebFetch", 3000)
+        b.observe("Edit", 10)
+        a.merge(b)
+        assert a.tools["WebFetch"].count == 2
+        assert a.tools["WebFetch"].total_ms == 4000
+        assert set(a.tools) == {"WebFetch", "Edit"}
+
+
+class TestSessionRecorder:
+    """Tests for the JSONL event log."""
+
+    def test_matches_tool_results(self, tmp_path):
+        clock = FakeClock()
+        latencies = ToolLatencies()
+        recorder = SessionRecorder(tmp_path / "s.jsonl", latencies, clock=clock, agent_id=1)
+        recorder.start()
+        recorder.turn()
+        recorder.tool_use("t1", "WebFetch", {"url": "https://x", "prompt": "long"})
+        recorder.tool_use("t2", "Edit", {"file_path": "jobs.json"})
+        clock.now = 0.2
+        recorder.tool_result("t2")
+        clock.now = 3.0
+        recorder.tool_result("t1", is_error=True)
+        recorder.turn()
+        clock.now = 10.0
+        recorder.end(num_turns=2)
+
+        events = _events(tmp_path / "s.jsonl")
+        assert [e["event"] for e in events] == [
+            "session_start",
+            "tool_use",
+            "tool_use",
+            "tool_result",
+            "tool_result",
+            "session_end",
+        ]
+        assert events[0]["agent_id"] == 1
+        assert events[1]["input"] == {"url": "https://x"}
+        assert events[4] == {
+            **events[4],
+            "tool": "WebFetch",
+            "duration_ms": 3000.0,
+            "is_error": True,
+        }
+        assert (
+            events[5]["turns"] == 2 and events[5]["tool_calls"] == 2 and events[5]["num_turns"] == 2
+        )
+
+        data = latencies.to_dict()
+        assert list(data["tools"]) == ["WebFetch", "Edit"]
+        assert data["tools"]["WebFetch"]["share_of_session"] == 0.3
+
+    def test_unmatched_calls_logged_at_end(self, tmp_path):
+        recorder = SessionRecorder(tmp_path / "s.jsonl", ToolLatencies(), clock=FakeClock())
+        recorder.start()
+        recorder.tool_use("t1", "WebSearch")
+        recorder.tool_result("unknown")
+        recorder.end(error="boom")
+        events = _events(tmp_path / "s.jsonl")
+        assert events[-2] == {**events[-2], "event": "tool_unmatched", "id": "t1"}
+        assert events[-1]["error"] == "boom"
+
+
+class TestRunnerSession:
+    """Tests for _run_session wiring."""
+
+    @pytest.mark.asyncio
+    async def test_session_is_recorded(self, tmp_path, monkeypatch):
+        async def fake_query(prompt, options):
+            yield AssistantMessage(
+                content=[TextBlock("hi"), ToolUseBlock("t1", "WebSearch", {"query": "jobs"})],
+                model="m",
+            )
+            yield UserMessage(content=[ToolResultBlock("t1", "results")])
+            yield ResultMessage(
+                subtype="success",
+                duration_ms=1200,
+                duration_api_ms=900,
+                is_error=False,
+                num_turns=1,
+                session_id="s",
+            )
+
+        monkeypatch.setattr(agent_runner_module, "run_query", fake_query)
+        config = AgentConfig(
+            id=1, name="GREENHOUSE", platform="greenhouse", domain="x", prompt_file=""
+        )
+        runner = AgentRunner(config, tmp_path / "agent-1", StateManager(tmp_path))
+        runner.state.iteration = 3
+        await runner._run_session(None, "go")
+
+        [log] = list((tmp_path / "agent-1" / "sessions").glob("*-iter003.jsonl"))
+        events = _events(log)
+        assert [e["event"] for e in events] == [
+            "session_start",
+            "tool_use",
+            "tool_result",
+            "session_end",
+        ]
+        assert events[-1]["num_turns"] == 1 and events[-1]["turns"] == 1
+        assert runner.tool_latencies.tools["WebSearch"].count == 1
+
+        lines = format_latency_report({"agent-1": runner.tool_latencies})
+        assert "WebSearch" in lines[1]
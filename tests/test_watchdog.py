@@ -0,0 +1,114 @@
+"""
+Session Watchdog Tests
+======================
+
+Tests for session deadlines, inactivity timeouts and stream cleanup.
+"""
+
+import asyncio
+
+import pytest
+
+from src import client as client_module
+from src.orchestration import agent_runner as agent_runner_module
+from src.orchestration.agent_runner import AgentRunner
+from src.orchestration.events import SESSION_STALLED, EventBus
+from src.orchestration.state import StateManager
+from src.orchestration.types import AgentConfig, AgentStatus, SessionLimits
+from src.orchestration.watchdog import SessionStalledError, watch_stream
+
+
+class Stream:
+    """Async generator factory that records whether it was closed."""
+
+    def __init__(self, delays: list[float]):
+        self.delays = delays
+        self.closed = False
+
+    async def __call__(self, *args, **kwargs):
+        try:
+            for i, delay in enumerate(self.delays):
+                await asyncio.sleep(delay)
+                yield i
+        finally:
+            self.closed = True
+
+
+async def _drain(stream, limits: SessionLimits) -> list:
+    return [m async for m in watch_stream(stream, limits)]
+
+
+class TestWatchStream:
+    """Tests for the stream watchdog."""
+
+    @pytest.mark.asyncio
+    async def test_completes_within_limits(self):
+        source = Stream([0, 0, 0])
+        assert await _drain(source(), SessionLimits(1, 1)) == [0, 1, 2]
+        assert source.closed
+
+    @pytest.mark.asyncio
+    async def test_idle_timeout(self):
+        source = Stream([0, 10])
+        with pytest.raises(SessionStalledError) as info:
+            await _drain(source(), SessionLimits(max_session_seconds=5, idle_timeout_seconds=0.05))
+        assert info.value.reason == "idle"
+        assert source.closed
+
+    @pytest.mark.asyncio
+    async def test_deadline_with_steady_messages(self):
+        source = Stream([0.02] * 1000)
+        with pytest.raises(SessionStalledError) as info:
+            await _drain(source(), SessionLimits(max_session_seconds=0.1, idle_timeout_seconds=1))
+        assert info.value.reason == "deadline"
+        assert source.closed
+
+    @pytest.mark.asyncio
+    async def test_limits_can_be_disabled(self):
+        source = Stream([0.01, 0.01])
+        assert await _drain(source(), SessionLimits(None, None)) == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_run_query_closes_sdk_stream_on_cancel(monkeypatch):
+    source = Stream([0, 10])
+    monkeypatch.setattr(client_module, "query", source)
+    with pytest.raises(SessionStalledError):
+        async for _ in watch_stream(client_module.run_query("p", None), SessionLimits(5, 0.05)):
+            pass
+    assert source.closed
+
+
+class TestRunnerStall:
+    """Tests for stall handling in the agent loop."""
+
+    @pytest.mark.asyncio
+    async def test_stall_is_recorded_and_agent_moves_on(self, tmp_path, monkeypatch):
+        agent_dir = tmp_path / "agent-1"
+
+        async def hung_query(prompt, options):
+            (agent_dir / "complete.flag").write_text("done")
+            await asyncio.sleep(60)
+            yield None
+
+        monkeypatch.setattr(agent_runner_module, "run_query", hung_query)
+        monkeypatch.setattr(AgentRunner, "_create_options", lambda self: None)
+        monkeypatch.setattr(AgentRunner, "_get_initial_prompt", lambda self: "go")
+
+        bus = EventBus()
+        config = AgentConfig(id=1, name="LEVER", platform="lever", domain="x", prompt_file="")
+        runner = AgentRunner(
+            config,
+            agent_dir,
+            StateManager(tmp_path),
+            max_iterations=3,
+            events=bus,
+            session_limits=SessionLimits(max_session_seconds=5, idle_timeout_seconds=0.05),
+        )
+        await asyncio.wait_for(runner.run(), timeout=5)
+
+        saved = StateManager(tmp_path).read_agent_state(1)
+        assert saved.status == AgentStatus.COMPLETED
+        assert saved.stalls == 1
+        assert saved.last_stall.startswith("iteration 1: session stalled")
+        assert [e.type for e in bus.recent() if e.type == SESSION_STALLED] == [SESSION_STALLED]
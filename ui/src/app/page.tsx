@@ -18,7 +18,7 @@ import {
   SheetDescription,
 } from "@/components/ui/sheet";
 import { searchJobs, filterByScore, sortJobs } from "@/lib/jobs";
-import { useJobs, useApplicationStatus } from "@/hooks/use-jobs";
+import { useJobs, useJobDetail, useApplicationStatus } from "@/hooks/use-jobs";
 import { useHiddenJobs } from "@/hooks/use-hidden-jobs";
 import { Job, calculateStats, type ApplicationStatus } from "@/types/job";
 import { List, BarChart3, Loader2, Search } from "lucide-react";
@@ -37,10 +37,11 @@ import {
 } from "@/lib/animations";
 
 export default function Home() {
-  const { jobs: allJobs, loading, error, refetch } = useJobs();
+  const { jobs: allJobs, total, manifest, stats: mergedStats, loading, loadingMore, error, refetch } = useJobs();
   const { hideJob, showJob, clearAllHidden, isHidden, hiddenCount, isLoaded: hiddenLoaded } = useHiddenJobs();
   const { updateStatus, updating } = useApplicationStatus();
   const [selectedJob, setSelectedJob] = useState<Job | null>(null);
+  const selectedDetail = useJobDetail(selectedJob, manifest);
   const [searchQuery, setSearchQuery] = useState("");
   const [sortBy, setSortBy] = useState<"score" | "date" | "company" | "salary">("score");
   const [scoreFilter, setScoreFilter] = useState(0);
@@ -50,7 +51,8 @@ export default function Home() {
   const [currentPage, setCurrentPage] = useState(1);
   const [pageSize, setPageSize] = useState(20);
 
-  const stats = useMemo(() => calculateStats(allJobs), [allJobs]);
+  // Precomputed by the merger in static mode; the API path counts locally
+  const stats = useMemo(() => mergedStats ?? calculateStats(allJobs), [mergedStats, allJobs]);
 
   const availableTech = useMemo(() => {
     return Object.entries(stats.techStackCounts)
@@ -101,7 +103,12 @@ export default function Home() {
     setCurrentPage(1);
   }, [searchQuery, scoreFilter, selectedTech, sortBy, showHidden]);
 
-  const filteredStats = useMemo(() => calculateStats(filteredJobs), [filteredJobs]);
+  const filtersActive =
+    Boolean(searchQuery) || scoreFilter > 0 || selectedTech.length > 0 || showHidden || hiddenCount > 0;
+  const filteredStats = useMemo(
+    () => (mergedStats && !filtersActive ? mergedStats : calculateStats(filteredJobs)),
+    [mergedStats, filtersActive, filteredJobs]
+  );
 
   // Status change handler
   const handleStatusChange = useCallback(
@@ -161,7 +168,11 @@ export default function Home() {
                 Job Opportunities
               </h2>
               <p className="text-muted-foreground mt-1">
-                {loading ? "Loading..." : `${stats.total} positions found across all platforms`}
+                {loading
+                  ? "Loading..."
+                  : loadingMore
+                    ? `Showing ${allJobs.length} of ${total} positions...`
+                    : `${stats.total} positions found across all platforms`}
               </p>
             </motion.div>
 
@@ -295,7 +306,7 @@ export default function Home() {
                 </SheetHeader>
                 {selectedJob && (
                   <JobDetail
-                    job={selectedJob}
+                    job={selectedDetail ?? selectedJob}
                     onClose={() => setSelectedJob(null)}
                     onStatusChange={(status) => handleStatusChange(selectedJob, status)}
                     updating={updating}
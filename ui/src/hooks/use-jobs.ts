@@ -1,19 +1,68 @@
 "use client";
 
 import { useState, useEffect, useCallback } from "react";
-import { Job } from "@/types/job";
+import { Job, JobStats } from "@/types/job";
+import {
+  fetchJobDetail,
+  fetchJobStats,
+  fetchJobsManifest,
+  loadJobPages,
+  type JobsManifest,
+} from "@/lib/jobs";
 
 const USE_API = process.env.NEXT_PUBLIC_USE_API === "true";
 
+// Static mode: jobs.version.json names the current content-hashed jobs file,
+// which never changes and can be cached indefinitely.
+async function staticJobsUrl(): Promise<string> {
+  try {
+    const response = await fetch("/data/jobs.version.json", { cache: "no-cache" });
+    if (response.ok) {
+      const version: { file: string } = await response.json();
+      return `/data/${version.file}`;
+    }
+  } catch {
+    // Fall through to the unversioned file
+  }
+  return "/data/jobs.json";
+}
+
 export function useJobs() {
   const [jobs, setJobs] = useState<Job[]>([]);
+  const [manifest, setManifest] = useState<JobsManifest | null>(null);
+  const [stats, setStats] = useState<JobStats | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
   const fetchJobs = useCallback(async () => {
     try {
       setLoading(true);
-      const url = USE_API ? "/api/jobs" : "/data/jobs.json";
+
+      // Static mode: stats for the whole job list come precomputed
+      if (!USE_API) {
+        fetchJobStats()
+          .catch(() => null)
+          .then(setStats);
+      }
+
+      // Static paged mode: show the first page as soon as it arrives,
+      // then append the rest in score order
+      const pages = USE_API ? null : await fetchJobsManifest().catch(() => null);
+      if (pages) {
+        setManifest(pages);
+        setLoadingMore(pages.pages.length > 1);
+        const loaded: Job[] = [];
+        await loadJobPages(pages, (page, index) => {
+          loaded.push(...page);
+          setJobs([...loaded]);
+          if (index === 0) setLoading(false);
+        });
+        setLoadingMore(false);
+        return;
+      }
+
+      const url = USE_API ? "/api/jobs" : await staticJobsUrl();
       const response = await fetch(url);
 
       if (!response.ok) {
@@ -53,6 +102,7 @@ export function useJobs() {
       setError(err instanceof Error ? err.message : "Unknown error");
     } finally {
       setLoading(false);
+      setLoadingMore(false);
     }
   }, []);
 
@@ -60,7 +110,31 @@ export function useJobs() {
     fetchJobs();
   }, [fetchJobs]);
 
-  return { jobs, loading, error, refetch: fetchJobs };
+  const total = manifest?.total ?? jobs.length;
+
+  return { jobs, total, manifest, stats, loading, loadingMore, error, refetch: fetchJobs };
+}
+
+// Hook for a job's full record; summaries from paged static data load
+// their long text fields on demand
+export function useJobDetail(job: Job | null, manifest?: JobsManifest | null) {
+  const [detailed, setDetailed] = useState<Job | null>(job);
+
+  useEffect(() => {
+    setDetailed(job);
+    if (!job?.detail) return;
+    let cancelled = false;
+    fetchJobDetail(job, manifest)
+      .then((full) => {
+        if (!cancelled) setDetailed(full);
+      })
+      .catch(() => {});
+    return () => {
+      cancelled = true;
+    };
+  }, [job, manifest]);
+
+  return detailed;
 }
 
 // Hook for updating application status
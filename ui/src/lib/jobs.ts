@@ -1,4 +1,105 @@
-import { Job } from "@/types/job";
+import { ATS_PLATFORMS } from "@/constants";
+import { Job, JobStats, type ATSPlatform } from "@/types/job";
+
+// Static UI data written by the merger under public/data/pages
+const PAGES_BASE = "/data/pages";
+
+export interface JobsManifestPage {
+  file: string;
+  count: number;
+  max_score: number;
+  min_score: number;
+  hash: string;
+}
+
+export interface JobsManifest {
+  generated_at: string;
+  total: number;
+  page_size: number;
+  pages: JobsManifestPage[];
+  detail_dir: string;
+}
+
+export async function fetchJobsManifest(): Promise<JobsManifest | null> {
+  const response = await fetch(`${PAGES_BASE}/manifest.json`, { cache: "no-cache" });
+  if (!response.ok) return null;
+  return response.json();
+}
+
+export async function fetchJobsPage(page: JobsManifestPage): Promise<Job[]> {
+  // The content hash changes whenever the page does, so cached copies stay valid
+  const response = await fetch(`${PAGES_BASE}/${page.file}?v=${page.hash}`);
+  if (!response.ok) throw new Error(`Failed to fetch ${page.file}`);
+  return response.json();
+}
+
+// Load every page in score order, reporting each as it arrives
+export async function loadJobPages(
+  manifest: JobsManifest,
+  onPage: (jobs: Job[], index: number) => void
+): Promise<void> {
+  const pending = manifest.pages.map(fetchJobsPage);
+  for (let i = 0; i < pending.length; i++) {
+    onPage(await pending[i], i);
+  }
+}
+
+const detailCache = new Map<string, Promise<Job>>();
+
+// Fill in a summary's long text fields from its detail file
+export async function fetchJobDetail(job: Job, manifest?: JobsManifest | null): Promise<Job> {
+  if (!job.detail) return job;
+  const dir = manifest?.detail_dir ?? "detail";
+  let detail = detailCache.get(job.detail);
+  if (!detail) {
+    detail = fetch(`${PAGES_BASE}/${dir}/${job.detail}.json`).then((response) => {
+      if (!response.ok) throw new Error("Failed to fetch job details");
+      return response.json();
+    });
+    detailCache.set(job.detail, detail);
+    detail.catch(() => detailCache.delete(job.detail!));
+  }
+  return { ...(await detail), ...job };
+}
+
+// Facet counts and aggregates precomputed by the merger (public/data/stats.json)
+export interface MergedStats {
+  generated_at: string;
+  total: number;
+  score_bands: { priority: number; high: number; good: number; other: number };
+  score_histogram: Record<string, number>;
+  tech_stack: Record<string, number>;
+  top_tech_stack: [string, number][];
+  locations: Record<string, number>;
+  platforms: Record<string, { jobs: number; avg_score: number }>;
+  company_count: number;
+  companies: Record<string, { jobs: number; avg_score: number; platforms: string[] }>;
+}
+
+export function toJobStats(merged: MergedStats): JobStats {
+  const atsPlatformCounts = Object.fromEntries(
+    Object.values(ATS_PLATFORMS).map((platform) => [platform, merged.platforms[platform]?.jobs ?? 0])
+  ) as Record<ATSPlatform, number>;
+  return {
+    total: merged.total,
+    priority: merged.score_bands.priority,
+    highMatch: merged.score_bands.high,
+    goodMatch: merged.score_bands.good,
+    other: merged.score_bands.other,
+    techStackCounts: merged.tech_stack,
+    companyCounts: Object.fromEntries(
+      Object.entries(merged.companies).map(([company, c]) => [company, c.jobs])
+    ),
+    locationCounts: merged.locations,
+    atsPlatformCounts,
+  };
+}
+
+export async function fetchJobStats(): Promise<JobStats | null> {
+  const response = await fetch("/data/stats.json", { cache: "no-cache" });
+  if (!response.ok) return null;
+  return toJobStats(await response.json());
+}
 
 export function searchJobs(jobs: Job[], query: string): Job[] {
   const lowerQuery = query.toLowerCase();
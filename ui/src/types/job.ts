@@ -67,6 +67,8 @@ export interface Job {
   // Database-specific fields (when using API mode)
   dbId?: number;
   appliedDate?: string;
+  // Static paged mode: key of the detail file holding the long text fields
+  detail?: string;
 }
 
 export interface JobStats {